@@ -0,0 +1,69 @@
+"""Compare aligned pairs kept as AlignedSpans with a list of string tuples.
+
+The book is aligned once; its main text is an AlignedSpans over the two
+main texts, and the list is what align_documents returned before (every
+pair materialized as two strings). Reported: memory held by each form
+(traced allocations, not counting the source texts both share), pickle
+size and dump + load time, and the size of what a worker process sends
+back per book (the detached spans only).
+
+Usage:
+    python -m benchmarks.bench_aligned_spans --chapters 50 --paragraphs 2000
+"""
+
+import argparse
+import pickle
+import tracemalloc
+
+from bilingual_reader.aligner import BilingualAligner
+from bilingual_reader.document_structure import DocumentSection
+
+from .common import best_of, make_parallel_book
+
+
+def traced_mb(func):
+    """Return (result, MB still allocated by func once it returns)."""
+    tracemalloc.start()
+    result = func()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size / 1e6
+
+
+def pickle_stats(value, repeat: int):
+    """Return (pickle size in MB, best dump + load time in seconds)."""
+    data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    elapsed, _ = best_of(lambda: pickle.loads(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)), repeat)
+    return len(data) / 1e6, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--chapters', type=int, default=50, help='Chapters per book (at most 99)')
+    parser.add_argument('--paragraphs', type=int, default=2000, help='Paragraphs per chapter')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement (best is reported)')
+    args = parser.parse_args()
+
+    text1, text2 = make_parallel_book(args.chapters, args.paragraphs)
+    doc1, doc2 = DocumentSection(main_text=text1), DocumentSection(main_text=text2)
+    doc1.chapters, doc2.chapters
+
+    aligner = BilingualAligner(strategy="length")
+    # Import NumPy and the length aligner before tracing
+    aligner.align_texts("One.\n\nTwo.", "一。\n\n二。", alignment_mode="paragraph")
+    spans, spans_mb = traced_mb(lambda: aligner.align_documents(doc1, doc2, alignment_mode="paragraph").main_text)
+    print(f"books: {len(text1) / 1e6:.1f}M + {len(text2) / 1e6:.1f}M chars, {len(spans)} pairs")
+
+    pairs, pairs_mb = traced_mb(lambda: list(spans))
+    assert pairs == spans
+
+    print(f"{'form':<16} {'held MB':>8} {'pickle MB':>10} {'dump+load s':>12}")
+    for label, value, held in (('list of tuples', pairs, pairs_mb), ('AlignedSpans', spans, spans_mb)):
+        size, elapsed = pickle_stats(value, args.repeat)
+        print(f"{label:<16} {held:>8.1f} {size:>10.1f} {elapsed:>12.3f}")
+    size, elapsed = pickle_stats(spans.detach(), args.repeat)
+    print(f"{'detached spans':<16} {'-':>8} {size:>10.1f} {elapsed:>12.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,270 @@
+"""Score every alignment strategy against gold alignments, at growing sizes.
+
+The corpus is a list of gold sentence pairs in which a share of the
+sentences has no counterpart: deleted from the translation (English
+only) or inserted by the translator (Chinese only). It is generated, or
+loaded from a TSV file of "english<TAB>chinese" lines with an empty side
+for an unmatched sentence, and laid out as paragraphs of a few sentences.
+Each strategy aligns the whole texts sentence by sentence, and its pairs
+are mapped back to gold sentences through their spans (AlignedSpans), so
+merged or re-split segments are scored by the sentences they cover.
+
+Reported per strategy and size: precision and recall of the sentence
+links (pairs of one English and one Chinese sentence aligned together;
+unmatched sentences form no link), segments (both sides) per second, and
+peak traced memory of one alignment. Results are written to JSON; pass
+--compare with an earlier file to print the change of F1 and speed.
+
+The embedding strategy uses a synthetic model by default, whose vectors
+for a sentence and its translation are close, so it runs without
+downloading anything; pass --model to score a real sentence-transformers
+model on the CPU instead (slow at the larger sizes).
+
+Usage:
+    python -m benchmarks.bench_alignment_accuracy --sizes 1000 10000 100000 --output accuracy.json
+    python -m benchmarks.bench_alignment_accuracy --corpus gold.tsv --sizes 1000 --compare accuracy.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import time
+import tracemalloc
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, NamedTuple, Set, Tuple
+
+import numpy as np
+
+from bilingual_reader.aligned_spans import UNSPACED_LANGUAGES, AlignedSpans
+from bilingual_reader.aligner import ALIGNMENT_STRATEGIES, BilingualAligner
+from bilingual_reader.embedding_aligner import SegmentEncoder, segment_key
+
+from .common import CHINESE_SAMPLE, SAMPLE_LINE, best_of
+
+Link = Tuple[int, int]
+
+
+class GoldCorpus(NamedTuple):
+    """Two texts and, for the sentences of each, their spans and gold links."""
+
+    text1: str
+    text2: str
+    starts1: List[int]
+    ends1: List[int]
+    starts2: List[int]
+    ends2: List[int]
+    links: Set[Link]  # (sentence of text1, sentence of text2) aligned in the gold
+    meanings: Dict[str, int]  # Sentence text -> index of its gold pair
+
+
+def generate_pairs(count: int, insert_rate: float, delete_rate: float, seed: int = 0) -> List[Tuple[str, str]]:
+    """Build count gold sentence pairs; deleted and inserted sentences have an empty side.
+
+    Chinese lengths follow the English ones with noise, as in real translations.
+    """
+    rng = random.Random(seed)
+    words = SAMPLE_LINE.rstrip('.').lower().split()
+    pairs = []
+    for _ in range(count):
+        length = rng.randint(4, 30)
+        english = ' '.join(rng.choice(words) for _ in range(length)).capitalize() + '.'
+        chinese = ''.join(rng.choice(CHINESE_SAMPLE) for _ in range(max(2, int(length * 1.6 * rng.uniform(0.8, 1.2)))))
+        chinese += '。'
+        draw = rng.random()
+        if draw < delete_rate:
+            chinese = ''
+        elif draw < delete_rate + insert_rate:
+            english = ''
+        pairs.append((english, chinese))
+    return pairs
+
+
+def load_pairs(path: str, count: int) -> List[Tuple[str, str]]:
+    """Read gold pairs from a TSV file, repeating them if it has fewer than count."""
+    with open(path, encoding='utf-8') as file:
+        pairs = [tuple(line.rstrip('\n').split('\t', 1)) for line in file if '\t' in line]
+    if not pairs:
+        raise ValueError(f"No tab-separated sentence pairs in {path}")
+    return [pairs[index % len(pairs)] for index in range(count)]
+
+
+def _layout(sentences: List[Tuple[int, str]], lang: str, per_paragraph: int):
+    """Join (pair index, sentence) into paragraphs; return the text and each sentence's span."""
+    joint = '' if lang in UNSPACED_LANGUAGES else ' '
+    parts, starts, ends, owners = [], [], [], []
+    position = 0
+    for number, (owner, sentence) in enumerate(sentences):
+        if number:
+            separator = '\n\n' if number % per_paragraph == 0 else joint
+            parts.append(separator)
+            position += len(separator)
+        parts.append(sentence)
+        starts.append(position)
+        position += len(sentence)
+        ends.append(position)
+        owners.append(owner)
+    return ''.join(parts), starts, ends, owners
+
+
+def build_corpus(pairs: List[Tuple[str, str]], lang1: str, lang2: str, per_paragraph: int) -> GoldCorpus:
+    """Lay out gold pairs as two texts and index their sentences."""
+    text1, starts1, ends1, owners1 = _layout(
+        [(index, english) for index, (english, _) in enumerate(pairs) if english], lang1, per_paragraph
+    )
+    text2, starts2, ends2, owners2 = _layout(
+        [(index, chinese) for index, (_, chinese) in enumerate(pairs) if chinese], lang2, per_paragraph
+    )
+    sentence2 = {owner: index for index, owner in enumerate(owners2)}
+    links = {(index, sentence2[owner]) for index, owner in enumerate(owners1) if owner in sentence2}
+    meanings = {}
+    for index, (english, chinese) in enumerate(pairs):
+        for sentence in (english, chinese):
+            if sentence:
+                meanings.setdefault(sentence, index)
+    return GoldCorpus(text1, text2, starts1, ends1, starts2, ends2, links, meanings)
+
+
+def _covered(starts: List[int], ends: List[int], start: int, end: int) -> range:
+    """Return the indexes of the sentences overlapping [start, end)."""
+    if start >= end:
+        return range(0)
+    return range(bisect_right(ends, start), bisect_left(starts, end))
+
+
+def predicted_links(aligned: AlignedSpans, corpus: GoldCorpus) -> Set[Link]:
+    """Return the sentence links of an alignment: every pair of sentences its pairs cover together."""
+    links = set()
+    for index in range(len(aligned)):
+        (start1, end1), (start2, end2) = aligned.pair_spans(index)
+        sentences2 = _covered(corpus.starts2, corpus.ends2, start2, end2)
+        for sentence1 in _covered(corpus.starts1, corpus.ends1, start1, end1):
+            links.update((sentence1, sentence2) for sentence2 in sentences2)
+    return links
+
+
+def score(predicted: Set[Link], gold: Set[Link]) -> Tuple[float, float, float]:
+    """Return (precision, recall, F1) of predicted links."""
+    correct = len(predicted & gold)
+    precision = correct / len(predicted) if predicted else 0.0
+    recall = correct / len(gold) if gold else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return precision, recall, f1
+
+
+class SyntheticModel:
+    """Stands in for a sentence-transformers model: a sentence and its translation get nearby vectors."""
+
+    def __init__(self, meanings: Dict[str, int], dimension: int = 384, noise: float = 0.6):
+        self.meanings = meanings
+        self.dimension = dimension
+        self.noise = noise
+
+    def _vector(self, key: str) -> np.ndarray:
+        return np.random.default_rng(int(segment_key(key, 'synthetic')[:15], 16)).standard_normal(self.dimension)
+
+    def encode(self, texts, batch_size=32):
+        vectors = np.empty((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            meaning = self.meanings.get(text)
+            vectors[row] = self._vector(text if meaning is None else f'#{meaning}') + self.noise * self._vector(text)
+        return vectors
+
+
+def measure(strategy: str, corpus: GoldCorpus, args) -> Dict[str, float]:
+    """Align the corpus with one strategy; return its scores, speed and peak memory."""
+    def align() -> AlignedSpans:
+        # A new aligner (and encoder) per run, so no run reuses the embeddings of another
+        encoder = None
+        if strategy == "embedding":
+            model = SyntheticModel(corpus.meanings) if args.model is None else None
+            encoder = SegmentEncoder(model=model, model_name=args.model or 'synthetic')
+        aligner = BilingualAligner(
+            lang1=args.lang1, lang2=args.lang2, strategy=strategy, splitter=args.splitter, encoder=encoder
+        )
+        return aligner.align_spans(corpus.text1, corpus.text2, alignment_mode="sentence")
+
+    elapsed, aligned = best_of(align, args.repeat)
+    tracemalloc.start()
+    align()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    precision, recall, f1 = score(predicted_links(aligned, corpus), corpus.links)
+    segments = len(corpus.starts1) + len(corpus.starts2)
+    return {
+        'seconds': round(elapsed, 4),
+        'segments_per_sec': round(segments / elapsed, 1),
+        'peak_mb': round(peak / 1e6, 2),
+        'precision': round(precision, 4),
+        'recall': round(recall, 4),
+        'f1': round(f1, 4),
+        'pairs': len(aligned),
+    }
+
+
+def compare(results: List[dict], path: str):
+    """Print the change of F1 and speed against the results in an earlier JSON file."""
+    with open(path, encoding='utf-8') as file:
+        previous = {(row['strategy'], row['size']): row for row in json.load(file)['results']}
+    print(f"\nchange against {path}:")
+    print(f"{'strategy':<11} {'size':>7} {'F1':>9} {'speed':>8}")
+    for row in results:
+        before = previous.get((row['strategy'], row['size']))
+        if before is None:
+            continue
+        speed = row['segments_per_sec'] / before['segments_per_sec'] - 1
+        print(f"{row['strategy']:<11} {row['size']:>7} {row['f1'] - before['f1']:>+9.4f} {speed:>+8.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help='Gold sentence pairs per corpus')
+    parser.add_argument('--strategies', nargs='+', choices=ALIGNMENT_STRATEGIES, default=list(ALIGNMENT_STRATEGIES),
+                        help='Strategies to run (default: all)')
+    parser.add_argument('--corpus', default=None, help='TSV file of gold pairs (default: generated)')
+    parser.add_argument('--insert-rate', type=float, default=0.02, help='Share of sentences only in the translation')
+    parser.add_argument('--delete-rate', type=float, default=0.02, help='Share of sentences missing from it')
+    parser.add_argument('--sentences-per-paragraph', type=int, default=5, help='Sentences per paragraph')
+    parser.add_argument('--lang1', default='en', help='Language of the first side')
+    parser.add_argument('--lang2', default='zh', help='Language of the second side')
+    parser.add_argument('--splitter', default='builtin', help='Sentence splitter (default: builtin)')
+    parser.add_argument('--model', default=None, help='sentence-transformers model (default: synthetic)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the generated corpus')
+    parser.add_argument('--repeat', type=int, default=1, help='Timed runs per measurement (best is reported)')
+    parser.add_argument('--output', default='alignment_accuracy.json', help='Where to write the JSON results')
+    parser.add_argument('--compare', default=None, help='Earlier JSON results to compare with')
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'strategy':<11} {'size':>7} {'precision':>9} {'recall':>7} {'F1':>7} "
+          f"{'seconds':>8} {'segs/sec':>9} {'peak MB':>8}")
+    for size in args.sizes:
+        if args.corpus is None:
+            pairs = generate_pairs(size, args.insert_rate, args.delete_rate, args.seed)
+        else:
+            pairs = load_pairs(args.corpus, size)
+        corpus = build_corpus(pairs, args.lang1, args.lang2, args.sentences_per_paragraph)
+        for strategy in args.strategies:
+            row = {'strategy': strategy, 'size': size, **measure(strategy, corpus, args)}
+            results.append(row)
+            print(f"{strategy:<11} {size:>7} {row['precision']:>9.4f} {row['recall']:>7.4f} {row['f1']:>7.4f} "
+                  f"{row['seconds']:>8.2f} {row['segments_per_sec']:>9.0f} {row['peak_mb']:>8.1f}")
+
+    config = {
+        key: getattr(args, key) for key in (
+            'corpus', 'insert_rate', 'delete_rate', 'sentences_per_paragraph',
+            'lang1', 'lang2', 'splitter', 'model', 'seed', 'repeat'
+        )
+    }
+    config.update(python=platform.python_version(), date=time.strftime('%Y-%m-%dT%H:%M:%S'))
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump({'config': config, 'results': results}, file, indent=2)
+    print(f"\nresults written to {args.output}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
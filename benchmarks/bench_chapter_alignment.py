@@ -0,0 +1,60 @@
+"""Compare whole-text alignment with chapter-paired alignment across worker counts.
+
+Both books have the same chapters, but a share of the Chinese paragraphs is
+missing. Whole-text alignment shifts every pair after the first omission;
+chapter pairing confines each shift to its own chapter, and the chapter
+pairs can be aligned in parallel. Wall time only improves with workers on
+a machine with several cores.
+
+Usage:
+    python -m benchmarks.bench_chapter_alignment --chapters 64 --paragraphs 400
+"""
+
+import argparse
+import os
+
+from bilingual_reader.aligner import BilingualAligner
+from bilingual_reader.document_structure import DocumentSection
+
+from .common import best_of, make_parallel_book, paragraph_accuracy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--chapters', type=int, default=64, help='Chapters per book (at most 99)')
+    parser.add_argument('--paragraphs', type=int, default=400, help='Paragraphs per chapter')
+    parser.add_argument('--drop-rate', type=float, default=0.002, help='Share of missing Chinese paragraphs')
+    parser.add_argument('--mode', default='paragraph', help='Alignment mode passed to the aligner')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per variant (best is reported)')
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    text1, text2 = make_parallel_book(args.chapters, args.paragraphs, args.drop_rate)
+    doc1, doc2 = DocumentSection(main_text=text1), DocumentSection(main_text=text2)
+    # Index the chapters once, outside the timed runs, as the extractor does
+    doc1.chapters, doc2.chapters
+
+    worker_counts = [1]
+    while worker_counts[-1] * 2 <= args.max_workers:
+        worker_counts.append(worker_counts[-1] * 2)
+    if worker_counts[-1] != args.max_workers:
+        worker_counts.append(args.max_workers)
+
+    print(f"books: {args.chapters} chapters x {args.paragraphs} paragraphs, "
+          f"{len(text1) / 1e6:.1f}M + {len(text2) / 1e6:.1f}M chars, cpus: {os.cpu_count()}")
+    print(f"{'variant':<22} {'seconds':>9} {'speedup':>8} {'accuracy':>9}")
+
+    def run(aligner):
+        return aligner.align_documents(doc1, doc2, alignment_mode=args.mode).main_text
+
+    baseline_time, pairs = best_of(lambda: run(BilingualAligner(by_chapter=False)), args.repeat)
+    print(f"{'whole text':<22} {baseline_time:>9.3f} {1.0:>7.2f}x {paragraph_accuracy(pairs):>9.1%}")
+
+    for workers in worker_counts:
+        elapsed, pairs = best_of(lambda: run(BilingualAligner(workers=workers)), args.repeat)
+        print(f"{f'by chapter, {workers} workers':<22} {elapsed:>9.3f} "
+              f"{baseline_time / elapsed:>7.2f}x {paragraph_accuracy(pairs):>9.1%}")
+
+
+if __name__ == '__main__':
+    main()
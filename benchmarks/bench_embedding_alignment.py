@@ -0,0 +1,102 @@
+"""Measure embedding-based alignment and the memory-mapped embedding store.
+
+Both books have the same paragraphs, but a share of the Chinese paragraphs
+is missing. By default paragraphs are encoded by a synthetic model whose
+vectors for a paragraph and its translation are close (derived from the
+shared "[chapter.paragraph]" label, plus noise), so the benchmark runs
+without downloading anything; pass --model to time a real
+sentence-transformers model on the CPU instead.
+
+Reported: the DP alone on precomputed embeddings, a first run that encodes
+every paragraph into an empty store, a rerun with a new encoder on the
+same store (as a second CLI run would), and pairing accuracy next to the
+length strategy.
+
+Usage:
+    python -m benchmarks.bench_embedding_alignment --chapters 20 --paragraphs 1000
+    python -m benchmarks.bench_embedding_alignment --chapters 2 --paragraphs 200 \\
+        --model sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2
+"""
+
+import argparse
+import os
+import re
+import tempfile
+
+import numpy as np
+
+from bilingual_reader.aligner import BilingualAligner
+from bilingual_reader.document_structure import DocumentSection
+from bilingual_reader.embedding_aligner import EmbeddingStore, SegmentEncoder, align_embeddings, segment_key
+
+from .common import best_of, make_parallel_book, paragraph_accuracy
+
+_LABEL = re.compile(r'\[\d+\.\d+\]')
+
+
+class SyntheticModel:
+    """Stands in for a sentence-transformers model: translations get nearby vectors."""
+
+    def __init__(self, dimension: int = 384, noise: float = 0.6):
+        self.dimension = dimension
+        self.noise = noise
+
+    def _vector(self, text: str) -> np.ndarray:
+        return np.random.default_rng(int(segment_key(text, 'synthetic')[:15], 16)).standard_normal(self.dimension)
+
+    def encode(self, texts, batch_size=32):
+        vectors = np.empty((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            label = _LABEL.search(text)
+            meaning = self._vector(label.group() if label else text)
+            vectors[row] = meaning + self.noise * self._vector(text)
+        return vectors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--chapters', type=int, default=20, help='Chapters per book (at most 99)')
+    parser.add_argument('--paragraphs', type=int, default=1000, help='Paragraphs per chapter')
+    parser.add_argument('--drop-rate', type=float, default=0.002, help='Share of missing Chinese paragraphs')
+    parser.add_argument('--model', default=None, help='sentence-transformers model (default: synthetic)')
+    parser.add_argument('--batch-size', type=int, default=128, help='Segments per forward pass of --model')
+    args = parser.parse_args()
+
+    text1, text2 = make_parallel_book(args.chapters, args.paragraphs, args.drop_rate)
+    doc1, doc2 = DocumentSection(main_text=text1), DocumentSection(main_text=text2)
+    doc1.chapters, doc2.chapters
+    model_name = args.model or 'synthetic'
+
+    def make_encoder(store):
+        model = SyntheticModel() if args.model is None else None
+        return SegmentEncoder(model=model, model_name=model_name, store=store, batch_size=args.batch_size)
+
+    aligner = BilingualAligner()
+    segments1 = aligner._split_paragraphs(text1, aligner.lang1)
+    segments2 = aligner._split_paragraphs(text2, aligner.lang2)
+    print(f"books: {len(segments1)} + {len(segments2)} paragraphs, model: {model_name}")
+
+    embeddings1 = make_encoder(None).encode(segments1)
+    embeddings2 = make_encoder(None).encode(segments2)
+    elapsed, beads = best_of(lambda: align_embeddings(embeddings1, embeddings2), 3)
+    print(f"embedding DP alone (whole text): {elapsed:.3f} s, {len(beads)} beads")
+
+    print(f"{'run':<30} {'seconds':>9} {'encoded':>8} {'accuracy':>9}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store_path = os.path.join(temp_dir, 'embeddings.npy')
+        for label in ('embedding, empty store', 'embedding, rerun on store'):
+            encoder = make_encoder(EmbeddingStore(store_path))
+            aligner = BilingualAligner(strategy="embedding", encoder=encoder)
+            elapsed, pairs = best_of(
+                lambda: aligner.align_documents(doc1, doc2, alignment_mode="paragraph").main_text, 1
+            )
+            print(f"{label:<30} {elapsed:>9.3f} {encoder.encoded:>8} {paragraph_accuracy(pairs):>9.1%}")
+        print(f"store on disk: {os.path.getsize(store_path) / 1e6:.1f} MB")
+
+    aligner = BilingualAligner(strategy="length")
+    elapsed, pairs = best_of(lambda: aligner.align_documents(doc1, doc2, alignment_mode="paragraph").main_text, 1)
+    print(f"{'length (for comparison)':<30} {elapsed:>9.3f} {'-':>8} {paragraph_accuracy(pairs):>9.1%}")
+
+
+if __name__ == '__main__':
+    main()
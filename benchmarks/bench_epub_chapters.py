@@ -0,0 +1,78 @@
+"""Measure ePub chapter text extraction throughput (chapters/sec).
+
+Compares the previous BeautifulSoup ``html.parser`` path (manifest order)
+with the lxml path (spine order), serially and with worker processes.
+
+Usage:
+    python -m benchmarks.bench_epub_chapters --chapters 2000 --workers 1 2 4
+"""
+
+import argparse
+import os
+from collections import Counter
+
+import ebooklib
+from bs4 import BeautifulSoup
+from ebooklib import epub
+
+from bilingual_reader.text_extractor import TextExtractor
+
+from .common import EXAMPLES_DIR, bench_dir, best_of, cached_synthetic_epub
+
+
+def extract_with_html_parser(epub_path: str) -> str:
+    """Text extraction as done before the lxml path, for reference."""
+    book = epub.read_epub(epub_path)
+    text = []
+    for item in book.get_items():
+        if item.get_type() == ebooklib.ITEM_DOCUMENT:
+            chapter_text = BeautifulSoup(item.get_content(), 'html.parser').get_text()
+            if chapter_text.strip():
+                text.append(chapter_text)
+    return '\n'.join(text)
+
+
+def count_documents(epub_path: str) -> int:
+    """Return the number of XHTML documents in an ePub."""
+    book = epub.read_epub(epub_path)
+    return sum(1 for item in book.get_items() if item.get_type() == ebooklib.ITEM_DOCUMENT)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--chapters', type=int, default=2000, help='Chapters in the synthetic ePub')
+    parser.add_argument('--epub', action='append', default=[], help='Extra ePub files to measure')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per variant (best is reported)')
+    args = parser.parse_args()
+
+    paths = [cached_synthetic_epub(bench_dir(), args.chapters)]
+    example = os.path.join(EXAMPLES_DIR, 'atomic_habits_english.epub')
+    if os.path.exists(example):
+        paths.append(example)
+    paths.extend(args.epub)
+
+    print(f"CPUs: {os.cpu_count()}")
+    for path in paths:
+        num_docs = count_documents(path)
+        print(f"\n{os.path.basename(path)}: {num_docs} documents")
+        print(f"{'variant':<18} {'seconds':>8} {'chapters/s':>11} {'speedup':>8}")
+
+        base_time, base_text = best_of(lambda: extract_with_html_parser(path), args.repeat)
+        print(f"{'html.parser':<18} {base_time:>8.3f} {num_docs / base_time:>11.0f} {1.0:>7.2f}x")
+
+        for workers in args.workers:
+            elapsed, text = best_of(
+                lambda: TextExtractor.extract_from_epub(path, workers=workers), args.repeat
+            )
+            label = f"lxml, {workers} worker{'s' if workers != 1 else ''}"
+            print(f"{label:<18} {elapsed:>8.3f} {num_docs / elapsed:>11.0f} {base_time / elapsed:>7.2f}x")
+
+        # Documents outside the spine (such as the nav page) are no longer read
+        words, base_words = Counter(text.split()), Counter(base_text.split())
+        print(f"words only in html.parser output: {sum((base_words - words).values())}, "
+              f"only in lxml output: {sum((words - base_words).values())}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""Compare separate text and image ePub passes against the single shared pass.
+
+Usage:
+    python -m benchmarks.bench_epub_extraction --epub examples/atomic_habits_english.epub
+"""
+
+import argparse
+import os
+
+from bilingual_reader.epub_reader import read_epub_content
+from bilingual_reader.image_extractor import extract_images_from_epub
+from bilingual_reader.text_extractor import TextExtractor
+
+from .common import EXAMPLES_DIR, best_of
+
+
+def two_passes(epub_path: str):
+    """Text and images extracted independently, each reading the whole ePub."""
+    return TextExtractor.extract_from_epub(epub_path), extract_images_from_epub(epub_path)
+
+
+def one_pass(epub_path: str):
+    """Text and images extracted from a single read and parse."""
+    content = read_epub_content(epub_path)
+    return content.text, content.images
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--epub', default=os.path.join(EXAMPLES_DIR, 'atomic_habits_english.epub'))
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per variant (best is reported)')
+    args = parser.parse_args()
+
+    two_time, (two_text, two_images) = best_of(lambda: two_passes(args.epub), args.repeat)
+    one_time, (one_text, one_images) = best_of(lambda: one_pass(args.epub), args.repeat)
+
+    print(f"ePub: {args.epub}")
+    print(f"{'variant':<12} {'seconds':>8} {'chars':>9} {'images':>7}")
+    print(f"{'two passes':<12} {two_time:>8.3f} {len(two_text):>9} {len(two_images):>7}")
+    print(f"{'one pass':<12} {one_time:>8.3f} {len(one_text):>9} {len(one_images):>7}")
+    print(f"speedup: {two_time / one_time:.2f}x, identical text: {one_text == two_text}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""Measure peak memory of ePub extraction on an image-heavy book.
+
+Compares loading the whole book with ebooklib (as extraction did before the
+lazy archive reader) against the zipfile-backed text and image paths. Each
+measurement runs in a fresh process so that peak RSS reflects only that
+variant.
+
+Usage:
+    python -m benchmarks.bench_epub_memory --images 120
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+
+from .common import bench_dir, make_image_epub, peak_rss_mb
+
+
+def _load_with_ebooklib(epub_path: str) -> int:
+    import ebooklib
+    from ebooklib import epub
+
+    book = epub.read_epub(epub_path)
+    return sum(1 for item in book.get_items() if item.get_type() == ebooklib.ITEM_DOCUMENT)
+
+
+def _text_only(epub_path: str) -> int:
+    from bilingual_reader.text_extractor import TextExtractor
+
+    return len(TextExtractor.extract_from_epub(epub_path))
+
+
+def _text_and_images(epub_path: str) -> int:
+    from bilingual_reader.epub_reader import read_epub_content
+
+    return len(read_epub_content(epub_path).images)
+
+
+VARIANTS = {
+    'ebooklib load': _load_with_ebooklib,
+    'text only': _text_only,
+    'text + images': _text_and_images,
+}
+
+
+def _measure(variant: str, epub_path: str, queue) -> None:
+    start = time.perf_counter()
+    result = VARIANTS[variant](epub_path)
+    queue.put((result, time.perf_counter() - start, peak_rss_mb()))
+
+
+def measure(variant: str, epub_path: str):
+    """Run one variant in a spawned child process and return its stats."""
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=_measure, args=(variant, epub_path, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--images', type=int, default=120, help='Images in the synthetic ePub')
+    parser.add_argument('--image-size', type=int, default=1600, help='Image width and height in pixels')
+    parser.add_argument('--epub', default=None, help='Measure this ePub instead of a synthetic one')
+    args = parser.parse_args()
+
+    epub_path = args.epub
+    if epub_path is None:
+        os.makedirs(bench_dir(), exist_ok=True)
+        epub_path = os.path.join(bench_dir(), f"images_{args.images}_{args.image_size}.epub")
+        if not os.path.exists(epub_path):
+            # Generate in a child process: peak RSS survives fork and exec on
+            # Linux, so a large parent would inflate every measurement
+            context = multiprocessing.get_context('spawn')
+            process = context.Process(
+                target=make_image_epub, args=(epub_path, args.images, args.image_size)
+            )
+            process.start()
+            process.join()
+
+    size_mb = os.path.getsize(epub_path) / (1024 * 1024)
+    print(f"ePub: {epub_path} ({size_mb:.0f} MB)")
+    print(f"{'variant':<14} {'result':>8} {'seconds':>8} {'peak MB':>8}")
+    for variant in VARIANTS:
+        result, elapsed, rss = measure(variant, epub_path)
+        print(f"{variant:<14} {result:>8} {elapsed:>8.2f} {rss:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
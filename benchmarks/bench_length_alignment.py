@@ -0,0 +1,57 @@
+"""Compare sequential pairing with length-based (Gale-Church) alignment.
+
+Both books have the same paragraphs, but a share of the Chinese paragraphs
+is missing. Sequential pairing shifts every pair after an omission (within
+its chapter when aligning by chapter); the length aligner absorbs each
+omission locally. Alignment time covers splitting and pairing, and the DP
+alone is timed on the paragraph lengths.
+
+Usage:
+    python -m benchmarks.bench_length_alignment --chapters 50 --paragraphs 2000
+"""
+
+import argparse
+
+from bilingual_reader.aligner import BilingualAligner
+from bilingual_reader.document_structure import DocumentSection
+from bilingual_reader.length_aligner import align_lengths
+
+from .common import best_of, make_parallel_book, paragraph_accuracy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--chapters', type=int, default=50, help='Chapters per book (at most 99)')
+    parser.add_argument('--paragraphs', type=int, default=2000, help='Paragraphs per chapter')
+    parser.add_argument('--drop-rate', type=float, default=0.002, help='Share of missing Chinese paragraphs')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per variant (best is reported)')
+    args = parser.parse_args()
+
+    text1, text2 = make_parallel_book(args.chapters, args.paragraphs, args.drop_rate)
+    doc1, doc2 = DocumentSection(main_text=text1), DocumentSection(main_text=text2)
+    # Index the chapters once, outside the timed runs, as the extractor does
+    doc1.chapters, doc2.chapters
+
+    aligner = BilingualAligner(strategy="length")
+    lengths1 = [len(segment) for segment in aligner._split_paragraphs(text1, aligner.lang1)]
+    lengths2 = [len(segment) for segment in aligner._split_paragraphs(text2, aligner.lang2)]
+    print(f"books: {len(lengths1)} + {len(lengths2)} paragraphs, "
+          f"{len(text1) / 1e6:.1f}M + {len(text2) / 1e6:.1f}M chars")
+
+    elapsed, beads = best_of(lambda: align_lengths(lengths1, lengths2), args.repeat)
+    print(f"length DP alone: {elapsed:.3f} s, {len(beads)} beads")
+
+    print(f"{'variant':<24} {'seconds':>9} {'accuracy':>9}")
+    for strategy in ("sequential", "length"):
+        for by_chapter in (False, True):
+            aligner = BilingualAligner(by_chapter=by_chapter, strategy=strategy)
+            elapsed, pairs = best_of(
+                lambda: aligner.align_documents(doc1, doc2, alignment_mode="paragraph").main_text,
+                args.repeat
+            )
+            variant = f"{strategy}, {'by chapter' if by_chapter else 'whole text'}"
+            print(f"{variant:<24} {elapsed:>9.3f} {paragraph_accuracy(pairs):>9.1%}")
+
+
+if __name__ == '__main__':
+    main()
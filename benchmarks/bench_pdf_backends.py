@@ -0,0 +1,63 @@
+"""Compare PDF text-extraction backends for throughput and peak memory.
+
+Each measurement runs in a fresh process so that peak RSS reflects only
+that backend's work on that file.
+
+Usage:
+    python -m benchmarks.bench_pdf_backends --pages 200 1000
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+
+from bilingual_reader.pdf_reader import available_pdf_backends, extract_pdf_page_range, pdf_page_count
+
+from .common import bench_dir, cached_synthetic_pdf, example_pdfs, peak_rss_mb
+
+
+def _measure(pdf_path: str, backend: str, queue) -> None:
+    """Extract every page of pdf_path in this process and report the stats."""
+    start = time.perf_counter()
+    num_pages = pdf_page_count(pdf_path, backend)
+    pages = extract_pdf_page_range(pdf_path, 0, num_pages, backend)
+    elapsed = time.perf_counter() - start
+    queue.put((num_pages, sum(len(page) for page in pages), elapsed, peak_rss_mb()))
+
+
+def measure(pdf_path: str, backend: str):
+    """Run _measure in a spawned child process and return its stats."""
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=_measure, args=(pdf_path, backend, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, nargs='*', default=[200, 1000],
+                        help='Sizes of synthetic PDFs to generate')
+    parser.add_argument('--backends', nargs='*', default=None,
+                        help='Backends to compare (default: all installed)')
+    args = parser.parse_args()
+
+    backends = args.backends or available_pdf_backends()
+    inputs = example_pdfs(bench_dir())
+    inputs += [cached_synthetic_pdf(bench_dir(), pages) for pages in args.pages]
+
+    print(f"{'input':<28} {'backend':<8} {'pages':>6} {'chars':>10} "
+          f"{'seconds':>8} {'pages/s':>9} {'peak MB':>8}")
+    for pdf_path in inputs:
+        for backend in backends:
+            num_pages, chars, elapsed, rss = measure(pdf_path, backend)
+            rate = num_pages / elapsed if elapsed else float('inf')
+            print(f"{os.path.basename(pdf_path):<28} {backend:<8} {num_pages:>6} {chars:>10} "
+                  f"{elapsed:>8.3f} {rate:>9.1f} {rss:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""Benchmark parallel page-range PDF text extraction against the serial path.
+
+Usage:
+    python -m benchmarks.bench_pdf_extraction --pages 800
+"""
+
+import argparse
+import os
+
+from bilingual_reader.text_extractor import TextExtractor
+
+from .common import bench_dir, best_of, cached_synthetic_pdf
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, default=800, help='Pages in the synthetic PDF')
+    parser.add_argument('--pdf', default=None, help='Benchmark this PDF instead of a synthetic one')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per worker count (best is reported)')
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    pdf_path = args.pdf or cached_synthetic_pdf(bench_dir(), args.pages)
+
+    worker_counts = [1]
+    while worker_counts[-1] * 2 <= args.max_workers:
+        worker_counts.append(worker_counts[-1] * 2)
+    if worker_counts[-1] != args.max_workers:
+        worker_counts.append(args.max_workers)
+
+    print(f"PDF: {pdf_path}")
+    print(f"{'workers':>8} {'seconds':>10} {'speedup':>8} {'identical':>10}")
+    baseline_time, baseline_text = best_of(
+        lambda: TextExtractor.extract_from_pdf(pdf_path, workers=1), args.repeat
+    )
+    print(f"{1:>8} {baseline_time:>10.3f} {1.0:>8.2f} {'yes':>10}")
+
+    for workers in worker_counts[1:]:
+        elapsed, text = best_of(
+            lambda: TextExtractor.extract_from_pdf(pdf_path, workers=workers), args.repeat
+        )
+        identical = 'yes' if text == baseline_text else 'NO'
+        print(f"{workers:>8} {elapsed:>10.3f} {baseline_time / elapsed:>8.2f} {identical:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Compare realigning a whole book after a one-paragraph edit with realign.
+
+The book is aligned once; then a Chinese paragraph is edited (a phrase
+inserted), deleted, or a new one inserted, and the edited texts are
+aligned again from scratch and with BilingualAligner.realign on the
+previous alignment. The realign time includes finding the edit with
+diff_texts. Accuracy is paragraph_accuracy of both results.
+
+Usage:
+    python -m benchmarks.bench_realign --chapters 50 --paragraphs 2000
+"""
+
+import argparse
+
+from bilingual_reader.aligner import BilingualAligner
+from bilingual_reader.document_structure import DocumentSection
+from bilingual_reader.text_edits import diff_texts
+
+from .common import best_of, make_parallel_book, paragraph_accuracy
+
+
+def edited_texts(text: str, label: str):
+    """Return (kind, edited text) for each kind of edit of the paragraph starting with label."""
+    start = text.index(label)
+    end = text.find('\n\n', start)
+    return [
+        ('typo', text[:start + len(label)] + '新' + text[start + len(label):]),
+        ('delete', text[:start] + text[end + 2:]),
+        ('insert', text[:start] + '译者加的一段话，交代了书中没有说明的背景。\n\n' + text[start:]),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--chapters', type=int, default=50, help='Chapters per book (at most 99)')
+    parser.add_argument('--paragraphs', type=int, default=2000, help='Paragraphs per chapter')
+    parser.add_argument('--mode', choices=('sentence', 'paragraph'), default='paragraph', help='Alignment mode')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs of realign (best is reported)')
+    args = parser.parse_args()
+
+    text1, text2 = make_parallel_book(args.chapters, args.paragraphs, drop_rate=0.002)
+    label = f"[{(args.chapters + 1) // 2}.{(args.paragraphs + 1) // 2}]"
+    print(f"books: {len(text1) / 1e6:.1f}M + {len(text2) / 1e6:.1f}M chars, edited paragraph {label}")
+    print(f"{'strategy':<11} {'edit':<7} {'full s':>7} {'realign ms':>11} {'full acc':>9} {'realign acc':>12}")
+    for strategy in ('sequential', 'length'):
+        aligner = BilingualAligner(strategy=strategy, splitter='builtin')
+        doc1, doc2 = DocumentSection(main_text=text1), DocumentSection(main_text=text2)
+        previous = aligner.align_documents(doc1, doc2, alignment_mode=args.mode).main_text
+        for kind, new_text2 in edited_texts(text2, label):
+            new_doc2 = DocumentSection(main_text=new_text2)
+            full_time, full = best_of(
+                lambda: aligner.align_documents(doc1, new_doc2, alignment_mode=args.mode).main_text, 1
+            )
+            realign_time, realigned = best_of(
+                lambda: aligner.realign(previous, edits2=diff_texts(text2, new_text2), alignment_mode=args.mode),
+                args.repeat
+            )
+            print(f"{strategy:<11} {kind:<7} {full_time:>7.2f} {realign_time * 1000:>11.1f} "
+                  f"{paragraph_accuracy(full):>9.2%} {paragraph_accuracy(realigned):>12.2%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""Measure memory of aligning a series of volumes into lists vs a SegmentStore.
+
+Each volume is built, aligned and dropped in turn, as a series job does.
+"list" keeps the pairs of every volume as lists of string tuples (the
+AlignedSpans of a volume would keep its whole texts alive); "store" writes
+them all into one SegmentStore that spills to disk past its threshold.
+Reported: wall time, peak and held traced memory, and the time to read
+back a sub-range of 1000 pairs from the middle of the series.
+
+Usage:
+    python -m benchmarks.bench_segment_store --volumes 10 --chapters 20 --paragraphs 500
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from bilingual_reader.aligner import BilingualAligner
+from bilingual_reader.document_structure import DocumentSection
+from bilingual_reader.segment_store import SegmentStore
+
+from .common import best_of, make_parallel_book
+
+
+def align_series(variant: str, args):
+    """Align every volume and return the pairs (a list of lists, or the store)."""
+    aligner = BilingualAligner()
+    pairs = [] if variant == 'list' else SegmentStore(max_memory_chars=args.max_memory_chars)
+    for _ in range(args.volumes):
+        text1, text2 = make_parallel_book(args.chapters, args.paragraphs)
+        doc1, doc2 = DocumentSection(main_text=text1), DocumentSection(main_text=text2)
+        if variant == 'list':
+            pairs.append(list(aligner.align_documents(doc1, doc2, alignment_mode="paragraph").main_text))
+        else:
+            aligner.align_documents(doc1, doc2, alignment_mode="paragraph", store=pairs)
+    return pairs
+
+
+def read_range(variant: str, pairs, start: int, count: int):
+    """Return count pairs from index start of the series."""
+    if variant == 'store':
+        return pairs[start:start + count]
+    flat = []
+    for volume in pairs:
+        if start < len(volume):
+            flat.extend(volume[start:start + count - len(flat)])
+            if len(flat) == count:
+                break
+            start = 0
+        else:
+            start -= len(volume)
+    return flat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--volumes', type=int, default=10, help='Volumes in the series')
+    parser.add_argument('--chapters', type=int, default=20, help='Chapters per volume (at most 99)')
+    parser.add_argument('--paragraphs', type=int, default=500, help='Paragraphs per chapter')
+    parser.add_argument('--max-memory-chars', type=int, default=4_000_000, help='Spill threshold of the store')
+    args = parser.parse_args()
+
+    print(f"series: {args.volumes} volumes x {args.chapters} chapters x {args.paragraphs} paragraphs")
+    print(f"{'variant':<8} {'pairs':>8} {'seconds':>8} {'peak MB':>8} {'held MB':>8} {'range ms':>9}")
+    for variant in ('list', 'store'):
+        tracemalloc.start()
+        start = time.perf_counter()
+        pairs = align_series(variant, args)
+        elapsed = time.perf_counter() - start
+        held, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        total = len(pairs) if variant == 'store' else sum(len(volume) for volume in pairs)
+        middle = total // 2
+        range_time, sample = best_of(lambda: read_range(variant, pairs, middle, 1000))
+        assert len(sample) == 1000
+        print(f"{variant:<8} {total:>8} {elapsed:>8.2f} {peak / 1e6:>8.1f} {held / 1e6:>8.1f} "
+              f"{range_time * 1000:>9.2f}")
+        if variant == 'store':
+            pairs.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""Measure sentence splitting throughput of the built-in splitter (and lingtrain if installed).
+
+Splits the English and Chinese halves of a synthetic parallel book and
+reports MB/s (UTF-8) and the number of sentences found.
+
+Usage:
+    python -m benchmarks.bench_sentence_splitter --chapters 40 --paragraphs 1000
+"""
+
+import argparse
+
+from bilingual_reader.sentence_splitter import HAS_LINGTRAIN, get_splitter
+
+from .common import best_of, make_parallel_book
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--chapters', type=int, default=40, help='Chapters in the book (at most 99)')
+    parser.add_argument('--paragraphs', type=int, default=1000, help='Paragraphs per chapter')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per splitter (best is reported)')
+    args = parser.parse_args()
+
+    text1, text2 = make_parallel_book(args.chapters, args.paragraphs)
+    splitters = ['builtin'] + (['lingtrain'] if HAS_LINGTRAIN else [])
+    if not HAS_LINGTRAIN:
+        print("lingtrain-aligner is not installed; only the built-in splitter is measured")
+
+    print(f"{'splitter':<10} {'lang':<5} {'MB':>6} {'seconds':>9} {'MB/s':>8} {'sentences':>10}")
+    for name in splitters:
+        _, split_function = get_splitter(name)
+        for lang, text in (('en', text1), ('zh', text2)):
+            megabytes = len(text.encode('utf-8')) / 1e6
+            elapsed, sentences = best_of(lambda: split_function(text, lang), args.repeat)
+            print(f"{name:<10} {lang:<5} {megabytes:>6.1f} {elapsed:>9.3f} "
+                  f"{megabytes / elapsed:>8.1f} {len(sentences):>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Measure sentence splitting with and without the per-paragraph split cache.
+
+Runs: no cache; a first run that fills an on-disk store; a rerun with a new
+cache object on the same store (as a second CLI run would); and a rerun
+after a share of the paragraphs was edited. lingtrain's splitter is used
+when it is installed, otherwise the built-in splitter (much cheaper, so
+the cache saves less).
+
+Usage:
+    python -m benchmarks.bench_split_cache --chapters 20 --paragraphs 400
+"""
+
+import argparse
+import os
+import random
+import tempfile
+
+from bilingual_reader.sentence_splitter import get_splitter
+from bilingual_reader.split_cache import SplitCache
+
+from .common import best_of, make_parallel_book
+
+SPLITTER_NAME, split_function = get_splitter('auto')
+
+
+def edit_paragraphs(text: str, share: float, seed: int = 0) -> str:
+    """Append a word to a random share of the paragraphs."""
+    rng = random.Random(seed)
+    paragraphs = text.split('\n\n')
+    return '\n\n'.join(
+        paragraph + ' edited.' if rng.random() < share else paragraph
+        for paragraph in paragraphs
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--chapters', type=int, default=20, help='Chapters in the book (at most 99)')
+    parser.add_argument('--paragraphs', type=int, default=400, help='Paragraphs per chapter')
+    parser.add_argument('--edit-share', type=float, default=0.01, help='Share of paragraphs edited for the rerun')
+    args = parser.parse_args()
+
+    text, _ = make_parallel_book(args.chapters, args.paragraphs)
+    edited = edit_paragraphs(text, args.edit_share)
+    print(f"book: {len(text) / 1e6:.1f}M chars, {text.count(chr(10) * 2) + 1} paragraphs, "
+          f"splitter: {SPLITTER_NAME}")
+    print(f"{'run':<26} {'seconds':>9} {'split':>7}")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store_path = os.path.join(temp_dir, 'splits.sqlite')
+
+        elapsed, _ = best_of(lambda: split_function(text, 'en'), 1)
+        print(f"{'no cache (whole text)':<26} {elapsed:>9.3f} {'all':>7}")
+
+        for label, run_text in (('first run, empty store', text), ('rerun, unchanged', text),
+                                (f'rerun, {args.edit_share:.0%} edited', edited)):
+            with SplitCache(store_path) as cache:
+                elapsed, _ = best_of(lambda: cache.split(run_text, 'en', split_function, SPLITTER_NAME), 1)
+                print(f"{label:<26} {elapsed:>9.3f} {cache.misses:>7}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""Measure peak memory of aligning a book and writing its PDF, listed vs streamed.
+
+"list" aligns the whole main text into a list and then builds the PDF
+story as one list of flowables, as the CLI did before; "stream" passes the
+iterator of align_documents(stream=True) to the PDF generator, so chapters
+are aligned as the layout consumes them and only a window of flowables
+exists at a time. Each variant runs in a fresh process so that peak RSS
+reflects only that variant; the baseline is the RSS after the book is
+built and its chapters indexed.
+
+Usage:
+    python -m benchmarks.bench_streaming_pdf --chapters 40 --paragraphs 300
+"""
+
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+
+from .common import make_parallel_book, peak_rss_mb
+
+
+def _run(variant: str, chapters: int, paragraphs: int, queue) -> None:
+    from bilingual_reader.aligner import BilingualAligner
+    from bilingual_reader.document_structure import DocumentSection
+    from bilingual_reader.pdf_generator import PDFGenerator
+
+    text1, text2 = make_parallel_book(chapters, paragraphs)
+    doc1, doc2 = DocumentSection(main_text=text1), DocumentSection(main_text=text2)
+    doc1.chapters, doc2.chapters
+    baseline = peak_rss_mb()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output = os.path.join(temp_dir, 'book.pdf')
+        start = time.perf_counter()
+        aligned_doc = BilingualAligner().align_documents(
+            doc1, doc2, alignment_mode="paragraph", stream=variant == 'stream'
+        )
+        PDFGenerator(output).generate_pdf_from_aligned_document(aligned_doc)
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(output)
+    queue.put((elapsed, baseline, peak_rss_mb(), size))
+
+
+def measure(variant: str, chapters: int, paragraphs: int):
+    """Run one variant in a spawned child process and return its stats."""
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=_run, args=(variant, chapters, paragraphs, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--chapters', type=int, default=40, help='Chapters per book (at most 99)')
+    parser.add_argument('--paragraphs', type=int, default=300, help='Paragraphs per chapter')
+    args = parser.parse_args()
+
+    print(f"book: {args.chapters} chapters x {args.paragraphs} paragraphs per language")
+    print(f"{'variant':<8} {'seconds':>8} {'base MB':>8} {'peak MB':>8} {'growth':>8} {'PDF MB':>7}")
+    for variant in ('list', 'stream'):
+        elapsed, baseline, peak, size = measure(variant, args.chapters, args.paragraphs)
+        print(f"{variant:<8} {elapsed:>8.2f} {baseline:>8.1f} {peak:>8.1f} {peak - baseline:>8.1f} "
+              f"{size / 1e6:>7.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""Compare per-line regex structure detection with the combined StructureScanner.
+
+The per-line reference tries every pattern against every stripped line and
+recomputes line offsets, as document_structure did before the scanner.
+Both produce the same positions on the synthetic book.
+
+Usage:
+    python -m benchmarks.bench_structure --mb 50
+"""
+
+import argparse
+import re
+from typing import List, Optional, Tuple
+
+from bilingual_reader.document_structure import (
+    BACK_MATTER_PATTERNS,
+    CHAPTER_PATTERNS,
+    detect_main_text_end,
+    detect_main_text_start,
+    find_section_boundaries,
+    get_chapter_info
+)
+
+from .common import SAMPLE_LINE, best_of
+
+CHINESE_LINE = "小王子住在一个很小的星球上，他每天都会清理火山，照顾他的玫瑰花。"
+
+
+def make_book(target_mb: float, lines_per_chapter: int = 400) -> str:
+    """Build a bilingual-looking book of about target_mb megabytes (UTF-8)."""
+    front = "Title Page\n\nCopyright notice.\n\nContents\n"
+    back = "\nAppendix\nSome appendix text.\n\nIndex\n"
+    body_line = f"{SAMPLE_LINE} {CHINESE_LINE}"
+    chapter_bytes = len('\n'.join([body_line] * lines_per_chapter).encode('utf-8'))
+    num_chapters = max(1, int(target_mb * 1024 * 1024 / chapter_bytes))
+
+    chapters = []
+    for chapter_num in range(num_chapters):
+        heading = f"Chapter {chapter_num + 1}" if chapter_num % 2 else f"第{chapter_num + 1}章"
+        chapters.append(heading + '\n' + '\n'.join([body_line] * lines_per_chapter))
+    return front + '\n'.join(chapters) + back
+
+
+# Per-line reference implementations
+
+def _line_matches(patterns: List[str], line_stripped: str) -> bool:
+    return any(re.match(pattern, line_stripped, re.IGNORECASE) for pattern in patterns)
+
+
+def per_line_start(text: str) -> int:
+    lines = text.split('\n')
+    for i, line in enumerate(lines):
+        line_stripped = line.strip()
+        if line_stripped and _line_matches(CHAPTER_PATTERNS, line_stripped):
+            return sum(len(lines[j]) + 1 for j in range(i))
+    return 0
+
+
+def per_line_end(text: str, start_pos: int) -> Optional[int]:
+    lines = text[start_pos:].split('\n')
+    for i, line in enumerate(lines):
+        line_stripped = line.strip()
+        if line_stripped and _line_matches(BACK_MATTER_PATTERNS, line_stripped):
+            return start_pos + sum(len(lines[j]) + 1 for j in range(i))
+    return None
+
+
+def per_line_chapters(text: str) -> List[Tuple[int, str]]:
+    chapters = []
+    char_position = 0
+    for line in text.split('\n'):
+        line_stripped = line.strip()
+        if line_stripped and _line_matches(CHAPTER_PATTERNS, line_stripped):
+            chapters.append((char_position, line_stripped))
+        char_position += len(line) + 1
+    return chapters
+
+
+def per_line_boundaries(text: str) -> Tuple[int, int]:
+    main_start = per_line_start(text)
+    main_end = per_line_end(text, main_start)
+    return main_start, main_end if main_end is not None else len(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--mb', type=float, nargs='+', default=[50.0], help='Text sizes in MB')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per variant (best is reported)')
+    args = parser.parse_args()
+
+    for target_mb in args.mb:
+        text = make_book(target_mb)
+        main_start = per_line_start(text)
+        size_mb = len(text.encode('utf-8')) / (1024 * 1024)
+        print(f"\ntext: {size_mb:.1f} MB, {text.count(chr(10)) + 1} lines")
+        print(f"{'function':<26} {'per-line s':>11} {'scanner s':>10} {'speedup':>8} {'same':>5}")
+
+        cases = [
+            ('detect_main_text_start', lambda: per_line_start(text), lambda: detect_main_text_start(text)),
+            ('detect_main_text_end', lambda: per_line_end(text, main_start),
+             lambda: detect_main_text_end(text, main_start)),
+            ('get_chapter_info', lambda: per_line_chapters(text), lambda: get_chapter_info(text)),
+            ('find_section_boundaries', lambda: per_line_boundaries(text),
+             lambda: find_section_boundaries(text)),
+        ]
+        for name, reference, scanner in cases:
+            reference_time, expected = best_of(reference, args.repeat)
+            scanner_time, result = best_of(scanner, args.repeat)
+            print(f"{name:<26} {reference_time:>11.3f} {scanner_time:>10.3f} "
+                  f"{reference_time / scanner_time:>7.1f}x {str(result == expected):>5}")
+
+
+if __name__ == '__main__':
+    main()
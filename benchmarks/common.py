@@ -0,0 +1,295 @@
+"""Shared helpers for benchmark scripts."""
+
+import os
+import random
+import re
+import tempfile
+import time
+from typing import Callable, List, Tuple
+
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+from reportlab.pdfgen import canvas
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'examples')
+
+SAMPLE_LINE = (
+    "The quick brown fox jumps over the lazy dog while the reader turns the page."
+)
+
+
+def make_synthetic_pdf(path: str, num_pages: int, lines_per_page: int = 40) -> str:
+    """Write a text-only PDF with a fixed amount of text on every page.
+
+    Args:
+        path: Where to write the PDF
+        num_pages: Number of pages to generate
+        lines_per_page: Lines of text on each page
+
+    Returns:
+        The path that was written
+    """
+    pdf = canvas.Canvas(path, pagesize=letter)
+    for page_num in range(num_pages):
+        y = 740
+        pdf.drawString(72, y, f"Chapter {page_num + 1}")
+        for line_num in range(lines_per_page):
+            y -= 16
+            pdf.drawString(72, y, f"{line_num + 1}. {SAMPLE_LINE}")
+        pdf.showPage()
+    pdf.save()
+    return path
+
+
+def make_pdf_from_text(path: str, text: str, lines_per_page: int = 40) -> str:
+    """Render a plain-text file line by line into a PDF.
+
+    Uses a CID font so that Chinese text survives the round trip.
+
+    Args:
+        path: Where to write the PDF
+        text: Text to render
+        lines_per_page: Lines of text on each page
+
+    Returns:
+        The path that was written
+    """
+    if 'STSong-Light' not in pdfmetrics.getRegisteredFontNames():
+        pdfmetrics.registerFont(UnicodeCIDFont('STSong-Light'))
+
+    pdf = canvas.Canvas(path, pagesize=letter)
+    pdf.setFont('STSong-Light', 11)
+    lines = text.split('\n')
+    for page_start in range(0, len(lines), lines_per_page):
+        y = 740
+        for line in lines[page_start:page_start + lines_per_page]:
+            pdf.drawString(72, y, line)
+            y -= 16
+        pdf.showPage()
+    pdf.save()
+    return path
+
+
+def example_pdfs(directory: str) -> List[str]:
+    """Render the bundled .txt examples to PDFs and return their paths."""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for name in sorted(os.listdir(EXAMPLES_DIR)):
+        if not name.endswith('.txt'):
+            continue
+        path = os.path.join(directory, name[:-4] + '.pdf')
+        if not os.path.exists(path):
+            with open(os.path.join(EXAMPLES_DIR, name), 'r', encoding='utf-8') as file:
+                make_pdf_from_text(path, file.read())
+        paths.append(path)
+    return paths
+
+
+def bench_dir() -> str:
+    """Return the directory used to cache generated benchmark inputs."""
+    return os.path.join(tempfile.gettempdir(), 'bilingual_reader_bench')
+
+
+def cached_synthetic_pdf(directory: str, num_pages: int) -> str:
+    """Return a synthetic PDF with num_pages pages, generating it if needed."""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"synthetic_{num_pages}.pdf")
+    if not os.path.exists(path):
+        make_synthetic_pdf(path, num_pages)
+    return path
+
+
+def make_synthetic_epub(path: str, num_chapters: int, paragraphs_per_chapter: int = 60) -> str:
+    """Write a text-only ePub with a fixed amount of text in every chapter.
+
+    The manifest lists the chapters in reverse, so only a reader that
+    follows the spine gets them in reading order.
+
+    Args:
+        path: Where to write the ePub
+        num_chapters: Number of chapter documents to generate
+        paragraphs_per_chapter: Paragraphs in each chapter
+
+    Returns:
+        The path that was written
+    """
+    from ebooklib import epub
+
+    book = epub.EpubBook()
+    book.set_identifier(f'synthetic-{num_chapters}')
+    book.set_title('Synthetic Book')
+    book.set_language('en')
+
+    chapters = []
+    for chapter_num in range(num_chapters):
+        paragraphs = ''.join(
+            f'<p class="body">{paragraph_num + 1}. <em>{SAMPLE_LINE}</em> {SAMPLE_LINE}</p>\n'
+            for paragraph_num in range(paragraphs_per_chapter)
+        )
+        chapter = epub.EpubHtml(
+            uid=f'ch{chapter_num}', title=f'Chapter {chapter_num + 1}',
+            file_name=f'text/ch{chapter_num:04d}.xhtml', lang='en'
+        )
+        chapter.content = f'<html><body><h1>Chapter {chapter_num + 1}</h1>\n{paragraphs}</body></html>'
+        chapters.append(chapter)
+
+    for chapter in reversed(chapters):
+        book.add_item(chapter)
+    book.toc = chapters
+    book.spine = chapters
+    book.add_item(epub.EpubNcx())
+    book.add_item(epub.EpubNav())
+    epub.write_epub(path, book)
+    return path
+
+
+def cached_synthetic_epub(directory: str, num_chapters: int) -> str:
+    """Return a synthetic ePub with num_chapters chapters, generating it if needed."""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"synthetic_{num_chapters}.epub")
+    if not os.path.exists(path):
+        make_synthetic_epub(path, num_chapters)
+    return path
+
+
+def make_image_epub(path: str, num_images: int, image_size: int = 1600) -> str:
+    """Write an ePub with one large, incompressible image per chapter.
+
+    Args:
+        path: Where to write the ePub
+        num_images: Number of chapters, each with one image
+        image_size: Width and height of every image in pixels
+
+    Returns:
+        The path that was written
+    """
+    import io
+    from ebooklib import epub
+    from PIL import Image
+
+    book = epub.EpubBook()
+    book.set_identifier(f'images-{num_images}')
+    book.set_title('Image Book')
+    book.set_language('en')
+
+    chapters = []
+    for image_num in range(num_images):
+        buffer = io.BytesIO()
+        noise = Image.frombytes('RGB', (image_size, image_size), os.urandom(image_size * image_size * 3))
+        noise.save(buffer, format='JPEG', quality=95)
+        book.add_item(epub.EpubItem(
+            uid=f'img{image_num}', file_name=f'images/plate{image_num:04d}.jpg',
+            media_type='image/jpeg', content=buffer.getvalue()
+        ))
+
+        chapter = epub.EpubHtml(
+            uid=f'ch{image_num}', title=f'Plate {image_num + 1}',
+            file_name=f'text/plate{image_num:04d}.xhtml', lang='en'
+        )
+        chapter.content = (
+            f'<html><body><h1>Plate {image_num + 1}</h1><p>{SAMPLE_LINE}</p>'
+            f'<figure><img src="../images/plate{image_num:04d}.jpg" alt=""/>'
+            f'<figcaption>Plate {image_num + 1}</figcaption></figure></body></html>'
+        )
+        book.add_item(chapter)
+        chapters.append(chapter)
+
+    book.toc = chapters
+    book.spine = chapters
+    book.add_item(epub.EpubNcx())
+    book.add_item(epub.EpubNav())
+    epub.write_epub(path, book)
+    return path
+
+
+CHINESE_SAMPLE = "小王子住在一个很小的星球上他每天都会清理火山照顾他的玫瑰花"
+
+_CHINESE_NUMBERS = "零一二三四五六七八九"
+
+# "[chapter.paragraph]" label at the start of every generated paragraph
+_PARAGRAPH_LABEL = re.compile(r'\[(\d+\.\d+)\]')
+
+
+def _chinese_number(number: int) -> str:
+    """Write 1-99 as a Chinese numeral."""
+    tens, units = divmod(number, 10)
+    text = (_CHINESE_NUMBERS[tens] if tens > 1 else '') + ('十' if tens else '')
+    return text + (_CHINESE_NUMBERS[units] if units else '')
+
+
+def make_parallel_book(
+    num_chapters: int,
+    paragraphs_per_chapter: int,
+    drop_rate: float = 0.0,
+    seed: int = 0
+) -> Tuple[str, str]:
+    """Build an English text and a Chinese "translation" with labeled paragraphs.
+
+    Every paragraph starts with a "[chapter.paragraph]" label shared by both
+    languages, so an alignment can be scored with paragraph_accuracy.
+    Paragraph lengths vary, and the Chinese length follows the English one
+    with noise, as in real translations. A share of Chinese paragraphs
+    (drop_rate) is left out to simulate translator omissions.
+
+    Args:
+        num_chapters: Chapters in each book (at most 99)
+        paragraphs_per_chapter: Paragraphs per English chapter
+        drop_rate: Probability that a Chinese paragraph is missing
+        seed: Random seed
+
+    Returns:
+        Tuple of (english_text, chinese_text)
+    """
+    rng = random.Random(seed)
+    chapters1, chapters2 = [], []
+    for chapter in range(1, num_chapters + 1):
+        paragraphs1 = [f"Chapter {chapter}"]
+        paragraphs2 = [f"第{_chinese_number(chapter)}章"]
+        for paragraph in range(1, paragraphs_per_chapter + 1):
+            label = f"[{chapter}.{paragraph}]"
+            words = rng.randint(5, 80)
+            paragraphs1.append(label + ' ' + ' '.join(rng.choice(SAMPLE_LINE.split()) for _ in range(words)))
+            if rng.random() >= drop_rate:
+                chars = max(2, int(words * 1.6 * rng.uniform(0.8, 1.2)))
+                paragraphs2.append(label + ''.join(rng.choice(CHINESE_SAMPLE) for _ in range(chars)) + '。')
+        chapters1.append('\n\n'.join(paragraphs1))
+        chapters2.append('\n\n'.join(paragraphs2))
+    return '\n\n'.join(chapters1), '\n\n'.join(chapters2)
+
+
+def paragraph_accuracy(pairs: List[Tuple[str, str]]) -> float:
+    """Return the share of labeled English paragraphs paired with their translation.
+
+    A pair counts as correct when the labels found on both sides are the
+    same set (merged segments carry several labels).
+    """
+    correct = total = 0
+    for text1, text2 in pairs:
+        labels1 = set(_PARAGRAPH_LABEL.findall(text1))
+        if not labels1:
+            continue
+        total += 1
+        correct += labels1 == set(_PARAGRAPH_LABEL.findall(text2))
+    return correct / total if total else 0.0
+
+
+def best_of(func: Callable[[], object], repeat: int = 3) -> Tuple[float, object]:
+    """Run func repeat times and return (best wall time in seconds, last result)."""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def peak_rss_mb() -> float:
+    """Return this process's peak resident set size in MB (Linux/macOS)."""
+    import resource
+    import sys
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
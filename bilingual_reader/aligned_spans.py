@@ -0,0 +1,446 @@
+"""Aligned pairs stored as spans into the source texts.
+
+An aligned book used to be a list of (str, str) tuples, each a copy of text
+that already exists in the source. AlignedSpans keeps the two source texts
+once and, per pair, a (start, end) span into each, in two int32 arrays: 16
+bytes per pair instead of a tuple and two string objects. Pickling it (to
+send it to or from another process) writes the two texts and the arrays
+instead of hundreds of thousands of small objects.
+
+Pair texts are sliced from the source when they are accessed, with each
+line break (and the whitespace around it) replaced by a space, or removed
+for languages written without spaces, as the sentence splitter does. A
+segment a splitter changed beyond whitespace cannot be found in the source;
+the text of such a pair is kept as a literal string instead.
+"""
+
+import re
+from array import array
+from collections.abc import Sequence as SequenceABC
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+# Languages written without spaces between words (or sentences)
+UNSPACED_LANGUAGES = frozenset(["zh", "ja"])
+
+# Array type code of the spans (a C int, 32 bits on every supported platform)
+SPAN_TYPECODE = 'i'
+
+# Characters a splitter may drop between segments that are still located
+_LOCATE_SLACK = 64
+
+# Leading characters of a segment searched for when resynchronizing
+_HEAD_LENGTH = 16
+
+# Consecutive non-blank lines, from the first to the last non-space character
+_PARAGRAPH = re.compile(r'\S(?:[^\n]*\S)?(?:[^\S\n]*\n[^\S\n]*\S(?:[^\n]*\S)?)*')
+_NON_SPACE = re.compile(r'\S+')
+
+Span = Tuple[int, int]
+
+
+def line_joint(lang: str) -> str:
+    """Return what replaces a line break inside a segment of language lang."""
+    return '' if lang in UNSPACED_LANGUAGES else ' '
+
+
+def join_lines(segment: str, joint: str = ' ') -> str:
+    """Replace every line break in a stripped segment, with the whitespace around it, by joint."""
+    if '\n' not in segment:
+        return segment
+    # Much faster than a regular expression substitution on long texts
+    return joint.join([line for line in map(str.strip, segment.split('\n')) if line])
+
+
+def paragraph_spans(text: str) -> List[Span]:
+    """Return the spans of the paragraphs of text.
+
+    Paragraphs are separated by blank lines; a span runs from the first to
+    the last non-space character of its paragraph.
+    """
+    return [match.span() for match in _PARAGRAPH.finditer(text)]
+
+
+class SpanTexts(SequenceABC):
+    """Read-only sequence of the segments at spans of a text, sliced when accessed."""
+
+    def __init__(self, text: str, spans: List[Span], joint: str = ' '):
+        """Initialize the sequence.
+
+        Args:
+            text: Text the spans are in
+            spans: (start, end) of every segment, stripped
+            joint: What replaces line breaks in a segment (see line_joint)
+        """
+        self.text = text
+        self.spans = spans
+        self.joint = joint
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        start, end = self.spans[index]
+        return join_lines(self.text[start:end], self.joint)
+
+
+class SegmentLocator:
+    """Find the spans of consecutive segments of a text.
+
+    Segments are looked up in text order, each one after the previous one.
+    A segment matches the source when they are equal apart from whitespace
+    at line breaks, so segments whose line breaks were joined by the
+    splitter are found too. A segment that cannot be found is skipped, and
+    the next one is searched for a little further on.
+    """
+
+    def __init__(self, text: str):
+        """Initialize the locator at the start of text.
+
+        Args:
+            text: Text the segments were split from
+        """
+        self.text = text
+        self.position = 0
+        # Characters of segments not found since the last one that was
+        self._skipped = 0
+
+    def locate(self, segment: str) -> Optional[Span]:
+        """Return the span of the next segment in the text.
+
+        Args:
+            segment: Segment that follows the previously located one
+
+        Returns:
+            (start, end) of the stripped segment in the text (empty for an
+            empty segment), or None if it does not occur there
+        """
+        segment = segment.strip()
+        position = self.position
+        if not segment:
+            return position, position
+        # Usually the segment follows after a little whitespace, as it is
+        start = self.text.find(segment, position, position + len(segment) + _LOCATE_SLACK)
+        if start >= 0 and (start == position or self.text[position:start].isspace()):
+            self.position = end = start + len(segment)
+            self._skipped = 0
+            return start, end
+
+        match = _NON_SPACE.search(self.text, position)
+        if match is None:
+            return None
+        start = match.start()
+        end = self._match(segment, start)
+        if end is None:
+            # Resynchronize after text a splitter dropped or changed
+            head = segment.split(None, 1)[0][:_HEAD_LENGTH]
+            limit = start + self._skipped + len(segment) + _LOCATE_SLACK
+            start = self.text.find(head, start + 1, limit)
+            while start >= 0:
+                end = self._match(segment, start)
+                if end is not None:
+                    break
+                start = self.text.find(head, start + 1, limit)
+            if end is None:
+                self._skipped += len(segment)
+                return None
+        self.position = end
+        self._skipped = 0
+        return start, end
+
+    def _match(self, segment: str, start: int) -> Optional[int]:
+        """Return where segment ends if it matches the text at start, line by line."""
+        text = self.text
+        index, position, length = 0, start, len(segment)
+        while True:
+            remaining = length - index
+            newline = text.find('\n', position, position + remaining)
+            if newline < 0:
+                if text.startswith(segment[index:], position):
+                    return position + remaining
+                return None
+            line_end = newline
+            while line_end > position and text[line_end - 1].isspace():
+                line_end -= 1
+            if not segment.startswith(text[position:line_end], index):
+                return None
+            index += line_end - position
+            while index < length and segment[index].isspace():
+                index += 1
+            if index == length:
+                return line_end
+            match = _NON_SPACE.search(text, newline)
+            if match is None:
+                return None
+            position = match.start()
+
+
+def locate_segments(text: str, segments: Sequence[str]) -> List[Optional[Span]]:
+    """Return the span of every segment of text (see SegmentLocator.locate)."""
+    locator = SegmentLocator(text)
+    find = text.find
+    spans = []
+    for segment in segments:
+        # Inlined fast path of locate: the segment follows as it is
+        position = locator.position
+        end = position + len(segment)
+        start = find(segment, position, end + _LOCATE_SLACK) if segment else -1
+        if start >= 0 and (start == position or text[position:start].isspace()) and \
+                not (segment[0].isspace() or segment[-1].isspace()):
+            locator.position = end = start + len(segment)
+            locator._skipped = 0
+            spans.append((start, end))
+        else:
+            spans.append(locator.locate(segment))
+    return spans
+
+
+def join_segments(
+    text: str,
+    segments: Sequence[str],
+    spans: Sequence[Optional[Span]],
+    start: int,
+    end: int,
+    separator: str
+) -> Tuple[Span, Optional[str]]:
+    """Join segments[start:end] of a text into the text of one pair.
+
+    Args:
+        text: Text the segments were split from
+        segments: Segments of the text
+        spans: Their spans, from locate_segments
+        start: First segment of the pair
+        end: End (exclusive) of the pair's segments
+        separator: What joins segments when they are not contiguous in text
+
+    Returns:
+        Tuple of (span, literal): the span of the joined segments in text,
+        and None, or, if they are not one span of text apart from
+        whitespace, the best span there is and the joined segments
+    """
+    if end - start == 1 and spans[start]:
+        return spans[start], None
+    if start == end:
+        position = spans[start - 1][1] if start and spans[start - 1] else 0
+        return (position, position), None
+    located = [span for span in spans[start:end] if span]
+    if len(located) == end - start and all(
+        not text[before[1]:after[0]].strip() for before, after in zip(located, located[1:])
+    ):
+        return (located[0][0], located[-1][1]), None
+    span = (located[0][0], located[-1][1]) if located else (0, 0)
+    return span, separator.join(segment.strip() for segment in segments[start:end])
+
+
+def _side_text(text: str, spans: array, literals: Dict[int, str], joint: str, index: int) -> str:
+    """Return one side of pair index."""
+    if literals and index in literals:
+        return literals[index]
+    return join_lines(text[spans[2 * index]:spans[2 * index + 1]], joint)
+
+
+def _side_texts(text: str, spans: array, literals: Dict[int, str], joint: str) -> Iterator[str]:
+    """Yield one side of every pair, in order."""
+    bounds = iter(spans)
+    for index, (start, end) in enumerate(zip(bounds, bounds)):
+        if literals and index in literals:
+            yield literals[index]
+            continue
+        segment = text[start:end]
+        yield join_lines(segment, joint) if '\n' in segment else segment
+
+
+def _bisect_pairs(spans: array, position: int, field: int, strict: bool) -> int:
+    """Return the first pair whose start (field 0) or end (field 1) is at or past position (past if strict)."""
+    low, high = 0, len(spans) // 2
+    while low < high:
+        middle = (low + high) // 2
+        value = spans[2 * middle + field]
+        if value > position or (value == position and not strict):
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+class AlignedSpans:
+    """List-like sequence of aligned pairs kept as spans into two source texts.
+
+    Indexing and iterating yield (text1, text2) tuples like the list that
+    align_texts returns; pair_spans gives the spans themselves. Containers
+    compare equal to any sequence of the same pairs.
+    """
+
+    def __init__(self, text1: str, text2: str, lang1: str = "en", lang2: str = "zh"):
+        """Initialize an empty container over two source texts.
+
+        Args:
+            text1: Source text in the first language
+            text2: Source text in the second language
+            lang1: Language code of text1 (decides how line breaks are joined)
+            lang2: Language code of text2
+        """
+        self.text1 = text1
+        self.text2 = text2
+        self.lang1 = lang1
+        self.lang2 = lang2
+        # start, end of pair 0, start, end of pair 1, ...
+        self.spans1 = array(SPAN_TYPECODE)
+        self.spans2 = array(SPAN_TYPECODE)
+        # Pair index -> text, for pairs whose segments are not spans of the source
+        self.literals1: Dict[int, str] = {}
+        self.literals2: Dict[int, str] = {}
+
+    def append(self, span1: Span, span2: Span, literal1: Optional[str] = None, literal2: Optional[str] = None):
+        """Append one pair.
+
+        Args:
+            span1: (start, end) of the pair's text in text1
+            span2: (start, end) of the pair's text in text2
+            literal1: Text used instead of span1, if the pair's text is not a span of text1
+            literal2: Text used instead of span2
+        """
+        index = len(self)
+        self.spans1.extend(span1)
+        self.spans2.extend(span2)
+        if literal1 is not None:
+            self.literals1[index] = literal1
+        if literal2 is not None:
+            self.literals2[index] = literal2
+
+    def detach(self) -> Tuple[array, array, Dict[int, str], Dict[int, str]]:
+        """Return the spans and literals without the source texts (see extend_spans)."""
+        return self.spans1, self.spans2, self.literals1, self.literals2
+
+    def extend_spans(
+        self,
+        spans1: Sequence[int],
+        spans2: Sequence[int],
+        literals1: Optional[Dict[int, str]] = None,
+        literals2: Optional[Dict[int, str]] = None,
+        offset1: int = 0,
+        offset2: int = 0
+    ):
+        """Append pairs given as detached spans.
+
+        Args:
+            spans1: Flat (start, end) spans into text1[offset1:]
+            spans2: Flat (start, end) spans into text2[offset2:]
+            literals1: Pair index (within these pairs) -> literal text1
+            literals2: Pair index (within these pairs) -> literal text2
+            offset1: Position in text1 the spans1 are relative to
+            offset2: Position in text2 the spans2 are relative to
+        """
+        base = len(self)
+        self.spans1.extend(spans1 if not offset1 else array(SPAN_TYPECODE, [v + offset1 for v in spans1]))
+        self.spans2.extend(spans2 if not offset2 else array(SPAN_TYPECODE, [v + offset2 for v in spans2]))
+        for index, literal in (literals1 or {}).items():
+            self.literals1[base + index] = literal
+        for index, literal in (literals2 or {}).items():
+            self.literals2[base + index] = literal
+
+    def extend(self, other: 'AlignedSpans', offset1: int = 0, offset2: int = 0):
+        """Append the pairs of other, whose texts start at offset1 and offset2 of these texts."""
+        self.extend_spans(*other.detach(), offset1=offset1, offset2=offset2)
+
+    def pair_spans(self, index: int) -> Tuple[Span, Span]:
+        """Return the (start, end) spans of one pair in text1 and text2."""
+        index = self._index(index)
+        spans1, spans2 = self.spans1, self.spans2
+        return (spans1[2 * index], spans1[2 * index + 1]), (spans2[2 * index], spans2[2 * index + 1])
+
+    def pairs_touching(self, side: int, start: int, end: int) -> Tuple[int, int]:
+        """Return the range (first, stop) of the pairs whose span in one text touches [start, end].
+
+        Pairs are in text order on both sides, so the range is found by
+        bisection. A pair touches if it ends at or after start and starts
+        at or before end; if none does, first == stop is where one would go.
+
+        Args:
+            side: 1 for text1, 2 for text2
+            start: Start of the range of the text
+            end: End of the range (inclusive)
+        """
+        spans = self.spans1 if side == 1 else self.spans2
+        return _bisect_pairs(spans, start, 1, False), _bisect_pairs(spans, end, 0, True)
+
+    def splice(
+        self,
+        first: int,
+        stop: int,
+        replacement: 'AlignedSpans',
+        shift1: int = 0,
+        shift2: int = 0
+    ) -> 'AlignedSpans':
+        """Return these pairs with pairs[first:stop] replaced, over the texts of replacement.
+
+        Pairs before first keep their spans, so the texts must be unchanged
+        before them; pairs from stop on are moved by shift1 and shift2, the
+        change in length of the texts before them.
+
+        Args:
+            first: First pair replaced
+            stop: End (exclusive) of the pairs replaced
+            replacement: The new pairs, as spans of the new texts
+            shift1: Characters added to text1 before pair stop (negative if removed)
+            shift2: Characters added to text2 before pair stop
+
+        Returns:
+            A new AlignedSpans over replacement.text1 and replacement.text2
+        """
+        result = AlignedSpans(replacement.text1, replacement.text2, self.lang1, self.lang2)
+        result.spans1 = self.spans1[:2 * first]
+        result.spans2 = self.spans2[:2 * first]
+        result.literals1 = {index: literal for index, literal in self.literals1.items() if index < first}
+        result.literals2 = {index: literal for index, literal in self.literals2.items() if index < first}
+        result.extend(replacement)
+        tail1, tail2 = self.spans1[2 * stop:], self.spans2[2 * stop:]
+        result.extend_spans(
+            tail1, tail2,
+            {index - stop: literal for index, literal in self.literals1.items() if index >= stop},
+            {index - stop: literal for index, literal in self.literals2.items() if index >= stop},
+            offset1=shift1, offset2=shift2
+        )
+        return result
+
+    def _index(self, index: int) -> int:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("aligned pair index out of range")
+        return index
+
+    def _pair(self, index: int) -> Tuple[str, str]:
+        return (
+            _side_text(self.text1, self.spans1, self.literals1, line_joint(self.lang1), index),
+            _side_text(self.text2, self.spans2, self.literals2, line_joint(self.lang2), index),
+        )
+
+    def __len__(self) -> int:
+        return len(self.spans1) // 2
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Tuple[str, str], 'AlignedSpans']:
+        if isinstance(index, slice):
+            result = AlignedSpans(self.text1, self.text2, self.lang1, self.lang2)
+            for position in range(*index.indices(len(self))):
+                result.append(*self.pair_spans(position), self.literals1.get(position), self.literals2.get(position))
+            return result
+        return self._pair(self._index(index))
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        return zip(
+            _side_texts(self.text1, self.spans1, self.literals1, line_joint(self.lang1)),
+            _side_texts(self.text2, self.spans2, self.literals2, line_joint(self.lang2)),
+        )
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (AlignedSpans, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"AlignedSpans({len(self)} pairs, {len(self.text1)} + {len(self.text2)} characters)"
@@ -1,13 +1,25 @@
 """Module for aligning text from two languages."""
 
-from typing import List, Tuple, NamedTuple, Optional
-try:
-    from lingtrain_aligner import splitter
-    USE_LINGTRAIN = True
-except ImportError:
-    USE_LINGTRAIN = False
-
-from .document_structure import DocumentSection
+import os
+from collections import deque
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Tuple, NamedTuple, Optional, Sequence
+
+from .aligned_spans import (
+    UNSPACED_LANGUAGES,
+    AlignedSpans,
+    Span,
+    SpanTexts,
+    join_segments,
+    line_joint,
+    locate_segments,
+    paragraph_spans
+)
+from .chapter_pairing import chapter_units
+from .document_structure import ChapterIndex, DocumentSection
+from .segment_store import SegmentStore
+from .sentence_splitter import SENTENCE_SPLITTERS, get_splitter, sentence_spans
+from .split_cache import SplitCache, worker_split_cache
+from .text_edits import TextEdit, apply_edits, edited_range
 from .text_extractor import DocumentWithImages
 from .image_extractor import (
     ImageBlock,
@@ -16,38 +28,168 @@ from .image_extractor import (
     match_images_by_proximity
 )
 
+if TYPE_CHECKING:
+    from array import array
+
+    from .embedding_aligner import SegmentEncoder
+
+# How segments are paired within a unit: in order, by Gale-Church length
+# statistics, or by the similarity of sentence embeddings
+ALIGNMENT_STRATEGIES = ("sequential", "length", "embedding")
+
+# (start1, end1, start2, end2): segments [start1:end1] of one text paired with
+# segments [start2:end2] of the other, like length_aligner.Bead
+SegmentBead = Tuple[int, int, int, int]
+
+# Detached spans of one aligned unit, see AlignedSpans.detach
+UnitSpans = Tuple['array', 'array', Dict[int, str], Dict[int, str]]
+
 
 class AlignedDocument(NamedTuple):
-    """Structure for aligned bilingual documents with front/main/back matter."""
+    """Structure for aligned bilingual documents with front/main/back matter.
+
+    main_text is an AlignedSpans, a list-like sequence of pairs kept as
+    spans of the two main texts, an iterator of pairs when the documents
+    were aligned with stream=True, or the SegmentStore they were aligned into.
+    """
 
     front_matter: List[Tuple[str, str]]
-    main_text: List[Tuple[str, str]]
+    main_text: Iterable[Tuple[str, str]]
     back_matter: List[Tuple[str, str]]
 
 
 class AlignedDocumentWithImages(NamedTuple):
-    """Structure for aligned bilingual documents with images."""
+    """Structure for aligned bilingual documents with images (main_text as in AlignedDocument)."""
 
     front_matter: List[Tuple[str, str]]
-    main_text: List[Tuple[str, str]]
+    main_text: Iterable[Tuple[str, str]]
     back_matter: List[Tuple[str, str]]
     matched_images: List[Tuple[ImageBlock, ImageBlock]]
     unmatched_images1: List[ImageBlock]
     unmatched_images2: List[ImageBlock]
 
 
+def align_unit(
+    lang1: str,
+    lang2: str,
+    text1: str,
+    text2: str,
+    alignment_mode: str,
+    strategy: str = "sequential",
+    split_store: Optional[str] = None,
+    splitter: str = "auto"
+) -> UnitSpans:
+    """Align one pair of chapter units.
+
+    Kept at module level so it can be pickled into worker processes. Only
+    the spans of the pairs are sent back; the parent already has the texts.
+
+    Args:
+        lang1: Language code of text1
+        lang2: Language code of text2
+        text1: Text in first language
+        text2: Text in second language
+        alignment_mode: "sentence" or "paragraph" alignment
+        strategy: "sequential" or "length" segment pairing ("embedding"
+            units are aligned in the parent process, see align_chapters)
+        split_store: Path of the sentence split store shared with the parent
+        splitter: Sentence splitter name (see sentence_splitter.get_splitter)
+
+    Returns:
+        The aligned pairs as spans of text1 and text2 (see AlignedSpans.detach)
+    """
+    aligner = BilingualAligner(
+        lang1=lang1, lang2=lang2, strategy=strategy,
+        split_cache=worker_split_cache(split_store), splitter=splitter
+    )
+    return aligner.align_spans(text1, text2, alignment_mode).detach()
+
+
+def _has_content(segments: Sequence[str], spans: List[Optional[Span]]) -> List[bool]:
+    """Return whether each segment has content (located spans are already stripped)."""
+    return [span[0] < span[1] if span else bool(segments[index].strip()) for index, span in enumerate(spans)]
+
+
+def _sequential_beads(content1: List[bool], content2: List[bool]) -> List[SegmentBead]:
+    """Pair segments in order, leaving one side empty where a text has fewer.
+
+    Only pairs where at least one segment has content are kept.
+    """
+    count1, count2 = len(content1), len(content2)
+    common = min(count1, count2)
+    beads = [(i, i + 1, i, i + 1) for i in range(common) if content1[i] or content2[i]]
+    beads.extend((i, i + 1, count2, count2) for i in range(common, count1) if content1[i])
+    beads.extend((count1, count1, i, i + 1) for i in range(common, count2) if content2[i])
+    return beads
+
+
 class BilingualAligner:
     """Align texts in two languages."""
 
-    def __init__(self, lang1: str = "en", lang2: str = "zh"):
+    # Below this many chapter units per worker, process start-up costs more than it saves
+    MIN_UNITS_PER_WORKER = 4
+
+    # Chapter units each worker aligns ahead of a consumer of iter_align
+    LOOKAHEAD_UNITS_PER_WORKER = 2
+
+    # Segments encoded per call of the model with the "embedding" strategy
+    EMBEDDING_BATCH_SEGMENTS = 8192
+
+    # Unchanged pairs realigned on each side of an edit by realign
+    REALIGN_CONTEXT_PAIRS = 2
+
+    def __init__(
+        self,
+        lang1: str = "en",
+        lang2: str = "zh",
+        workers: int = 1,
+        by_chapter: bool = True,
+        strategy: str = "sequential",
+        split_cache: Optional[SplitCache] = None,
+        splitter: str = "auto",
+        encoder: Optional['SegmentEncoder'] = None
+    ):
         """Initialize the aligner with language codes.
         
         Args:
             lang1: Language code for first language (default: "en")
             lang2: Language code for second language (default: "zh")
+            workers: Worker processes for aligning chapters (1 = serial, 0 or less = one per CPU)
+            by_chapter: Pair chapters across the two documents and align each
+                pair separately (default: True)
+            strategy: How segments are paired: "sequential" pairs them in
+                order, "length" finds 1:1, 1:2, 2:1, 1:0 and 0:1 pairs from
+                segment lengths, "embedding" finds them from the similarity
+                of sentence embeddings (default: "sequential")
+            split_cache: Memoizes sentence splits per paragraph across texts
+                and runs (default: no caching)
+            splitter: Sentence splitter for sentence mode: "builtin",
+                "lingtrain", or "auto" for lingtrain when it is installed
+                (default: "auto")
+            encoder: Encodes segments for the "embedding" strategy
+                (default: the default sentence-transformers model, loaded on
+                first use, with an in-memory embedding store)
+
+        Raises:
+            ValueError: If strategy is not one of ALIGNMENT_STRATEGIES, or
+                splitter is not one of SENTENCE_SPLITTERS
         """
+        if strategy not in ALIGNMENT_STRATEGIES:
+            raise ValueError(
+                f"Unknown alignment strategy {strategy!r}; expected one of {', '.join(ALIGNMENT_STRATEGIES)}"
+            )
+        if splitter not in SENTENCE_SPLITTERS:
+            raise ValueError(
+                f"Unknown sentence splitter {splitter!r}; expected one of {', '.join(SENTENCE_SPLITTERS)}"
+            )
         self.lang1 = lang1
         self.lang2 = lang2
+        self.workers = workers
+        self.by_chapter = by_chapter
+        self.strategy = strategy
+        self.split_cache = split_cache
+        self.splitter = splitter
+        self.encoder = encoder
 
     def align_texts(
         self,
@@ -57,9 +199,12 @@ class BilingualAligner:
     ) -> List[Tuple[str, str]]:
         """Align two texts at sentence or paragraph level.
         
-        This method uses a simple sequential alignment strategy where
-        segments from both texts are paired in order. For more complex
-        alignment, consider using lingtrain-aligner's full workflow.
+        With the "sequential" strategy segments from both texts are paired
+        in order. With the "length" strategy segments are aligned by their
+        lengths (see length_aligner), and with the "embedding" strategy by
+        the similarity of their sentence embeddings (see embedding_aligner),
+        so a segment missing from one text or split in two only affects its
+        own pair; segments that end up in the same pair are joined.
         
         Args:
             text1: Text in first language
@@ -68,71 +213,477 @@ class BilingualAligner:
             
         Returns:
             List of tuples containing aligned text segments
+
+        Raises:
+            ImportError: If sentence mode uses the lingtrain splitter, or the
+                embedding strategy uses sentence-transformers, and it is not installed
+        """
+        return list(self.align_spans(text1, text2, alignment_mode))
+
+    def align_spans(self, text1: str, text2: str, alignment_mode: str = "sentence") -> AlignedSpans:
+        """Align two texts like align_texts, keeping the pairs as spans of the texts.
+
+        Args:
+            text1: Text in first language
+            text2: Text in second language
+            alignment_mode: "sentence" or "paragraph" alignment
+
+        Returns:
+            AlignedSpans over text1 and text2, equal to the list align_texts returns
+
+        Raises:
+            ImportError: As for align_texts
+        """
+        segments1, spans1 = self._split(text1, self.lang1, alignment_mode)
+        segments2, spans2 = self._split(text2, self.lang2, alignment_mode)
+        return self._span_pairs(text1, text2, segments1, spans1, segments2, spans2)
+
+    def realign(
+        self,
+        previous: AlignedSpans,
+        edits1: Sequence[TextEdit] = (),
+        edits2: Sequence[TextEdit] = (),
+        alignment_mode: str = "sentence"
+    ) -> AlignedSpans:
+        """Update an alignment after its source texts were edited, realigning only near the edits.
+
+        The pairs touching an edit, and REALIGN_CONTEXT_PAIRS unchanged
+        pairs on each side of them, are realigned from the edited texts;
+        the pairs before and after are kept, moved by the change in length.
+        Edits far apart in one text are realigned as one window spanning
+        them, so several distant changes are best applied in separate calls.
+        With the sequential strategy a segment added or removed leaves a
+        pair with an empty side in the window, where aligning the texts
+        from scratch would shift every later pair.
+
+        Args:
+            previous: Alignment of the texts before the edits, as returned by
+                align_spans, align_chapters or align_documents
+            edits1: Edits of previous.text1, in text order (see text_edits.diff_texts)
+            edits2: Edits of previous.text2, in text order
+            alignment_mode: "sentence" or "paragraph", as previous was aligned
+
+        Returns:
+            AlignedSpans over the edited texts
+
+        Raises:
+            ValueError: If edits overlap, are out of order or lie outside their text
+        """
+        text1, text2 = apply_edits(previous.text1, edits1), apply_edits(previous.text2, edits2)
+        if not (edits1 or edits2):
+            return previous
+
+        count = len(previous)
+        first, stop = count, 0
+        shifts = []
+        for side, edits in ((1, edits1), (2, edits2)):
+            if not edits:
+                shifts.append(0)
+                continue
+            start, end, shift = edited_range(edits)
+            side_first, side_stop = previous.pairs_touching(side, start, end)
+            first, stop = min(first, side_first), max(stop, side_stop)
+            shifts.append(shift)
+        first = max(0, first - self.REALIGN_CONTEXT_PAIRS)
+        stop = min(count, stop + self.REALIGN_CONTEXT_PAIRS)
+
+        # The window runs from the end of the last pair kept before it to the
+        # start of the first pair kept after it, in the edited texts
+        bounds = []
+        for spans, text, shift in zip((previous.spans1, previous.spans2), (text1, text2), shifts):
+            begin = spans[2 * first - 1] if first else 0
+            finish = spans[2 * stop] + shift if stop < count else len(text)
+            bounds.append((begin, finish))
+        (begin1, finish1), (begin2, finish2) = bounds
+
+        # The few segments of the window would give the length aligner a
+        # poor estimate of the length ratio; the whole texts give a good one
+        window1, window2 = text1[begin1:finish1], text2[begin2:finish2]
+        segments1, spans1 = self._split(window1, self.lang1, alignment_mode)
+        segments2, spans2 = self._split(window2, self.lang2, alignment_mode)
+        length_ratio = len(text2) / len(text1) if text1 and text2 else None
+        window = AlignedSpans(text1, text2, self.lang1, self.lang2)
+        window.extend(
+            self._span_pairs(window1, window2, segments1, spans1, segments2, spans2, length_ratio),
+            offset1=begin1, offset2=begin2
+        )
+        return previous.splice(first, stop, window, *shifts)
+
+    def _split(self, text: str, lang: str, alignment_mode: str) -> Tuple[Sequence[str], List[Optional[Span]]]:
+        """Split a text into sentences or paragraphs and find their spans (None if not found).
+
+        Paragraphs, and sentences from the built-in splitter, come with their
+        spans; their text is only sliced if a strategy needs it.
         """
-        # Split texts based on alignment mode
         if alignment_mode == "paragraph":
-            segments1 = self._split_paragraphs(text1)
-            segments2 = self._split_paragraphs(text2)
-        else:  # sentence mode
-            if not USE_LINGTRAIN:
-                raise ImportError(
-                    "lingtrain-aligner is required for sentence-level alignment. "
-                    "Install it with: pip install lingtrain-aligner"
-                )
-            segments1 = splitter.split_by_sentences_wrapper(text1, self.lang1)
-            segments2 = splitter.split_by_sentences_wrapper(text2, self.lang2)
-
-        # Simple sequential alignment
-        # Pair segments in order, padding with empty strings if lengths differ
-        max_len = max(len(segments1), len(segments2))
-        result = []
-        
-        for i in range(max_len):
-            seg1 = segments1[i] if i < len(segments1) else ""
-            seg2 = segments2[i] if i < len(segments2) else ""
-            
-            # Only add if at least one segment has content
-            if seg1.strip() or seg2.strip():
-                result.append((seg1.strip(), seg2.strip()))
-        
-        return result
+            spans = paragraph_spans(text)
+            return SpanTexts(text, spans), spans
+        if self.split_cache is None and get_splitter(self.splitter)[0] == "builtin":
+            spans = sentence_spans(text, lang)
+            return SpanTexts(text, spans, line_joint(lang)), spans
+        segments = self._split_sentences(text, lang)
+        return segments, locate_segments(text, segments)
+
+    def _span_pairs(
+        self,
+        text1: str,
+        text2: str,
+        segments1: Sequence[str],
+        spans1: List[Optional[Span]],
+        segments2: Sequence[str],
+        spans2: List[Optional[Span]],
+        length_ratio: Optional[float] = None
+    ) -> AlignedSpans:
+        """Pair the segments of two texts and record each pair as spans of the texts.
+
+        length_ratio is passed to the length aligner (default: the ratio of
+        the segment lengths of the two texts).
+        """
+        if self.strategy == "sequential":
+            beads = _sequential_beads(_has_content(segments1, spans1), _has_content(segments2, spans2))
+        else:
+            # The length and embedding aligners only pair segments with content
+            spans1 = [span for span, segment in zip(spans1, segments1) if segment.strip()]
+            spans2 = [span for span, segment in zip(spans2, segments2) if segment.strip()]
+            segments1 = [segment.strip() for segment in segments1 if segment.strip()]
+            segments2 = [segment.strip() for segment in segments2 if segment.strip()]
+            beads = self._align_segments(segments1, segments2, length_ratio)
+
+        # Segments that end up in the same pair are joined
+        separator1 = "" if self.lang1 in UNSPACED_LANGUAGES else " "
+        separator2 = "" if self.lang2 in UNSPACED_LANGUAGES else " "
+        flat1, flat2, literals1, literals2 = [], [], {}, {}
+        for index, (start1, end1, start2, end2) in enumerate(beads):
+            # Inlined for the common pair of one located segment per side
+            if end1 - start1 == 1 and spans1[start1]:
+                span1, literal1 = spans1[start1], None
+            else:
+                span1, literal1 = join_segments(text1, segments1, spans1, start1, end1, separator1)
+            if end2 - start2 == 1 and spans2[start2]:
+                span2, literal2 = spans2[start2], None
+            else:
+                span2, literal2 = join_segments(text2, segments2, spans2, start2, end2, separator2)
+            flat1.extend(span1)
+            flat2.extend(span2)
+            if literal1 is not None:
+                literals1[index] = literal1
+            if literal2 is not None:
+                literals2[index] = literal2
+
+        pairs = AlignedSpans(text1, text2, self.lang1, self.lang2)
+        pairs.extend_spans(flat1, flat2, literals1, literals2)
+        return pairs
+
+    def _align_segments(
+        self,
+        segments1: List[str],
+        segments2: List[str],
+        length_ratio: Optional[float] = None
+    ) -> List[SegmentBead]:
+        """Pair stripped, non-empty segments with the "length" or "embedding" strategy."""
+        if self.strategy == "length":
+            return self._align_by_length(segments1, segments2, length_ratio)
+        return self._align_by_embedding(segments1, segments2)
+
+    def _split_sentences(self, text: str, lang: str) -> List[str]:
+        """Split a text into sentences, through the split cache if any.
+
+        Raises:
+            ImportError: If the lingtrain splitter was requested but is not installed
+        """
+        name, split_function = get_splitter(self.splitter)
+        if self.split_cache is not None:
+            return self.split_cache.split(text, lang, split_function, splitter_name=name)
+        return split_function(text, lang)
+
+    def _align_by_length(
+        self,
+        segments1: List[str],
+        segments2: List[str],
+        ratio: Optional[float] = None
+    ) -> List[SegmentBead]:
+        """Pair segments with the Gale-Church length aligner.
+
+        Args:
+            segments1: Stripped, non-empty segments of the first text
+            segments2: Stripped, non-empty segments of the second text
+            ratio: Expected characters of text 2 per character of text 1
+                (default: the ratio of the total segment lengths)
+
+        Returns:
+            Beads of consecutive segments; a segment without a counterpart
+            is paired with an empty range
+        """
+        # Imported here because NumPy is only needed by this strategy
+        from .length_aligner import align_lengths
+
+        return align_lengths(
+            [len(segment) for segment in segments1], [len(segment) for segment in segments2], ratio=ratio
+        )
+
+    def _embedding_encoder(self) -> 'SegmentEncoder':
+        """Return the segment encoder, creating the default one on first use."""
+        if self.encoder is None:
+            from .embedding_aligner import SegmentEncoder
+
+            self.encoder = SegmentEncoder()
+        return self.encoder
+
+    def _align_by_embedding(self, segments1: List[str], segments2: List[str]) -> List[SegmentBead]:
+        """Pair segments by the similarity of their sentence embeddings.
+
+        Args:
+            segments1: Stripped, non-empty segments of the first text
+            segments2: Stripped, non-empty segments of the second text
+
+        Returns:
+            Beads of consecutive segments; a segment without a counterpart
+            is paired with an empty range
+
+        Raises:
+            ImportError: If no encoder was given and sentence-transformers is not installed
+        """
+        # The embedding module loads NumPy and looks up sentence-transformers,
+        # which the other strategies never need
+        from .embedding_aligner import align_embeddings
+
+        encoder = self._embedding_encoder()
+        return align_embeddings(encoder.encode(segments1), encoder.encode(segments2))
+
+    def align_chapters(
+        self,
+        text1: str,
+        text2: str,
+        chapters1: ChapterIndex,
+        chapters2: ChapterIndex,
+        alignment_mode: str = "sentence"
+    ) -> AlignedSpans:
+        """Align two texts chapter by chapter.
+
+        Chapters are paired across the languages by their normalized
+        headings (see chapter_pairing), and each pair is aligned on its own,
+        so a segment missing in one chapter does not shift the pairs of the
+        chapters after it. Pairs are aligned in worker processes when the
+        aligner has more than one worker (except with the "embedding"
+        strategy, which encodes the segments of many pairs in one batched
+        pass in this process); results are concatenated in order.
+
+        Args:
+            text1: Text in first language
+            text2: Text in second language
+            chapters1: Chapter index of text1
+            chapters2: Chapter index of text2
+            alignment_mode: "sentence" or "paragraph" alignment
+
+        Returns:
+            AlignedSpans over text1 and text2 (a list-like sequence of pairs)
+        """
+        pairs = AlignedSpans(text1, text2, self.lang1, self.lang2)
+        for unit in self._iter_unit_spans(text1, text2, alignment_mode, chapters1, chapters2):
+            pairs.extend(unit)
+        return pairs
+
+    def iter_align(
+        self,
+        text1: str,
+        text2: str,
+        alignment_mode: str = "sentence",
+        chapters1: Optional[ChapterIndex] = None,
+        chapters2: Optional[ChapterIndex] = None
+    ) -> Iterator[Tuple[str, str]]:
+        """Yield the aligned pairs of two texts as they are aligned.
+
+        With chapter indexes the texts are aligned chapter pair by chapter
+        pair, as in align_chapters, and the pairs of each chapter are yielded
+        as soon as it is aligned; only LOOKAHEAD_UNITS_PER_WORKER chapter
+        pairs per worker are aligned ahead of the consumer, so memory does
+        not grow with the length of the book. Without chapter indexes the
+        whole texts are aligned at once, as in align_texts.
+
+        Args:
+            text1: Text in first language
+            text2: Text in second language
+            alignment_mode: "sentence" or "paragraph" alignment
+            chapters1: Chapter index of text1 (default: align the whole texts)
+            chapters2: Chapter index of text2
+
+        Yields:
+            Tuples of aligned text segments, in text order
+        """
+        if chapters1 is None or chapters2 is None:
+            yield from self.align_spans(text1, text2, alignment_mode)
+            return
+        for unit in self._iter_unit_spans(text1, text2, alignment_mode, chapters1, chapters2):
+            yield from unit
+
+    def _iter_unit_spans(
+        self,
+        text1: str,
+        text2: str,
+        alignment_mode: str,
+        chapters1: ChapterIndex,
+        chapters2: ChapterIndex
+    ) -> Iterator[AlignedSpans]:
+        """Align the chapter pairs of two texts, yielding the pairs of each as spans of text1 and text2."""
+        units = chapter_units(chapters1, chapters2)
+        unit_texts = ((text1[start1:end1], text2[start2:end2]) for (start1, end1), (start2, end2) in units)
+
+        workers = self.workers
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(units) // self.MIN_UNITS_PER_WORKER)
+
+        if self.strategy == "embedding":
+            results = self._iter_embedding_units(unit_texts, alignment_mode)
+        elif workers > 1:
+            results = self._iter_parallel_units(unit_texts, alignment_mode, workers)
+        else:
+            results = (self.align_spans(unit1, unit2, alignment_mode).detach() for unit1, unit2 in unit_texts)
+
+        for spans, ((start1, _), (start2, _)) in zip(results, units):
+            unit = AlignedSpans(text1, text2, self.lang1, self.lang2)
+            unit.extend_spans(*spans, offset1=start1, offset2=start2)
+            yield unit
+
+    def _iter_parallel_units(
+        self,
+        unit_texts: Iterable[Tuple[str, str]],
+        alignment_mode: str,
+        workers: int
+    ) -> Iterator[UnitSpans]:
+        """Align chapter pairs in worker processes, keeping a bounded number in flight."""
+        # Imported here because multiprocessing is slow to import and only used in parallel
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Workers open the on-disk split store themselves; a memory-only cache is not shared
+        split_store = self.split_cache.path if self.split_cache is not None else None
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for unit1, unit2 in unit_texts:
+                pending.append(executor.submit(
+                    align_unit, self.lang1, self.lang2, unit1, unit2,
+                    alignment_mode, self.strategy, split_store, self.splitter
+                ))
+                if len(pending) >= workers * self.LOOKAHEAD_UNITS_PER_WORKER:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def _iter_embedding_units(
+        self,
+        unit_texts: Iterable[Tuple[str, str]],
+        alignment_mode: str
+    ) -> Iterator[UnitSpans]:
+        """Align chapter pairs with the embedding strategy, encoding them in batches.
+
+        The model is loaded once, in this process. Segments of consecutive
+        units are collected until there are EMBEDDING_BATCH_SEGMENTS of them,
+        encoded in one call, and then the units are aligned.
+        """
+        encoder = self._embedding_encoder()
+        window = []
+        count = 0
+        for unit1, unit2 in unit_texts:
+            split1 = self._split(unit1, self.lang1, alignment_mode)
+            split2 = self._split(unit2, self.lang2, alignment_mode)
+            window.append((unit1, unit2, split1, split2))
+            count += len(split1[0]) + len(split2[0])
+            if count >= self.EMBEDDING_BATCH_SEGMENTS:
+                yield from self._align_embedding_window(encoder, window)
+                window, count = [], 0
+        yield from self._align_embedding_window(encoder, window)
+
+    def _align_embedding_window(self, encoder, window) -> Iterator[UnitSpans]:
+        """Encode the segments of several units in one call, then align each unit."""
+        encoder.encode([
+            segment.strip()
+            for _, _, (segments1, _), (segments2, _) in window
+            for segments in (segments1, segments2) for segment in segments if segment.strip()
+        ])
+        for unit1, unit2, (segments1, spans1), (segments2, spans2) in window:
+            yield self._span_pairs(unit1, unit2, segments1, spans1, segments2, spans2).detach()
+
+    def _iter_main_text(
+        self,
+        doc1: DocumentSection,
+        doc2: DocumentSection,
+        alignment_mode: str
+    ) -> Iterator[Tuple[str, str]]:
+        """Yield the aligned pairs of the main texts of two documents, by chapter when enabled."""
+        if not (doc1.part_length('main_text') or doc2.part_length('main_text')):
+            return
+        if self.by_chapter:
+            yield from self.iter_align(
+                doc1.main_text, doc2.main_text, alignment_mode, doc1.chapters, doc2.chapters
+            )
+        else:
+            yield from self.align_spans(doc1.main_text, doc2.main_text, alignment_mode=alignment_mode)
+
+    def _align_main_text(
+        self,
+        doc1: DocumentSection,
+        doc2: DocumentSection,
+        alignment_mode: str,
+        stream: bool = False,
+        store: Optional[SegmentStore] = None
+    ) -> Iterable[Tuple[str, str]]:
+        """Align the main texts of two documents, as AlignedSpans, an iterator (stream) or into store."""
+        if stream and store is not None:
+            raise ValueError("stream and store cannot be combined; iterate over the store instead")
+        if store is not None:
+            store.extend(self._iter_main_text(doc1, doc2, alignment_mode))
+            return store
+        if stream:
+            return self._iter_main_text(doc1, doc2, alignment_mode)
+        text1, text2 = doc1.main_text, doc2.main_text
+        if not (text1 or text2):
+            return AlignedSpans(text1, text2, self.lang1, self.lang2)
+        if self.by_chapter:
+            return self.align_chapters(text1, text2, doc1.chapters, doc2.chapters, alignment_mode)
+        return self.align_spans(text1, text2, alignment_mode=alignment_mode)
 
     def align_documents(
         self,
         doc1: DocumentSection,
         doc2: DocumentSection,
-        alignment_mode: str = "sentence"
+        alignment_mode: str = "sentence",
+        stream: bool = False,
+        store: Optional[SegmentStore] = None
     ) -> AlignedDocument:
         """Align two structured documents with front matter, main text, and back matter.
 
         Front and back matter are concatenated side-by-side (not sentence-aligned).
-        Main text is aligned sentence-by-sentence or paragraph-by-paragraph.
+        Main text is aligned sentence-by-sentence or paragraph-by-paragraph,
+        within paired chapters unless the aligner was created with by_chapter=False.
 
         Args:
             doc1: First document section (typically English)
             doc2: Second document section (typically Chinese)
             alignment_mode: "sentence" or "paragraph" alignment for main text
+            stream: Return main_text as an iterator that aligns the main text
+                as it is consumed (see iter_align), so a consumer such as
+                PDFGenerator overlaps alignment with its own work
+            store: Append the main text pairs to this SegmentStore as they
+                are aligned and return it as main_text, so their memory is
+                bounded by the store's threshold; cannot be combined with stream
 
         Returns:
             AlignedDocument with front_matter, main_text, and back_matter aligned
+
+        Raises:
+            ValueError: If both stream and store are given
         """
         # Handle front matter - simple concatenation (side-by-side)
         front_matter_aligned = []
-        if doc1.front_matter or doc2.front_matter:
+        if doc1.part_length('front_matter') or doc2.part_length('front_matter'):
             front_matter_aligned = [(doc1.front_matter, doc2.front_matter)]
 
-        # Handle main text - sentence/paragraph alignment
-        main_text_aligned = []
-        if doc1.main_text or doc2.main_text:
-            main_text_aligned = self.align_texts(
-                doc1.main_text,
-                doc2.main_text,
-                alignment_mode=alignment_mode
-            )
+        # Handle main text - sentence/paragraph alignment, chapter by chapter
+        main_text_aligned = self._align_main_text(doc1, doc2, alignment_mode, stream, store)
 
         # Handle back matter - simple concatenation (side-by-side)
         back_matter_aligned = []
-        if doc1.back_matter or doc2.back_matter:
+        if doc1.part_length('back_matter') or doc2.part_length('back_matter'):
             back_matter_aligned = [(doc1.back_matter, doc2.back_matter)]
 
         return AlignedDocument(
@@ -146,7 +697,9 @@ class BilingualAligner:
         doc1: DocumentWithImages,
         doc2: DocumentWithImages,
         alignment_mode: str = "sentence",
-        image_match_mode: str = "inline"
+        image_match_mode: str = "inline",
+        stream: bool = False,
+        store: Optional[SegmentStore] = None
     ) -> AlignedDocumentWithImages:
         """Align two documents with images.
 
@@ -155,27 +708,26 @@ class BilingualAligner:
             doc2: Second document with images
             alignment_mode: "sentence" or "paragraph" alignment for text
             image_match_mode: "inline", "position", "page", or "proximity" for images
+            stream: Return main_text as an iterator (see align_documents)
+            store: Align main_text into this SegmentStore (see align_documents)
 
         Returns:
             AlignedDocumentWithImages with aligned text and images
+
+        Raises:
+            ValueError: If both stream and store are given
         """
         # Handle front matter - simple concatenation (side-by-side)
         front_matter_aligned = []
-        if doc1.front_matter or doc2.front_matter:
+        if doc1.part_length('front_matter') or doc2.part_length('front_matter'):
             front_matter_aligned = [(doc1.front_matter, doc2.front_matter)]
 
-        # Handle main text - sentence/paragraph alignment
-        main_text_aligned = []
-        if doc1.main_text or doc2.main_text:
-            main_text_aligned = self.align_texts(
-                doc1.main_text,
-                doc2.main_text,
-                alignment_mode=alignment_mode
-            )
+        # Handle main text - sentence/paragraph alignment, chapter by chapter
+        main_text_aligned = self._align_main_text(doc1, doc2, alignment_mode, stream, store)
 
         # Handle back matter - simple concatenation (side-by-side)
         back_matter_aligned = []
-        if doc1.back_matter or doc2.back_matter:
+        if doc1.part_length('back_matter') or doc2.part_length('back_matter'):
             back_matter_aligned = [(doc1.back_matter, doc2.back_matter)]
 
         # Handle images
@@ -210,29 +762,14 @@ class BilingualAligner:
             unmatched_images2=unmatched_images2
         )
 
-    def _split_paragraphs(self, text: str) -> List[str]:
+    def _split_paragraphs(self, text: str, lang: str) -> List[str]:
         """Split text into paragraphs.
         
         Args:
             text: Text to split
+            lang: Language code of text
             
         Returns:
-            List of paragraphs
+            List of paragraphs, with the lines of each joined as in paragraph mode
         """
-        # Split by double newlines or multiple newlines
-        paragraphs = []
-        current_para = []
-        
-        for line in text.split('\n'):
-            line = line.strip()
-            if line:
-                current_para.append(line)
-            elif current_para:
-                paragraphs.append(' '.join(current_para))
-                current_para = []
-        
-        # Add last paragraph if exists
-        if current_para:
-            paragraphs.append(' '.join(current_para))
-        
-        return [p for p in paragraphs if p]
+        return list(SpanTexts(text, paragraph_spans(text), line_joint(lang)))
@@ -0,0 +1,245 @@
+"""Content-addressed on-disk cache for structure-aware extraction results.
+
+Entries are keyed by a hash of the input file's bytes plus the extraction
+parameters, so renaming or touching a file does not invalidate its entry
+and editing it does. Each entry stores the extracted text, the main text
+boundaries, the chapter index and the optimized images; the least
+recently used entries are evicted once the cache grows past its size
+limit.
+"""
+
+import hashlib
+import io
+import json
+import os
+import re
+import shutil
+import tempfile
+from typing import List, NamedTuple, Optional
+
+from .document_structure import ChapterIndex
+from .image_extractor import ImageBlock
+from .split_cache import SPLIT_STORE_NAME
+
+# Bump when the stored layout or the extraction output changes
+CACHE_VERSION = 5
+
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3  # 2 GB
+
+# Names of what the cache creates in its directory: entries (named by
+# make_key), temporary directories of interrupted writes, and the sentence
+# split store (with the journal files SQLite keeps beside it) and embedding
+# stores kept beside the entries. Anything else in the directory is left alone.
+_ENTRY_NAME = re.compile(r'[0-9a-f]{64}')
+_TEMP_NAME = re.compile(r'\.tmp-.*')
+_STORE_NAME = re.compile(re.escape(SPLIT_STORE_NAME) + r'(?:-journal|-wal|-shm)?|\.embeddings-.*\.(?:npy|keys)')
+
+
+def default_cache_dir() -> str:
+    """Return the default cache directory (under $XDG_CACHE_HOME or ~/.cache)."""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'bilingual_reader', 'extraction')
+
+
+def hash_file(file_path: str, block_size: int = 1024 * 1024) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class CachedExtraction(NamedTuple):
+    """An extraction result loaded from the cache."""
+
+    text: str
+    main_start: int
+    main_end: int
+    images: List[ImageBlock]
+    chapters: Optional[ChapterIndex] = None  # Chapters of the stripped main text
+
+
+class ExtractionCache:
+    """Size-bounded LRU cache of extraction results on disk."""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the entries (default: default_cache_dir())
+            max_bytes: Total size above which least recently used entries are evicted
+        """
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def make_key(self, file_path: str, **params) -> str:
+        """Build the cache key for a file and a set of extraction parameters.
+
+        Args:
+            file_path: Path to the input file
+            **params: Extraction parameters that affect the result (JSON-serializable)
+
+        Returns:
+            Hex digest identifying the entry
+        """
+        payload = json.dumps(
+            {'version': CACHE_VERSION, 'content': hash_file(file_path), 'params': params},
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _entry_dir(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key)
+
+    def get(self, key: str) -> Optional[CachedExtraction]:
+        """Load an entry and mark it as recently used.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            CachedExtraction, or None if there is no (readable) entry
+        """
+        from PIL import Image
+
+        entry_dir = self._entry_dir(key)
+        meta_path = os.path.join(entry_dir, 'meta.json')
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as file:
+                meta = json.load(file)
+            with open(os.path.join(entry_dir, 'text.txt'), 'r', encoding='utf-8', newline='') as file:
+                text = file.read()
+
+            images = []
+            for image_meta in meta['images']:
+                with open(os.path.join(entry_dir, image_meta['file']), 'rb') as file:
+                    pil_image = Image.open(io.BytesIO(file.read()))
+                    pil_image.load()
+                images.append(ImageBlock(
+                    image=pil_image,
+                    caption=image_meta['caption'],
+                    position=image_meta['position'],
+                    page=image_meta['page'],
+                    index=image_meta['index']
+                ))
+        except (OSError, ValueError, KeyError) as e:
+            if os.path.exists(entry_dir):
+                print(f"Warning: Ignoring unreadable cache entry {key}: {e}")
+            return None
+
+        # Last use is tracked through the metadata file's modification time
+        os.utime(meta_path)
+        chapters = meta.get('chapters')
+        return CachedExtraction(
+            text=text,
+            main_start=meta['main_start'],
+            main_end=meta['main_end'],
+            images=images,
+            chapters=ChapterIndex.from_dict(chapters) if chapters is not None else None
+        )
+
+    def put(
+        self,
+        key: str,
+        text: str,
+        main_start: int,
+        main_end: int,
+        images: List[ImageBlock],
+        chapters: Optional[ChapterIndex] = None
+    ):
+        """Store an extraction result, then evict old entries if over the size limit.
+
+        Args:
+            key: Key from make_key
+            text: Full extracted text
+            main_start: Character position where main text starts
+            main_end: Character position where back matter starts
+            images: Extracted (already optimized) images
+            chapters: Chapter index of the main text (optional)
+        """
+        # Write into a temporary directory and rename it into place, so a
+        # concurrent reader never sees a half-written entry
+        temp_dir = tempfile.mkdtemp(prefix='.tmp-', dir=self.cache_dir)
+        try:
+            with open(os.path.join(temp_dir, 'text.txt'), 'w', encoding='utf-8', newline='') as file:
+                file.write(text)
+
+            images_meta = []
+            for number, image in enumerate(images):
+                file_name = f'image_{number}.png'
+                # PNG is lossless, so the cached pixels match the extracted ones
+                image.image.save(os.path.join(temp_dir, file_name), format='PNG')
+                images_meta.append({
+                    'file': file_name,
+                    'caption': image.caption,
+                    'position': image.position,
+                    'page': image.page,
+                    'index': image.index
+                })
+
+            with open(os.path.join(temp_dir, 'meta.json'), 'w', encoding='utf-8') as file:
+                json.dump({
+                    'version': CACHE_VERSION,
+                    'main_start': main_start,
+                    'main_end': main_end,
+                    'images': images_meta,
+                    'chapters': chapters.to_dict() if chapters is not None else None
+                }, file)
+
+            entry_dir = self._entry_dir(key)
+            if os.path.exists(entry_dir):
+                shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(temp_dir, entry_dir)
+        except BaseException:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            raise
+
+        self.evict()
+
+    def _is_entry(self, name: str) -> bool:
+        """Return whether name is a complete entry of the cache directory."""
+        return bool(_ENTRY_NAME.fullmatch(name)) and os.path.isfile(os.path.join(self.cache_dir, name, 'meta.json'))
+
+    def _entries(self):
+        """Return (last_used, size, path) for every complete entry."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not self._is_entry(name):
+                continue
+            entry_dir = os.path.join(self.cache_dir, name)
+            size = sum(
+                os.path.getsize(os.path.join(entry_dir, file_name))
+                for file_name in os.listdir(entry_dir)
+            )
+            entries.append((os.path.getmtime(os.path.join(entry_dir, 'meta.json')), size, entry_dir))
+        return entries
+
+    def size(self) -> int:
+        """Return the total size of all entries in bytes."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits in max_bytes."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry_dir in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        """Remove every entry, leftovers of interrupted writes and the stores kept beside the entries.
+
+        Only what the cache created is removed, since cache_dir may be a
+        directory that also holds other files.
+        """
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if os.path.isdir(path):
+                if self._is_entry(name) or _TEMP_NAME.fullmatch(name):
+                    shutil.rmtree(path, ignore_errors=True)
+            elif _STORE_NAME.fullmatch(name):
+                os.remove(path)
@@ -0,0 +1,261 @@
+"""Pair the chapters of two translations of a book.
+
+Chapter headings are normalized to a language-independent key such as
+("chapter", 12), so that "Chapter 12", "CHAPTER XII", "Chapter Twelve" and
+"第十二章" all match. Matching keys, taken in reading order, anchor the two
+texts to each other; the text between consecutive anchors forms one unit
+that can be aligned independently of the rest of the book.
+"""
+
+import re
+from difflib import SequenceMatcher
+from typing import List, Optional, Tuple
+
+from .document_structure import ChapterIndex
+
+_CHINESE_DIGITS = {
+    '零': 0, '〇': 0, '一': 1, '二': 2, '两': 2, '三': 3, '四': 4,
+    '五': 5, '六': 6, '七': 7, '八': 8, '九': 9,
+}
+_CHINESE_UNITS = {'十': 10, '百': 100, '千': 1000}
+
+_ROMAN_VALUES = {'i': 1, 'v': 5, 'x': 10, 'l': 50, 'c': 100, 'd': 500, 'm': 1000}
+_ROMAN_NUMERAL = re.compile(r'^m{0,4}(cm|cd|d?c{0,3})(xc|xl|l?x{0,3})(ix|iv|v?i{0,3})$')
+
+_ENGLISH_UNITS = {
+    'zero': 0, 'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5, 'six': 6,
+    'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10, 'eleven': 11, 'twelve': 12,
+    'thirteen': 13, 'fourteen': 14, 'fifteen': 15, 'sixteen': 16,
+    'seventeen': 17, 'eighteen': 18, 'nineteen': 19,
+}
+_ENGLISH_TENS = {
+    'twenty': 20, 'thirty': 30, 'forty': 40, 'fifty': 50,
+    'sixty': 60, 'seventy': 70, 'eighty': 80, 'ninety': 90,
+}
+_ENGLISH_ORDINALS = {
+    'first': 1, 'second': 2, 'third': 3, 'fourth': 4, 'fifth': 5, 'sixth': 6,
+    'seventh': 7, 'eighth': 8, 'ninth': 9, 'tenth': 10, 'eleventh': 11,
+    'twelfth': 12, 'thirteenth': 13, 'fourteenth': 14, 'fifteenth': 15,
+    'sixteenth': 16, 'seventeenth': 17, 'eighteenth': 18, 'nineteenth': 19,
+    'twentieth': 20, 'thirtieth': 30, 'fortieth': 40, 'fiftieth': 50,
+}
+
+# Heading word -> kind of division
+_ENGLISH_KINDS = {
+    'chapter': 'chapter', 'ch': 'chapter', 'part': 'part', 'book': 'book',
+    'volume': 'book', 'vol': 'book', 'section': 'section',
+}
+_CHINESE_KINDS = {
+    '章': 'chapter', '回': 'chapter', '节': 'section', '部分': 'part',
+    '部': 'part', '篇': 'part', '卷': 'book',
+}
+
+# Unnumbered divisions that appear once per book
+_NAMED_DIVISIONS = [
+    (re.compile(r'^(prologue|序章|楔子)', re.IGNORECASE), 'prologue'),
+    (re.compile(r'^(epilogue|终章|尾声)', re.IGNORECASE), 'epilogue'),
+    (re.compile(r'^(introduction|引言|导言)', re.IGNORECASE), 'introduction'),
+    (re.compile(r'^(preface|前言|序言)', re.IGNORECASE), 'preface'),
+]
+
+_CHINESE_NUMBER = r'[零〇一二两三四五六七八九十百千万\d０-９]+'
+
+_ENGLISH_HEADING = re.compile(
+    r'^(chapter|ch\.|part|book|volume|vol\.|section)\s*(?:the\s+)?'
+    r'(\d+|[a-z]+(?:[\s-][a-z]+)?)\b',
+    re.IGNORECASE
+)
+_CHINESE_HEADING = re.compile(rf'^第\s*({_CHINESE_NUMBER})\s*(部分|[章回节部篇卷])')
+_CHINESE_PREFIX_HEADING = re.compile(rf'^([卷篇])\s*({_CHINESE_NUMBER})')
+_NUMBERED_HEADING = re.compile(rf'^({_CHINESE_NUMBER})\s*[\.、]')
+
+ChapterKey = Tuple[str, int]
+
+
+def parse_chinese_numeral(numeral: str) -> Optional[int]:
+    """Parse a Chinese (or Arabic) numeral such as "十二", "一百零五" or "１２".
+
+    Args:
+        numeral: The numeral, without surrounding text
+
+    Returns:
+        The value, or None if numeral is not a number
+    """
+    if not numeral:
+        return None
+    if numeral.isdigit():
+        # int() accepts full-width and other Unicode decimal digits
+        return int(numeral)
+
+    total = section = digit = 0
+    seen = False
+    for char in numeral:
+        if char in _CHINESE_DIGITS:
+            digit = _CHINESE_DIGITS[char]
+        elif char in _CHINESE_UNITS:
+            # A bare unit counts as one of it ("十二" is 12)
+            section += (digit or 1) * _CHINESE_UNITS[char]
+            digit = 0
+        elif char == '万':
+            total += (section + digit) * 10000
+            section = digit = 0
+        else:
+            return None
+        seen = True
+    return total + section + digit if seen else None
+
+
+def parse_roman_numeral(numeral: str) -> Optional[int]:
+    """Parse a Roman numeral such as "XII" (case-insensitive).
+
+    Args:
+        numeral: The numeral, without surrounding text
+
+    Returns:
+        The value, or None if numeral is not a Roman numeral
+    """
+    numeral = numeral.lower()
+    if not numeral or not _ROMAN_NUMERAL.match(numeral):
+        return None
+
+    values = [_ROMAN_VALUES[char] for char in numeral]
+    total = 0
+    for value, following in zip(values, values[1:] + [0]):
+        total += -value if value < following else value
+    return total
+
+
+def parse_english_number(words: str) -> Optional[int]:
+    """Parse an English cardinal or ordinal below 100, such as "twelve" or "twenty-first".
+
+    Args:
+        words: The number words, separated by a space or hyphen
+
+    Returns:
+        The value, or None if words is not a number
+    """
+    parts = re.split(r'[\s-]+', words.strip().lower())
+    if len(parts) == 1:
+        word = parts[0]
+        for table in (_ENGLISH_UNITS, _ENGLISH_TENS, _ENGLISH_ORDINALS):
+            if word in table:
+                return table[word]
+        return None
+    if len(parts) == 2 and parts[0] in _ENGLISH_TENS:
+        unit = _ENGLISH_UNITS.get(parts[1], _ENGLISH_ORDINALS.get(parts[1]))
+        if unit is not None and 0 < unit < 10:
+            return _ENGLISH_TENS[parts[0]] + unit
+    return None
+
+
+def _parse_english_ordinal(token: str) -> Optional[int]:
+    """Parse the number after an English heading word ("12", "XII", "Twelve")."""
+    if token.isdigit():
+        return int(token)
+    number = parse_english_number(token)
+    if number is None:
+        # "Chapter Twelve Begins" matches "Twelve Begins"; the number is the first word
+        first_word = re.split(r'[\s-]', token)[0]
+        number = parse_english_number(first_word)
+        if number is None:
+            number = parse_roman_numeral(first_word)
+    return number
+
+
+def chapter_key(title: str) -> Optional[ChapterKey]:
+    """Normalize a chapter heading to a language-independent key.
+
+    Args:
+        title: Heading line, e.g. "Chapter 12", "CHAPTER XII" or "第十二章"
+
+    Returns:
+        Tuple of (kind, number) such as ("chapter", 12), or None if the
+        heading carries no recognizable number
+    """
+    title = title.strip()
+
+    match = _CHINESE_HEADING.match(title)
+    if match:
+        number = parse_chinese_numeral(match.group(1))
+        return (_CHINESE_KINDS[match.group(2)], number) if number is not None else None
+
+    match = _CHINESE_PREFIX_HEADING.match(title)
+    if match:
+        number = parse_chinese_numeral(match.group(2))
+        return (_CHINESE_KINDS[match.group(1)], number) if number is not None else None
+
+    match = _ENGLISH_HEADING.match(title)
+    if match:
+        number = _parse_english_ordinal(match.group(2))
+        if number is not None:
+            return _ENGLISH_KINDS[match.group(1).lower().rstrip('.')], number
+
+    match = _NUMBERED_HEADING.match(title)
+    if match:
+        number = parse_chinese_numeral(match.group(1))
+        return ('chapter', number) if number is not None else None
+
+    for pattern, kind in _NAMED_DIVISIONS:
+        if pattern.match(title):
+            return kind, 0
+    return None
+
+
+def pair_chapters(titles1: List[str], titles2: List[str]) -> List[Tuple[int, int]]:
+    """Pair chapters of two books by their normalized headings.
+
+    Keys are matched in reading order with difflib's sequence matcher, so
+    a chapter missing from one book or numbering that restarts in later
+    parts does not pair chapters out of order. When no heading carries a key but
+    both books have the same number of chapters, they are paired by index.
+
+    Args:
+        titles1: Chapter titles of the first book, in text order
+        titles2: Chapter titles of the second book, in text order
+
+    Returns:
+        List of (index1, index2) pairs, increasing in both indexes
+    """
+    # Headings without a key never match anything
+    keys1 = [chapter_key(title) or ('?1', i) for i, title in enumerate(titles1)]
+    keys2 = [chapter_key(title) or ('?2', i) for i, title in enumerate(titles2)]
+
+    matcher = SequenceMatcher(None, keys1, keys2, autojunk=False)
+    pairs = [
+        (block.a + offset, block.b + offset)
+        for block in matcher.get_matching_blocks()
+        for offset in range(block.size)
+    ]
+    if not pairs and titles1 and len(titles1) == len(titles2):
+        pairs = [(i, i) for i in range(len(titles1))]
+    return pairs
+
+
+def chapter_units(
+    chapters1: ChapterIndex,
+    chapters2: ChapterIndex
+) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+    """Cut two texts into units that can be aligned independently.
+
+    Each paired chapter starts a unit that runs until the next paired
+    chapter, so unpaired chapters stay with the unit before them. Text
+    before the first pair forms its own unit. The units cover both texts
+    completely and in order.
+
+    Args:
+        chapters1: Chapter index of the first text
+        chapters2: Chapter index of the second text
+
+    Returns:
+        List of ((start1, end1), (start2, end2)) spans; a single unit
+        covering both texts if no chapters could be paired
+    """
+    length1, length2 = chapters1.text_length, chapters2.text_length
+    pairs = pair_chapters(chapters1.titles, chapters2.titles)
+    anchors = [(chapters1.starts[i], chapters2.starts[j]) for i, j in pairs]
+
+    if not anchors or anchors[0] != (0, 0):
+        anchors.insert(0, (0, 0))
+    ends = anchors[1:] + [(length1, length2)]
+
+    return [((start1, end1), (start2, end2)) for (start1, start2), (end1, end2) in zip(anchors, ends)]
@@ -2,9 +2,10 @@
 
 import click
 import os
+from .cache import ExtractionCache
 from .text_extractor import TextExtractor
 from .aligner import BilingualAligner
-from .pdf_generator import PDFGenerator
+from .split_cache import SPLIT_STORE_NAME, SplitCache
 
 
 @click.command()
@@ -83,14 +84,70 @@ from .pdf_generator import PDFGenerator
     default='inline',
     help='Image matching mode: inline (no matching), position, page, or proximity (default: inline)'
 )
+@click.option(
+    '--strategy',
+    type=click.Choice(['sequential', 'length', 'embedding'], case_sensitive=False),
+    default='sequential',
+    help='Segment pairing: sequential (in order), length (Gale-Church length-based alignment) '
+         'or embedding (sentence embedding similarity; needs sentence-transformers) (default: sequential)'
+)
+@click.option(
+    '--embedding-model',
+    default=None,
+    help='sentence-transformers model for --strategy embedding '
+         '(default: sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2)'
+)
+@click.option(
+    '--splitter',
+    type=click.Choice(['auto', 'builtin', 'lingtrain'], case_sensitive=False),
+    default='auto',
+    help='Sentence splitter for sentence mode (default: auto, lingtrain if installed, else builtin)'
+)
+@click.option(
+    '--workers',
+    type=int,
+    default=1,
+    help='Worker processes for PDF and ePub text extraction and chapter alignment (0 = one per CPU, default: 1)'
+)
+@click.option(
+    '--pdf-backend',
+    type=click.Choice(['auto', 'fitz', 'pypdf2'], case_sensitive=False),
+    default='auto',
+    help='PDF text extraction backend (default: auto, the fastest installed)'
+)
+@click.option(
+    '--cache/--no-cache',
+    default=False,
+    help='Reuse extraction results for unchanged input files, and sentence splits and embeddings '
+         'for unchanged segments (default: disabled)'
+)
+@click.option(
+    '--cache-dir',
+    type=click.Path(file_okay=False),
+    default=None,
+    help='Directory for the extraction cache (default: ~/.cache/bilingual_reader/extraction)'
+)
+@click.option(
+    '--cache-max-mb',
+    type=int,
+    default=2048,
+    help='Evict least recently used cache entries above this size in MB (default: 2048)'
+)
+@click.option(
+    '--clear-cache',
+    is_flag=True,
+    default=False,
+    help='Empty the extraction cache before running'
+)
 def main(input1, input2, output, lang1, lang2, mode, title, detect_structure,
          start_marker1, start_marker2, end_marker1, end_marker2,
-         extract_images, image_match_mode):
+         extract_images, image_match_mode, strategy, embedding_model, splitter, workers, pdf_backend,
+         cache, cache_dir, cache_max_mb, clear_cache):
     """Generate a bilingual PDF with aligned text from two language sources.
 
     This tool reads books in two different languages (PDF, ePub, or txt format)
     and creates a PDF where the text alternates between the two languages
-    at the sentence or paragraph level using Lingtrain Aligner.
+    at the sentence or paragraph level.
 
     With structure detection enabled (default), the tool automatically identifies
     front matter (preface, TOC), main text, and back matter (appendix, notes),
@@ -103,154 +160,206 @@ def main(input1, input2, output, lang1, lang2, mode, title, detect_structure,
         bilingual-pdf --input1 book_en.pdf --input2 book_zh.pdf --output out.pdf \\
             --start-marker1 "Chapter 1" --start-marker2 "第一章"
     """
+    # reportlab and PIL are slow to import, so they are not loaded for --help
+    from .pdf_generator import PDFGenerator
+
     click.echo("Bilingual PDF Generator")
     click.echo("=" * 50)
 
-    if detect_structure:
-        # Extract text with structure detection (and optionally images)
-        extraction_mode = "with images" if extract_images else "text only"
-        click.echo(f"\n1. Extracting {extraction_mode} with structure detection from {input1}...")
-        try:
-            doc1 = TextExtractor.extract_with_structure_and_images(
-                input1,
-                extract_images_flag=extract_images,
-                start_marker=start_marker1,
-                end_marker=end_marker1
-            )
-            click.echo(f"   ✓ Front matter: {len(doc1.front_matter)} chars")
-            click.echo(f"   ✓ Main text: {len(doc1.main_text)} chars")
-            click.echo(f"   ✓ Back matter: {len(doc1.back_matter)} chars")
-            if extract_images:
-                click.echo(f"   ✓ Images: {len(doc1.images)} extracted")
-        except Exception as e:
-            click.echo(f"   ✗ Error extracting from {input1}: {e}", err=True)
-            return
+    extraction_cache = None
+    if cache or clear_cache:
+        extraction_cache = ExtractionCache(cache_dir, max_bytes=cache_max_mb * 1024 * 1024)
+        if clear_cache:
+            extraction_cache.clear()
+            click.echo(f"Cleared extraction cache at {extraction_cache.cache_dir}")
+        if not cache:
+            extraction_cache = None
+
+    # Sentence splits are memoized per paragraph next to the extraction cache
+    split_cache = None
+    if extraction_cache is not None:
+        split_cache = SplitCache(os.path.join(extraction_cache.cache_dir, SPLIT_STORE_NAME))
 
-        click.echo(f"\n2. Extracting {extraction_mode} with structure detection from {input2}...")
-        try:
-            doc2 = TextExtractor.extract_with_structure_and_images(
-                input2,
-                extract_images_flag=extract_images,
-                start_marker=start_marker2,
-                end_marker=end_marker2
+    try:
+        encoder = None
+        if strategy == 'embedding':
+            from .embedding_aligner import (
+                DEFAULT_EMBEDDING_MODEL, EmbeddingStore, SegmentEncoder, embedding_store_name
             )
-            click.echo(f"   ✓ Front matter: {len(doc2.front_matter)} chars")
-            click.echo(f"   ✓ Main text: {len(doc2.main_text)} chars")
-            click.echo(f"   ✓ Back matter: {len(doc2.back_matter)} chars")
-            if extract_images:
-                click.echo(f"   ✓ Images: {len(doc2.images)} extracted")
-        except Exception as e:
-            click.echo(f"   ✗ Error extracting from {input2}: {e}", err=True)
-            return
 
-        # Align documents
-        alignment_info = f"{mode} mode"
-        if extract_images:
-            alignment_info += f", images: {image_match_mode}"
-        click.echo(f"\n3. Aligning documents using {alignment_info}...")
-        try:
-            aligner = BilingualAligner(lang1=lang1, lang2=lang2)
+            embedding_model = embedding_model or DEFAULT_EMBEDDING_MODEL
+            # Embeddings are stored per model next to the extraction cache
+            store = None
+            if extraction_cache is not None:
+                store = EmbeddingStore(os.path.join(extraction_cache.cache_dir, embedding_store_name(embedding_model)))
+            encoder = SegmentEncoder(model_name=embedding_model, store=store)
 
-            if extract_images:
-                aligned_doc = aligner.align_documents_with_images(
-                    doc1, doc2,
-                    alignment_mode=mode,
-                    image_match_mode=image_match_mode
+        if detect_structure:
+            # Extract text with structure detection (and optionally images)
+            extraction_mode = "with images" if extract_images else "text only"
+            click.echo(f"\n1. Extracting {extraction_mode} with structure detection from {input1}...")
+            try:
+                doc1 = TextExtractor.extract_with_structure_and_images(
+                    input1,
+                    extract_images_flag=extract_images,
+                    start_marker=start_marker1,
+                    end_marker=end_marker1,
+                    workers=workers,
+                    pdf_backend=pdf_backend,
+                    cache=extraction_cache
                 )
-                click.echo(f"   ✓ Front matter: {len(aligned_doc.front_matter)} sections")
-                click.echo(f"   ✓ Main text: {len(aligned_doc.main_text)} aligned segments")
-                click.echo(f"   ✓ Back matter: {len(aligned_doc.back_matter)} sections")
-                click.echo(f"   ✓ Matched images: {len(aligned_doc.matched_images)}")
-                click.echo(f"   ✓ Unmatched images (doc1): {len(aligned_doc.unmatched_images1)}")
-                click.echo(f"   ✓ Unmatched images (doc2): {len(aligned_doc.unmatched_images2)}")
-            else:
-                # Convert DocumentWithImages to DocumentSection for backward compatibility
-                from .document_structure import DocumentSection
-                doc_section1 = DocumentSection(
-                    front_matter=doc1.front_matter,
-                    main_text=doc1.main_text,
-                    back_matter=doc1.back_matter
+                click.echo(f"   ✓ Front matter: {doc1.part_length('front_matter')} chars")
+                click.echo(f"   ✓ Main text: {doc1.part_length('main_text')} chars")
+                click.echo(f"   ✓ Back matter: {doc1.part_length('back_matter')} chars")
+                if extract_images:
+                    click.echo(f"   ✓ Images: {len(doc1.images)} extracted")
+            except Exception as e:
+                click.echo(f"   ✗ Error extracting from {input1}: {e}", err=True)
+                return
+
+            click.echo(f"\n2. Extracting {extraction_mode} with structure detection from {input2}...")
+            try:
+                doc2 = TextExtractor.extract_with_structure_and_images(
+                    input2,
+                    extract_images_flag=extract_images,
+                    start_marker=start_marker2,
+                    end_marker=end_marker2,
+                    workers=workers,
+                    pdf_backend=pdf_backend,
+                    cache=extraction_cache
                 )
-                doc_section2 = DocumentSection(
-                    front_matter=doc2.front_matter,
-                    main_text=doc2.main_text,
-                    back_matter=doc2.back_matter
+                click.echo(f"   ✓ Front matter: {doc2.part_length('front_matter')} chars")
+                click.echo(f"   ✓ Main text: {doc2.part_length('main_text')} chars")
+                click.echo(f"   ✓ Back matter: {doc2.part_length('back_matter')} chars")
+                if extract_images:
+                    click.echo(f"   ✓ Images: {len(doc2.images)} extracted")
+            except Exception as e:
+                click.echo(f"   ✗ Error extracting from {input2}: {e}", err=True)
+                return
+
+            # Align documents
+            alignment_info = f"{mode} mode"
+            if extract_images:
+                alignment_info += f", images: {image_match_mode}"
+            click.echo(f"\n3. Aligning documents using {alignment_info}...")
+            try:
+                aligner = BilingualAligner(
+                    lang1=lang1, lang2=lang2, workers=workers, strategy=strategy,
+                    split_cache=split_cache, splitter=splitter, encoder=encoder
                 )
-                aligned_doc = aligner.align_documents(doc_section1, doc_section2, alignment_mode=mode)
-                click.echo(f"   ✓ Front matter: {len(aligned_doc.front_matter)} sections")
-                click.echo(f"   ✓ Main text: {len(aligned_doc.main_text)} aligned segments")
-                click.echo(f"   ✓ Back matter: {len(aligned_doc.back_matter)} sections")
-        except Exception as e:
-            click.echo(f"   ✗ Error aligning documents: {e}", err=True)
-            return
 
-        # Generate PDF
-        click.echo(f"\n4. Generating PDF at {output}...")
-        try:
-            pdf_gen = PDFGenerator(output, title=title)
+                # The main text is aligned while the PDF is written (see step 4)
+                if extract_images:
+                    aligned_doc = aligner.align_documents_with_images(
+                        doc1, doc2,
+                        alignment_mode=mode,
+                        image_match_mode=image_match_mode,
+                        stream=True
+                    )
+                    click.echo(f"   ✓ Front matter: {len(aligned_doc.front_matter)} sections")
+                    click.echo(f"   ✓ Back matter: {len(aligned_doc.back_matter)} sections")
+                    click.echo(f"   ✓ Matched images: {len(aligned_doc.matched_images)}")
+                    click.echo(f"   ✓ Unmatched images (doc1): {len(aligned_doc.unmatched_images1)}")
+                    click.echo(f"   ✓ Unmatched images (doc2): {len(aligned_doc.unmatched_images2)}")
+                else:
+                    # DocumentWithImages is a DocumentSection, so no conversion is needed
+                    aligned_doc = aligner.align_documents(doc1, doc2, alignment_mode=mode, stream=True)
+                    click.echo(f"   ✓ Front matter: {len(aligned_doc.front_matter)} sections")
+                    click.echo(f"   ✓ Back matter: {len(aligned_doc.back_matter)} sections")
+                main_text = CountingIterable(aligned_doc.main_text)
+                aligned_doc = aligned_doc._replace(main_text=main_text)
+            except Exception as e:
+                click.echo(f"   ✗ Error aligning documents: {e}", err=True)
+                return
 
-            if extract_images:
-                pdf_gen.generate_pdf_from_aligned_document_with_images(
-                    aligned_doc,
-                    lang1_name=f"Language 1 ({lang1})",
-                    lang2_name=f"Language 2 ({lang2})",
-                    image_match_mode=image_match_mode
+            # Generate PDF
+            click.echo(f"\n4. Aligning main text and generating PDF at {output}...")
+            try:
+                pdf_gen = PDFGenerator(output, title=title)
+
+                if extract_images:
+                    pdf_gen.generate_pdf_from_aligned_document_with_images(
+                        aligned_doc,
+                        lang1_name=f"Language 1 ({lang1})",
+                        lang2_name=f"Language 2 ({lang2})",
+                        image_match_mode=image_match_mode
+                    )
+                else:
+                    pdf_gen.generate_pdf_from_aligned_document(
+                        aligned_doc,
+                        lang1_name=f"Language 1 ({lang1})",
+                        lang2_name=f"Language 2 ({lang2})"
+                    )
+                click.echo(f"   ✓ Main text: {main_text.count} aligned segments")
+                click.echo(f"   ✓ PDF generated successfully!")
+            except Exception as e:
+                click.echo(f"   ✗ Error aligning main text or generating PDF: {e}", err=True)
+                return
+
+        else:
+            # Legacy mode: extract text without structure detection
+            click.echo(f"\n1. Extracting text from {input1}...")
+            try:
+                text1 = TextExtractor.extract_text(input1, workers=workers, pdf_backend=pdf_backend)
+                click.echo(f"   ✓ Extracted {len(text1)} characters from first file")
+            except Exception as e:
+                click.echo(f"   ✗ Error extracting text from {input1}: {e}", err=True)
+                return
+
+            click.echo(f"\n2. Extracting text from {input2}...")
+            try:
+                text2 = TextExtractor.extract_text(input2, workers=workers, pdf_backend=pdf_backend)
+                click.echo(f"   ✓ Extracted {len(text2)} characters from second file")
+            except Exception as e:
+                click.echo(f"   ✗ Error extracting text from {input2}: {e}", err=True)
+                return
+
+            # Align texts
+            click.echo(f"\n3. Aligning texts using {mode} mode...")
+            try:
+                aligner = BilingualAligner(
+                    lang1=lang1, lang2=lang2, strategy=strategy, split_cache=split_cache, splitter=splitter,
+                    encoder=encoder
                 )
-            else:
-                pdf_gen.generate_pdf_from_aligned_document(
-                    aligned_doc,
+                aligned_texts = aligner.align_texts(text1, text2, alignment_mode=mode)
+                click.echo(f"   ✓ Created {len(aligned_texts)} aligned segments")
+            except Exception as e:
+                click.echo(f"   ✗ Error aligning texts: {e}", err=True)
+                return
+
+            # Generate PDF
+            click.echo(f"\n4. Generating PDF at {output}...")
+            try:
+                pdf_gen = PDFGenerator(output, title=title)
+                pdf_gen.generate_pdf(
+                    aligned_texts,
                     lang1_name=f"Language 1 ({lang1})",
                     lang2_name=f"Language 2 ({lang2})"
                 )
-            click.echo(f"   ✓ PDF generated successfully!")
-        except Exception as e:
-            click.echo(f"   ✗ Error generating PDF: {e}", err=True)
-            return
+                click.echo(f"   ✓ PDF generated successfully!")
+            except Exception as e:
+                click.echo(f"   ✗ Error generating PDF: {e}", err=True)
+                return
 
-    else:
-        # Legacy mode: extract text without structure detection
-        click.echo(f"\n1. Extracting text from {input1}...")
-        try:
-            text1 = TextExtractor.extract_text(input1)
-            click.echo(f"   ✓ Extracted {len(text1)} characters from first file")
-        except Exception as e:
-            click.echo(f"   ✗ Error extracting text from {input1}: {e}", err=True)
-            return
+        click.echo(f"\n{'=' * 50}")
+        click.echo(f"✓ Complete! Output saved to: {output}")
+    finally:
+        if split_cache is not None:
+            # Close the store here rather than leaving it to interpreter teardown
+            split_cache.close()
 
-        click.echo(f"\n2. Extracting text from {input2}...")
-        try:
-            text2 = TextExtractor.extract_text(input2)
-            click.echo(f"   ✓ Extracted {len(text2)} characters from second file")
-        except Exception as e:
-            click.echo(f"   ✗ Error extracting text from {input2}: {e}", err=True)
-            return
 
-        # Align texts
-        click.echo(f"\n3. Aligning texts using {mode} mode...")
-        try:
-            aligner = BilingualAligner(lang1=lang1, lang2=lang2)
-            aligned_texts = aligner.align_texts(text1, text2, alignment_mode=mode)
-            click.echo(f"   ✓ Created {len(aligned_texts)} aligned segments")
-        except Exception as e:
-            click.echo(f"   ✗ Error aligning texts: {e}", err=True)
-            return
+class CountingIterable:
+    """Iterable that counts the items taken from it, for reporting streamed pairs."""
 
-        # Generate PDF
-        click.echo(f"\n4. Generating PDF at {output}...")
-        try:
-            pdf_gen = PDFGenerator(output, title=title)
-            pdf_gen.generate_pdf(
-                aligned_texts,
-                lang1_name=f"Language 1 ({lang1})",
-                lang2_name=f"Language 2 ({lang2})"
-            )
-            click.echo(f"   ✓ PDF generated successfully!")
-        except Exception as e:
-            click.echo(f"   ✗ Error generating PDF: {e}", err=True)
-            return
+    def __init__(self, items):
+        self.items = items
+        self.count = 0
 
-    click.echo(f"\n{'=' * 50}")
-    click.echo(f"✓ Complete! Output saved to: {output}")
+    def __iter__(self):
+        for item in self.items:
+            self.count += 1
+            yield item
 
 
 if __name__ == '__main__':
@@ -1,29 +1,148 @@
 """Data structures and utilities for document structure analysis."""
 
 import re
-from dataclasses import dataclass
-from typing import Optional, List, Tuple
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, NamedTuple, Optional, List, Tuple
+
+
+def _strip_span(text: str, start: int, end: int) -> Tuple[int, int]:
+    """Return the span of text[start:end].strip() without copying the text."""
+    start, end, _ = slice(start, end).indices(len(text))
+    end = max(start, end)
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def _part_property(name: str, doc: str) -> property:
+    """Build a property that slices one part of a DocumentSection on access."""
+    return property(
+        lambda self: self._get_part(name),
+        lambda self, value: self._set_part(name, value),
+        doc=doc
+    )
 
 
-@dataclass
 class DocumentSection:
-    """Represents a structured document with front matter, main text, and back matter."""
+    """Represents a structured document with front matter, main text, and back matter.
+
+    The three parts are kept as (start, end) spans into one backing buffer,
+    usually the full extracted text, so splitting a book does not copy it.
+    The front_matter, main_text and back_matter strings are sliced from the
+    buffer when they are accessed; assigning one replaces just that part.
+    """
 
-    front_matter: str
-    main_text: str
-    back_matter: str
+    _PARTS = ('front_matter', 'main_text', 'back_matter')
 
-    def __init__(self, front_matter: str = "", main_text: str = "", back_matter: str = ""):
+    def __init__(
+        self,
+        front_matter: str = "",
+        main_text: str = "",
+        back_matter: str = "",
+        chapters: Optional['ChapterIndex'] = None
+    ):
         """Initialize document section.
 
         Args:
             front_matter: Text before main content (title, preface, TOC, etc.)
             main_text: Main body content
             back_matter: Text after main content (appendix, notes, etc.)
+            chapters: Chapters of main_text (detected on first use if None)
         """
+        # Part name -> (buffer, start, end)
+        self._spans: Dict[str, Tuple[str, int, int]] = {}
         self.front_matter = front_matter
         self.main_text = main_text
         self.back_matter = back_matter
+        self._chapters = chapters
+
+    @classmethod
+    def from_boundaries(
+        cls,
+        text: str,
+        main_start: int,
+        main_end: int,
+        chapters: Optional['ChapterIndex'] = None,
+        **kwargs
+    ) -> 'DocumentSection':
+        """Build a section whose parts are stripped spans of text.
+
+        The parts equal text[:main_start].strip(), text[main_start:main_end].strip()
+        and text[main_end:].strip(), but share text instead of copying it.
+
+        Args:
+            text: The full document text
+            main_start: Character position where main text starts
+            main_end: Character position where back matter starts
+            chapters: Chapters of the main text (optional)
+            **kwargs: Further constructor arguments of the subclass
+
+        Returns:
+            A section (of the class this is called on) backed by text
+        """
+        section = cls(chapters=chapters, **kwargs)
+        section._spans = {
+            'front_matter': (text, *_strip_span(text, 0, main_start)),
+            'main_text': (text, *_strip_span(text, main_start, main_end)),
+            'back_matter': (text, *_strip_span(text, main_end, len(text))),
+        }
+        return section
+
+    def _get_part(self, name: str) -> str:
+        buffer, start, end = self._spans[name]
+        if start == 0 and end == len(buffer):
+            return buffer
+        return buffer[start:end]
+
+    def _set_part(self, name: str, value: str):
+        self._spans[name] = (value, 0, len(value))
+        if name == 'main_text':
+            # The chapters index positions in the old main text
+            self._chapters = None
+
+    front_matter = _part_property('front_matter', "Text before main content (title, preface, TOC, etc.)")
+    main_text = _part_property('main_text', "Main body content")
+    back_matter = _part_property('back_matter', "Text after main content (appendix, notes, etc.)")
+
+    def span(self, name: str) -> Tuple[int, int]:
+        """Return the (start, end) span of a part in its backing buffer.
+
+        Args:
+            name: "front_matter", "main_text" or "back_matter"
+
+        Returns:
+            Character positions of the part
+        """
+        _, start, end = self._spans[name]
+        return start, end
+
+    def part_length(self, name: str) -> int:
+        """Return the length of a part without materializing it.
+
+        Args:
+            name: "front_matter", "main_text" or "back_matter"
+        """
+        start, end = self.span(name)
+        return end - start
+
+    @property
+    def chapters(self) -> 'ChapterIndex':
+        """The chapters of main_text, with offsets relative to main_text."""
+        if self._chapters is None:
+            self._chapters = ChapterIndex.from_text(self.main_text)
+        return self._chapters
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._PARTS)
+
+    def __repr__(self) -> str:
+        parts = ', '.join(f"{name}=<{self.part_length(name)} chars>" for name in self._PARTS)
+        return f"{type(self).__name__}({parts})"
 
 
 # Comprehensive chapter marker patterns for English and Chinese
@@ -63,6 +182,219 @@ CHAPTER_PATTERNS = [
     r'^[一二三四五六七八九十]+[\.、]',           # "一、", "二、"
 ]
 
+# Common back matter markers
+BACK_MATTER_PATTERNS = [
+    r'^appendix',
+    r'^bibliography',
+    r'^references',
+    r'^index$',
+    r'^glossary',
+    r'^notes$',
+    r'^acknowledgements',
+    r'^afterword',
+    r'^about the author',
+    r'^附录',      # Appendix
+    r'^参考文献',   # References
+    r'^索引',      # Index
+    r'^词汇表',    # Glossary
+    r'^注释',      # Notes
+    r'^后记',      # Afterword
+    r'^致谢',      # Acknowledgements
+]
+
+# Table of contents titles that belong to the front matter
+FRONT_MATTER_PATTERNS = [
+    r'^cover',
+    r'^title page',
+    r'^half title',
+    r'^copyright',
+    r'^(table of )?contents$',
+    r'^dedication',
+    r'^epigraph',
+    r'^also by',
+    r'^praise for',
+    r'^foreword',
+    r'^封面',      # Cover
+    r'^扉页',      # Title page
+    r'^版权',      # Copyright
+    r'^目录',      # Contents
+    r'^献词',      # Dedication
+]
+
+
+# Horizontal whitespace: what str.strip() removes, minus the line break
+_INLINE_SPACE = r'[^\S\n]'
+
+
+def _line_pattern(pattern: str) -> str:
+    """Turn a pattern for a stripped line into one for a line inside a full text.
+
+    The leading ^ is dropped (the combined pattern supplies it), \\s may not
+    cross a line break, and a trailing $ allows trailing whitespace.
+    """
+    if pattern.startswith('^'):
+        pattern = pattern[1:]
+    pattern = pattern.replace(r'\s', _INLINE_SPACE)
+    if pattern.endswith('$') and not pattern.endswith(r'\$'):
+        pattern = pattern[:-1] + _INLINE_SPACE + '*$'
+    return pattern
+
+
+class TocEntry(NamedTuple):
+    """A table of contents (or PDF outline) entry mapped into the extracted text."""
+
+    position: int  # Character position the entry points at
+    title: str
+    level: int = 0  # Nesting depth, 0 for top-level entries
+
+
+class StructureMarker(NamedTuple):
+    """A line that starts a chapter or the back matter."""
+
+    position: int  # Character position of the start of the line
+    kind: str      # "chapter" or "back_matter"
+    title: str     # The stripped line
+
+
+class StructureScanner:
+    """Find chapter and back matter markers with one precompiled pattern.
+
+    All chapter and back matter patterns are combined into a single
+    multiline regular expression, so one left-to-right pass over the text
+    finds every marker line with its absolute position, without splitting
+    the text into lines. A line is matched the same way as testing each
+    pattern against the stripped line: patterns are anchored at the first
+    non-space character and may use \\s outside character classes.
+    A line matching both kinds of pattern is reported as a chapter.
+    """
+
+    def __init__(
+        self,
+        chapter_patterns: Optional[List[str]] = None,
+        back_matter_patterns: Optional[List[str]] = None
+    ):
+        """Compile the scanner.
+
+        Args:
+            chapter_patterns: Patterns for chapter lines (default: CHAPTER_PATTERNS)
+            back_matter_patterns: Patterns for back matter lines (default: BACK_MATTER_PATTERNS)
+        """
+        chapter_patterns = CHAPTER_PATTERNS if chapter_patterns is None else chapter_patterns
+        back_matter_patterns = BACK_MATTER_PATTERNS if back_matter_patterns is None else back_matter_patterns
+
+        # Negative lookahead (?!) never matches, which keeps an empty group valid
+        chapter = '|'.join(_line_pattern(pattern) for pattern in chapter_patterns) or '(?!)'
+        back = '|'.join(_line_pattern(pattern) for pattern in back_matter_patterns) or '(?!)'
+        self._text_pattern = re.compile(
+            rf'^{_INLINE_SPACE}*(?:(?P<chapter>{chapter})|(?P<back_matter>{back}))',
+            re.IGNORECASE | re.MULTILINE
+        )
+
+        chapter = '|'.join(pattern.lstrip('^') for pattern in chapter_patterns) or '(?!)'
+        back = '|'.join(pattern.lstrip('^') for pattern in back_matter_patterns) or '(?!)'
+        self._line_pattern = re.compile(
+            rf'(?:(?P<chapter>{chapter})|(?P<back_matter>{back}))',
+            re.IGNORECASE
+        )
+
+    def classify_line(self, line_stripped: str) -> Optional[str]:
+        """Return "chapter", "back_matter" or None for a stripped line."""
+        match = self._line_pattern.match(line_stripped)
+        return match.lastgroup if match else None
+
+    def iter_markers(self, text: str, start: int = 0) -> Iterator[StructureMarker]:
+        """Yield every marker line at or after start, in text order.
+
+        Args:
+            text: The text to scan
+            start: Position to scan from; a line it cuts in half is skipped
+
+        Yields:
+            StructureMarker for each matching line
+        """
+        for match in self._text_pattern.finditer(text, start):
+            line_start = match.start()
+            line_end = text.find('\n', line_start)
+            title = text[line_start:line_end if line_end >= 0 else len(text)].strip()
+            yield StructureMarker(position=line_start, kind=match.lastgroup, title=title)
+
+    def find_main_text_start(self, text: str) -> int:
+        """Return the position of the first chapter line (0 if none)."""
+        for marker in self.iter_markers(text):
+            if marker.kind == 'chapter':
+                return marker.position
+        return 0
+
+    def find_back_matter(self, text: str, start_pos: int = 0) -> Optional[int]:
+        """Return the position of the first back matter line at or after start_pos.
+
+        When start_pos falls inside a line, the rest of that line counts as
+        a line of its own, matching at start_pos.
+
+        Args:
+            text: The text to scan
+            start_pos: Position where main text starts
+
+        Returns:
+            Character position where back matter starts (None if not found)
+        """
+        if start_pos > 0 and text[start_pos - 1] != '\n':
+            line_end = text.find('\n', start_pos)
+            if line_end < 0:
+                line_end = len(text)
+            if self.classify_line(text[start_pos:line_end].strip()) == 'back_matter':
+                return start_pos
+            start_pos = line_end + 1
+
+        for marker in self.iter_markers(text, start_pos):
+            if marker.kind == 'back_matter':
+                return marker.position
+        return None
+
+    def find_boundaries(self, text: str) -> Tuple[int, Optional[int]]:
+        """Find the main text start and the back matter start in a single pass.
+
+        Equivalent to find_main_text_start followed by find_back_matter from
+        that position, but reads the text only once and stops at the first
+        back matter line after the first chapter.
+
+        Args:
+            text: The text to scan
+
+        Returns:
+            Tuple of (main_start, back_matter_start or None)
+        """
+        main_start = None
+        first_back_matter = None
+
+        for marker in self.iter_markers(text):
+            if marker.kind == 'chapter':
+                if main_start is None:
+                    main_start = marker.position
+            elif main_start is not None:
+                return main_start, marker.position
+            elif first_back_matter is None:
+                # Only used if no chapter line turns up
+                first_back_matter = marker.position
+
+        if main_start is None:
+            return 0, first_back_matter
+        return main_start, None
+
+    def chapters(self, text: str) -> List[Tuple[int, str]]:
+        """Return (position, title) for every chapter line."""
+        return [
+            (marker.position, marker.title)
+            for marker in self.iter_markers(text)
+            if marker.kind == 'chapter'
+        ]
+
+
+@lru_cache(maxsize=None)
+def _default_scanner() -> StructureScanner:
+    """Return the scanner shared by the module-level helpers, compiled on first use."""
+    return StructureScanner()
+
 
 def detect_main_text_start(text: str, custom_marker: Optional[str] = None) -> int:
     """Detect where the main text starts based on chapter markers.
@@ -80,24 +412,7 @@ def detect_main_text_start(text: str, custom_marker: Optional[str] = None) -> in
         if match:
             return match.start()
 
-    # Try each pattern
-    lines = text.split('\n')
-    for i, line in enumerate(lines):
-        line_stripped = line.strip()
-
-        # Skip empty lines
-        if not line_stripped:
-            continue
-
-        # Check against all chapter patterns
-        for pattern in CHAPTER_PATTERNS:
-            if re.match(pattern, line_stripped, re.IGNORECASE):
-                # Found a chapter marker - calculate character position
-                char_position = sum(len(lines[j]) + 1 for j in range(i))  # +1 for newline
-                return char_position
-
-    # No chapter marker found
-    return 0
+    return _default_scanner().find_main_text_start(text)
 
 
 def detect_main_text_end(text: str, start_pos: int = 0) -> Optional[int]:
@@ -110,55 +425,244 @@ def detect_main_text_end(text: str, start_pos: int = 0) -> Optional[int]:
     Returns:
         Character position where back matter starts (None if not found)
     """
-    # Common back matter markers
-    back_matter_patterns = [
-        r'^appendix',
-        r'^bibliography',
-        r'^references',
-        r'^index$',
-        r'^glossary',
-        r'^notes$',
-        r'^acknowledgements',
-        r'^afterword',
-        r'^about the author',
-        r'^附录',      # Appendix
-        r'^参考文献',   # References
-        r'^索引',      # Index
-        r'^词汇表',    # Glossary
-        r'^注释',      # Notes
-        r'^后记',      # Afterword
-        r'^致谢',      # Acknowledgements
-    ]
+    return _default_scanner().find_back_matter(text, start_pos)
 
-    text_from_start = text[start_pos:]
-    lines = text_from_start.split('\n')
 
-    for i, line in enumerate(lines):
-        line_stripped = line.strip()
+_FRONT_MATTER_TITLE = re.compile('|'.join(FRONT_MATTER_PATTERNS), re.IGNORECASE)
+
 
-        # Skip empty lines
-        if not line_stripped:
-            continue
+def classify_toc_title(title: str) -> str:
+    """Classify a table of contents title.
 
-        # Check against back matter patterns
-        for pattern in back_matter_patterns:
-            if re.match(pattern, line_stripped, re.IGNORECASE):
-                # Found back matter - calculate absolute character position
-                char_position = start_pos + sum(len(lines[j]) + 1 for j in range(i))
-                return char_position
+    Args:
+        title: The entry's title
 
-    # No back matter found
+    Returns:
+        "front_matter", "back_matter" or "chapter"
+    """
+    title = title.strip()
+    if _FRONT_MATTER_TITLE.match(title):
+        return 'front_matter'
+    if _default_scanner().classify_line(title) == 'back_matter':
+        return 'back_matter'
+    return 'chapter'
+
+
+def _toc_back_matter_start(toc: List[TocEntry], main_start: int) -> Optional[int]:
+    """Return the position of the first back matter entry at or after main_start."""
+    for entry in sorted(toc, key=lambda entry: entry.position):
+        if entry.position >= main_start and classify_toc_title(entry.title) == 'back_matter':
+            return entry.position
     return None
 
 
-def split_document(
+def toc_section_boundaries(toc: List[TocEntry], text_length: int) -> Optional[Tuple[int, int]]:
+    """Find the main text boundaries from a table of contents.
+
+    The main text starts at the first entry that is neither front nor back
+    matter, and ends at the first back matter entry after it.
+
+    Args:
+        toc: Entries mapped to character positions
+        text_length: Length of the text the entries point into
+
+    Returns:
+        Tuple of (main_start, main_end), or None if no entry looks like a chapter
+    """
+    main_start = next(
+        (entry.position for entry in sorted(toc, key=lambda entry: entry.position)
+         if classify_toc_title(entry.title) == 'chapter'),
+        None
+    )
+    if main_start is None:
+        return None
+
+    main_end = _toc_back_matter_start(toc, main_start)
+    if main_end is None:
+        main_end = text_length
+    return min(main_start, text_length), min(main_end, text_length)
+
+
+def toc_chapters(toc: List[TocEntry], text_length: int) -> List[Tuple[int, str]]:
+    """Return (position, title) for the main text entries of a table of contents.
+
+    Counterpart of get_chapter_info for documents with their own table of
+    contents.
+
+    Args:
+        toc: Entries mapped to character positions
+        text_length: Length of the text the entries point into
+
+    Returns:
+        List of tuples (character_position, chapter_title) in text order
+    """
+    boundaries = toc_section_boundaries(toc, text_length)
+    if boundaries is None:
+        return []
+
+    main_start, main_end = boundaries
+    return [
+        (entry.position, entry.title)
+        for entry in sorted(toc, key=lambda entry: entry.position)
+        if main_start <= entry.position < main_end and classify_toc_title(entry.title) == 'chapter'
+    ]
+
+
+class Chapter(NamedTuple):
+    """One chapter of a ChapterIndex."""
+
+    start: int  # Character position of the chapter heading
+    end: int    # Character position where the next chapter (or the text) ends
+    title: str
+
+
+class ChapterIndex:
+    """Chapter start offsets of one text, built once and shared.
+
+    Offsets are kept sorted so that finding the chapter containing a
+    character position is a binary search rather than a rescan of the text.
+    """
+
+    def __init__(self, chapters: Iterable[Tuple[int, str]], text_length: int):
+        """Initialize the index.
+
+        Args:
+            chapters: (character_position, chapter_title) pairs, as from get_chapter_info
+            text_length: Length of the text the positions point into
+        """
+        chapters = sorted(chapters, key=lambda chapter: chapter[0])
+        self.starts: List[int] = [position for position, _ in chapters]
+        self.titles: List[str] = [title for _, title in chapters]
+        self.text_length = text_length
+
+    @classmethod
+    def from_text(cls, text: str, toc: Optional[List[TocEntry]] = None) -> 'ChapterIndex':
+        """Build the index for a text, from its table of contents if it has one.
+
+        Args:
+            text: The text to index
+            toc: Table of contents mapped into text (optional)
+
+        Returns:
+            ChapterIndex over text
+        """
+        chapters = toc_chapters(toc, len(text)) if toc else []
+        if not chapters:
+            chapters = get_chapter_info(text)
+        return cls(chapters, len(text))
+
+    @classmethod
+    def for_main_text(
+        cls,
+        text: str,
+        main_start: int,
+        main_end: int,
+        toc: Optional[List[TocEntry]] = None
+    ) -> 'ChapterIndex':
+        """Build the index for the main text that split_document cuts out of text.
+
+        Offsets are relative to the stripped main text, like the main_text
+        attribute of the resulting DocumentSection.
+
+        Args:
+            text: The full document text
+            main_start: Character position where main text starts
+            main_end: Character position where back matter starts
+            toc: Table of contents mapped into the full text (optional)
+
+        Returns:
+            ChapterIndex over the main text
+        """
+        offset, end = _strip_span(text, main_start, main_end)
+
+        chapters = []
+        if toc:
+            chapters = [
+                (position - offset, title)
+                for position, title in toc_chapters(toc, len(text))
+                if offset <= position < end
+            ]
+        if not chapters:
+            chapters = get_chapter_info(text[offset:end])
+        return cls(chapters, end - offset)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[Chapter]:
+        return (self[index] for index in range(len(self)))
+
+    def __getitem__(self, index: int) -> Chapter:
+        start, end = self.span(index)
+        return Chapter(start=start, end=end, title=self.titles[index])
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ChapterIndex):
+            return NotImplemented
+        return (self.starts, self.titles, self.text_length) == (other.starts, other.titles, other.text_length)
+
+    def __repr__(self) -> str:
+        return f"ChapterIndex({len(self)} chapters, text_length={self.text_length})"
+
+    def chapter_at(self, position: int) -> Optional[int]:
+        """Return the index of the chapter containing a character position.
+
+        Args:
+            position: Character position in the text
+
+        Returns:
+            Chapter index, or None if the position comes before the first chapter
+        """
+        index = bisect_right(self.starts, position) - 1
+        return index if index >= 0 else None
+
+    def span(self, index: int) -> Tuple[int, int]:
+        """Return the (start, end) character positions of a chapter.
+
+        Raises:
+            IndexError: If there is no such chapter
+        """
+        if index < 0:
+            index += len(self.starts)
+        start = self.starts[index]
+        end = self.starts[index + 1] if index + 1 < len(self.starts) else self.text_length
+        return start, end
+
+    def chapter_text(self, text: str, index: int) -> str:
+        """Return the text of a chapter, heading included.
+
+        Args:
+            text: The text the index was built for
+            index: Chapter index
+
+        Returns:
+            The chapter's slice of text
+        """
+        start, end = self.span(index)
+        return text[start:end]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable representation (see from_dict)."""
+        return {'starts': self.starts, 'titles': self.titles, 'text_length': self.text_length}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ChapterIndex':
+        """Rebuild an index from to_dict output."""
+        return cls(zip(data['starts'], data['titles']), data['text_length'])
+
+
+def find_section_boundaries(
     text: str,
     start_marker: Optional[str] = None,
     end_marker: Optional[str] = None,
     start_position: Optional[int] = None,
-    end_position: Optional[int] = None
-) -> DocumentSection:
-    """Split a document into front matter, main text, and back matter.
+    end_position: Optional[int] = None,
+    toc: Optional[List[TocEntry]] = None
+) -> Tuple[int, int]:
+    """Find where the main text starts and where the back matter starts.
+
+    Manual positions take precedence over markers, markers over the table
+    of contents, and the table of contents over CHAPTER_PATTERNS.
 
     Args:
         text: The full document text
@@ -166,13 +670,26 @@ def split_document(
         end_marker: Custom marker for where back matter starts (optional)
         start_position: Manual character position for main text start (takes precedence)
         end_position: Manual character position for back matter start (takes precedence)
+        toc: The document's own table of contents mapped into text (optional)
 
     Returns:
-        DocumentSection with the three parts split
+        Tuple of (main_start, main_end) character positions
     """
+    toc_boundaries = toc_section_boundaries(toc, len(text)) if toc else None
+
+    if start_position is None and end_position is None and not start_marker and not end_marker:
+        if toc_boundaries is not None:
+            return toc_boundaries
+        # Both boundaries come from the same scan
+        main_start, detected_end = _default_scanner().find_boundaries(text)
+        return main_start, detected_end if detected_end is not None else len(text)
+
     # Determine start position
     if start_position is not None:
         main_start = start_position
+    elif toc_boundaries is not None:
+        match = re.search(re.escape(start_marker), text, re.IGNORECASE) if start_marker else None
+        main_start = match.start() if match else toc_boundaries[0]
     else:
         main_start = detect_main_text_start(text, start_marker)
 
@@ -186,21 +703,53 @@ def split_document(
             main_end = main_start + match.start()
         else:
             main_end = len(text)
+    elif toc_boundaries is not None:
+        detected_end = _toc_back_matter_start(toc, main_start)
+        main_end = min(detected_end, len(text)) if detected_end is not None else len(text)
     else:
         detected_end = detect_main_text_end(text, main_start)
         main_end = detected_end if detected_end is not None else len(text)
 
-    # Split the document
-    front_matter = text[:main_start].strip()
-    main_text = text[main_start:main_end].strip()
-    back_matter = text[main_end:].strip() if main_end < len(text) else ""
+    return main_start, main_end
+
+
+def split_document(
+    text: str,
+    start_marker: Optional[str] = None,
+    end_marker: Optional[str] = None,
+    start_position: Optional[int] = None,
+    end_position: Optional[int] = None,
+    toc: Optional[List[TocEntry]] = None
+) -> DocumentSection:
+    """Split a document into front matter, main text, and back matter.
+
+    Args:
+        text: The full document text
+        start_marker: Custom marker for where main text starts (optional)
+        end_marker: Custom marker for where back matter starts (optional)
+        start_position: Manual character position for main text start (takes precedence)
+        end_position: Manual character position for back matter start (takes precedence)
+        toc: The document's own table of contents mapped into text (optional)
 
-    return DocumentSection(
-        front_matter=front_matter,
-        main_text=main_text,
-        back_matter=back_matter
+    Returns:
+        DocumentSection with the three parts split
+    """
+    main_start, main_end = find_section_boundaries(
+        text,
+        start_marker=start_marker,
+        end_marker=end_marker,
+        start_position=start_position,
+        end_position=end_position,
+        toc=toc
     )
 
+    # Chapters from the table of contents cost nothing to map; otherwise
+    # they are detected from main_text on first use
+    chapters = ChapterIndex.for_main_text(text, main_start, main_end, toc) if toc else None
+
+    # The parts are spans of text rather than copies
+    return DocumentSection.from_boundaries(text, main_start, main_end, chapters=chapters)
+
 
 def get_chapter_info(text: str) -> List[Tuple[int, str]]:
     """Extract all chapter positions and titles from text.
@@ -211,20 +760,138 @@ def get_chapter_info(text: str) -> List[Tuple[int, str]]:
     Returns:
         List of tuples (character_position, chapter_title)
     """
-    chapters = []
-    lines = text.split('\n')
+    return _default_scanner().chapters(text)
 
-    char_position = 0
-    for line in lines:
-        line_stripped = line.strip()
 
-        if line_stripped:
-            # Check against all chapter patterns
-            for pattern in CHAPTER_PATTERNS:
-                if re.match(pattern, line_stripped, re.IGNORECASE):
-                    chapters.append((char_position, line_stripped))
-                    break
+def iter_lines(chunks: Iterable[str]) -> Iterator[Tuple[int, str]]:
+    """Yield every line of a chunked text together with its character offset.
+
+    The text is the chunks joined with newlines, which is how the extractors
+    assemble pages and chapters, so chunk boundaries are line boundaries.
+
+    Args:
+        chunks: Text chunks, e.g. from TextExtractor.iter_pages
+
+    Yields:
+        Tuples of (character_position, line) without the trailing newline
+    """
+    offset = 0
+    for chunk in chunks:
+        for line in chunk.split('\n'):
+            yield offset, line
+            offset += len(line) + 1  # +1 for newline
+
+
+def _find_end_in_line(
+    line: str,
+    line_offset: int,
+    main_start: int,
+    end_pattern: Optional["re.Pattern"]
+) -> Optional[int]:
+    """Look for the start of back matter in one line, at or after main_start.
+
+    Mirrors the custom end marker search and detect_main_text_end for a
+    single line, including a first line that main_start cuts in half.
+    """
+    if line_offset + len(line) < main_start:
+        return None
+
+    cut = max(0, main_start - line_offset)
+    segment = line[cut:]
+    if end_pattern is not None:
+        match = end_pattern.search(segment)
+        return line_offset + cut + match.start() if match else None
+
+    if _default_scanner().classify_line(segment.strip()) == 'back_matter':
+        return line_offset + cut
+    return None
+
+
+def split_document_stream(
+    chunks: Iterable[str],
+    start_marker: Optional[str] = None,
+    end_marker: Optional[str] = None
+) -> Tuple[int, int]:
+    """Find the main text boundaries of a chunked document in a single pass.
+
+    Streaming counterpart of find_section_boundaries: only one line is held at a
+    time, and reading stops as soon as both boundaries are known. Passing
+    the result as start_position/end_position to split_document gives the
+    same sections as passing the markers. Markers are matched within a line.
 
-        char_position += len(line) + 1  # +1 for newline
+    Args:
+        chunks: Text chunks that join with newlines into the full document
+        start_marker: Custom marker for where main text starts (optional)
+        end_marker: Custom marker for where back matter starts (optional)
 
-    return chapters
+    Returns:
+        Tuple of (main_start, main_end) character positions
+    """
+    start_pattern = re.compile(re.escape(start_marker), re.IGNORECASE) if start_marker else None
+    end_pattern = re.compile(re.escape(end_marker), re.IGNORECASE) if end_marker else None
+
+    # Track the custom marker start and the chapter pattern start side by side,
+    # since the marker may turn out to be missing. Main text starts at 0 if
+    # neither is found.
+    marker_start = marker_end = None
+    chapter_start = chapter_end = None
+    zero_end = None
+    text_length = 0
+
+    for line_offset, line in iter_lines(chunks):
+        text_length = line_offset + len(line)
+
+        if start_pattern is not None and marker_start is None:
+            match = start_pattern.search(line)
+            if match:
+                marker_start = line_offset + match.start()
+        if chapter_start is None and _default_scanner().classify_line(line.strip()) == 'chapter':
+            chapter_start = line_offset
+
+        if marker_start is not None and marker_end is None:
+            marker_end = _find_end_in_line(line, line_offset, marker_start, end_pattern)
+        if chapter_start is not None and chapter_end is None:
+            chapter_end = _find_end_in_line(line, line_offset, chapter_start, end_pattern)
+        if zero_end is None:
+            zero_end = _find_end_in_line(line, line_offset, 0, end_pattern)
+
+        if marker_end is not None or (start_pattern is None and chapter_end is not None):
+            break
+
+    if marker_start is not None:
+        main_start, main_end = marker_start, marker_end
+    elif chapter_start is not None:
+        main_start, main_end = chapter_start, chapter_end
+    else:
+        main_start, main_end = 0, zero_end
+
+    return main_start, (main_end if main_end is not None else text_length)
+
+
+def iter_chapters(chunks: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """Group a chunked document into chapters, one chapter in memory at a time.
+
+    A chapter runs from a line matching CHAPTER_PATTERNS up to the next one.
+    Text before the first chapter marker is yielded with an empty title.
+    Joining the yielded texts with newlines reproduces the full document.
+
+    Args:
+        chunks: Text chunks that join with newlines into the full document
+
+    Yields:
+        Tuples of (chapter_title, chapter_text)
+    """
+    title = ""
+    lines = []
+
+    for _, line in iter_lines(chunks):
+        line_stripped = line.strip()
+        if _default_scanner().classify_line(line_stripped) == 'chapter':
+            if lines:
+                yield title, '\n'.join(lines)
+            title = line_stripped
+            lines = []
+        lines.append(line)
+
+    if lines:
+        yield title, '\n'.join(lines)
@@ -0,0 +1,411 @@
+"""Segment alignment by the similarity of multilingual sentence embeddings.
+
+Length statistics (see length_aligner) cannot tell two translations of
+similar length apart. A multilingual sentence-transformers model maps a
+sentence and its translation to nearby vectors, so the cosine similarity
+of two segments measures whether they say the same thing.
+
+Segments of both texts are encoded in large batches on the CPU, and the
+cheapest monotonic path through the similarity matrix is found with the
+banded dynamic programming of length_aligner, in the style of Vecalign
+(Thompson and Koehn, 2019). A bead costs 1 - cosine similarity of its two
+sides (the side of a merge is the sum of its segments), divided by the
+average of that for random pairs of segments so costs mean the same for
+models with different similarity scales, and multiplied by half the
+number of segments it covers so merges are not cheaper than pairs. 2:1
+and 1:2 beads also pay a small merge penalty; 1:0 and 0:1 beads cost a
+fixed skip cost.
+
+Embeddings are kept in an EmbeddingStore: a memory-mapped .npy file with
+one row per segment plus a file of segment hashes, so a rerun on the same
+(or a slightly edited) book only encodes the segments it has not seen.
+"""
+
+import hashlib
+import os
+import re
+from importlib.util import find_spec
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .length_aligner import DEFAULT_BAND, Bead, Move, banded_align
+
+# sentence-transformers imports PyTorch, so it is only imported when a
+# model has to be loaded
+HAS_SENTENCE_TRANSFORMERS = find_spec('sentence_transformers') is not None
+
+# Small multilingual model (English, Chinese and 48 other languages) that
+# runs at a few hundred sentences per second on a laptop CPU
+DEFAULT_EMBEDDING_MODEL = 'sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2'
+
+DEFAULT_BATCH_SIZE = 128
+
+# Segments encoded (and written to the store) per call of the model
+_ENCODE_CHUNK = 4096
+
+# Bead types; merges are limited to two segments
+EMBEDDING_MOVES: Tuple[Move, ...] = ((1, 1), (1, 0), (0, 1), (2, 1), (1, 2))
+
+# Cost of leaving a segment unpaired, in units of the average cost of a
+# random pair: pairs of translations cost about 0.2-0.5, unrelated ones 1
+DEFAULT_SKIP_COST = 0.5
+
+# Added to the cost of 2:1 and 1:2 beads, so two good 1:1 beads win over a merge
+DEFAULT_MERGE_PENALTY = 0.1
+
+# Bump when the way segments are hashed changes
+EMBEDDING_STORE_VERSION = 1
+
+# Rows the memory-mapped file is created with; it doubles when full
+_INITIAL_CAPACITY = 1024
+
+# Random segment pairs whose similarity normalizes bead costs
+_BASELINE_SAMPLES = 10_000
+
+
+def segment_key(segment: str, model_name: str) -> str:
+    """Return the store key of one segment encoded by one model."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f'{EMBEDDING_STORE_VERSION}\0{model_name}\0'.encode('utf-8'))
+    digest.update(segment.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def embedding_store_name(model_name: str) -> str:
+    """Return the file name of a model's store inside an extraction cache directory.
+
+    The leading dot keeps ExtractionCache from treating it as an entry.
+    """
+    return '.embeddings-' + re.sub(r'[^A-Za-z0-9_.-]+', '_', model_name) + '.npy'
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """Scale every row to unit length (all-zero rows are left as they are)."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+class EmbeddingStore:
+    """Segment embeddings in a memory-mapped .npy file, keyed by segment hash.
+
+    Row k of the .npy file holds the embedding of the k-th key in a text
+    file next to it (same name, ".keys" extension). Rows are written and
+    flushed before their keys are appended, so an interrupted run never
+    leaves a key pointing at an unwritten row. The file is created with
+    spare rows and doubled when full, so adding embeddings does not
+    rewrite it every time.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """Open (or create on first add) a store.
+
+        Args:
+            path: The .npy file (default: keep embeddings in memory only)
+        """
+        self.path = path
+        self._rows: Dict[str, int] = {}
+        self._array: Optional[np.ndarray] = None
+        if path is None:
+            return
+        self._keys_path = os.path.splitext(path)[0] + '.keys'
+        if os.path.exists(path) and os.path.exists(self._keys_path):
+            self._array = np.load(path, mmap_mode='r+')
+            with open(self._keys_path, 'r', encoding='ascii') as file:
+                keys = file.read().split()
+            # Keys past the end of the array were never backed by a row
+            for row, key in enumerate(keys[:len(self._array)]):
+                self._rows[key] = row
+        elif os.path.exists(self._keys_path):
+            # Keys without their array cannot be used; start over
+            os.remove(self._keys_path)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    @property
+    def dimension(self) -> Optional[int]:
+        """Length of the stored vectors (None while the store is empty)."""
+        return None if self._array is None else self._array.shape[1]
+
+    def get(self, keys: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Look up the embeddings of keys.
+
+        Args:
+            keys: Segment keys
+
+        Returns:
+            Tuple of (mask of the keys that were found, their embeddings in
+            key order as a float32 array with one row per found key)
+        """
+        rows = np.fromiter((self._rows.get(key, -1) for key in keys), dtype=np.int64, count=len(keys))
+        found = rows >= 0
+        if self._array is None:
+            return found, np.empty((0, 0), dtype=np.float32)
+        return found, np.asarray(self._array[rows[found]], dtype=np.float32)
+
+    def add(self, keys: Sequence[str], vectors: np.ndarray):
+        """Store the embeddings of new keys (keys already stored are skipped).
+
+        Raises:
+            ValueError: If the vectors do not match the store's dimension
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if self.dimension is not None and vectors.shape[1] != self.dimension:
+            raise ValueError(
+                f"Embeddings of dimension {vectors.shape[1]} do not fit a store of dimension {self.dimension}; "
+                "use a separate store for each model"
+            )
+        new = {}
+        for key, vector in zip(keys, vectors):
+            if key not in self._rows and key not in new:
+                new[key] = vector
+        if not new:
+            return
+
+        start = len(self._rows)
+        self._reserve(start + len(new), vectors.shape[1])
+        self._array[start:start + len(new)] = np.stack(list(new.values()))
+        if self.path is not None:
+            self._array.flush()
+            with open(self._keys_path, 'a', encoding='ascii') as file:
+                file.write(''.join(key + '\n' for key in new))
+        for row, key in enumerate(new, start):
+            self._rows[key] = row
+
+    def _reserve(self, rows: int, dimension: int):
+        """Make room for rows embeddings, doubling the array when it is full."""
+        if self._array is not None and len(self._array) >= rows:
+            return
+        capacity = max(_INITIAL_CAPACITY, rows, 2 * len(self._array) if self._array is not None else 0)
+        used = len(self._rows)
+        if self.path is None:
+            array = np.zeros((capacity, dimension), dtype=np.float32)
+        else:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            temp_path = self.path + '.tmp'
+            array = np.lib.format.open_memmap(temp_path, mode='w+', dtype=np.float32, shape=(capacity, dimension))
+        if used:
+            array[:used] = self._array[:used]
+        if self.path is not None:
+            array.flush()
+            del array
+            self._array = None
+            os.replace(temp_path, self.path)
+            array = np.load(self.path, mmap_mode='r+')
+        self._array = array
+
+    def clear(self):
+        """Remove every embedding, from memory and from disk."""
+        self._rows.clear()
+        self._array = None
+        if self.path is not None:
+            for path in (self.path, self._keys_path):
+                if os.path.exists(path):
+                    os.remove(path)
+
+
+class SegmentEncoder:
+    """Encodes segments with a sentence embedding model, through an EmbeddingStore."""
+
+    def __init__(
+        self,
+        model: Any = None,
+        model_name: str = DEFAULT_EMBEDDING_MODEL,
+        store: Optional[EmbeddingStore] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ):
+        """Initialize the encoder.
+
+        Args:
+            model: Object with a sentence-transformers style
+                encode(texts, batch_size=...) method returning one vector per
+                text (default: load model_name with sentence-transformers on
+                the CPU the first time a segment has to be encoded)
+            model_name: Name of the model, part of every store key so
+                embeddings of different models are never mixed
+            store: Where embeddings are kept across texts and runs
+                (default: an in-memory store)
+            batch_size: Segments per forward pass of the model
+        """
+        self.model = model
+        self.model_name = model_name
+        self.store = store if store is not None else EmbeddingStore()
+        self.batch_size = batch_size
+        self.encoded = 0
+
+    def _load_model(self):
+        """Load the sentence-transformers model on first use.
+
+        Raises:
+            ImportError: If sentence-transformers is not installed
+        """
+        if self.model is None:
+            if not HAS_SENTENCE_TRANSFORMERS:
+                raise ImportError(
+                    "sentence-transformers is required for the embedding alignment strategy. "
+                    "Install it with: pip install -e .[embedding]"
+                )
+            from sentence_transformers import SentenceTransformer
+
+            self.model = SentenceTransformer(self.model_name, device='cpu')
+        return self.model
+
+    def encode(self, segments: Sequence[str]) -> np.ndarray:
+        """Return unit-length embeddings of segments, encoding only unknown ones.
+
+        Segments missing from the store are deduplicated, sorted by length
+        (so batches hold segments of similar length and little padding) and
+        encoded in chunks that are written to the store as they finish.
+
+        Args:
+            segments: Segments to encode
+
+        Returns:
+            float32 array with one row per segment
+
+        Raises:
+            ImportError: If a segment has to be encoded, no model was given
+                and sentence-transformers is not installed
+        """
+        keys = [segment_key(segment, self.model_name) for segment in segments]
+        missing = {}
+        for key, segment in zip(keys, segments):
+            if key not in self.store and key not in missing:
+                missing[key] = segment
+
+        if missing:
+            model = self._load_model()
+            pending = sorted(missing.items(), key=lambda item: len(item[1]))
+            for start in range(0, len(pending), _ENCODE_CHUNK):
+                chunk = pending[start:start + _ENCODE_CHUNK]
+                vectors = model.encode([segment for _, segment in chunk], batch_size=self.batch_size)
+                self.store.add([key for key, _ in chunk], normalize_rows(vectors))
+            self.encoded += len(missing)
+
+        _, vectors = self.store.get(keys)
+        if not len(keys):
+            return np.empty((0, self.store.dimension or 0), dtype=np.float32)
+        return vectors
+
+
+def embedding_cost(
+    embeddings1: np.ndarray,
+    embeddings2: np.ndarray,
+    skip_cost: float = DEFAULT_SKIP_COST,
+    merge_penalty: float = DEFAULT_MERGE_PENALTY
+):
+    """Build the bead cost function for two arrays of unit-length embeddings.
+
+    Similarities are computed a block at a time as a dense product of the
+    rows and columns a block of the banded table touches, so the full
+    n x m similarity matrix is never built. The embedding of a merged pair
+    is the sum of its two vectors; its norm follows from their similarity.
+    Costs are normalized by the average cost of random pairs, sampled with
+    a fixed seed so the same texts always align the same way.
+
+    Args:
+        embeddings1: One unit-length row per segment of text 1
+        embeddings2: One unit-length row per segment of text 2
+        skip_cost: Cost of a 1:0 or 0:1 bead
+        merge_penalty: Added to the cost of 2:1 and 1:2 beads
+
+    Returns:
+        Function cost(move, i, j) giving the cost of the beads that end
+        after segment i of text 1 and segment j of text 2 (see
+        length_aligner.banded_align); moves may take at most two segments
+        from either text
+    """
+    embeddings1 = np.asarray(embeddings1, dtype=np.float32)
+    embeddings2 = np.asarray(embeddings2, dtype=np.float32)
+    pair_norms1 = _pair_norms(embeddings1)
+    pair_norms2 = _pair_norms(embeddings2)
+    baseline = _random_pair_cost(embeddings1, embeddings2)
+    block = {'rows': (0, 0), 'columns': (0, 0), 'similarities': np.empty((0, 0), dtype=np.float32)}
+
+    def similarities(row_low: int, row_high: int, column_low: int, column_high: int) -> np.ndarray:
+        """Return the similarities of a block, reusing the last block if it covers it."""
+        (rows_from, rows_to), (columns_from, columns_to) = block['rows'], block['columns']
+        if not (rows_from <= row_low and row_high <= rows_to and columns_from <= column_low
+                and column_high <= columns_to):
+            # Two extra rows and columns cover the merges of the same block
+            row_low, column_low = max(row_low - 2, 0), max(column_low - 2, 0)
+            block['rows'], block['columns'] = (row_low, row_high), (column_low, column_high)
+            block['similarities'] = embeddings1[row_low:row_high] @ embeddings2[column_low:column_high].T
+        return block['similarities']
+
+    def cost(move: Move, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+        di, dj = move
+        if di == 0 or dj == 0:
+            return np.full(np.shape(i), skip_cost)
+        if di > 2 or dj > 2:
+            raise ValueError(f"Beads of more than two segments are not supported: {move}")
+        # First segment of each side of the bead (cells a move cannot reach
+        # are clamped here; banded_align discards their costs)
+        first1, first2 = np.maximum(i - di, 0), np.maximum(j - dj, 0)
+        row_low, column_low = int(first1.min()), int(first2.min())
+        matrix = similarities(row_low, int(i.max()), column_low, int(j.max()))
+        row_offset, column_offset = block['rows'][0], block['columns'][0]
+
+        dot = np.zeros(np.shape(i), dtype=np.float64)
+        for a in range(di):
+            for b in range(dj):
+                dot += matrix[first1 + a - row_offset, first2 + b - column_offset]
+        norm = pair_norms1[first1] if di == 2 else 1.0
+        if dj == 2:
+            norm = norm * pair_norms2[first2]
+        penalty = merge_penalty if di > 1 or dj > 1 else 0.0
+        return (1.0 - dot / norm) / baseline * ((di + dj) / 2) + penalty
+
+    return cost
+
+
+def _random_pair_cost(embeddings1: np.ndarray, embeddings2: np.ndarray) -> float:
+    """Return the average of 1 - similarity over random pairs of segments of the two texts."""
+    if not len(embeddings1) or not len(embeddings2):
+        return 1.0
+    rng = np.random.default_rng(0)
+    if len(embeddings1) * len(embeddings2) <= _BASELINE_SAMPLES:
+        similarities = embeddings1 @ embeddings2.T
+    else:
+        rows = rng.integers(len(embeddings1), size=_BASELINE_SAMPLES)
+        columns = rng.integers(len(embeddings2), size=_BASELINE_SAMPLES)
+        similarities = np.einsum('ij,ij->i', embeddings1[rows], embeddings2[columns])
+    return max(float(np.mean(1.0 - similarities)), 1e-3)
+
+
+def _pair_norms(embeddings: np.ndarray) -> np.ndarray:
+    """Return the norm of the sum of every segment with the one after it.
+
+    The last segment, which has no successor, gets 1 so that the result can
+    be indexed by any segment.
+    """
+    similarities = np.einsum('ij,ij->i', embeddings[:-1], embeddings[1:])
+    return np.append(np.sqrt(np.maximum(2 + 2 * similarities, 1e-12)), 1.0)
+
+
+def align_embeddings(
+    embeddings1: np.ndarray,
+    embeddings2: np.ndarray,
+    band: int = DEFAULT_BAND,
+    skip_cost: float = DEFAULT_SKIP_COST,
+    merge_penalty: float = DEFAULT_MERGE_PENALTY
+) -> List[Bead]:
+    """Align two arrays of unit-length segment embeddings.
+
+    Args:
+        embeddings1: One row per segment of text 1
+        embeddings2: One row per segment of text 2
+        band: Half-width of the band in columns
+        skip_cost: Cost of leaving a segment unpaired
+        merge_penalty: Added to the cost of 2:1 and 1:2 beads
+
+    Returns:
+        Beads in text order, covering both texts
+    """
+    cost = embedding_cost(embeddings1, embeddings2, skip_cost=skip_cost, merge_penalty=merge_penalty)
+    return banded_align(len(embeddings1), len(embeddings2), cost, moves=EMBEDDING_MOVES, band=band)
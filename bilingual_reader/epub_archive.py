@@ -0,0 +1,279 @@
+"""Lazy ePub container access built on zipfile.
+
+An ePub is a zip archive whose META-INF/container.xml points at an OPF
+package document listing every member (the manifest) and the reading order
+(the spine). EpubArchive reads only those two small XML files up front;
+chapter documents and images are read from the archive one member at a
+time when they are needed, so memory use does not grow with the size of
+the book's images. The book's own table of contents is read from the
+EPUB 3 navigation document or, failing that, the EPUB 2 NCX.
+"""
+
+import posixpath
+import zipfile
+from typing import Dict, List, NamedTuple, Optional
+from urllib.parse import unquote
+
+from lxml import etree, html
+
+CONTAINER_PATH = 'META-INF/container.xml'
+
+DOCUMENT_MEDIA_TYPES = frozenset(['application/xhtml+xml', 'text/html'])
+
+NCX_MEDIA_TYPE = 'application/x-dtbncx+xml'
+
+
+class ManifestItem(NamedTuple):
+    """One entry of an ePub's OPF manifest."""
+
+    id: str
+    name: str  # Member name inside the zip archive
+    media_type: str
+    properties: frozenset
+
+    @property
+    def is_document(self) -> bool:
+        """Whether the item is a content document (the nav document excluded)."""
+        return self.media_type in DOCUMENT_MEDIA_TYPES and 'nav' not in self.properties
+
+    @property
+    def is_image(self) -> bool:
+        """Whether the item is an image."""
+        return self.media_type.startswith('image/')
+
+
+class TocLink(NamedTuple):
+    """One entry of an ePub's table of contents."""
+
+    title: str
+    name: str      # Member name of the target document
+    fragment: str  # Element id inside the document ("" for its start)
+    level: int     # Nesting depth, 0 for top-level entries
+
+
+def resolve_href(base_name: str, href: str) -> str:
+    """Resolve an href relative to the archive member it appears in.
+
+    Args:
+        base_name: Member name of the referring file (e.g. "OEBPS/text/ch1.xhtml")
+        href: Relative, percent-encoded reference, optionally with a fragment
+
+    Returns:
+        Normalized member name the href points at
+    """
+    href = unquote(href.split('#', 1)[0])
+    if href.startswith('/'):
+        return posixpath.normpath(href.lstrip('/'))
+    return posixpath.normpath(posixpath.join(posixpath.dirname(base_name), href))
+
+
+class EpubArchive:
+    """Read-only view of an ePub that loads members on demand.
+
+    Use as a context manager, or call close() when done.
+    """
+
+    def __init__(self, file_path: str):
+        """Open an ePub and read its package document.
+
+        Args:
+            file_path: Path to the ePub file
+
+        Raises:
+            ValueError: If the file is not a valid ePub
+        """
+        self.file_path = file_path
+        self._zip = zipfile.ZipFile(file_path)
+        try:
+            self.opf_name = self._find_opf()
+            self._read_opf()
+        except (KeyError, etree.XMLSyntaxError) as e:
+            self._zip.close()
+            raise ValueError(f"Invalid ePub file {file_path}: {e}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the underlying zip file."""
+        self._zip.close()
+
+    def _parse_xml(self, name: str):
+        return etree.fromstring(self._zip.read(name), etree.XMLParser(recover=True))
+
+    def _find_opf(self) -> str:
+        container = self._parse_xml(CONTAINER_PATH)
+        rootfile = next(container.iter('{*}rootfile'), None)
+        if rootfile is None or not rootfile.get('full-path'):
+            raise KeyError("container.xml names no package document")
+        return rootfile.get('full-path')
+
+    def _read_opf(self):
+        package = self._parse_xml(self.opf_name)
+
+        self.manifest: Dict[str, ManifestItem] = {}
+        for item in package.iter('{*}item'):
+            item_id, href = item.get('id'), item.get('href')
+            if not item_id or not href:
+                continue
+            self.manifest[item_id] = ManifestItem(
+                id=item_id,
+                name=resolve_href(self.opf_name, href),
+                media_type=item.get('media-type', ''),
+                properties=frozenset(item.get('properties', '').split())
+            )
+
+        self._image_names = [item.name for item in self.manifest.values() if item.is_image]
+        self._image_name_set = frozenset(self._image_names)
+
+        spine = next(package.iter('{*}spine'), None)
+        self.spine_toc: Optional[str] = spine.get('toc') if spine is not None else None
+        self.spine: List[ManifestItem] = []
+        if spine is not None:
+            for itemref in spine.iter('{*}itemref'):
+                item = self.manifest.get(itemref.get('idref'))
+                if item is not None:
+                    self.spine.append(item)
+
+    def documents(self) -> List[ManifestItem]:
+        """Return the content documents in spine (reading) order.
+
+        Falls back to manifest order when the book has no usable spine.
+        """
+        documents = [item for item in self.spine if item.is_document]
+        if not documents:
+            documents = [item for item in self.manifest.values() if item.is_document]
+        return documents
+
+    def image_names(self) -> List[str]:
+        """Return the member names of all images in the manifest."""
+        return list(self._image_names)
+
+    def toc(self) -> List[TocLink]:
+        """Return the table of contents in reading order, nested entries flattened.
+
+        The EPUB 3 navigation document is preferred; the EPUB 2 NCX is used
+        when there is none. Entries without a link are skipped.
+
+        Returns:
+            List of TocLink, empty if the book has no usable table of contents
+        """
+        nav = next((item for item in self.manifest.values() if 'nav' in item.properties), None)
+        if nav is not None:
+            links = self._read_nav(nav.name)
+            if links:
+                return links
+
+        ncx = self.manifest.get(self.spine_toc) if self.spine_toc else None
+        if ncx is None:
+            ncx = next((item for item in self.manifest.values() if item.media_type == NCX_MEDIA_TYPE), None)
+        if ncx is not None:
+            return self._read_ncx(ncx.name)
+        return []
+
+    def _toc_link(self, title: str, base_name: str, href: str, level: int) -> TocLink:
+        fragment = unquote(href.split('#', 1)[1]) if '#' in href else ''
+        return TocLink(
+            title=' '.join(title.split()),
+            name=resolve_href(base_name, href),
+            fragment=fragment,
+            level=level
+        )
+
+    def _read_nav(self, nav_name: str) -> List[TocLink]:
+        try:
+            root = html.document_fromstring(self._zip.read(nav_name))
+        except (KeyError, etree.ParserError, ValueError):
+            return []
+
+        navs = list(root.iter('nav'))
+        toc_nav = next((nav for nav in navs if 'toc' in nav.get('epub:type', '').split()), None)
+        if toc_nav is None:
+            toc_nav = navs[0] if navs else None
+        if toc_nav is None:
+            return []
+
+        top_list = next(toc_nav.iter('ol', 'ul'), None)
+        if top_list is None:
+            return []
+        return self._read_nav_list(top_list, nav_name, 0)
+
+    def _read_nav_list(self, entry_list, nav_name: str, level: int) -> List[TocLink]:
+        links = []
+        for item in entry_list:
+            if item.tag != 'li':
+                continue
+            # Only the item's own link; links of nested entries come after it
+            anchor = next((child for child in item if child.tag == 'a'), None)
+            if anchor is not None and anchor.get('href'):
+                links.append(self._toc_link(anchor.text_content(), nav_name, anchor.get('href'), level))
+            for sublist in item:
+                if sublist.tag in ('ol', 'ul'):
+                    links.extend(self._read_nav_list(sublist, nav_name, level + 1))
+        return links
+
+    def _read_ncx(self, ncx_name: str) -> List[TocLink]:
+        try:
+            root = self._parse_xml(ncx_name)
+        except (KeyError, etree.XMLSyntaxError):
+            return []
+        nav_map = next(root.iter('{*}navMap'), None)
+        if nav_map is None:
+            return []
+
+        return self._read_nav_points(nav_map, ncx_name, 0)
+
+    def _read_nav_points(self, parent, ncx_name: str, level: int) -> List[TocLink]:
+        links = []
+        for nav_point in parent.iterchildren('{*}navPoint'):
+            label = nav_point.find('{*}navLabel/{*}text')
+            content = nav_point.find('{*}content')
+            if content is not None and content.get('src'):
+                title = (label.text or '') if label is not None else ''
+                links.append(self._toc_link(title, ncx_name, content.get('src'), level))
+            links.extend(self._read_nav_points(nav_point, ncx_name, level + 1))
+        return links
+
+    def read(self, name: str) -> bytes:
+        """Read one member of the archive.
+
+        Raises:
+            KeyError: If the member does not exist
+        """
+        return self._zip.read(name)
+
+    def find_image(self, img_src: str, document_name: str) -> Optional[bytes]:
+        """Read the image an <img> src in a document refers to.
+
+        The src is resolved relative to the document first; books with
+        inconsistent paths fall back to matching the src against the end of
+        every image name.
+
+        Args:
+            img_src: Value of the src attribute
+            document_name: Member name of the document containing the <img>
+
+        Returns:
+            The image bytes, or None if no image matches
+        """
+        name = resolve_href(document_name, img_src)
+        if name not in self._image_name_set:
+            # Clean up the path (remove ../ and leading /)
+            cleaned = unquote(img_src.split('#', 1)[0]).replace('../', '').lstrip('/')
+            if not cleaned:
+                return None
+            name = next(
+                (image_name for image_name in self._image_names
+                 if cleaned in image_name or image_name.endswith(cleaned)),
+                None
+            )
+            if name is None:
+                return None
+
+        try:
+            return self._zip.read(name)
+        except KeyError:
+            return None
@@ -0,0 +1,400 @@
+"""Single-pass ePub reading shared by text and image extraction.
+
+Opening an ePub and parsing its XHTML documents dominates extraction time,
+so each document is parsed once with lxml and text and image references are
+collected from the same parse tree. Documents are visited in spine (reading)
+order and can be parsed in parallel worker processes. Members are read from
+the zip archive only when needed (see EpubArchive), so only the document
+being parsed and the images it references are held in memory.
+"""
+
+import io
+import os
+import zipfile
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from lxml import etree, html
+
+from .document_structure import TocEntry
+from .epub_archive import EpubArchive
+from .image_extractor import ImageBlock, optimize_image
+
+# Below this many documents per worker, process start-up costs more than it saves
+MIN_DOCUMENTS_PER_WORKER = 8
+
+# Text inside these elements is not part of the readable text
+_SKIPPED_TAGS = frozenset(['script', 'style', 'template'])
+
+# Whitespace inside these elements is kept as-is
+_PRESERVED_TAGS = frozenset(['pre', 'textarea'])
+
+_ASCII_SPACES = ' \n\t\f\r'
+
+
+class EpubContent(NamedTuple):
+    """Text and images extracted from an ePub in one pass."""
+
+    text: str
+    images: List[ImageBlock]
+    # The book's table of contents mapped to positions in text (empty if it has none)
+    toc: Sequence[TocEntry] = ()
+
+
+class ImageRef(NamedTuple):
+    """An <img> reference found while parsing an ePub document."""
+
+    src: str
+    caption: str
+
+
+class ParsedDocument(NamedTuple):
+    """The text, image references and anchor positions of one XHTML document."""
+
+    text: str
+    images: List[ImageRef]
+    anchors: Dict[str, int]  # Element id -> character position in text
+
+
+def _collect_text(element, pieces: List[str], preserve: bool, anchors: Optional[Dict[str, int]] = None):
+    """Append the text of an element and its descendants to pieces.
+
+    Whitespace-only strings collapse to a single newline (or space) the way
+    BeautifulSoup does, so the text matches BeautifulSoup.get_text().
+    When anchors maps element ids to None, the text position of each of
+    those elements is filled in.
+    """
+    if not isinstance(element.tag, str):
+        # Comments and processing instructions carry no readable text
+        return
+    if element.tag in _SKIPPED_TAGS:
+        return
+
+    if anchors:
+        for anchor in (element.get('id'), element.get('name')):
+            if anchor in anchors and anchors[anchor] is None:
+                anchors[anchor] = sum(len(piece) for piece in pieces)
+
+    preserve = preserve or element.tag in _PRESERVED_TAGS
+    if element.text:
+        pieces.append(_collapse_whitespace(element.text, preserve))
+    for child in element:
+        _collect_text(child, pieces, preserve, anchors)
+        if child.tail:
+            pieces.append(_collapse_whitespace(child.tail, preserve))
+
+
+def _collapse_whitespace(text: str, preserve: bool) -> str:
+    if preserve or text.strip(_ASCII_SPACES):
+        return text
+    return '\n' if '\n' in text else ' '
+
+
+def element_text(element) -> str:
+    """Return the readable text of a parsed (X)HTML element.
+
+    Args:
+        element: lxml element
+
+    Returns:
+        The concatenated text, skipping scripts, styles and comments
+    """
+    pieces = []
+    _collect_text(element, pieces, False)
+    return ''.join(pieces)
+
+
+def parse_document(
+    content: bytes,
+    extract_images: bool = True,
+    anchors: Iterable[str] = ()
+) -> ParsedDocument:
+    """Parse one XHTML document into its text and image references.
+
+    Kept at module level so it can be pickled into worker processes.
+
+    Args:
+        content: Raw bytes of the document
+        extract_images: Whether to collect <img> references
+        anchors: Element ids (e.g. table of contents targets) to locate in the text
+
+    Returns:
+        ParsedDocument with the body text, image references in document order
+        and the positions of the anchors that were found
+    """
+    try:
+        root = html.document_fromstring(content)
+    except (etree.ParserError, ValueError):
+        # Empty or unparsable document
+        return ParsedDocument(text='', images=[], anchors={})
+
+    body = root.find('body')
+    if body is None:
+        body = root
+
+    anchor_positions = dict.fromkeys(anchors)
+    pieces = []
+    _collect_text(body, pieces, False, anchor_positions)
+    text = ''.join(pieces)
+
+    refs = []
+    if extract_images:
+        for img_tag in body.iter('img'):
+            img_src = img_tag.get('src', '')
+            if not img_src:
+                continue
+
+            # Extract caption from alt text or figcaption
+            caption = img_tag.get('alt', '').strip()
+
+            # Try figcaption (if img is inside a figure)
+            figure = next(img_tag.iterancestors('figure'), None)
+            if figure is not None:
+                figcaption = next(figure.iter('figcaption'), None)
+                if figcaption is not None:
+                    caption = element_text(figcaption).strip()
+
+            refs.append(ImageRef(src=img_src, caption=caption))
+
+    return ParsedDocument(
+        text=text,
+        images=refs,
+        anchors={anchor: position for anchor, position in anchor_positions.items() if position is not None}
+    )
+
+
+# Zip files opened by worker processes, reused across the documents they parse
+_worker_archives: Dict[str, zipfile.ZipFile] = {}
+
+
+def parse_member(
+    file_path: str,
+    name: str,
+    extract_images: bool = True,
+    anchors: Iterable[str] = ()
+) -> ParsedDocument:
+    """Read one document from an ePub and parse it.
+
+    Used by worker processes, which open the archive themselves instead of
+    receiving document bytes from the parent.
+
+    Args:
+        file_path: Path to the ePub file
+        name: Member name of the document
+        extract_images: Whether to collect <img> references
+        anchors: Element ids to locate in the text
+
+    Returns:
+        ParsedDocument, as from parse_document
+    """
+    archive = _worker_archives.get(file_path)
+    if archive is None:
+        archive = _worker_archives[file_path] = zipfile.ZipFile(file_path)
+    return parse_document(archive.read(name), extract_images, anchors)
+
+
+def parse_members(
+    file_path: str,
+    names: List[str],
+    extract_images: bool,
+    anchor_lists: List[List[str]]
+) -> List[ParsedDocument]:
+    """Parse a chunk of documents of an ePub with parse_member, in one worker task."""
+    return [parse_member(file_path, name, extract_images, anchors) for name, anchors in zip(names, anchor_lists)]
+
+
+def _extract_document_images(
+    refs: List[ImageRef],
+    archive: EpubArchive,
+    document_name: str,
+    position: float,
+    start_index: int
+) -> List[ImageBlock]:
+    """Load the images referenced by one parsed ePub document.
+
+    Args:
+        refs: Image references from parse_document
+        archive: The open ePub
+        document_name: Member name of the document the references come from
+        position: Relative position of the document in the book
+        start_index: Sequential index to give the first image found
+
+    Returns:
+        List of ImageBlock objects in document order
+    """
+    from PIL import Image
+
+    images = []
+
+    for ref in refs:
+        try:
+            image_bytes = archive.find_image(ref.src, document_name)
+            if not image_bytes:
+                continue
+
+            # Convert to PIL Image
+            pil_image = Image.open(io.BytesIO(image_bytes))
+
+            # Filter out very small images
+            if pil_image.width < 50 or pil_image.height < 50:
+                continue
+
+            # Optimize image
+            pil_image = optimize_image(pil_image)
+
+            images.append(ImageBlock(
+                image=pil_image,
+                caption=ref.caption,
+                position=position,
+                page=None,  # ePub doesn't have page numbers
+                index=start_index + len(images)
+            ))
+
+        except Exception as e:
+            # Skip problematic images
+            print(f"Warning: Could not extract image from ePub: {e}")
+            continue
+
+    return images
+
+
+def _iter_parsed_documents(
+    archive: EpubArchive,
+    extract_images: bool,
+    workers: int,
+    anchors_by_name: Optional[Dict[str, List[str]]] = None
+) -> Iterator[Tuple[str, ParsedDocument, List[ImageBlock]]]:
+    """Parse the documents of an open ePub in spine order.
+
+    Yields:
+        Tuples of (member_name, parsed_document, document_images)
+    """
+    names = [item.name for item in archive.documents()]
+    anchor_lists = [(anchors_by_name or {}).get(name, []) for name in names]
+    total_docs = len(names)
+
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    workers = min(workers, total_docs // MIN_DOCUMENTS_PER_WORKER)
+
+    executor = None
+    if workers > 1:
+        # Imported here because multiprocessing is slow to import and only used in parallel
+        from concurrent.futures import ProcessPoolExecutor
+
+        executor = ProcessPoolExecutor(max_workers=workers)
+        chunksize = max(1, total_docs // (workers * 4))
+        futures = [
+            executor.submit(
+                parse_members, archive.file_path, names[start:start + chunksize],
+                extract_images, anchor_lists[start:start + chunksize]
+            )
+            for start in range(0, total_docs, chunksize)
+        ]
+        parsed = (document for future in futures for document in future.result())
+    else:
+        parsed = (
+            parse_document(archive.read(name), extract_images, anchors)
+            for name, anchors in zip(names, anchor_lists)
+        )
+
+    try:
+        image_index = 0
+        for doc_index, document in enumerate(parsed):
+            images = []
+            if document.images:
+                # Calculate position (relative to document)
+                position = (doc_index + 0.5) / total_docs
+                images = _extract_document_images(
+                    document.images, archive, names[doc_index], position, image_index
+                )
+                image_index += len(images)
+
+            yield names[doc_index], document, images
+    finally:
+        if executor is not None:
+            # Cancel the chunks not started yet, for a consumer that stops early
+            # (shutdown(cancel_futures=True) needs Python 3.9)
+            for future in futures:
+                future.cancel()
+            executor.shutdown()
+
+
+def iter_epub_documents(
+    file_path: str,
+    extract_images: bool = True,
+    workers: int = 1
+) -> Iterator[Tuple[str, List[ImageBlock]]]:
+    """Read an ePub once and yield the text and images of each document.
+
+    Documents are parsed with lxml, in worker processes when workers > 1;
+    results are always yielded in spine order.
+
+    Args:
+        file_path: Path to the ePub file
+        extract_images: Whether to extract the images referenced by each document
+        workers: Number of worker processes (1 = serial, 0 or less = one per CPU)
+
+    Yields:
+        Tuples of (document_text, document_images) for every XHTML document,
+        including documents without text
+
+    Raises:
+        ValueError: If the file is not a valid ePub
+    """
+    with EpubArchive(file_path) as archive:
+        for _, document, images in _iter_parsed_documents(archive, extract_images, workers):
+            yield document.text, images
+
+
+def read_epub_content(file_path: str, extract_images: bool = True, workers: int = 1) -> EpubContent:
+    """Extract the text, images and table of contents of an ePub in a single pass.
+
+    The text matches TextExtractor.extract_from_epub and the images match
+    extract_images_from_epub. Table of contents entries are mapped to
+    character positions in the text while the documents are parsed: an
+    entry points at its target element, or at the start of its document
+    when it has no fragment (or the fragment is not found).
+
+    Args:
+        file_path: Path to the ePub file
+        extract_images: Whether to extract images as well as text
+        workers: Number of worker processes for parsing documents
+
+    Returns:
+        EpubContent with the joined text, the list of ImageBlocks and the
+        table of contents
+    """
+    text = []
+    images = []
+    document_starts = {}
+    anchor_positions = {}
+    length = 0  # Length of the joined text so far
+
+    with EpubArchive(file_path) as archive:
+        links = archive.toc()
+        anchors_by_name = {}
+        for link in links:
+            if link.fragment:
+                anchors_by_name.setdefault(link.name, []).append(link.fragment)
+
+        for name, document, document_images in _iter_parsed_documents(
+            archive, extract_images, workers, anchors_by_name
+        ):
+            # Where this document's text starts, after the joining newline
+            start = length + 1 if text else 0
+            document_starts[name] = start
+            kept = bool(document.text.strip())
+            if kept:
+                text.append(document.text)
+                length = start + len(document.text)
+            for anchor, position in document.anchors.items():
+                anchor_positions[name, anchor] = start + position if kept else start
+            images.extend(document_images)
+
+    text = '\n'.join(text)
+    toc = []
+    for link in links:
+        position = anchor_positions.get((link.name, link.fragment), document_starts.get(link.name))
+        if position is not None:
+            toc.append(TocEntry(position=min(position, len(text)), title=link.title, level=link.level))
+
+    return EpubContent(text=text, images=images, toc=toc)
@@ -1,27 +1,22 @@
 """Module for extracting images from PDF and ePub files."""
 
 import os
-import io
-from typing import List, Tuple, Optional, Union
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, List, Tuple, Optional, Union
 from dataclasses import dataclass
-from PIL import Image
-import ebooklib
-from ebooklib import epub
-from bs4 import BeautifulSoup
 
-# PyMuPDF imports (try/except for graceful degradation)
-try:
-    import fitz  # PyMuPDF
-    HAS_PYMUPDF = True
-except ImportError:
-    HAS_PYMUPDF = False
+# PIL and PyMuPDF are slow to import, so they are imported where they are used
+if TYPE_CHECKING:
+    from PIL import Image
+
+HAS_PYMUPDF = find_spec('fitz') is not None
 
 
 @dataclass
 class ImageBlock:
     """Represents an extracted image with metadata."""
 
-    image: Image.Image
+    image: 'Image.Image'
     caption: str
     position: float  # Relative position in document (0.0 to 1.0)
     page: Optional[int]  # Page number (for PDFs)
@@ -29,7 +24,7 @@ class ImageBlock:
 
     def __init__(
         self,
-        image: Image.Image,
+        image: 'Image.Image',
         caption: str = "",
         position: float = 0.0,
         page: Optional[int] = None,
@@ -57,11 +52,11 @@ class ContentBlock:
 
 
 def optimize_image(
-    image: Image.Image,
+    image: 'Image.Image',
     max_width: int = 800,
     max_height: int = 1200,
     quality: int = 85
-) -> Image.Image:
+) -> 'Image.Image':
     """Optimize image size and quality.
 
     Args:
@@ -73,6 +68,8 @@ def optimize_image(
     Returns:
         Optimized PIL Image
     """
+    from PIL import Image
+
     # Get original dimensions
     width, height = image.size
 
@@ -119,56 +116,10 @@ def extract_images_from_pdf(file_path: str) -> List[ImageBlock]:
             "Install it with: pip install PyMuPDF"
         )
 
-    images = []
-    doc = fitz.open(file_path)
-    total_pages = len(doc)
-    image_index = 0
-
-    for page_num in range(total_pages):
-        page = doc[page_num]
-        image_list = page.get_images()
-
-        for img_index, img_info in enumerate(image_list):
-            try:
-                # Extract image
-                xref = img_info[0]
-                base_image = doc.extract_image(xref)
-                image_bytes = base_image["image"]
-
-                # Convert to PIL Image
-                pil_image = Image.open(io.BytesIO(image_bytes))
-
-                # Filter out very small images (likely decorative)
-                if pil_image.width < 50 or pil_image.height < 50:
-                    continue
-
-                # Optimize image
-                pil_image = optimize_image(pil_image)
+    # Imported here because pdf_reader builds on this module's ImageBlock
+    from .pdf_reader import read_pdf_content
 
-                # Try to extract caption (text directly below image)
-                caption = ""
-                # Note: Extracting captions from PDF is complex, leaving as empty for now
-
-                # Calculate position (relative to document)
-                position = (page_num + 0.5) / total_pages
-
-                images.append(ImageBlock(
-                    image=pil_image,
-                    caption=caption,
-                    position=position,
-                    page=page_num + 1,  # 1-indexed
-                    index=image_index
-                ))
-
-                image_index += 1
-
-            except Exception as e:
-                # Skip problematic images
-                print(f"Warning: Could not extract image {img_index} from page {page_num + 1}: {e}")
-                continue
-
-    doc.close()
-    return images
+    return read_pdf_content(file_path, extract_text=False).images
 
 
 def extract_images_from_epub(file_path: str) -> List[ImageBlock]:
@@ -180,91 +131,10 @@ def extract_images_from_epub(file_path: str) -> List[ImageBlock]:
     Returns:
         List of ImageBlock objects
     """
-    images = []
-    book = epub.read_epub(file_path)
-    image_index = 0
-
-    # First, get all image items from the ePub
-    epub_images = {}
-    for item in book.get_items():
-        if item.get_type() == ebooklib.ITEM_IMAGE:
-            # Store images by their href/filename
-            epub_images[item.get_name()] = item.get_content()
-
-    # Now parse HTML documents to find where images are used
-    documents = [item for item in book.get_items() if item.get_type() == ebooklib.ITEM_DOCUMENT]
-    total_docs = len(documents)
-
-    for doc_index, item in enumerate(documents):
-        soup = BeautifulSoup(item.get_content(), 'html.parser')
-
-        # Find all img tags
-        img_tags = soup.find_all('img')
-
-        for img_tag in img_tags:
-            try:
-                # Get image source
-                img_src = img_tag.get('src', '')
-                if not img_src:
-                    continue
-
-                # Clean up the path (remove ../ and leading /)
-                img_src = img_src.replace('../', '').lstrip('/')
-
-                # Try to find the image in our epub_images dict
-                image_bytes = None
-                for key, value in epub_images.items():
-                    if img_src in key or key.endswith(img_src):
-                        image_bytes = value
-                        break
-
-                if not image_bytes:
-                    continue
-
-                # Convert to PIL Image
-                pil_image = Image.open(io.BytesIO(image_bytes))
-
-                # Filter out very small images
-                if pil_image.width < 50 or pil_image.height < 50:
-                    continue
-
-                # Optimize image
-                pil_image = optimize_image(pil_image)
-
-                # Extract caption from alt text or figcaption
-                caption = ""
-
-                # Try alt text
-                alt_text = img_tag.get('alt', '').strip()
-                if alt_text:
-                    caption = alt_text
-
-                # Try figcaption (if img is inside a figure)
-                figure = img_tag.find_parent('figure')
-                if figure:
-                    figcaption = figure.find('figcaption')
-                    if figcaption:
-                        caption = figcaption.get_text().strip()
-
-                # Calculate position (relative to document)
-                position = (doc_index + 0.5) / total_docs if total_docs > 0 else 0.5
-
-                images.append(ImageBlock(
-                    image=pil_image,
-                    caption=caption,
-                    position=position,
-                    page=None,  # ePub doesn't have page numbers
-                    index=image_index
-                ))
-
-                image_index += 1
-
-            except Exception as e:
-                # Skip problematic images
-                print(f"Warning: Could not extract image from ePub: {e}")
-                continue
-
-    return images
+    # Imported here because epub_reader builds on this module's ImageBlock
+    from .epub_reader import read_epub_content
+
+    return read_epub_content(file_path, extract_images=True).images
 
 
 def extract_images(file_path: str) -> List[ImageBlock]:
@@ -0,0 +1,284 @@
+"""Length-based segment alignment in the style of Gale and Church (1993).
+
+Translated sentences (or paragraphs) have lengths that are roughly
+proportional to their originals. Each possible bead, 1:1, 1:0, 0:1, 2:1 or
+1:2 segments, gets a cost from how far its length ratio is from the
+expected ratio plus a prior for the bead type, and dynamic programming
+finds the cheapest sequence of beads.
+
+The table is only filled within a band around the diagonal (scaled to the
+two segment counts), so time and memory grow with n * band instead of
+n * m. Rows are computed with NumPy: moves from earlier rows are plain
+vector operations, and the 0:1 move within a row is resolved with a
+running minimum instead of a Python loop over cells.
+"""
+
+import math
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+# (segments taken from text 1, segments taken from text 2)
+Move = Tuple[int, int]
+
+# Bead types and their prior probabilities (Gale and Church, 1993, Table 5;
+# the 1:0/0:1 and 2:1/1:2 masses are split evenly between the two directions)
+GALE_CHURCH_PRIORS = {
+    (1, 1): 0.89,
+    (1, 0): 0.0099 / 2,
+    (0, 1): 0.0099 / 2,
+    (2, 1): 0.089 / 2,
+    (1, 2): 0.089 / 2,
+}
+
+# Variance of the length of a translation per character of the original
+GALE_CHURCH_VARIANCE = 6.8
+
+DEFAULT_BAND = 50
+
+# Rows whose bead costs are computed in one batch
+_BLOCK_ROWS = 512
+
+_INF = np.inf
+
+_SQRT_HALF = math.sqrt(0.5)
+
+# Index of the "no move" marker in back pointers (only used for the origin)
+_NO_MOVE = -1
+
+
+class Bead(NamedTuple):
+    """Segments text1[start1:end1] aligned with text2[start2:end2]."""
+
+    start1: int
+    end1: int
+    start2: int
+    end2: int
+
+
+def neg_log_erfc(x: np.ndarray) -> np.ndarray:
+    """Return -log(erfc(x)) for non-negative x.
+
+    NumPy has no vectorized erfc; this uses the Abramowitz and Stegun 7.1.26
+    approximation erfc(x) = poly(t) * exp(-x**2) (absolute error below
+    1.5e-7) and takes the logarithm analytically, so it neither underflows
+    nor needs exp() for large x.
+    """
+    t = 1.0 / (1.0 + 0.3275911 * x)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    return x * x - np.log(poly)
+
+
+def gale_church_cost(
+    lengths1: Sequence[int],
+    lengths2: Sequence[int],
+    ratio: Optional[float] = None,
+    variance: float = GALE_CHURCH_VARIANCE,
+    priors: Optional[Dict[Move, float]] = None
+) -> Callable[[Move, np.ndarray, np.ndarray], np.ndarray]:
+    """Build the Gale-Church bead cost function for two lists of segment lengths.
+
+    Args:
+        lengths1: Length (in characters) of every segment of text 1
+        lengths2: Length of every segment of text 2
+        ratio: Expected characters of text 2 per character of text 1
+            (default: the ratio of the two totals, which suits language
+            pairs such as English and Chinese whose ratio is far from 1)
+        variance: Variance of a translation's length per character of the
+            original, in text 1 characters
+        priors: Bead type -> prior probability (default: GALE_CHURCH_PRIORS)
+
+    Returns:
+        Function cost(move, i, j) giving the cost of the beads that end
+        after segment i of text 1 and segment j of text 2
+    """
+    prefix1 = np.concatenate(([0], np.cumsum(lengths1, dtype=np.float64)))
+    prefix2 = np.concatenate(([0], np.cumsum(lengths2, dtype=np.float64)))
+    if ratio is None:
+        ratio = prefix2[-1] / prefix1[-1] if prefix1[-1] and prefix2[-1] else 1.0
+    priors = priors or GALE_CHURCH_PRIORS
+    penalties = {move: -math.log(prior) for move, prior in priors.items()}
+
+    def cost(move: Move, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+        di, dj = move
+        length1 = prefix1[i] - prefix1[i - di]
+        length2 = prefix2[j] - prefix2[j - dj]
+        # The deviation's variance grows with the mean bead length (in text 1 characters)
+        spread = np.maximum(length1 + length2 / ratio, 1e-9) * (variance * ratio / 2)
+        delta = np.abs(length2 - length1 * ratio) / np.sqrt(spread)
+        # Two-sided tail probability of the deviation: erfc(|delta| / sqrt(2))
+        return penalties[move] + neg_log_erfc(delta * _SQRT_HALF)
+
+    return cost
+
+
+def banded_align(
+    n: int,
+    m: int,
+    cost: Callable[[Move, np.ndarray, np.ndarray], np.ndarray],
+    moves: Sequence[Move] = tuple(GALE_CHURCH_PRIORS),
+    band: int = DEFAULT_BAND
+) -> List[Bead]:
+    """Find the cheapest monotonic sequence of beads through an n x m table.
+
+    Cell (i, j) holds the cheapest alignment of the first i segments of
+    text 1 with the first j of text 2. Only cells within band columns of
+    the line from (0, 0) to (n, m) are computed.
+
+    Args:
+        n: Number of segments in text 1
+        m: Number of segments in text 2
+        cost: Function cost(move, i, j) returning bead costs for arrays of
+            end cells (i, j), as built by gale_church_cost
+        moves: Bead types (di, dj) that are allowed; (0, 1) is the only one
+            allowed with di == 0
+        band: Half-width of the band in columns
+
+    Returns:
+        Beads in text order, covering both texts
+
+    Raises:
+        ValueError: If moves contains a move other than (0, 1) with di == 0
+    """
+    moves = list(moves)
+    if any(di == 0 and dj != 1 for di, dj in moves):
+        raise ValueError("Only the (0, 1) move may take no segment from text 1")
+    if n == 0 or m == 0:
+        if n == 0 and m == 0:
+            return []
+        return [Bead(0, n, 0, m)]
+
+    row_moves = [move for move in moves if move[0] > 0]
+    insert = (0, 1) in moves
+    insert_code = moves.index((0, 1)) if insert else _NO_MOVE
+    row_codes = np.array([moves.index(move) for move in row_moves], dtype=np.int8)
+
+    # Row i covers columns lows[i] .. lows[i] + width - 1; a steep band is
+    # widened so that consecutive rows always overlap
+    slope = m / n
+    band = max(band, int(math.ceil(slope)) + 2)
+    centers = np.round(np.arange(n + 1) * slope).astype(np.int64)
+    lows = centers - band
+    width = 2 * band + 1
+
+    # Rows of the table are padded on both sides, so the cells a move comes
+    # from are a plain slice of an earlier row
+    max_di = max(di for di, _ in row_moves)
+    padding = int(np.max(lows[max_di:] - lows[:-max_di])) + max(dj for _, dj in row_moves) + 1 if n >= max_di else 0
+    padding = max(padding, int(math.ceil(slope)) + 3)
+    costs = np.full((n + 1, width + 2 * padding), _INF)
+    back = np.full((n + 1, width), _NO_MOVE, dtype=np.int8)
+    offsets = np.arange(width)
+
+    # Row 0: the origin, then 0:1 moves along the row
+    columns = lows[0] + offsets
+    row = np.where(columns == 0, 0.0, _INF)
+    if insert:
+        steps = _insert_costs(cost, np.zeros((1, width), dtype=np.int64), columns[None, :], m)[0]
+        row, inserted = _insert_scan(row, np.cumsum(steps))
+        back[0][inserted] = insert_code
+    costs[0, padding:padding + width] = row
+
+    stride = costs.shape[1]
+    flat_costs = costs.reshape(-1)
+    move_rows = np.array([di for di, _ in row_moves])
+    move_columns = np.array([dj for _, dj in row_moves])
+    cell_index = np.arange(width)
+    for block_start in range(1, n + 1, _BLOCK_ROWS):
+        block_rows = np.arange(block_start, min(block_start + _BLOCK_ROWS, n + 1))
+        block_columns = lows[block_rows][:, None] + offsets[None, :]
+        rows = np.broadcast_to(block_rows[:, None], block_columns.shape)
+        valid = (block_columns >= 0) & (block_columns <= m)
+
+        # Bead costs for every cell of the block and every move, in one batch;
+        # moves that would start outside the table cost infinity
+        block_costs = np.empty((len(block_rows), len(row_moves), width))
+        for number, (di, dj) in enumerate(row_moves):
+            usable = valid & (rows >= di) & (block_columns >= dj)
+            move_cost = cost((di, dj), np.clip(rows, min(di, n), n), np.clip(block_columns, min(dj, m), m))
+            block_costs[:, number] = np.where(usable, move_cost, _INF)
+        if insert:
+            block_prefix = np.cumsum(_insert_costs(cost, rows, block_columns, m), axis=1)
+
+        # Flat positions in costs of the cells each move comes from
+        previous_rows = np.maximum(block_rows[:, None] - move_rows[None, :], 0)
+        starts = padding + lows[block_rows][:, None] - lows[previous_rows] - move_columns[None, :]
+        sources = (previous_rows * stride + starts)[:, :, None] + cell_index[None, None, :]
+
+        for index, i in enumerate(block_rows):
+            candidates = flat_costs.take(sources[index])
+            candidates += block_costs[index]
+            best = candidates.argmin(axis=0)
+            row = candidates[best, cell_index]
+            codes = row_codes[best]
+            if insert:
+                row, inserted = _insert_scan(row, block_prefix[index])
+                codes[inserted] = insert_code
+            costs[i, padding:padding + width] = row
+            back[i] = codes
+
+    return _backtrace(back, lows, moves, n, m)
+
+
+def _insert_costs(cost, rows: np.ndarray, columns: np.ndarray, m: int) -> np.ndarray:
+    """Return the 0:1 bead cost of every cell (0 where no 0:1 move can end)."""
+    usable = (columns >= 1) & (columns <= m)
+    if not usable.any():
+        return np.zeros(columns.shape)
+    return np.where(usable, cost((0, 1), rows, np.clip(columns, 1, m)), 0.0)
+
+
+def _insert_scan(row: np.ndarray, prefix: np.ndarray):
+    """Apply 0:1 moves along a row with a running minimum.
+
+    best[k] = min over k' <= k of row[k'] plus the cost of inserting the
+    segments of text 2 between columns k' and k. With prefix the running
+    sum of the insertion costs that is prefix[k] + min(row[k'] - prefix[k']).
+    Cells left of column 0 are infinite, so no chain enters the table from
+    outside it; chains past column m never lead back to (n, m).
+
+    Returns:
+        Tuple of (new row, mask of cells reached by a 0:1 move)
+    """
+    shifted = row - prefix
+    running = np.minimum.accumulate(shifted)
+    # Compared before adding the prefix back, so rounding cannot fake a gain
+    inserted = running < shifted
+    return np.where(inserted, running + prefix, row), inserted
+
+
+def _backtrace(back: np.ndarray, lows: np.ndarray, moves: Sequence[Move], n: int, m: int) -> List[Bead]:
+    """Follow back pointers from (n, m) to the origin."""
+    beads = []
+    i, j = n, m
+    while i > 0 or j > 0:
+        code = back[i, j - lows[i]]
+        if code == _NO_MOVE:
+            raise ValueError("The band is too narrow to align these texts; increase band")
+        di, dj = moves[code]
+        beads.append(Bead(i - di, i, j - dj, j))
+        i, j = i - di, j - dj
+    beads.reverse()
+    return beads
+
+
+def align_lengths(
+    lengths1: Sequence[int],
+    lengths2: Sequence[int],
+    band: int = DEFAULT_BAND,
+    ratio: Optional[float] = None
+) -> List[Bead]:
+    """Align two lists of segment lengths with the Gale-Church cost.
+
+    Args:
+        lengths1: Length of every segment of text 1
+        lengths2: Length of every segment of text 2
+        band: Half-width of the band in columns
+        ratio: Expected characters of text 2 per character of text 1
+            (default: the ratio of the totals)
+
+    Returns:
+        Beads in text order, covering both lists
+    """
+    cost = gale_church_cost(lengths1, lengths2, ratio=ratio)
+    return banded_align(len(lengths1), len(lengths2), cost, band=band)
@@ -2,7 +2,9 @@
 
 import os
 import io
-from typing import List, Tuple
+from collections.abc import Sized
+from itertools import chain, islice
+from typing import Iterable, Iterator, List, Optional, Tuple
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
@@ -122,48 +124,20 @@ class PDFGenerator:
 
     def generate_pdf(
         self,
-        aligned_texts: List[Tuple[str, str]],
+        aligned_texts: Iterable[Tuple[str, str]],
         lang1_name: str = "Language 1",
         lang2_name: str = "Language 2"
     ):
         """Generate the PDF with aligned bilingual text.
         
         Args:
-            aligned_texts: List of tuples containing aligned text segments
+            aligned_texts: Tuples containing aligned text segments; a list,
+                or an iterator (such as BilingualAligner.iter_align) that is
+                consumed while the PDF is written
             lang1_name: Name of first language for display
             lang2_name: Name of second language for display
         """
-        story = []
-        
-        # Add title
-        title = Paragraph(self.title, self.styles['CustomTitle'])
-        story.append(title)
-        story.append(Spacer(1, 0.2 * inch))
-        
-        # Add aligned text segments
-        for idx, (text1, text2) in enumerate(aligned_texts):
-            if text1.strip():
-                # Add language 1 text
-                para1 = Paragraph(
-                    self._sanitize_text(text1),
-                    self.styles['Language1']
-                )
-                story.append(para1)
-            
-            if text2.strip():
-                # Add language 2 text
-                para2 = Paragraph(
-                    self._sanitize_text(text2),
-                    self.styles['Language2']
-                )
-                story.append(para2)
-            
-            # Add extra spacing between alignment pairs
-            if idx < len(aligned_texts) - 1:
-                story.append(Spacer(1, 0.1 * inch))
-        
-        # Build the PDF
-        self.doc.build(story)
+        self._build(chain(self._title_flowables(), self._pair_flowables(aligned_texts)))
 
     def generate_pdf_from_aligned_document(
         self,
@@ -174,118 +148,101 @@ class PDFGenerator:
         """Generate PDF from an AlignedDocument with front/main/back matter.
 
         Front and back matter are displayed side-by-side (concatenated).
-        Main text is displayed with sentence/paragraph alignment.
+        Main text is displayed with sentence/paragraph alignment; it may be
+        an iterator (see BilingualAligner.align_documents with stream=True),
+        which is consumed while the PDF is written, or a SegmentStore, which
+        is read in order in batches. To re-render a sub-range of a store,
+        pass aligned_doc._replace(main_text=store.iter_range(start, end)).
 
         Args:
             aligned_doc: AlignedDocument with front_matter, main_text, back_matter
             lang1_name: Name of first language for display
             lang2_name: Name of second language for display
         """
-        story = []
+        main_text = _non_empty(aligned_doc.main_text)
+        main_flowables = self._main_text_flowables(main_text) if main_text is not None else ()
+        self._build(self._document_flowables(aligned_doc, main_flowables, lang1_name, lang2_name))
+
+    def _build(self, flowables: Iterable):
+        """Build the PDF from flowables, creating them as the layout consumes them."""
+        self.doc.build(StreamingStory(flowables))
 
-        # Add title
-        title = Paragraph(self.title, self.styles['CustomTitle'])
-        story.append(title)
-        story.append(Spacer(1, 0.2 * inch))
+    def _title_flowables(self) -> List:
+        """Return the document title and the space below it."""
+        return [Paragraph(self.title, self.styles['CustomTitle']), Spacer(1, 0.2 * inch)]
+
+    def _pair_flowables(self, aligned_texts: Iterable[Tuple[str, str]]) -> Iterator:
+        """Yield the paragraphs of aligned pairs, with extra spacing between pairs."""
+        for idx, (text1, text2) in enumerate(aligned_texts):
+            # Add extra spacing between alignment pairs
+            if idx:
+                yield Spacer(1, 0.1 * inch)
+            yield from self._text_flowables(text1, text2)
+
+    def _text_flowables(self, text1: str, text2: str) -> Iterator:
+        """Yield the paragraphs of one aligned pair, skipping empty sides."""
+        if text1.strip():
+            yield Paragraph(self._sanitize_text(text1), self.styles['Language1'])
+
+        if text2.strip():
+            yield Paragraph(self._sanitize_text(text2), self.styles['Language2'])
+
+    def _main_text_flowables(self, main_text: Iterable[Tuple[str, str]]) -> Iterator:
+        """Yield the main text section: its header, then the aligned pairs."""
+        yield Paragraph("Main Text", self.styles['SectionHeader'])
+        yield Spacer(1, 0.1 * inch)
+        yield from self._pair_flowables(main_text)
+
+    def _matter_flowables(
+        self,
+        pairs: List[Tuple[str, str]],
+        style_name: str,
+        lang1_name: str,
+        lang2_name: str
+    ) -> Iterator:
+        """Yield front or back matter: each language labeled, split into paragraphs."""
+        for text1, text2 in pairs:
+            if text1.strip():
+                yield Paragraph(f"<b>{lang1_name}:</b>", self.styles[style_name])
+                # Split long front/back matter into paragraphs for better display
+                for para in text1.split('\n\n'):
+                    if para.strip():
+                        yield Paragraph(self._sanitize_text(para), self.styles[style_name])
+
+            yield Spacer(1, 0.15 * inch)
+
+            if text2.strip():
+                yield Paragraph(f"<b>{lang2_name}:</b>", self.styles[style_name])
+                for para in text2.split('\n\n'):
+                    if para.strip():
+                        yield Paragraph(self._sanitize_text(para), self.styles[style_name])
+
+    def _document_flowables(
+        self,
+        aligned_doc,
+        main_flowables: Iterable,
+        lang1_name: str,
+        lang2_name: str
+    ) -> Iterator:
+        """Yield the title, front matter, main text section and back matter of a document."""
+        yield from self._title_flowables()
 
         # Add front matter section (if present)
         if aligned_doc.front_matter:
-            story.append(Paragraph("Front Matter", self.styles['SectionHeader']))
-            story.append(Spacer(1, 0.1 * inch))
-
-            for text1, text2 in aligned_doc.front_matter:
-                if text1.strip():
-                    story.append(Paragraph(
-                        f"<b>{lang1_name}:</b>",
-                        self.styles['FrontMatter']
-                    ))
-                    # Split long front matter into paragraphs for better display
-                    for para in text1.split('\n\n'):
-                        if para.strip():
-                            story.append(Paragraph(
-                                self._sanitize_text(para),
-                                self.styles['FrontMatter']
-                            ))
-
-                story.append(Spacer(1, 0.15 * inch))
-
-                if text2.strip():
-                    story.append(Paragraph(
-                        f"<b>{lang2_name}:</b>",
-                        self.styles['FrontMatter']
-                    ))
-                    # Split long front matter into paragraphs for better display
-                    for para in text2.split('\n\n'):
-                        if para.strip():
-                            story.append(Paragraph(
-                                self._sanitize_text(para),
-                                self.styles['FrontMatter']
-                            ))
-
+            yield Paragraph("Front Matter", self.styles['SectionHeader'])
+            yield Spacer(1, 0.1 * inch)
+            yield from self._matter_flowables(aligned_doc.front_matter, 'FrontMatter', lang1_name, lang2_name)
             # Page break after front matter
-            story.append(PageBreak())
-
-        # Add main text section (aligned)
-        if aligned_doc.main_text:
-            story.append(Paragraph("Main Text", self.styles['SectionHeader']))
-            story.append(Spacer(1, 0.1 * inch))
-
-            for idx, (text1, text2) in enumerate(aligned_doc.main_text):
-                if text1.strip():
-                    para1 = Paragraph(
-                        self._sanitize_text(text1),
-                        self.styles['Language1']
-                    )
-                    story.append(para1)
-
-                if text2.strip():
-                    para2 = Paragraph(
-                        self._sanitize_text(text2),
-                        self.styles['Language2']
-                    )
-                    story.append(para2)
-
-                # Add spacing between alignment pairs
-                if idx < len(aligned_doc.main_text) - 1:
-                    story.append(Spacer(1, 0.1 * inch))
+            yield PageBreak()
+
+        yield from main_flowables
 
         # Add back matter section (if present)
         if aligned_doc.back_matter:
-            story.append(PageBreak())
-            story.append(Paragraph("Back Matter", self.styles['SectionHeader']))
-            story.append(Spacer(1, 0.1 * inch))
-
-            for text1, text2 in aligned_doc.back_matter:
-                if text1.strip():
-                    story.append(Paragraph(
-                        f"<b>{lang1_name}:</b>",
-                        self.styles['BackMatter']
-                    ))
-                    # Split long back matter into paragraphs for better display
-                    for para in text1.split('\n\n'):
-                        if para.strip():
-                            story.append(Paragraph(
-                                self._sanitize_text(para),
-                                self.styles['BackMatter']
-                            ))
-
-                story.append(Spacer(1, 0.15 * inch))
-
-                if text2.strip():
-                    story.append(Paragraph(
-                        f"<b>{lang2_name}:</b>",
-                        self.styles['BackMatter']
-                    ))
-                    # Split long back matter into paragraphs for better display
-                    for para in text2.split('\n\n'):
-                        if para.strip():
-                            story.append(Paragraph(
-                                self._sanitize_text(para),
-                                self.styles['BackMatter']
-                            ))
-
-        # Build the PDF
-        self.doc.build(story)
+            yield PageBreak()
+            yield Paragraph("Back Matter", self.styles['SectionHeader'])
+            yield Spacer(1, 0.1 * inch)
+            yield from self._matter_flowables(aligned_doc.back_matter, 'BackMatter', lang1_name, lang2_name)
 
     def _sanitize_text(self, text: str) -> str:
         """Sanitize text for PDF generation.
@@ -428,191 +385,131 @@ class PDFGenerator:
     ):
         """Generate PDF from AlignedDocumentWithImages.
 
+        Main text may be an iterator, as in generate_pdf_from_aligned_document.
+        Inline images are placed by the index of the pair they fall on, which
+        needs the number of pairs, so an iterator is collected into a list
+        first when the document has images and image_match_mode is "inline".
+
         Args:
             aligned_doc: AlignedDocumentWithImages with text and images
             lang1_name: Name of first language
             lang2_name: Name of second language
             image_match_mode: How images were matched ("inline", "position", "page", "proximity")
         """
-        story = []
-
-        # Add title
-        title = Paragraph(self.title, self.styles['CustomTitle'])
-        story.append(title)
-        story.append(Spacer(1, 0.2 * inch))
+        main_text = _non_empty(aligned_doc.main_text)
+        main_flowables = ()
+        if main_text is not None:
+            main_flowables = self._main_text_with_images_flowables(aligned_doc, main_text, image_match_mode)
+        self._build(self._document_flowables(aligned_doc, main_flowables, lang1_name, lang2_name))
 
-        # Add front matter section (if present)
-        if aligned_doc.front_matter:
-            story.append(Paragraph("Front Matter", self.styles['SectionHeader']))
-            story.append(Spacer(1, 0.1 * inch))
-
-            for text1, text2 in aligned_doc.front_matter:
-                if text1.strip():
-                    story.append(Paragraph(
-                        f"<b>{lang1_name}:</b>",
-                        self.styles['FrontMatter']
-                    ))
-                    for para in text1.split('\n\n'):
-                        if para.strip():
-                            story.append(Paragraph(
-                                self._sanitize_text(para),
-                                self.styles['FrontMatter']
-                            ))
-
-                story.append(Spacer(1, 0.15 * inch))
-
-                if text2.strip():
-                    story.append(Paragraph(
-                        f"<b>{lang2_name}:</b>",
-                        self.styles['FrontMatter']
-                    ))
-                    for para in text2.split('\n\n'):
-                        if para.strip():
-                            story.append(Paragraph(
-                                self._sanitize_text(para),
-                                self.styles['FrontMatter']
-                            ))
-
-            story.append(PageBreak())
-
-        # Add main text section with images
-        if aligned_doc.main_text:
-            story.append(Paragraph("Main Text", self.styles['SectionHeader']))
-            story.append(Spacer(1, 0.1 * inch))
-
-            # Track which images have been displayed
-            displayed_matched = set()
-            displayed_unmatched1 = set()
-            displayed_unmatched2 = set()
-
-            # For inline mode, interleave images with text based on position
-            if image_match_mode == "inline":
-                # Combine all images into a single list with language indicator
-                all_images = []
-                for img in aligned_doc.unmatched_images1:
-                    all_images.append((img, 1))  # lang1
-                for img in aligned_doc.unmatched_images2:
-                    all_images.append((img, 2))  # lang2
-
-                # Sort by position
-                all_images.sort(key=lambda x: x[0].position)
-
-                img_index = 0
-                for idx, (text1, text2) in enumerate(aligned_doc.main_text):
-                    # Display images that appear before this text segment
-                    while img_index < len(all_images):
-                        img, lang = all_images[img_index]
-                        # Rough heuristic: image position corresponds to text segment
-                        segment_position = (idx + 0.5) / len(aligned_doc.main_text)
-                        if img.position <= segment_position:
-                            # Display image for its language
-                            if lang == 1:
-                                for elem in self._create_single_image_element(img):
-                                    story.append(elem)
-                                story.append(Spacer(1, 0.15 * inch))
-                            img_index += 1
-                        else:
-                            break
-
-                    # Display text
-                    if text1.strip():
-                        para1 = Paragraph(
-                            self._sanitize_text(text1),
-                            self.styles['Language1']
-                        )
-                        story.append(para1)
-
-                    if text2.strip():
-                        # Display images for lang2 before the text if applicable
-                        para2 = Paragraph(
-                            self._sanitize_text(text2),
-                            self.styles['Language2']
-                        )
-                        story.append(para2)
-
-                    if idx < len(aligned_doc.main_text) - 1:
-                        story.append(Spacer(1, 0.1 * inch))
-
-                # Display any remaining images
+    def _main_text_with_images_flowables(
+        self,
+        aligned_doc: AlignedDocumentWithImages,
+        main_text: Iterable[Tuple[str, str]],
+        image_match_mode: str
+    ) -> Iterator:
+        """Yield the main text section with the document's images."""
+        yield Paragraph("Main Text", self.styles['SectionHeader'])
+        yield Spacer(1, 0.1 * inch)
+
+        # For inline mode, interleave images with text based on position
+        if image_match_mode == "inline":
+            # Combine all images into a single list with language indicator
+            all_images = []
+            for img in aligned_doc.unmatched_images1:
+                all_images.append((img, 1))  # lang1
+            for img in aligned_doc.unmatched_images2:
+                all_images.append((img, 2))  # lang2
+
+            # Sort by position
+            all_images.sort(key=lambda x: x[0].position)
+
+            if all_images and not isinstance(main_text, Sized):
+                main_text = list(main_text)
+
+            img_index = 0
+            for idx, (text1, text2) in enumerate(main_text):
+                if idx:
+                    yield Spacer(1, 0.1 * inch)
+
+                # Display images that appear before this text segment
                 while img_index < len(all_images):
                     img, lang = all_images[img_index]
-                    for elem in self._create_single_image_element(img):
-                        story.append(elem)
-                    story.append(Spacer(1, 0.15 * inch))
-                    img_index += 1
-
-            else:
-                # For matched modes, display matched images side-by-side
-                # and unmatched images inline
-
-                # Display matched images first (or intersperse with text)
-                for matched_img1, matched_img2 in aligned_doc.matched_images:
-                    table = self._create_matched_image_table(matched_img1, matched_img2)
-                    story.append(table)
-                    story.append(Spacer(1, 0.2 * inch))
+                    # Rough heuristic: image position corresponds to text segment
+                    segment_position = (idx + 0.5) / len(main_text)
+                    if img.position <= segment_position:
+                        # Display image for its language
+                        if lang == 1:
+                            yield from self._create_single_image_element(img)
+                            yield Spacer(1, 0.15 * inch)
+                        img_index += 1
+                    else:
+                        break
 
                 # Display text
-                for idx, (text1, text2) in enumerate(aligned_doc.main_text):
-                    if text1.strip():
-                        para1 = Paragraph(
-                            self._sanitize_text(text1),
-                            self.styles['Language1']
-                        )
-                        story.append(para1)
-
-                    if text2.strip():
-                        para2 = Paragraph(
-                            self._sanitize_text(text2),
-                            self.styles['Language2']
-                        )
-                        story.append(para2)
-
-                    if idx < len(aligned_doc.main_text) - 1:
-                        story.append(Spacer(1, 0.1 * inch))
-
-                # Display unmatched images at the end
-                for img in aligned_doc.unmatched_images1:
-                    story.append(Spacer(1, 0.15 * inch))
-                    for elem in self._create_single_image_element(img):
-                        story.append(elem)
-
-                for img in aligned_doc.unmatched_images2:
-                    story.append(Spacer(1, 0.15 * inch))
-                    for elem in self._create_single_image_element(img):
-                        story.append(elem)
-
-        # Add back matter section (if present)
-        if aligned_doc.back_matter:
-            story.append(PageBreak())
-            story.append(Paragraph("Back Matter", self.styles['SectionHeader']))
-            story.append(Spacer(1, 0.1 * inch))
-
-            for text1, text2 in aligned_doc.back_matter:
-                if text1.strip():
-                    story.append(Paragraph(
-                        f"<b>{lang1_name}:</b>",
-                        self.styles['BackMatter']
-                    ))
-                    for para in text1.split('\n\n'):
-                        if para.strip():
-                            story.append(Paragraph(
-                                self._sanitize_text(para),
-                                self.styles['BackMatter']
-                            ))
-
-                story.append(Spacer(1, 0.15 * inch))
-
-                if text2.strip():
-                    story.append(Paragraph(
-                        f"<b>{lang2_name}:</b>",
-                        self.styles['BackMatter']
-                    ))
-                    for para in text2.split('\n\n'):
-                        if para.strip():
-                            story.append(Paragraph(
-                                self._sanitize_text(para),
-                                self.styles['BackMatter']
-                            ))
-
-        # Build the PDF
-        self.doc.build(story)
+                yield from self._text_flowables(text1, text2)
+
+            # Display any remaining images
+            while img_index < len(all_images):
+                img, lang = all_images[img_index]
+                yield from self._create_single_image_element(img)
+                yield Spacer(1, 0.15 * inch)
+                img_index += 1
+
+        else:
+            # For matched modes, display matched images side-by-side
+            # and unmatched images inline
+
+            # Display matched images first (or intersperse with text)
+            for matched_img1, matched_img2 in aligned_doc.matched_images:
+                yield self._create_matched_image_table(matched_img1, matched_img2)
+                yield Spacer(1, 0.2 * inch)
+
+            # Display text
+            yield from self._pair_flowables(main_text)
+
+            # Display unmatched images at the end
+            for img in aligned_doc.unmatched_images1:
+                yield Spacer(1, 0.15 * inch)
+                yield from self._create_single_image_element(img)
+
+            for img in aligned_doc.unmatched_images2:
+                yield Spacer(1, 0.15 * inch)
+                yield from self._create_single_image_element(img)
+
+
+def _non_empty(pairs: Iterable) -> Optional[Iterable]:
+    """Return pairs, or None if there are none; an iterator is peeked, not consumed."""
+    if isinstance(pairs, Sized):
+        return pairs if len(pairs) else None
+    iterator = iter(pairs)
+    for first in iterator:
+        return chain([first], iterator)
+    return None
+
+
+class StreamingStory(list):
+    """A reportlab story that is filled from an iterator as it is consumed.
+
+    reportlab's build() treats the story as a list: it takes flowables from
+    the front and puts split parts back, checking len() before every
+    flowable. Here len() tops the list up from the iterator, so only about
+    LOOKAHEAD flowables exist at a time instead of one per paragraph of the
+    book, and removing the first flowable stays cheap.
+    """
+
+    LOOKAHEAD = 256
+
+    def __init__(self, flowables: Iterable):
+        super().__init__()
+        self._source = iter(flowables)
+
+    def __len__(self) -> int:
+        size = list.__len__(self)
+        if size < self.LOOKAHEAD and self._source is not None:
+            wanted = 2 * self.LOOKAHEAD - size
+            self.extend(islice(self._source, wanted))
+            if list.__len__(self) - size < wanted:
+                self._source = None
+            size = list.__len__(self)
+        return size
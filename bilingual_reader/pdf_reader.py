@@ -0,0 +1,459 @@
+"""Pluggable PDF text-extraction backends and single-pass PDF reading.
+
+Each backend knows how to count the pages of a PDF and how to iterate over
+the text of a contiguous page range. Backends are registered by name so that
+callers (and worker processes) can select one with a plain string.
+
+read_pdf_content visits every page once with PyMuPDF and collects both the
+text and the images, instead of opening the file once per concern.
+
+The outline (bookmarks) is read with PyMuPDF and mapped onto the extracted
+text through the character offset at which each page starts.
+"""
+
+import io
+import re
+from importlib.util import find_spec
+from typing import Callable, Dict, Iterator, List, NamedTuple, Sequence, Tuple
+
+from .document_structure import TocEntry
+from .image_extractor import ImageBlock, optimize_image
+
+# Both libraries are optional; a backend is only usable when its library is
+# installed. They are slow to import, so they are only looked up here and
+# imported by the functions that use them.
+HAS_PYPDF2 = find_spec('PyPDF2') is not None
+HAS_PYMUPDF = find_spec('fitz') is not None
+
+
+class PDFBackend(NamedTuple):
+    """A registered PDF text-extraction backend."""
+
+    name: str
+    page_count: Callable[[str], int]
+    iter_pages: Callable[[str, int, int], Iterator[str]]  # "" for pages without text
+    available: bool
+    rank: int  # Lower is faster; used by "auto" selection
+
+
+PDF_BACKENDS: Dict[str, PDFBackend] = {}
+
+
+def register_pdf_backend(
+    name: str,
+    page_count: Callable[[str], int],
+    available: bool = True,
+    rank: int = 100
+):
+    """Register a PDF backend.
+
+    Decorates a generator ``iter_pages(file_path, start, end)`` that yields
+    the text of every page in [start, end) in page order, with an empty
+    string for pages without text.
+
+    Args:
+        name: Name used to select the backend
+        page_count: Function returning the number of pages in a PDF
+        available: Whether the backend's dependencies are installed
+        rank: Relative speed rank; "auto" picks the lowest available rank
+
+    Returns:
+        Decorator that registers and returns the function unchanged
+    """
+    def decorator(iter_pages):
+        PDF_BACKENDS[name] = PDFBackend(
+            name=name,
+            page_count=page_count,
+            iter_pages=iter_pages,
+            available=available,
+            rank=rank
+        )
+        return iter_pages
+    return decorator
+
+
+def get_pdf_backend(name: str = "auto") -> PDFBackend:
+    """Look up a PDF backend by name.
+
+    Args:
+        name: Backend name, or "auto" for the fastest available backend
+
+    Returns:
+        The selected PDFBackend
+
+    Raises:
+        ValueError: If the backend is unknown
+        ImportError: If the backend's library is not installed
+    """
+    if name == "auto":
+        candidates = sorted(
+            (backend for backend in PDF_BACKENDS.values() if backend.available),
+            key=lambda backend: backend.rank
+        )
+        if not candidates:
+            raise ImportError(
+                "No PDF backend is available. "
+                "Install one with: pip install PyMuPDF (or PyPDF2)"
+            )
+        return candidates[0]
+
+    if name not in PDF_BACKENDS:
+        known = ", ".join(sorted(PDF_BACKENDS))
+        raise ValueError(f"Unknown PDF backend: {name} (available: auto, {known})")
+
+    backend = PDF_BACKENDS[name]
+    if not backend.available:
+        raise ImportError(f"PDF backend '{name}' is not installed")
+    return backend
+
+
+def available_pdf_backends() -> List[str]:
+    """Return the names of installed backends, fastest first."""
+    backends = sorted(PDF_BACKENDS.values(), key=lambda backend: backend.rank)
+    return [backend.name for backend in backends if backend.available]
+
+
+def extract_pdf_page_range(file_path: str, start: int, end: int, backend: str = "auto") -> List[str]:
+    """Extract the non-empty page texts for pages [start, end) of a PDF.
+
+    Kept at module level so it can be pickled into worker processes; each
+    call opens the file itself.
+
+    Args:
+        file_path: Path to the PDF file
+        start: First page index (0-indexed, inclusive)
+        end: Last page index (exclusive)
+        backend: Backend name (see PDF_BACKENDS)
+
+    Returns:
+        List of page texts in page order, skipping pages without text
+    """
+    return [page_text for page_text in get_pdf_backend(backend).iter_pages(file_path, start, end) if page_text]
+
+
+def extract_pdf_pages(file_path: str, start: int, end: int, backend: str = "auto") -> List[str]:
+    """Extract the text of every page in [start, end) of a PDF.
+
+    Like extract_pdf_page_range, but pages without text are kept as empty
+    strings so that list indexes stay aligned with page numbers.
+
+    Args:
+        file_path: Path to the PDF file
+        start: First page index (0-indexed, inclusive)
+        end: Last page index (exclusive)
+        backend: Backend name (see PDF_BACKENDS)
+
+    Returns:
+        List with one text per page, in page order
+    """
+    return list(get_pdf_backend(backend).iter_pages(file_path, start, end))
+
+
+def iter_pdf_pages(file_path: str, backend: str = "auto") -> Iterator[str]:
+    """Lazily yield the non-empty page texts of a PDF in page order.
+
+    Args:
+        file_path: Path to the PDF file
+        backend: Backend name (see PDF_BACKENDS)
+
+    Yields:
+        Page texts, skipping pages without text
+    """
+    pdf_backend = get_pdf_backend(backend)
+    for page_text in pdf_backend.iter_pages(file_path, 0, pdf_backend.page_count(file_path)):
+        if page_text:
+            yield page_text
+
+
+def join_pages(page_texts: Sequence[str]) -> Tuple[str, List[int]]:
+    """Join page texts the way the extractors do and record where each page starts.
+
+    Pages without text are skipped in the joined text; their offset is where
+    the next page's text starts (or the end of the text).
+
+    Args:
+        page_texts: Text of every page in order, "" for pages without text
+
+    Returns:
+        Tuple of (text, page_starts) with one character offset per page
+    """
+    kept = []
+    page_starts = []
+    length = 0
+
+    for page_text in page_texts:
+        start = length + 1 if kept else 0
+        page_starts.append(start)
+        if page_text:
+            kept.append(page_text)
+            length = start + len(page_text)
+
+    return '\n'.join(kept), [min(start, length) for start in page_starts]
+
+
+def pdf_page_count(file_path: str, backend: str = "auto") -> int:
+    """Return the number of pages in a PDF using the given backend."""
+    return get_pdf_backend(backend).page_count(file_path)
+
+
+def split_page_range(num_pages: int, num_blocks: int) -> List[Tuple[int, int]]:
+    """Split [0, num_pages) into at most num_blocks contiguous (start, end) blocks.
+
+    Args:
+        num_pages: Total number of pages
+        num_blocks: Desired number of blocks
+
+    Returns:
+        List of (start, end) tuples covering every page exactly once, in order
+    """
+    num_blocks = max(1, min(num_blocks, num_pages))
+    block_size, remainder = divmod(num_pages, num_blocks)
+    ranges = []
+    start = 0
+    for block in range(num_blocks):
+        end = start + block_size + (1 if block < remainder else 0)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+# PyPDF2 backend: pure Python, slower on large files
+
+def _pypdf2_page_count(file_path: str) -> int:
+    import PyPDF2
+
+    with open(file_path, 'rb') as file:
+        return len(PyPDF2.PdfReader(file).pages)
+
+
+@register_pdf_backend("pypdf2", page_count=_pypdf2_page_count, available=HAS_PYPDF2, rank=20)
+def _pypdf2_iter_pages(file_path: str, start: int, end: int) -> Iterator[str]:
+    import PyPDF2
+
+    with open(file_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        for page_num in range(start, end):
+            yield pdf_reader.pages[page_num].extract_text() or ""
+
+
+# PyMuPDF backend: several times faster than PyPDF2
+
+def _fitz_page_count(file_path: str) -> int:
+    import fitz  # PyMuPDF
+
+    with fitz.open(file_path) as doc:
+        return len(doc)
+
+
+@register_pdf_backend("fitz", page_count=_fitz_page_count, available=HAS_PYMUPDF, rank=10)
+def _fitz_iter_pages(file_path: str, start: int, end: int) -> Iterator[str]:
+    import fitz  # PyMuPDF
+
+    with fitz.open(file_path) as doc:
+        for page_num in range(start, end):
+            yield doc[page_num].get_text()
+
+
+# Single-pass text and image extraction
+
+class PdfContent(NamedTuple):
+    """Text and images extracted from a PDF in one pass."""
+
+    text: str
+    images: List[ImageBlock]
+    # Character offset in text at which each page starts
+    page_starts: Sequence[int] = ()
+
+
+def _extract_page_images(doc, page, page_num: int, total_pages: int, start_index: int) -> List[ImageBlock]:
+    """Extract the images drawn on one PDF page.
+
+    Args:
+        doc: Open fitz.Document
+        page: The fitz.Page to read
+        page_num: Page index (0-indexed)
+        total_pages: Number of pages in the document
+        start_index: Sequential index to give the first image found
+
+    Returns:
+        List of ImageBlock objects in page order
+    """
+    from PIL import Image
+
+    images = []
+
+    for img_index, img_info in enumerate(page.get_images()):
+        try:
+            # Extract image
+            xref = img_info[0]
+            base_image = doc.extract_image(xref)
+            image_bytes = base_image["image"]
+
+            # Convert to PIL Image
+            pil_image = Image.open(io.BytesIO(image_bytes))
+
+            # Filter out very small images (likely decorative)
+            if pil_image.width < 50 or pil_image.height < 50:
+                continue
+
+            # Optimize image
+            pil_image = optimize_image(pil_image)
+
+            # Try to extract caption (text directly below image)
+            caption = ""
+            # Note: Extracting captions from PDF is complex, leaving as empty for now
+
+            # Calculate position (relative to document)
+            position = (page_num + 0.5) / total_pages
+
+            images.append(ImageBlock(
+                image=pil_image,
+                caption=caption,
+                position=position,
+                page=page_num + 1,  # 1-indexed
+                index=start_index + len(images)
+            ))
+
+        except Exception as e:
+            # Skip problematic images
+            print(f"Warning: Could not extract image {img_index} from page {page_num + 1}: {e}")
+            continue
+
+    return images
+
+
+def iter_pdf_pages_with_images(
+    file_path: str,
+    extract_text: bool = True,
+    extract_images: bool = True
+) -> Iterator[Tuple[str, List[ImageBlock]]]:
+    """Open a PDF once and yield the text and images of each page.
+
+    Args:
+        file_path: Path to the PDF file
+        extract_text: Whether to extract page text (the "fitz" backend's text)
+        extract_images: Whether to extract page images
+
+    Yields:
+        Tuples of (page_text, page_images) for every page, including pages
+        without text
+
+    Raises:
+        ImportError: If PyMuPDF is not installed
+    """
+    if not HAS_PYMUPDF:
+        raise ImportError(
+            "PyMuPDF (fitz) is required for PDF image extraction. "
+            "Install it with: pip install PyMuPDF"
+        )
+    import fitz  # PyMuPDF
+
+    with fitz.open(file_path) as doc:
+        total_pages = len(doc)
+        image_index = 0
+
+        for page_num in range(total_pages):
+            page = doc[page_num]
+            page_text = page.get_text() if extract_text else ""
+
+            images = []
+            if extract_images:
+                images = _extract_page_images(doc, page, page_num, total_pages, image_index)
+                image_index += len(images)
+
+            yield page_text, images
+
+
+def read_pdf_content(
+    file_path: str,
+    extract_text: bool = True,
+    extract_images: bool = True
+) -> PdfContent:
+    """Extract the text and images of a PDF in a single pass over its pages.
+
+    The text matches TextExtractor.extract_from_pdf with the "fitz" backend
+    and the images match extract_images_from_pdf.
+
+    Args:
+        file_path: Path to the PDF file
+        extract_text: Whether to extract text
+        extract_images: Whether to extract images
+
+    Returns:
+        PdfContent with the joined text and the list of ImageBlocks
+    """
+    page_texts = []
+    images = []
+
+    for page_text, page_images in iter_pdf_pages_with_images(file_path, extract_text, extract_images):
+        page_texts.append(page_text)
+        images.extend(page_images)
+
+    text, page_starts = join_pages(page_texts)
+    return PdfContent(text=text, images=images, page_starts=page_starts)
+
+
+# Outline (bookmarks)
+
+class OutlineLink(NamedTuple):
+    """One entry of a PDF outline."""
+
+    level: int  # Nesting depth, 0 for top-level entries
+    title: str
+    page: int   # Target page index (0-indexed)
+
+
+def read_pdf_outline(file_path: str) -> List[OutlineLink]:
+    """Read the outline (bookmarks) of a PDF.
+
+    Args:
+        file_path: Path to the PDF file
+
+    Returns:
+        List of OutlineLink in outline order, skipping entries without a page
+        target; empty if the PDF has no outline or PyMuPDF is not installed
+    """
+    if not HAS_PYMUPDF:
+        return []
+    import fitz  # PyMuPDF
+
+    with fitz.open(file_path) as doc:
+        outline = doc.get_toc(simple=True)
+
+    return [
+        OutlineLink(level=level - 1, title=' '.join(title.split()), page=page - 1)
+        for level, title, page in outline
+        if page >= 1
+    ]
+
+
+def outline_toc(outline: List[OutlineLink], text: str, page_starts: Sequence[int]) -> List[TocEntry]:
+    """Map outline entries to character positions in the extracted text.
+
+    An entry points at the start of its target page, or at its title when
+    the title appears on that page (chapters often start mid-page).
+
+    Args:
+        outline: Entries from read_pdf_outline
+        text: Text joined by join_pages
+        page_starts: Page offsets from join_pages
+
+    Returns:
+        List of TocEntry in outline order
+    """
+    toc = []
+    for link in outline:
+        if link.page >= len(page_starts):
+            continue
+
+        position = page_starts[link.page]
+        page_end = page_starts[link.page + 1] if link.page + 1 < len(page_starts) else len(text)
+        words = link.title.split()
+        if words:
+            title_pattern = re.compile(r'\s+'.join(re.escape(word) for word in words), re.IGNORECASE)
+            match = title_pattern.search(text, position, page_end)
+            if match:
+                position = match.start()
+
+        toc.append(TocEntry(position=position, title=link.title, level=link.level))
+    return toc
@@ -0,0 +1,162 @@
+"""Aligned segment pairs kept in memory, spilling to SQLite once they grow.
+
+Aligning a whole series in one job produces more pairs than a worker can
+hold. SegmentStore collects pairs in a list like align_documents returns,
+and once their text passes a threshold moves them into a scratch SQLite
+file; from then on new pairs are buffered and written in batches, so
+memory stays bounded by the threshold whatever the number of pairs.
+Reading is by index, by range or in order, in batches, so a PDF can be
+written from the store, or a sub-range re-rendered, without loading it.
+"""
+
+import os
+import sqlite3
+import tempfile
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+Pair = Tuple[str, str]
+
+DEFAULT_MAX_MEMORY_CHARS = 16_000_000  # Characters of pair text kept in memory
+
+# Pairs read from the spill file per query
+_READ_BATCH = 1000
+
+
+class SegmentStore:
+    """Append-only sequence of aligned pairs that spills to disk past a size threshold."""
+
+    def __init__(
+        self,
+        max_memory_chars: int = DEFAULT_MAX_MEMORY_CHARS,
+        spill_dir: Optional[str] = None
+    ):
+        """Initialize an empty store.
+
+        Args:
+            max_memory_chars: Characters of pair text kept in memory; past
+                this the pairs are moved to a spill file, and afterwards
+                written to it whenever this many are buffered
+            spill_dir: Directory for the spill file (default: the system
+                temp directory); the file is removed by close()
+        """
+        self.max_memory_chars = max_memory_chars
+        self.spill_dir = spill_dir
+        self.spill_path: Optional[str] = None
+        self._buffer: List[Pair] = []  # All pairs, or those not yet written to the spill file
+        self._buffer_chars = 0
+        self._stored = 0  # Pairs in the spill file
+        self._db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Drop every pair and remove the spill file."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        if self.spill_path is not None:
+            os.remove(self.spill_path)
+            self.spill_path = None
+        self._buffer = []
+        self._buffer_chars = 0
+        self._stored = 0
+
+    @property
+    def spilled(self) -> bool:
+        """Whether the pairs have been moved to the spill file."""
+        return self._db is not None
+
+    def __len__(self) -> int:
+        return self._stored + len(self._buffer)
+
+    def append(self, text1: str, text2: str):
+        """Add one aligned pair at the end."""
+        self._buffer.append((text1, text2))
+        self._buffer_chars += len(text1) + len(text2)
+        if self._buffer_chars > self.max_memory_chars:
+            self.flush()
+
+    def extend(self, pairs: Iterable[Pair]):
+        """Add aligned pairs at the end, consuming them as they come (an iterator is fine)."""
+        for text1, text2 in pairs:
+            self.append(text1, text2)
+
+    def flush(self):
+        """Write the buffered pairs to the spill file, creating it on first use."""
+        if not self._buffer:
+            return
+        if self._db is None:
+            self._open_spill_file()
+        self._db.executemany(
+            'INSERT INTO pairs (idx, text1, text2) VALUES (?, ?, ?)',
+            ((self._stored + offset, text1, text2) for offset, (text1, text2) in enumerate(self._buffer))
+        )
+        self._db.commit()
+        self._stored += len(self._buffer)
+        self._buffer = []
+        self._buffer_chars = 0
+
+    def _open_spill_file(self):
+        """Create the spill file; it is scratch space, so durability is turned off."""
+        descriptor, self.spill_path = tempfile.mkstemp(
+            prefix='bilingual_reader_', suffix='.sqlite', dir=self.spill_dir
+        )
+        os.close(descriptor)
+        self._db = sqlite3.connect(self.spill_path)
+        self._db.execute('PRAGMA journal_mode = OFF')
+        self._db.execute('PRAGMA synchronous = OFF')
+        self._db.execute('CREATE TABLE pairs (idx INTEGER PRIMARY KEY, text1 TEXT NOT NULL, text2 TEXT NOT NULL)')
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Pair, List[Pair]]:
+        """Return one pair, or a list of pairs for a slice."""
+        if isinstance(index, slice):
+            start, end, step = index.indices(len(self))
+            if step != 1:
+                return [self[position] for position in range(start, end, step)]
+            return list(self.iter_range(start, end))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('SegmentStore index out of range')
+        if index >= self._stored:
+            return self._buffer[index - self._stored]
+        row = self._db.execute('SELECT text1, text2 FROM pairs WHERE idx = ?', (index,)).fetchone()
+        return row[0], row[1]
+
+    def __iter__(self) -> Iterator[Pair]:
+        return self.iter_range()
+
+    def iter_range(self, start: int = 0, end: Optional[int] = None) -> Iterator[Pair]:
+        """Yield the pairs [start:end] in order, reading the spill file in batches.
+
+        Pairs appended while iterating are not yielded past the end the
+        store had when iteration started.
+
+        Args:
+            start: Index of the first pair
+            end: Index after the last pair (default: the end of the store)
+        """
+        end = len(self) if end is None else min(end, len(self))
+        position = start
+        while position < min(end, self._stored):
+            batch_end = min(position + _READ_BATCH, end, self._stored)
+            rows = self._db.execute(
+                'SELECT text1, text2 FROM pairs WHERE idx >= ? AND idx < ? ORDER BY idx', (position, batch_end)
+            ).fetchall()
+            yield from rows
+            position = batch_end
+        while position < end:
+            # The buffer may have been flushed while the consumer held a pair
+            if position < self._stored:
+                yield from self.iter_range(position, end)
+                return
+            yield self._buffer[position - self._stored]
+            position += 1
+
+    def __repr__(self) -> str:
+        where = f'spilled to {self.spill_path}' if self.spilled else 'in memory'
+        return f'SegmentStore({len(self)} pairs, {where})'
@@ -0,0 +1,151 @@
+"""Rule-based sentence splitting for English and Chinese.
+
+lingtrain-aligner's splitter pulls in PyTorch and transformers just to cut
+text into sentences. The built-in splitter covers the common cases with a
+few precompiled regular expressions:
+
+- Chinese (and Japanese) sentences end at 。！？ (or their half-width
+  forms), or at an ellipsis followed by a closing quote; closing quotes
+  and brackets stay with the sentence they close.
+- English (and other space-separated languages) sentences end at . ! ? or
+  an ellipsis followed by whitespace and an uppercase letter, digit or
+  opening quote. Decimals never match (no whitespace follows the dot), and
+  known abbreviations and single initials ("Mr.", "J. K.") do not end a
+  sentence.
+
+Blank lines always end a sentence; single line breaks inside a paragraph
+(hard-wrapped PDF text) are joined with a space, or removed for Chinese.
+"""
+
+import re
+from importlib.util import find_spec
+from typing import Callable, List, Tuple
+
+from .aligned_spans import join_lines
+
+# lingtrain-aligner imports PyTorch and transformers, so it is only imported
+# when its splitter is requested
+HAS_LINGTRAIN = find_spec('lingtrain_aligner') is not None
+
+# Names accepted by get_splitter; "auto" prefers lingtrain when it is installed
+SENTENCE_SPLITTERS = ("auto", "builtin", "lingtrain")
+
+# Languages whose sentences end with full-width punctuation and no space
+CJK_LANGUAGES = frozenset(["zh", "ja"])
+
+# Words that are usually followed by a period without ending a sentence
+ABBREVIATIONS = (
+    "Mr", "Mrs", "Ms", "Dr", "Prof", "Sr", "Jr", "St", "Mt", "Ft", "vs", "etc",
+    "Gen", "Col", "Lt", "Sgt", "Capt", "Cmdr", "Rev", "Gov", "Sen", "Rep", "Hon",
+    "Inc", "Ltd", "Co", "Corp", "Bros", "No", "Nos", "Vol", "vol", "Fig", "fig",
+    "pp", "ed", "eds", "approx", "cf", "al",
+    "Jan", "Feb", "Mar", "Apr", "Jun", "Jul", "Aug", "Sep", "Sept", "Oct", "Nov", "Dec",
+)
+
+_CLOSERS = '"\'”’」』）)\\]》'
+_OPENERS = '"\'“‘「『（(\\[《'
+
+# A lookbehind per abbreviation (lookbehinds must have a fixed width). They
+# follow the period, so they are only tried where there is one.
+_NOT_ABBREVIATION = ''.join(rf'(?<!\b{re.escape(word)}\.)' for word in ABBREVIATIONS)
+
+_LATIN_BOUNDARY = re.compile(
+    # A period that does not end an abbreviation or a single letter, or ! ? …
+    rf'(?:\.{_NOT_ABBREVIATION}(?<!\b[A-Za-z]\.)|[!?…])'
+    rf'[.!?…]*[{_CLOSERS}]*'
+    # followed by the start of a new sentence
+    rf'(?=\s+[{_OPENERS}]*[A-Z0-9])'
+)
+
+_CJK_BOUNDARY = re.compile(
+    rf'(?:[。！？!?][。！？!?…]*|…+(?=[{_CLOSERS}{_OPENERS}]))[{_CLOSERS}]*'
+)
+
+_PARAGRAPH_BREAK = re.compile(r'\n[ \t\r\f\v]*\n\s*')
+
+SplitFunction = Callable[[str, str], List[str]]
+
+
+def sentence_spans(text: str, lang: str = "en") -> List[Tuple[int, int]]:
+    """Return the (start, end) spans of the sentences of a text.
+
+    Args:
+        text: Text to split
+        lang: Language code; "zh" and "ja" use the Chinese rules, every
+            other language the English ones
+
+    Returns:
+        Spans of the stripped, non-empty sentences in text order
+    """
+    boundary = _CJK_BOUNDARY if lang in CJK_LANGUAGES else _LATIN_BOUNDARY
+
+    pieces = []
+    start = 0
+    for paragraph_break in _PARAGRAPH_BREAK.finditer(text):
+        pieces.extend(_paragraph_pieces(text, boundary, start, paragraph_break.start()))
+        start = paragraph_break.end()
+    pieces.extend(_paragraph_pieces(text, boundary, start, len(text)))
+
+    spans = []
+    for start, end in pieces:
+        sentence = text[start:end]
+        left = len(sentence) - len(sentence.lstrip())
+        right = len(sentence.rstrip())
+        if right > left:
+            spans.append((start + left, start + right))
+    return spans
+
+
+def _paragraph_pieces(text: str, boundary: 're.Pattern', start: int, end: int) -> List[Tuple[int, int]]:
+    """Cut text[start:end] at every sentence boundary."""
+    pieces = []
+    for match in boundary.finditer(text, start, end):
+        pieces.append((start, match.end()))
+        start = match.end()
+    pieces.append((start, end))
+    return pieces
+
+
+def split_sentences(text: str, lang: str = "en") -> List[str]:
+    """Split a text into sentences with the built-in rules.
+
+    Args:
+        text: Text to split
+        lang: Language code; "zh" and "ja" use the Chinese rules, every
+            other language the English ones
+
+    Returns:
+        Stripped, non-empty sentences in text order
+    """
+    line_joint = '' if lang in CJK_LANGUAGES else ' '
+    return [join_lines(text[start:end], line_joint) for start, end in sentence_spans(text, lang)]
+
+
+def get_splitter(name: str = "auto") -> Tuple[str, SplitFunction]:
+    """Return a sentence splitter by name.
+
+    Args:
+        name: "builtin", "lingtrain", or "auto" for lingtrain when it is
+            installed and the built-in splitter otherwise
+
+    Returns:
+        Tuple of (resolved name, function called as function(text, lang))
+
+    Raises:
+        ValueError: If name is not one of SENTENCE_SPLITTERS
+        ImportError: If "lingtrain" is requested but not installed
+    """
+    if name not in SENTENCE_SPLITTERS:
+        raise ValueError(f"Unknown sentence splitter {name!r}; expected one of {', '.join(SENTENCE_SPLITTERS)}")
+    if name == "auto":
+        name = "lingtrain" if HAS_LINGTRAIN else "builtin"
+    if name == "builtin":
+        return name, split_sentences
+    if not HAS_LINGTRAIN:
+        raise ImportError(
+            "lingtrain-aligner is required for the lingtrain sentence splitter. "
+            "Install it with: pip install lingtrain-aligner, or use the builtin splitter"
+        )
+    from lingtrain_aligner import splitter as lingtrain_splitter
+
+    return name, lingtrain_splitter.split_by_sentences_wrapper
@@ -0,0 +1,211 @@
+"""Memoized sentence splitting, keyed by paragraph content.
+
+Sentence splitting is one of the slowest steps of alignment and gives the
+same result for the same text on every run. SplitCache cuts a text into
+paragraphs (at blank lines), hashes each one together with the splitter
+and language, and only passes paragraphs it has not seen before to the
+splitter. Results are kept in a bounded in-memory LRU and, optionally, in
+a SQLite file, so a rerun on a slightly edited book only re-splits the
+paragraphs that changed.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional
+
+# Bump when the stored layout or the way texts are cut into paragraphs changes
+SPLIT_CACHE_VERSION = 1
+
+DEFAULT_MAX_ENTRIES = 100_000   # Paragraphs kept in memory
+DEFAULT_MAX_STORED = 1_000_000  # Paragraphs kept in the on-disk store
+
+# File name of the store inside an extraction cache directory (the leading
+# dot keeps ExtractionCache from treating it as an entry)
+SPLIT_STORE_NAME = '.sentences.sqlite'
+
+# SQLite limits the number of parameters per statement
+_QUERY_BATCH = 500
+
+_PARAGRAPH_BREAK = re.compile(r'\n[ \t\r\f\v]*\n')
+
+SplitFunction = Callable[[str, str], List[str]]
+
+
+def split_paragraphs(text: str) -> List[str]:
+    """Cut a text into paragraphs at blank lines, dropping empty ones."""
+    return [paragraph for paragraph in _PARAGRAPH_BREAK.split(text) if paragraph.strip()]
+
+
+def paragraph_key(paragraph: str, lang: str, splitter_name: str) -> str:
+    """Return the cache key of one paragraph split by one splitter."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f'{SPLIT_CACHE_VERSION}\0{splitter_name}\0{lang}\0'.encode('utf-8'))
+    digest.update(paragraph.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class SplitCache:
+    """Two-level (memory, then SQLite) cache of per-paragraph sentence splits."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_stored: int = DEFAULT_MAX_STORED
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite file for the on-disk store (default: memory only)
+            max_entries: Paragraphs kept in the in-memory LRU
+            max_stored: Paragraphs kept in the on-disk store; least recently
+                used ones are evicted when it grows past this
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_stored = max_stored
+        self.hits = 0
+        self.misses = 0
+        self._memory: 'OrderedDict[str, List[str]]' = OrderedDict()
+        self._db = None
+        if path is not None:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            # Worker processes may write to the same store; wait for their locks
+            self._db = sqlite3.connect(path, timeout=30)
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS splits '
+                '(key TEXT PRIMARY KEY, sentences TEXT NOT NULL, used REAL NOT NULL)'
+            )
+            self._db.execute('CREATE INDEX IF NOT EXISTS splits_used ON splits (used)')
+            self._db.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the on-disk store."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def split(
+        self,
+        text: str,
+        lang: str,
+        split_function: SplitFunction,
+        splitter_name: str = 'default'
+    ) -> List[str]:
+        """Split a text into sentences, reusing the splits of known paragraphs.
+
+        Every paragraph is split on its own, so no sentence spans a blank
+        line; splitters that only break sentences at punctuation give the
+        same result as for the whole text.
+
+        Args:
+            text: Text to split
+            lang: Language code passed to split_function
+            split_function: Splitter called as split_function(paragraph, lang)
+            splitter_name: Name of the splitter, part of the key so results
+                of different splitters are never mixed
+
+        Returns:
+            Sentences of all paragraphs, in text order
+        """
+        paragraphs = split_paragraphs(text)
+        keys = [paragraph_key(paragraph, lang, splitter_name) for paragraph in paragraphs]
+        found = self._lookup(keys)
+
+        computed = {}
+        for key, paragraph in zip(keys, paragraphs):
+            if key not in found and key not in computed:
+                computed[key] = list(split_function(paragraph, lang))
+        self.misses += len(computed)
+        self.hits += len(keys) - len(computed)
+
+        self._remember(computed)
+        self._store(computed)
+        found.update(computed)
+        return [sentence for key in keys for sentence in found[key]]
+
+    def _lookup(self, keys: Iterable[str]) -> Dict[str, List[str]]:
+        """Find splits in memory, then in the store; store hits are promoted to memory."""
+        found = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                found[key] = self._memory[key]
+            else:
+                missing.append(key)
+
+        if self._db is not None and missing:
+            stored = {}
+            for start in range(0, len(missing), _QUERY_BATCH):
+                batch = missing[start:start + _QUERY_BATCH]
+                rows = self._db.execute(
+                    f'SELECT key, sentences FROM splits WHERE key IN ({",".join("?" * len(batch))})', batch
+                )
+                stored.update((key, json.loads(sentences)) for key, sentences in rows)
+            if stored:
+                now = time.time()
+                self._db.executemany('UPDATE splits SET used = ? WHERE key = ?', [(now, key) for key in stored])
+                self._db.commit()
+                self._remember(stored)
+                found.update(stored)
+        return found
+
+    def _remember(self, splits: Dict[str, List[str]]):
+        """Add splits to the in-memory LRU, evicting the oldest past max_entries."""
+        for key, sentences in splits.items():
+            self._memory[key] = sentences
+            self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _store(self, splits: Dict[str, List[str]]):
+        """Write new splits to the on-disk store, then evict past max_stored."""
+        if self._db is None or not splits:
+            return
+        now = time.time()
+        self._db.executemany(
+            'INSERT OR REPLACE INTO splits (key, sentences, used) VALUES (?, ?, ?)',
+            [(key, json.dumps(sentences, ensure_ascii=False), now) for key, sentences in splits.items()]
+        )
+        excess = self._db.execute('SELECT COUNT(*) FROM splits').fetchone()[0] - self.max_stored
+        if excess > 0:
+            self._db.execute(
+                'DELETE FROM splits WHERE key IN (SELECT key FROM splits ORDER BY used, rowid LIMIT ?)', (excess,)
+            )
+        self._db.commit()
+
+    def clear(self):
+        """Remove every split, from memory and from the store."""
+        self._memory.clear()
+        if self._db is not None:
+            self._db.execute('DELETE FROM splits')
+            self._db.commit()
+
+
+# Caches opened by worker processes, reused across the units they align
+_worker_caches: Dict[str, SplitCache] = {}
+
+
+def worker_split_cache(path: Optional[str]) -> Optional[SplitCache]:
+    """Return this process's SplitCache for a store path (None for no cache)."""
+    if path is None:
+        return None
+    cache = _worker_caches.get(path)
+    if cache is None:
+        cache = _worker_caches[path] = SplitCache(path)
+    return cache
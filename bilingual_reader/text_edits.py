@@ -0,0 +1,85 @@
+"""Edits to a source text, as replaced spans.
+
+An edit replaces text[start:end] of the old text with new text; a list of
+non-overlapping edits, in text order, describes one revision of a text.
+BilingualAligner.realign takes them to realign only the pairs near the
+edits. diff_texts finds the edit between two versions of a text when an
+editor saves the whole file rather than reporting its changes.
+"""
+
+from typing import List, NamedTuple, Sequence, Tuple
+
+
+class TextEdit(NamedTuple):
+    """Replacement of old_text[start:end] by text."""
+
+    start: int
+    end: int
+    text: str
+
+
+def check_edits(edits: Sequence[TextEdit], length: int):
+    """Check edits are in text order, do not overlap and lie within a text of length characters.
+
+    Raises:
+        ValueError: If they do not
+    """
+    position = 0
+    for edit in edits:
+        if not position <= edit.start <= edit.end <= length:
+            raise ValueError(
+                f"Edit {edit.start}:{edit.end} is out of order, overlaps another or lies outside "
+                f"the text (0:{length})"
+            )
+        position = edit.end
+
+
+def apply_edits(text: str, edits: Sequence[TextEdit]) -> str:
+    """Return text with the edits applied.
+
+    Raises:
+        ValueError: If the edits are not in order, overlap or lie outside text
+    """
+    check_edits(edits, len(text))
+    if not edits:
+        return text
+    parts = []
+    position = 0
+    for edit in edits:
+        parts.append(text[position:edit.start])
+        parts.append(edit.text)
+        position = edit.end
+    parts.append(text[position:])
+    return ''.join(parts)
+
+
+def edited_range(edits: Sequence[TextEdit]) -> Tuple[int, int, int]:
+    """Return (start, end, shift): the old span the edits cover and how much they change its length."""
+    shift = sum(len(edit.text) - (edit.end - edit.start) for edit in edits)
+    return edits[0].start, edits[-1].end, shift
+
+
+def diff_texts(old: str, new: str) -> List[TextEdit]:
+    """Return the edit turning old into new: the span between their common prefix and suffix.
+
+    Returns:
+        One TextEdit, or an empty list if the texts are equal
+    """
+    if old == new:
+        return []
+    prefix = _common_prefix_length(old, new)
+    suffix = _common_prefix_length(old[prefix:][::-1], new[prefix:][::-1])
+    return [TextEdit(prefix, len(old) - suffix, new[prefix:len(new) - suffix])]
+
+
+def _common_prefix_length(first: str, second: str) -> int:
+    """Return the length of the common prefix of two strings."""
+    # Bisect with slice comparisons, which run in C, instead of a loop per character
+    low, high = 0, min(len(first), len(second))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if first[low:middle] == second[low:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
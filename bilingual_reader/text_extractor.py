@@ -1,102 +1,261 @@
 """Module for extracting text from various file formats (PDF, ePub, txt)."""
 
 import os
-from typing import List, Optional
-from dataclasses import dataclass
-import PyPDF2
-import ebooklib
-from ebooklib import epub
-from bs4 import BeautifulSoup
-
-from .document_structure import DocumentSection, split_document
+from typing import Iterator, List, Optional, Tuple
+
+from .cache import ExtractionCache
+from .document_structure import (
+    ChapterIndex,
+    DocumentSection,
+    TocEntry,
+    find_section_boundaries,
+    iter_chapters,
+    split_document,
+    split_document_stream
+)
+from .pdf_reader import (
+    extract_pdf_pages,
+    get_pdf_backend,
+    iter_pdf_pages,
+    join_pages,
+    outline_toc,
+    pdf_page_count,
+    read_pdf_content,
+    read_pdf_outline,
+    split_page_range
+)
 from .image_extractor import ImageBlock, extract_images
+from .txt_reader import iter_txt_blocks, read_txt
 
 
-@dataclass
-class DocumentWithImages:
+class DocumentWithImages(DocumentSection):
     """Document section with associated images."""
 
-    front_matter: str
-    main_text: str
-    back_matter: str
-    images: List[ImageBlock]
-
     def __init__(
         self,
         front_matter: str = "",
         main_text: str = "",
         back_matter: str = "",
-        images: Optional[List[ImageBlock]] = None
+        images: Optional[List[ImageBlock]] = None,
+        chapters: Optional[ChapterIndex] = None
     ):
-        self.front_matter = front_matter
-        self.main_text = main_text
-        self.back_matter = back_matter
+        super().__init__(front_matter, main_text, back_matter, chapters=chapters)
         self.images = images if images is not None else []
 
+    def __eq__(self, other) -> bool:
+        result = super().__eq__(other)
+        if result is NotImplemented or not result:
+            return result
+        return self.images == other.images
+
+    def __repr__(self) -> str:
+        return f"{super().__repr__()[:-1]}, images=<{len(self.images)}>)"
+
 
 class TextExtractor:
     """Extract text from various file formats."""
 
+    # Below this many pages per worker, process start-up costs more than it saves
+    MIN_PAGES_PER_WORKER = 16
+
     @staticmethod
-    def extract_from_pdf(file_path: str) -> str:
+    def extract_from_pdf(file_path: str, workers: int = 1, backend: str = "auto") -> str:
         """Extract text from a PDF file.
-        
+
+        With more than one worker, the page range is split into contiguous
+        blocks that are extracted in separate processes and stitched back
+        together in page order. The result is identical to the serial path.
+
         Args:
             file_path: Path to the PDF file
-            
+            workers: Number of worker processes (1 = serial, 0 or less = one per CPU)
+            backend: PDF backend name ("fitz", "pypdf2"), or "auto" for the fastest installed
+
         Returns:
             Extracted text as a string
         """
-        text = []
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text.append(page_text)
-        return '\n'.join(text)
+        text, _ = join_pages(TextExtractor._extract_pdf_pages(file_path, workers, backend))
+        return text
 
     @staticmethod
-    def extract_from_epub(file_path: str) -> str:
+    def extract_pdf_with_outline(
+        file_path: str,
+        workers: int = 1,
+        backend: str = "auto"
+    ) -> Tuple[str, List[TocEntry]]:
+        """Extract text from a PDF file together with its outline (bookmarks).
+
+        Outline entries point at pages; they are mapped to character
+        positions through the offset at which each page's text starts.
+
+        Args:
+            file_path: Path to the PDF file
+            workers: Number of worker processes (1 = serial, 0 or less = one per CPU)
+            backend: PDF backend name ("fitz", "pypdf2"), or "auto" for the fastest installed
+
+        Returns:
+            Tuple of (text, toc); toc is empty if the PDF has no outline
+        """
+        text, page_starts = join_pages(TextExtractor._extract_pdf_pages(file_path, workers, backend))
+        return text, outline_toc(read_pdf_outline(file_path), text, page_starts)
+
+    @staticmethod
+    def _extract_pdf_pages(file_path: str, workers: int, backend: str) -> List[str]:
+        """Extract the text of every page of a PDF ("" for pages without text)."""
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+
+        # Resolve "auto" once so every worker uses the same backend
+        backend = get_pdf_backend(backend).name
+        num_pages = pdf_page_count(file_path, backend)
+
+        workers = min(workers, num_pages // TextExtractor.MIN_PAGES_PER_WORKER)
+        if workers <= 1:
+            return extract_pdf_pages(file_path, 0, num_pages, backend)
+
+        # Imported here because multiprocessing is slow to import and only used in parallel
+        from concurrent.futures import ProcessPoolExecutor
+
+        ranges = split_page_range(num_pages, workers)
+        pages = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(extract_pdf_pages, file_path, start, end, backend)
+                for start, end in ranges
+            ]
+            for future in futures:
+                pages.extend(future.result())
+        return pages
+
+    @staticmethod
+    def extract_from_epub(file_path: str, workers: int = 1) -> str:
         """Extract text from an ePub file.
-        
+
+        Documents are read in spine (reading) order and parsed with lxml,
+        in separate processes when more than one worker is requested.
+
         Args:
             file_path: Path to the ePub file
-            
+            workers: Number of worker processes (1 = serial, 0 or less = one per CPU)
+
         Returns:
             Extracted text as a string
         """
-        book = epub.read_epub(file_path)
-        text = []
-        
-        for item in book.get_items():
-            if item.get_type() == ebooklib.ITEM_DOCUMENT:
-                soup = BeautifulSoup(item.get_content(), 'html.parser')
-                chapter_text = soup.get_text()
-                if chapter_text.strip():
-                    text.append(chapter_text)
-        
-        return '\n'.join(text)
+        return '\n'.join(TextExtractor._iter_epub_documents(file_path, workers=workers))
 
     @staticmethod
-    def extract_from_txt(file_path: str) -> str:
+    def _iter_epub_documents(file_path: str, workers: int = 1) -> Iterator[str]:
+        """Yield the text of each non-empty document in an ePub."""
+        # ePub modules are imported on use, so lxml is only loaded for ePubs
+        from .epub_reader import iter_epub_documents
+
+        for chapter_text, _ in iter_epub_documents(file_path, extract_images=False, workers=workers):
+            if chapter_text.strip():
+                yield chapter_text
+
+    @staticmethod
+    def extract_from_txt(file_path: str, encoding: Optional[str] = None) -> str:
         """Extract text from a text file.
-        
+
+        The file is memory-mapped and decoded in chunks; UTF-8, GB18030 and
+        Big5 are detected automatically.
+
         Args:
             file_path: Path to the text file
-            
+            encoding: Codec to use instead of detecting it
+
         Returns:
             Extracted text as a string
         """
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return file.read()
+        return read_txt(file_path, encoding=encoding)
+
+    @staticmethod
+    def _read_txt_with_boundaries(
+        file_path: str,
+        start_marker: Optional[str] = None,
+        end_marker: Optional[str] = None
+    ) -> Tuple[str, int, int]:
+        """Read a text file and find its main text boundaries in the same pass.
+
+        The boundaries are found with split_document_stream while the blocks
+        are decoded, rather than by scanning the text once it is all read.
+
+        Returns:
+            Tuple of (text, main_start, main_end)
+        """
+        blocks = []
+        # The whole text is kept anyway, so long lines are not split into blocks
+        source = iter_txt_blocks(file_path, max_block_size=None)
+
+        def kept(chunks: Iterator[str]) -> Iterator[str]:
+            for chunk in chunks:
+                blocks.append(chunk)
+                yield chunk
+
+        main_start, main_end = split_document_stream(kept(source), start_marker, end_marker)
+        # The scan stops at the back matter; the rest of the file is only decoded
+        blocks.extend(source)
+        return '\n'.join(blocks), main_start, main_end
 
     @staticmethod
-    def extract_text(file_path: str) -> str:
+    def iter_pages(file_path: str, pdf_backend: str = "auto") -> Iterator[str]:
+        """Lazily yield the text of a file one page (or chapter document) at a time.
+
+        PDFs yield one string per non-empty page, ePubs one per non-empty
+        document, and text files blocks of whole lines decoded from a
+        memory map, so memory stays bounded by the chunk size. In every case
+        '\\n'.join(TextExtractor.iter_pages(path)) equals extract_text(path),
+        except for text files with a line longer than DEFAULT_MAX_BLOCK_SIZE
+        characters, which is split into several blocks.
+
+        Args:
+            file_path: Path to the file
+            pdf_backend: PDF backend name, or "auto" for the fastest installed
+
+        Yields:
+            Text chunks in document order
+
+        Raises:
+            ValueError: If file format is not supported
+        """
+        ext = os.path.splitext(file_path)[1].lower()
+
+        if ext == '.pdf':
+            return iter_pdf_pages(file_path, get_pdf_backend(pdf_backend).name)
+        elif ext == '.epub':
+            return TextExtractor._iter_epub_documents(file_path)
+        elif ext == '.txt':
+            return iter_txt_blocks(file_path)
+        else:
+            raise ValueError(f"Unsupported file format: {ext}")
+
+    @staticmethod
+    def iter_chapters(file_path: str, pdf_backend: str = "auto") -> Iterator[Tuple[str, str]]:
+        """Lazily yield the chapters of a file, holding one chapter in memory at a time.
+
+        Chapters start at lines matching CHAPTER_PATTERNS; text before the
+        first chapter marker is yielded with an empty title.
+
+        Args:
+            file_path: Path to the file
+            pdf_backend: PDF backend name, or "auto" for the fastest installed
+
+        Yields:
+            Tuples of (chapter_title, chapter_text)
+
+        Raises:
+            ValueError: If file format is not supported
+        """
+        return iter_chapters(TextExtractor.iter_pages(file_path, pdf_backend=pdf_backend))
+
+    @staticmethod
+    def extract_text(file_path: str, workers: int = 1, pdf_backend: str = "auto") -> str:
         """Extract text from a file based on its extension.
 
         Args:
             file_path: Path to the file
+            workers: Number of worker processes for PDF and ePub extraction
+            pdf_backend: PDF backend name, or "auto" for the fastest installed
 
         Returns:
             Extracted text as a string
@@ -107,9 +266,9 @@ class TextExtractor:
         ext = os.path.splitext(file_path)[1].lower()
 
         if ext == '.pdf':
-            return TextExtractor.extract_from_pdf(file_path)
+            return TextExtractor.extract_from_pdf(file_path, workers=workers, backend=pdf_backend)
         elif ext == '.epub':
-            return TextExtractor.extract_from_epub(file_path)
+            return TextExtractor.extract_from_epub(file_path, workers=workers)
         elif ext == '.txt':
             return TextExtractor.extract_from_txt(file_path)
         else:
@@ -121,12 +280,16 @@ class TextExtractor:
         start_marker: Optional[str] = None,
         end_marker: Optional[str] = None,
         start_position: Optional[int] = None,
-        end_position: Optional[int] = None
+        end_position: Optional[int] = None,
+        workers: int = 1,
+        pdf_backend: str = "auto"
     ) -> DocumentSection:
         """Extract text with structure detection (front matter, main text, back matter).
 
-        This method first extracts all text, then uses chapter marker detection
-        or manual specification to split the document into sections.
+        This method first extracts all text, then uses the ePub's table of
+        contents or the PDF's outline, chapter marker detection or manual specification to split
+        the document into sections. Text files are scanned for markers while
+        they are decoded.
 
         Args:
             file_path: Path to the file
@@ -134,6 +297,8 @@ class TextExtractor:
             end_marker: Custom text marker for where back matter starts (e.g., "Appendix")
             start_position: Manual character position for main text start (takes precedence)
             end_position: Manual character position for back matter start (takes precedence)
+            workers: Number of worker processes for PDF and ePub extraction
+            pdf_backend: PDF backend name, or "auto" for the fastest installed
 
         Returns:
             DocumentSection with front_matter, main_text, and back_matter
@@ -141,8 +306,24 @@ class TextExtractor:
         Raises:
             ValueError: If file format is not supported
         """
-        # First, extract all text using existing method
-        full_text = TextExtractor.extract_text(file_path)
+        toc = None
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext == '.epub':
+            # The book's own table of contents locates the main text
+            from .epub_reader import read_epub_content
+
+            full_text, _, toc = read_epub_content(file_path, extract_images=False, workers=workers)
+        elif ext == '.pdf':
+            # So does the PDF outline, when there is one
+            full_text, toc = TextExtractor.extract_pdf_with_outline(file_path, workers=workers, backend=pdf_backend)
+        elif ext == '.txt' and start_position is None and end_position is None:
+            # Structure detection runs on the blocks as they are decoded
+            full_text, start_position, end_position = TextExtractor._read_txt_with_boundaries(
+                file_path, start_marker, end_marker
+            )
+        else:
+            # First, extract all text using existing method
+            full_text = TextExtractor.extract_text(file_path, workers=workers, pdf_backend=pdf_backend)
 
         # Split into structured sections
         return split_document(
@@ -150,7 +331,8 @@ class TextExtractor:
             start_marker=start_marker,
             end_marker=end_marker,
             start_position=start_position,
-            end_position=end_position
+            end_position=end_position,
+            toc=toc
         )
 
     @staticmethod
@@ -160,7 +342,10 @@ class TextExtractor:
         start_marker: Optional[str] = None,
         end_marker: Optional[str] = None,
         start_position: Optional[int] = None,
-        end_position: Optional[int] = None
+        end_position: Optional[int] = None,
+        workers: int = 1,
+        pdf_backend: str = "auto",
+        cache: Optional[ExtractionCache] = None
     ) -> DocumentWithImages:
         """Extract text and images with structure detection.
 
@@ -171,6 +356,9 @@ class TextExtractor:
             end_marker: Custom text marker for where back matter starts
             start_position: Manual character position for main text start
             end_position: Manual character position for back matter start
+            workers: Number of worker processes for PDF and ePub extraction
+            pdf_backend: PDF backend name, or "auto" for the fastest installed
+            cache: Optional ExtractionCache to reuse results for unchanged inputs
 
         Returns:
             DocumentWithImages with front_matter, main_text, back_matter, and images
@@ -178,27 +366,82 @@ class TextExtractor:
         Raises:
             ValueError: If file format is not supported
         """
-        # Extract text with structure
-        doc_section = TextExtractor.extract_with_structure(
-            file_path=file_path,
-            start_marker=start_marker,
-            end_marker=end_marker,
-            start_position=start_position,
-            end_position=end_position
-        )
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext == '.pdf':
+            # Resolve "auto" so the cache key names the backend that produced the text
+            pdf_backend = get_pdf_backend(pdf_backend).name
+
+        cache_key = None
+        if cache is not None:
+            cache_key = cache.make_key(
+                file_path,
+                extract_images=extract_images_flag,
+                start_marker=start_marker,
+                end_marker=end_marker,
+                start_position=start_position,
+                end_position=end_position,
+                pdf_backend=pdf_backend if ext == '.pdf' else None
+            )
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return DocumentWithImages.from_boundaries(
+                    cached.text, cached.main_start, cached.main_end,
+                    chapters=cached.chapters, images=cached.images
+                )
+
+        toc = None
+        boundaries = None
+        if ext == '.epub':
+            # Text, images and table of contents come from the same parse of each document
+            from .epub_reader import read_epub_content
+
+            text, images, toc = read_epub_content(
+                file_path, extract_images=extract_images_flag, workers=workers
+            )
+        elif ext == '.pdf' and extract_images_flag and workers == 1 and pdf_backend == "fitz":
+            # Text and images come from the same visit to each page
+            text, images, page_starts = read_pdf_content(file_path)
+            toc = outline_toc(read_pdf_outline(file_path), text, page_starts)
+        else:
+            if ext == '.pdf':
+                text, toc = TextExtractor.extract_pdf_with_outline(file_path, workers=workers, backend=pdf_backend)
+            elif ext == '.txt' and start_position is None and end_position is None:
+                # Structure detection runs on the blocks as they are decoded
+                text, main_start, main_end = TextExtractor._read_txt_with_boundaries(
+                    file_path, start_marker, end_marker
+                )
+                boundaries = (main_start, main_end)
+            else:
+                text = TextExtractor.extract_text(file_path, workers=workers, pdf_backend=pdf_backend)
+
+            # Extract images if requested
+            images = []
+            if extract_images_flag:
+                try:
+                    images = extract_images(file_path)
+                except Exception as e:
+                    print(f"Warning: Could not extract images from {file_path}: {e}")
+                    images = []
+
+        # Split into structured sections
+        if boundaries is not None:
+            main_start, main_end = boundaries
+        else:
+            main_start, main_end = find_section_boundaries(
+                text,
+                start_marker=start_marker,
+                end_marker=end_marker,
+                start_position=start_position,
+                end_position=end_position,
+                toc=toc
+            )
+        chapters = None
+        if toc or cache is not None:
+            # Cached entries carry the index so later runs skip the chapter scan
+            chapters = ChapterIndex.for_main_text(text, main_start, main_end, toc)
+        if cache is not None:
+            cache.put(cache_key, text, main_start, main_end, images, chapters=chapters)
 
-        # Extract images if requested
-        images = []
-        if extract_images_flag:
-            try:
-                images = extract_images(file_path)
-            except Exception as e:
-                print(f"Warning: Could not extract images from {file_path}: {e}")
-                images = []
-
-        return DocumentWithImages(
-            front_matter=doc_section.front_matter,
-            main_text=doc_section.main_text,
-            back_matter=doc_section.back_matter,
-            images=images
+        return DocumentWithImages.from_boundaries(
+            text, main_start, main_end, chapters=chapters, images=images
         )
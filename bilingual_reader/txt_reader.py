@@ -0,0 +1,226 @@
+"""Memory-mapped, chunked reading of plain-text files in any common CJK encoding.
+
+Large web-novel dumps arrive as UTF-8, GB18030 or Big5. The file is
+memory-mapped, its encoding is detected from a few samples, and it is then
+decoded incrementally one chunk at a time, so peak memory depends on the
+chunk size rather than on the file size. If a chunk between the samples
+turns out not to be in the detected encoding, the encoding is detected
+again from that chunk and decoding resumes with it.
+"""
+
+import codecs
+import io
+import mmap
+import os
+from typing import Iterator, List, Optional
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # bytes
+DEFAULT_MAX_BLOCK_SIZE = 4 * DEFAULT_CHUNK_SIZE  # characters
+SAMPLE_SIZE = 64 * 1024  # bytes per sample used for encoding detection
+
+# Share of CJK characters that must be in GB2312 for a GB18030 decode to be
+# trusted; Big5 bytes decoded as GB18030 produce many characters outside it.
+GB2312_THRESHOLD = 0.9
+
+_BOMS = [
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+
+def _decodes(samples: List[bytes], encoding: str) -> bool:
+    """Check whether every sample decodes cleanly (allowing a truncated tail)."""
+    for sample in samples:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            decoder.decode(sample, final=False)
+        except UnicodeDecodeError:
+            return False
+    return True
+
+
+def _gb2312_share(samples: List[bytes]) -> float:
+    """Return the share of decoded CJK characters that GB2312 can encode."""
+    cjk = common = 0
+    for sample in samples:
+        text = codecs.getincrementaldecoder('gb18030')(errors='ignore').decode(sample)
+        for char in text:
+            if '\u4e00' <= char <= '\u9fff':
+                cjk += 1
+                try:
+                    char.encode('gb2312')
+                    common += 1
+                except UnicodeEncodeError:
+                    pass
+    return common / cjk if cjk else 1.0
+
+
+def _take_samples(data, sample_size: int = SAMPLE_SIZE) -> List[bytes]:
+    """Take samples from the start, middle and end of a buffer.
+
+    Samples after the first start just past a newline, which is a single
+    byte in UTF-8, GB18030 and Big5 alike, so they begin on a character
+    boundary.
+    """
+    size = len(data)
+    samples = [data[:sample_size]]
+    for start in (size // 2, size - sample_size):
+        if start <= sample_size:
+            continue
+        sample = data[start:start + sample_size]
+        newline = sample.find(b'\n')
+        if newline >= 0:
+            samples.append(sample[newline + 1:])
+    return samples
+
+
+def _guess_encoding(samples: List[bytes]) -> Optional[str]:
+    """Return the first encoding that decodes every sample plausibly, or None."""
+    if _decodes(samples, 'utf-8'):
+        return 'utf-8'
+    if _decodes(samples, 'gb18030') and _gb2312_share(samples) >= GB2312_THRESHOLD:
+        return 'gb18030'
+    if _decodes(samples, 'big5'):
+        return 'big5'
+    if _decodes(samples, 'gb18030'):
+        return 'gb18030'
+    return None
+
+
+def _newline_decoder(encoding: str) -> io.IncrementalNewlineDecoder:
+    """Return an incremental decoder that also translates newlines like text-mode open."""
+    return io.IncrementalNewlineDecoder(codecs.getincrementaldecoder(encoding)(), translate=True)
+
+
+def detect_encoding(data) -> str:
+    """Detect the encoding of a text buffer.
+
+    Args:
+        data: bytes or mmap of the file contents
+
+    Returns:
+        Codec name: "utf-8-sig", "utf-16", "utf-8", "gb18030" or "big5"
+    """
+    head = data[:4]
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
+
+    return _guess_encoding(_take_samples(data)) or 'utf-8'
+
+
+def iter_txt_chunks(
+    file_path: str,
+    encoding: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[str]:
+    """Decode a text file lazily, one chunk at a time.
+
+    Newlines are translated the same way as ``open(..., 'r')`` does, so the
+    concatenated chunks equal reading the file in text mode. A detected
+    encoding that fails on a later chunk is replaced by one detected from
+    that chunk, and decoding resumes after the last character yielded.
+
+    Args:
+        file_path: Path to the text file
+        encoding: Codec to use (detected from the file if None)
+        chunk_size: Number of bytes to decode per chunk
+
+    Yields:
+        Decoded text chunks with arbitrary boundaries
+
+    Raises:
+        UnicodeDecodeError: If the file is not in the given encoding, or no
+            detected encoding decodes it
+    """
+    if os.path.getsize(file_path) == 0:
+        return
+
+    with open(file_path, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        detected = encoding is None
+        encoding = encoding or detect_encoding(data)
+        decoder = _newline_decoder(encoding)
+
+        start = 0
+        while True:
+            final = start >= len(data)
+            state = decoder.getstate()
+            try:
+                text = decoder.decode(data[start:start + chunk_size], final=final)
+            except UnicodeDecodeError as error:
+                # The samples missed this part of the file; the bytes the
+                # decoder held back from earlier chunks are decoded again.
+                # The new encoding must decode the rest of this chunk and a
+                # sample past the error, which may lie at the chunk's end.
+                pending, flag = state
+                resume = start - len(pending)
+                sample_end = max(start + chunk_size, resume + error.start + SAMPLE_SIZE)
+                fallback = _guess_encoding([data[resume:sample_end]]) if detected else None
+                if fallback is None or fallback == encoding:
+                    raise
+                encoding = fallback
+                decoder = _newline_decoder(encoding)
+                # Keep a carriage return seen at the end of the last chunk
+                decoder.setstate((b'', flag & 1))
+                start = resume
+                continue
+
+            if text:
+                yield text
+            if final:
+                break
+            start += chunk_size
+
+
+def iter_txt_blocks(
+    file_path: str,
+    encoding: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_block_size: Optional[int] = DEFAULT_MAX_BLOCK_SIZE
+) -> Iterator[str]:
+    """Yield blocks of whole lines that join with newlines into the file text.
+
+    Each chunk is cut at its last newline and the remainder carried into the
+    next one, which matches the page contract of TextExtractor.iter_pages.
+    A line longer than max_block_size is yielded in pieces, as if it were
+    several lines, so that memory stays bounded on text without newlines.
+
+    Args:
+        file_path: Path to the text file
+        encoding: Codec to use (detected from the file if None)
+        chunk_size: Number of bytes to decode per chunk
+        max_block_size: Characters of one line held before it is split
+            (None never splits a line, keeping the join exact)
+
+    Yields:
+        Text blocks without their final newline
+    """
+    carry = ''
+    for chunk in iter_txt_chunks(file_path, encoding, chunk_size):
+        chunk = carry + chunk
+        cut = chunk.rfind('\n')
+        if cut < 0:
+            carry = chunk
+            if max_block_size is not None and len(carry) > max_block_size:
+                yield carry
+                carry = ''
+            continue
+        yield chunk[:cut]
+        carry = chunk[cut + 1:]
+    yield carry
+
+
+def read_txt(file_path: str, encoding: Optional[str] = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """Read a whole text file, detecting its encoding.
+
+    Args:
+        file_path: Path to the text file
+        encoding: Codec to use (detected from the file if None)
+        chunk_size: Number of bytes to decode per chunk
+
+    Returns:
+        The decoded text
+    """
+    return ''.join(iter_txt_chunks(file_path, encoding, chunk_size))
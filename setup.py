@@ -18,14 +18,20 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[
-        "lingtrain-aligner>=0.4.0",
         "PyPDF2>=3.0.0",
         "ebooklib>=0.18",
         "reportlab>=4.0.0",
         "beautifulsoup4>=4.12.0",
         "lxml>=4.9.0",
         "click>=8.1.0",
+        "numpy>=1.22",
     ],
+    extras_require={
+        # Alternative sentence splitter (pulls in PyTorch and transformers)
+        "lingtrain": ["lingtrain-aligner>=0.4.0"],
+        # Embedding-based alignment strategy (pulls in PyTorch and transformers)
+        "embedding": ["sentence-transformers>=2.2"],
+    },
     entry_points={
         "console_scripts": [
             "bilingual-pdf=bilingual_reader.cli:main",
@@ -0,0 +1,147 @@
+"""Tests for aligned_spans module."""
+
+import pickle
+import unittest
+from unittest import mock
+
+from bilingual_reader.aligned_spans import AlignedSpans, locate_segments, paragraph_spans
+from bilingual_reader.aligner import BilingualAligner, align_unit
+from bilingual_reader.document_structure import DocumentSection
+
+
+class TestAlignedSpans(unittest.TestCase):
+    """Test cases for the AlignedSpans container."""
+
+    def setUp(self):
+        """Build a container with three pairs, one of them a literal."""
+        self.text1 = "One.\n\nTwo is\nwrapped.\n\nThree."
+        self.text2 = "一。\n\n二\n换行。\n\n三。"
+        self.pairs = AlignedSpans(self.text1, self.text2, "en", "zh")
+        self.pairs.append((0, 4), (0, 2))
+        self.pairs.append((6, 21), (4, 9))
+        self.pairs.append((23, 29), (11, 13), literal2="叁。")
+        self.expected = [("One.", "一。"), ("Two is wrapped.", "二换行。"), ("Three.", "叁。")]
+
+    def test_list_like(self):
+        """Test indexing, slicing, iteration and comparison behave like the list of pairs."""
+        self.assertEqual(len(self.pairs), 3)
+        self.assertEqual(list(self.pairs), self.expected)
+        self.assertEqual(self.pairs, self.expected)
+        self.assertEqual(self.pairs[1], self.expected[1])
+        self.assertEqual(self.pairs[-1], self.expected[-1])
+        self.assertEqual(self.pairs[1:], self.expected[1:])
+        self.assertIn(("One.", "一。"), self.pairs)
+        with self.assertRaises(IndexError):
+            self.pairs[3]
+
+    def test_pair_spans(self):
+        """Test the spans of a pair are those it was given."""
+        self.assertEqual(self.pairs.pair_spans(1), ((6, 21), (4, 9)))
+
+    def test_extend_with_offsets(self):
+        """Test pairs of a unit are shifted to the positions of the unit in the texts."""
+        unit = AlignedSpans("Two is\nwrapped.", "二\n换行。", "en", "zh")
+        unit.append((0, 15), (0, 5))
+        pairs = AlignedSpans(self.text1, self.text2, "en", "zh")
+        pairs.extend(unit, offset1=6, offset2=4)
+        self.assertEqual(list(pairs), [("Two is wrapped.", "二换行。")])
+
+    def test_pairs_touching(self):
+        """Test the pairs overlapping or bordering a range of one text are found."""
+        self.assertEqual(self.pairs.pairs_touching(1, 8, 10), (1, 2))
+        self.assertEqual(self.pairs.pairs_touching(1, 4, 6), (0, 2))
+        self.assertEqual(self.pairs.pairs_touching(2, 10, 10), (2, 2))
+        self.assertEqual(self.pairs.pairs_touching(2, 30, 40), (3, 3))
+
+    def test_splice(self):
+        """Test pairs are replaced, and later ones moved by the change of length of the texts."""
+        text1 = "One.\n\nTwo is\nwrapped.\n\nNew.\n\nThree."
+        replacement = AlignedSpans(text1, self.text2, "en", "zh")
+        replacement.append((6, 21), (4, 9))
+        replacement.append((23, 27), (9, 9))
+        spliced = self.pairs.splice(1, 2, replacement, shift1=6)
+        self.assertIs(spliced.text1, text1)
+        self.assertEqual(spliced, [self.expected[0], self.expected[1], ("New.", ""), self.expected[2]])
+        self.assertEqual(spliced.literals2, {3: "叁。"})
+        self.assertEqual(len(self.pairs), 3)
+
+    def test_pickle(self):
+        """Test a pickled container gives the same pairs and the texts are written once."""
+        restored = pickle.loads(pickle.dumps(self.pairs))
+        self.assertEqual(restored, self.expected)
+        self.assertEqual(pickle.dumps(self.pairs).count("Three.".encode()), 1)
+
+
+class TestLocateSegments(unittest.TestCase):
+    """Test cases for finding segments in their source text."""
+
+    def test_paragraph_spans(self):
+        """Test paragraphs run from their first to their last non-space character."""
+        text = "  First\n  line.  \n \nSecond.\n\n\n"
+        self.assertEqual([text[start:end] for start, end in paragraph_spans(text)], ["First\n  line.", "Second."])
+
+    def test_joined_line_breaks(self):
+        """Test segments whose line breaks were joined are found."""
+        text = "It was a\ndark night. 天很\n黑。"
+        spans = locate_segments(text, ["It was a dark night.", "天很黑。"])
+        self.assertEqual([text[start:end] for start, end in spans], ["It was a\ndark night.", "天很\n黑。"])
+
+    def test_changed_segment(self):
+        """Test a segment that is not in the text is skipped and the next one is still found."""
+        text = "One. • Two. Three."
+        spans = locate_segments(text, ["One.", "Deux.", "Three."])
+        self.assertIsNone(spans[1])
+        self.assertEqual(text[spans[2][0]:spans[2][1]], "Three.")
+
+
+class TestAlignerSpans(unittest.TestCase):
+    """Test cases for the aligner's span-based results."""
+
+    def test_align_spans_matches_align_texts(self):
+        """Test align_spans gives the pairs of align_texts for every strategy and mode."""
+        text1 = "First line,\nsame paragraph.\n\nSecond paragraph. With two sentences.\n\nThird."
+        text2 = "第一行，\n同一段。\n\n第二段。有两句。"
+        for strategy in ("sequential", "length"):
+            for mode in ("sentence", "paragraph"):
+                aligner = BilingualAligner(strategy=strategy, splitter="builtin")
+                with self.subTest(strategy=strategy, mode=mode):
+                    spans = aligner.align_spans(text1, text2, mode)
+                    self.assertIsInstance(spans, AlignedSpans)
+                    self.assertEqual(spans, aligner.align_texts(text1, text2, mode))
+        self.assertEqual(
+            BilingualAligner().align_texts(text1, text2, "paragraph")[0],
+            ("First line, same paragraph.", "第一行，同一段。")
+        )
+
+    def test_changed_segments_are_kept_as_literals(self):
+        """Test segments a splitter rewrote are kept as they were split."""
+        def shouting_splitter(text, lang):
+            return [sentence.upper() for sentence in text.split("\n\n")]
+
+        aligner = BilingualAligner()
+        with mock.patch('bilingual_reader.aligner.get_splitter', return_value=("shouting", shouting_splitter)):
+            aligned = aligner.align_spans("One.\n\nTwo.", "一。\n\n二。", "sentence")
+        self.assertEqual(aligned, [("ONE.", "一。"), ("TWO.", "二。")])
+        self.assertEqual(aligned.literals1, {0: "ONE.", 1: "TWO."})
+        self.assertEqual(aligned.literals2, {})
+
+    def test_align_documents(self):
+        """Test the main text of an aligned document is kept as spans of the main texts."""
+        doc1 = DocumentSection(main_text="First.\n\nSecond.")
+        doc2 = DocumentSection(main_text="第一。\n\n第二。")
+        main_text = BilingualAligner().align_documents(doc1, doc2, alignment_mode="paragraph").main_text
+        self.assertIsInstance(main_text, AlignedSpans)
+        self.assertEqual(main_text, [("First.", "第一。"), ("Second.", "第二。")])
+        self.assertIs(main_text.text1, doc1.main_text)
+
+    def test_workers_return_only_spans(self):
+        """Test a worker sends the spans of its pairs back, not their text."""
+        result = align_unit("en", "zh", "A paragraph.\n\nAnother one.", "一段。\n\n另一段。", "paragraph")
+        self.assertNotIn(b"paragraph", pickle.dumps(result))
+        unit = AlignedSpans("A paragraph.\n\nAnother one.", "一段。\n\n另一段。")
+        unit.extend_spans(*result)
+        self.assertEqual(unit, [("A paragraph.", "一段。"), ("Another one.", "另一段。")])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,11 @@
 """Tests for aligner module."""
 
 import unittest
+from unittest import mock
 from bilingual_reader.aligner import BilingualAligner, AlignedDocument
+from bilingual_reader.chapter_pairing import chapter_units
 from bilingual_reader.document_structure import DocumentSection
+from bilingual_reader.text_edits import TextEdit, apply_edits, diff_texts
 
 
 class TestBilingualAligner(unittest.TestCase):
@@ -25,12 +28,16 @@ class TestBilingualAligner(unittest.TestCase):
 
     def test_split_paragraphs(self):
         """Test paragraph splitting."""
-        paragraphs = self.aligner._split_paragraphs(self.para_text1)
+        paragraphs = self.aligner._split_paragraphs(self.para_text1, self.aligner.lang1)
         self.assertEqual(len(paragraphs), 3)
         self.assertIn("First paragraph", paragraphs[0])
         self.assertIn("Second paragraph", paragraphs[1])
         self.assertIn("Third paragraph", paragraphs[2])
 
+        wrapped = "第一行\n第二行。\n\nLine one\nline two."
+        self.assertEqual(self.aligner._split_paragraphs(wrapped, "zh")[0], "第一行第二行。")
+        self.assertEqual(self.aligner._split_paragraphs(wrapped, "en")[1], "Line one line two.")
+
     def test_align_texts_sentence_mode(self):
         """Test text alignment in sentence mode."""
         aligned = self.aligner.align_texts(self.text1, self.text2, alignment_mode="sentence")
@@ -120,5 +127,169 @@ class TestBilingualAligner(unittest.TestCase):
         self.assertEqual(len(aligned_doc.back_matter), 0)
 
 
+class TestChapterAlignment(unittest.TestCase):
+    """Test cases for chapter-by-chapter alignment."""
+
+    def setUp(self):
+        """Create two books whose second language lacks a paragraph in chapter 1."""
+        chapters1, chapters2 = [], []
+        for number, chinese in enumerate(["一", "二", "三", "四", "五"], start=1):
+            paragraphs1 = [f"Paragraph {number}.{p}." for p in range(1, 4)]
+            paragraphs2 = [f"第{number}章第{p}段。" for p in range(1, 4)]
+            if number == 1:
+                del paragraphs2[1]
+            chapters1.append(f"Chapter {number}\n\n" + "\n\n".join(paragraphs1))
+            chapters2.append(f"第{chinese}章\n\n" + "\n\n".join(paragraphs2))
+        self.doc1 = DocumentSection(main_text="\n\n".join(chapters1))
+        self.doc2 = DocumentSection(main_text="\n\n".join(chapters2))
+
+    def test_missing_paragraph_stays_in_its_chapter(self):
+        """Test later chapters stay aligned after a missing paragraph."""
+        aligned = BilingualAligner().align_documents(self.doc1, self.doc2, alignment_mode="paragraph")
+
+        self.assertIn(("Paragraph 1.3.", ""), aligned.main_text)
+        self.assertIn(("Chapter 5", "第五章"), aligned.main_text)
+        self.assertIn(("Paragraph 5.3.", "第5章第3段。"), aligned.main_text)
+
+        whole = BilingualAligner(by_chapter=False).align_documents(
+            self.doc1, self.doc2, alignment_mode="paragraph"
+        )
+        self.assertNotIn(("Paragraph 5.3.", "第5章第3段。"), whole.main_text)
+
+    def test_parallel_matches_serial(self):
+        """Test aligning chapter pairs in worker processes keeps their order."""
+        serial = BilingualAligner().align_documents(self.doc1, self.doc2, alignment_mode="paragraph")
+        with mock.patch.object(BilingualAligner, 'MIN_UNITS_PER_WORKER', 1):
+            parallel = BilingualAligner(workers=2).align_documents(
+                self.doc1, self.doc2, alignment_mode="paragraph"
+            )
+        self.assertEqual(parallel, serial)
+
+    def test_iter_align_is_lazy(self):
+        """Test iter_align aligns a chapter pair only when its pairs are needed."""
+        aligner = BilingualAligner()
+        expected = aligner.align_chapters(
+            self.doc1.main_text, self.doc2.main_text, self.doc1.chapters, self.doc2.chapters, "paragraph"
+        )
+        with mock.patch.object(BilingualAligner, 'align_spans', autospec=True,
+                               side_effect=BilingualAligner.align_spans) as align_spans:
+            pairs = aligner.iter_align(
+                self.doc1.main_text, self.doc2.main_text, "paragraph", self.doc1.chapters, self.doc2.chapters
+            )
+            self.assertEqual(next(pairs), expected[0])
+            self.assertEqual(align_spans.call_count, 1)
+            self.assertEqual([expected[0]] + list(pairs), expected)
+            self.assertEqual(align_spans.call_count, len(chapter_units(self.doc1.chapters, self.doc2.chapters)))
+
+    def test_parallel_stream_matches_serial(self):
+        """Test streamed documents give the same pairs, also with worker processes."""
+        serial = BilingualAligner().align_documents(self.doc1, self.doc2, alignment_mode="paragraph")
+        streamed = BilingualAligner().align_documents(self.doc1, self.doc2, alignment_mode="paragraph", stream=True)
+        self.assertNotIsInstance(streamed.main_text, list)
+        self.assertEqual(list(streamed.main_text), serial.main_text)
+
+        with mock.patch.object(BilingualAligner, 'MIN_UNITS_PER_WORKER', 1), \
+                mock.patch.object(BilingualAligner, 'LOOKAHEAD_UNITS_PER_WORKER', 1):
+            parallel = BilingualAligner(workers=2).align_documents(
+                self.doc1, self.doc2, alignment_mode="paragraph", stream=True
+            )
+            self.assertEqual(list(parallel.main_text), serial.main_text)
+
+
+class TestLengthStrategy(unittest.TestCase):
+    """Test cases for the length-based segment pairing."""
+
+    def test_missing_paragraph_does_not_shift_later_pairs(self):
+        """Test a paragraph missing from one text only affects its own pair."""
+        english = [
+            "The first paragraph sets the scene.",
+            "A second paragraph follows it, noticeably longer than the first one was.",
+            "Then a third, of medium length.",
+            "The fourth paragraph closes the chapter with a long, winding sentence.",
+            "A short coda.",
+        ]
+        chinese = [
+            "第一段交代了场景。",
+            "第二段紧随其后，明显比第一段要长得多。",
+            "第四段用一个长长的、曲折的句子结束了这一章。",
+            "简短的尾声。",
+        ]
+        aligned = BilingualAligner(strategy="length").align_texts(
+            "\n\n".join(english), "\n\n".join(chinese), alignment_mode="paragraph"
+        )
+
+        self.assertEqual(len(aligned), 4)
+        self.assertEqual(aligned[1], (english[1], chinese[1]))
+        self.assertEqual(aligned[-1], (english[-1], chinese[-1]))
+
+    def test_merged_segments_are_joined(self):
+        """Test segments aligned to one counterpart are joined per language."""
+        english = ["One.", "Two.", "This paragraph was split in two.", "In the translation it is one.", "End."]
+        chinese = ["一。", "二。", "这个段落在原文中被分成了两段在译文里它是一段。", "完。"]
+        aligned = BilingualAligner(strategy="length").align_texts(
+            "\n\n".join(english), "\n\n".join(chinese), alignment_mode="paragraph"
+        )
+        self.assertIn(("This paragraph was split in two. In the translation it is one.", chinese[2]), aligned)
+
+    def test_unknown_strategy(self):
+        """Test an unknown strategy is rejected."""
+        with self.assertRaises(ValueError):
+            BilingualAligner(strategy="semantic")
+
+
+class TestRealign(unittest.TestCase):
+    """Test cases for realigning edited texts near their edits."""
+
+    def setUp(self):
+        """Build two 60-paragraph texts."""
+        self.english = [f"Paragraph {number} of the story, {'told at length ' * (number % 5)}ends here."
+                        for number in range(60)]
+        self.chinese = [f"故事的第{number}段，{'详细地讲述' * (number % 5)}到此结束。" for number in range(60)]
+        self.text1 = "\n\n".join(self.english)
+        self.text2 = "\n\n".join(self.chinese)
+
+    def test_typo_matches_full_alignment(self):
+        """Test realigning after a small edit gives the pairs of aligning the edited texts."""
+        position = self.text1.index("Paragraph 30") + len("Paragraph 30 of the")
+        edits1 = [TextEdit(position, position, " whole")]
+        for strategy in ("sequential", "length"):
+            for mode in ("sentence", "paragraph"):
+                aligner = BilingualAligner(strategy=strategy, splitter="builtin")
+                with self.subTest(strategy=strategy, mode=mode):
+                    previous = aligner.align_spans(self.text1, self.text2, mode)
+                    realigned = aligner.realign(previous, edits1=edits1, alignment_mode=mode)
+                    expected = aligner.align_spans(apply_edits(self.text1, edits1), self.text2, mode)
+                    self.assertEqual(realigned, expected)
+                    self.assertEqual(realigned.pair_spans(-1), expected.pair_spans(-1))
+
+    def test_inserted_paragraph(self):
+        """Test a paragraph added to one text is aligned as aligning the edited texts would."""
+        aligner = BilingualAligner(strategy="length")
+        previous = aligner.align_spans(self.text1, self.text2, "paragraph")
+        new_text2 = self.text2.replace(self.chinese[20], self.chinese[20] + "\n\n译者加的一段话。")
+        realigned = aligner.realign(previous, edits2=diff_texts(self.text2, new_text2), alignment_mode="paragraph")
+
+        self.assertEqual(realigned.text2, new_text2)
+        self.assertEqual(realigned, aligner.align_spans(self.text1, new_text2, "paragraph"))
+        self.assertEqual(realigned[:20], previous[:20])
+        self.assertEqual(realigned[22:], previous[22:])
+
+    def test_only_window_is_realigned(self):
+        """Test only the pairs near the edit are split and aligned again."""
+        aligner = BilingualAligner(strategy="length")
+        previous = aligner.align_spans(self.text1, self.text2, "paragraph")
+        position = self.text2.index(self.chinese[45])
+        with mock.patch.object(aligner, '_split', wraps=aligner._split) as split:
+            aligner.realign(previous, edits2=[TextEdit(position, position + 1, "古")], alignment_mode="paragraph")
+        window1 = split.call_args_list[0][0][0]
+        self.assertEqual(len(aligner._split_paragraphs(window1, aligner.lang1)), 1 + 2 * aligner.REALIGN_CONTEXT_PAIRS)
+
+    def test_no_edits(self):
+        """Test an alignment without edits is returned as it is."""
+        aligner = BilingualAligner()
+        previous = aligner.align_spans(self.text1, self.text2, "paragraph")
+        self.assertIs(aligner.realign(previous, alignment_mode="paragraph"), previous)
+
+
 if __name__ == '__main__':
     unittest.main()
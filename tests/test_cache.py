@@ -0,0 +1,152 @@
+"""Tests for cache module."""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from PIL import Image
+from bilingual_reader.cache import ExtractionCache
+from bilingual_reader.document_structure import ChapterIndex
+from bilingual_reader.image_extractor import ImageBlock
+from bilingual_reader.split_cache import SPLIT_STORE_NAME, SplitCache
+from bilingual_reader.text_extractor import TextExtractor
+
+
+def entry_key(name):
+    """Return a key shaped like those of ExtractionCache.make_key."""
+    return hashlib.sha256(name.encode('utf-8')).hexdigest()
+
+
+class TestExtractionCache(unittest.TestCase):
+    """Test cases for ExtractionCache."""
+
+    def setUp(self):
+        """Create a cache in a temporary directory and a small input file."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = ExtractionCache(os.path.join(self.temp_dir, 'cache'))
+        self.input_path = os.path.join(self.temp_dir, 'book.txt')
+        with open(self.input_path, 'w', encoding='utf-8') as f:
+            f.write("Preface text.\n\nChapter 1\nMain text.\n\nAppendix\nNotes.\n")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_key_depends_on_content_and_params(self):
+        """Test keys change with the file content and the parameters only."""
+        key = self.cache.make_key(self.input_path, start_marker=None)
+        self.assertEqual(key, self.cache.make_key(self.input_path, start_marker=None))
+        self.assertNotEqual(key, self.cache.make_key(self.input_path, start_marker="Chapter 1"))
+
+        copy_path = os.path.join(self.temp_dir, 'renamed.txt')
+        shutil.copy(self.input_path, copy_path)
+        self.assertEqual(key, self.cache.make_key(copy_path, start_marker=None))
+
+        with open(copy_path, 'a', encoding='utf-8') as f:
+            f.write("edited")
+        self.assertNotEqual(key, self.cache.make_key(copy_path, start_marker=None))
+
+    def test_round_trip(self):
+        """Test text, boundaries and images survive a put/get round trip."""
+        image = Image.new('RGB', (60, 70), (10, 200, 30))
+        blocks = [ImageBlock(image=image, caption="Figure", position=0.25, page=3, index=0)]
+
+        self.cache.put(entry_key("key"), "a\r\nb", 1, 3, blocks)
+        cached = self.cache.get(entry_key("key"))
+
+        self.assertEqual(cached.text, "a\r\nb")
+        self.assertEqual((cached.main_start, cached.main_end), (1, 3))
+        self.assertEqual(len(cached.images), 1)
+        self.assertEqual(cached.images[0].caption, "Figure")
+        self.assertEqual(cached.images[0].page, 3)
+        self.assertEqual(cached.images[0].image.tobytes(), image.tobytes())
+        self.assertIsNone(cached.chapters)
+
+    def test_round_trip_chapters(self):
+        """Test a chapter index survives a put/get round trip."""
+        chapters = ChapterIndex([(0, "Chapter 1"), (40, "Chapter 2")], 90)
+
+        self.cache.put(entry_key("key"), "text", 0, 4, [], chapters=chapters)
+
+        self.assertEqual(self.cache.get(entry_key("key")).chapters, chapters)
+
+    def test_missing_entry(self):
+        """Test a miss returns None."""
+        self.assertIsNone(self.cache.get(entry_key("missing")))
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted when over the limit."""
+        self.cache.put(entry_key("old"), "x" * 1000, 0, 0, [])
+        self.cache.put(entry_key("new"), "y" * 1000, 0, 0, [])
+        entry_size = self.cache.size() // 2
+
+        # Touch "old" so that "new" becomes the least recently used entry
+        os.utime(os.path.join(self.cache.cache_dir, entry_key("new"), "meta.json"), (1, 1))
+        self.assertIsNotNone(self.cache.get(entry_key("old")))
+
+        self.cache.max_bytes = 2 * entry_size + entry_size // 2
+        self.cache.put(entry_key("newest"), "z" * 1000, 0, 0, [])
+
+        self.assertIsNone(self.cache.get(entry_key("new")))
+        self.assertIsNotNone(self.cache.get(entry_key("old")))
+        self.assertIsNotNone(self.cache.get(entry_key("newest")))
+
+    def test_clear(self):
+        """Test clear removes every entry."""
+        self.cache.put(entry_key("key"), "text", 0, 4, [])
+        self.cache.clear()
+        self.assertIsNone(self.cache.get(entry_key("key")))
+        self.assertEqual(self.cache.size(), 0)
+
+    def test_clear_removes_files(self):
+        """Test clear also removes files kept beside the entries, such as the split store."""
+        store_path = os.path.join(self.cache.cache_dir, SPLIT_STORE_NAME)
+        with SplitCache(store_path) as split_cache:
+            split_cache.split("One. Two.", "en", lambda text, lang: [text])
+        # Journal files SQLite leaves beside the store after a crash
+        for suffix in ('-journal', '-wal'):
+            with open(store_path + suffix, 'wb') as f:
+                f.write(b'')
+        self.cache.put(entry_key("key"), "text", 0, 4, [])
+        self.assertEqual(len(self.cache._entries()), 1)
+
+        self.cache.clear()
+        self.assertEqual(os.listdir(self.cache.cache_dir), [])
+
+    def test_clear_keeps_foreign_files(self):
+        """Test clear leaves files and directories the cache did not create."""
+        cache_dir = self.cache.cache_dir
+        os.makedirs(os.path.join(cache_dir, 'photos'))
+        os.makedirs(os.path.join(cache_dir, 'reports'))
+        with open(os.path.join(cache_dir, 'reports', 'meta.json'), 'w', encoding='utf-8') as f:
+            f.write('{}')
+        with open(os.path.join(cache_dir, 'notes.txt'), 'w', encoding='utf-8') as f:
+            f.write("Keep me.")
+        os.makedirs(os.path.join(cache_dir, '.tmp-interrupted'))
+        with open(os.path.join(cache_dir, '.embeddings-model.npy'), 'wb') as f:
+            f.write(b'')
+        self.cache.put(entry_key("key"), "text", 0, 4, [])
+
+        self.cache.clear()
+        self.assertEqual(sorted(os.listdir(cache_dir)), ['notes.txt', 'photos', 'reports'])
+
+    def test_extract_with_cache(self):
+        """Test a cached extraction is reused and matches a fresh one."""
+        first = TextExtractor.extract_with_structure_and_images(self.input_path, cache=self.cache)
+
+        with mock.patch.object(TextExtractor, 'extract_text', side_effect=AssertionError("not cached")):
+            second = TextExtractor.extract_with_structure_and_images(self.input_path, cache=self.cache)
+
+        self.assertEqual(second.front_matter, first.front_matter)
+        self.assertEqual(second.main_text, first.main_text)
+        self.assertEqual(second.back_matter, first.back_matter)
+        self.assertIn("Chapter 1", second.main_text)
+        self.assertIn("Appendix", second.back_matter)
+        self.assertEqual(second.chapters, first.chapters)
+        self.assertEqual(second.chapters.titles[0], "Chapter 1")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""Tests for chapter_pairing module."""
+
+import unittest
+from bilingual_reader.chapter_pairing import (
+    chapter_key,
+    chapter_units,
+    pair_chapters,
+    parse_chinese_numeral,
+    parse_english_number,
+    parse_roman_numeral
+)
+from bilingual_reader.document_structure import ChapterIndex
+
+
+class TestNumeralParsing(unittest.TestCase):
+    """Test cases for the numeral parsers."""
+
+    def test_chinese_numerals(self):
+        """Test Chinese numerals, including implied ones and zeros."""
+        self.assertEqual(parse_chinese_numeral("十二"), 12)
+        self.assertEqual(parse_chinese_numeral("二十"), 20)
+        self.assertEqual(parse_chinese_numeral("一百零五"), 105)
+        self.assertEqual(parse_chinese_numeral("两千零二十四"), 2024)
+        self.assertEqual(parse_chinese_numeral("一万零三百"), 10300)
+        self.assertEqual(parse_chinese_numeral("１２"), 12)
+        self.assertIsNone(parse_chinese_numeral("十章"))
+        self.assertIsNone(parse_chinese_numeral(""))
+
+    def test_roman_numerals(self):
+        """Test Roman numerals, rejecting malformed ones."""
+        self.assertEqual(parse_roman_numeral("XII"), 12)
+        self.assertEqual(parse_roman_numeral("iv"), 4)
+        self.assertEqual(parse_roman_numeral("MCMXCIV"), 1994)
+        self.assertIsNone(parse_roman_numeral("IIII"))
+        self.assertIsNone(parse_roman_numeral("did"))
+
+    def test_english_numbers(self):
+        """Test English cardinals and ordinals."""
+        self.assertEqual(parse_english_number("twelve"), 12)
+        self.assertEqual(parse_english_number("Twenty-One"), 21)
+        self.assertEqual(parse_english_number("third"), 3)
+        self.assertEqual(parse_english_number("thirty second"), 32)
+        self.assertIsNone(parse_english_number("dozen"))
+
+
+class TestChapterKey(unittest.TestCase):
+    """Test cases for heading normalization."""
+
+    def test_same_chapter_in_both_languages(self):
+        """Test equivalent headings share a key."""
+        headings = ["Chapter 12", "CHAPTER XII", "Chapter Twelve: The Storm", "第十二章 风暴", "第12章", "12. The Storm"]
+        self.assertEqual({chapter_key(heading) for heading in headings}, {("chapter", 12)})
+
+    def test_division_kinds(self):
+        """Test parts, books and named divisions get their own kinds."""
+        self.assertEqual(chapter_key("Part II"), ("part", 2))
+        self.assertEqual(chapter_key("第二部分"), ("part", 2))
+        self.assertEqual(chapter_key("卷三"), ("book", 3))
+        self.assertEqual(chapter_key("Prologue"), chapter_key("序章"))
+
+    def test_unrecognized_heading(self):
+        """Test headings without a number have no key."""
+        self.assertIsNone(chapter_key("The Storm"))
+        self.assertIsNone(chapter_key("Chapter Did"))
+
+
+class TestPairChapters(unittest.TestCase):
+    """Test cases for pairing chapters across books."""
+
+    def test_missing_chapter(self):
+        """Test a chapter missing from one book leaves the others paired."""
+        titles1 = ["Chapter 1", "Chapter 2", "Chapter 3", "Chapter 4"]
+        titles2 = ["第一章", "第三章", "第四章"]
+        self.assertEqual(pair_chapters(titles1, titles2), [(0, 0), (2, 1), (3, 2)])
+
+    def test_numbering_restarts_per_part(self):
+        """Test repeated keys pair in reading order."""
+        titles1 = ["Part 1", "Chapter 1", "Chapter 2", "Part 2", "Chapter 1"]
+        titles2 = ["第一部", "第一章", "第二章", "第二部", "第一章"]
+        self.assertEqual(pair_chapters(titles1, titles2), [(i, i) for i in range(5)])
+
+    def test_unnumbered_titles_pair_by_index(self):
+        """Test equal counts of unrecognized titles pair by position."""
+        self.assertEqual(pair_chapters(["Storm", "Calm"], ["风暴", "平静"]), [(0, 0), (1, 1)])
+        self.assertEqual(pair_chapters(["Storm", "Calm"], ["风暴"]), [])
+
+    def test_units_cover_both_texts(self):
+        """Test units run from one pair to the next and cover the texts in order."""
+        chapters1 = ChapterIndex([(5, "Chapter 1"), (20, "Chapter 2"), (40, "Chapter 3")], 60)
+        chapters2 = ChapterIndex([(0, "第一章"), (30, "第三章")], 50)
+
+        self.assertEqual(
+            chapter_units(chapters1, chapters2),
+            [((0, 5), (0, 0)), ((5, 40), (0, 30)), ((40, 60), (30, 50))]
+        )
+        self.assertEqual(chapter_units(ChapterIndex([], 7), chapters2), [((0, 7), (0, 50))])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,16 +2,27 @@
 
 import unittest
 from bilingual_reader.document_structure import (
+    Chapter,
+    ChapterIndex,
     DocumentSection,
+    StructureScanner,
+    TocEntry,
+    classify_toc_title,
+    toc_chapters,
+    toc_section_boundaries,
     detect_main_text_start,
     detect_main_text_end,
     split_document,
-    get_chapter_info
+    split_document_stream,
+    get_chapter_info,
+    iter_chapters,
+    iter_lines,
+    find_section_boundaries
 )
 
 
 class TestDocumentSection(unittest.TestCase):
-    """Test cases for DocumentSection dataclass."""
+    """Test cases for DocumentSection."""
 
     def test_initialization(self):
         """Test DocumentSection initialization."""
@@ -31,6 +42,46 @@ class TestDocumentSection(unittest.TestCase):
         self.assertEqual(doc.main_text, "")
         self.assertEqual(doc.back_matter, "")
 
+    def test_from_boundaries_matches_stripped_slices(self):
+        """Test spans give the same parts as stripping slices of the text."""
+        text = " Title\u3000\n\n Chapter 1\nBody \n\nNotes\n "
+        for main_start, main_end in [(0, len(text)), (7, 27), (9, 9), (20, 10), (0, 0), (len(text), len(text))]:
+            doc = DocumentSection.from_boundaries(text, main_start, main_end)
+            self.assertEqual(doc.front_matter, text[:main_start].strip())
+            self.assertEqual(doc.main_text, text[main_start:main_end].strip())
+            self.assertEqual(doc.back_matter, text[main_end:].strip())
+            self.assertEqual(doc.part_length('main_text'), len(doc.main_text))
+
+    def test_parts_share_the_buffer(self):
+        """Test a section built from boundaries holds spans, not copies."""
+        text = "Front\nChapter 1\nBody\nNotes"
+        doc = DocumentSection.from_boundaries(text, 6, 21)
+
+        self.assertIs(doc._spans['main_text'][0], text)
+        self.assertEqual(doc.span('main_text'), (6, 20))
+        self.assertEqual(doc, DocumentSection("Front", "Chapter 1\nBody", "Notes"))
+
+    def test_assigning_a_part(self):
+        """Test assigning a part replaces only that part."""
+        doc = DocumentSection.from_boundaries("Front\nMain\nBack", 6, 11)
+        doc.main_text = "Other"
+
+        self.assertEqual(doc.main_text, "Other")
+        self.assertEqual(doc.front_matter, "Front")
+        self.assertEqual(doc.back_matter, "Back")
+        self.assertIn("main_text=<5 chars>", repr(doc))
+
+    def test_assigning_main_text_resets_chapters(self):
+        """Test chapters are detected again after main_text is replaced."""
+        doc = DocumentSection(main_text="Chapter 1\nOne.\n\nChapter 2\nTwo.")
+        self.assertEqual(len(doc.chapters), 2)
+
+        doc.main_text = "Chapter 1\nOnly one."
+        self.assertEqual(len(doc.chapters), 1)
+
+        doc.front_matter = "Title"
+        self.assertEqual(len(doc.chapters), 1)
+
 
 class TestChapterDetection(unittest.TestCase):
     """Test cases for chapter marker detection."""
@@ -272,5 +323,231 @@ Just plain text."""
         self.assertEqual(len(chapters), 0)
 
 
+class TestStreaming(unittest.TestCase):
+    """Test cases for the streaming structure helpers."""
+
+    TEXTS = [
+        "Title: My Book\nBy: Author Name\n\nChapter 1\nFirst.\n\nChapter 2\nSecond.\n\nAppendix A\nNotes.",
+        "书名：我的书\n\n第一章\n内容。\n\n附录\n附加信息。",
+        "Plain text without markers.\nJust lines.\n",
+        "Front\nSTART HERE and more\nMain content\nEND HERE\nBack stuff",
+        "Preface stuff\nIndex\nChapter 1\nBody\n",
+    ]
+
+    @staticmethod
+    def _chunk(text, lines_per_chunk):
+        lines = text.split('\n')
+        return ['\n'.join(lines[i:i + lines_per_chunk]) for i in range(0, len(lines), lines_per_chunk)]
+
+    def _assert_same_sections(self, text, **markers):
+        expected = split_document(text, **markers)
+        for lines_per_chunk in (1, 2, 100):
+            main_start, main_end = split_document_stream(self._chunk(text, lines_per_chunk), **markers)
+            doc = split_document(text, start_position=main_start, end_position=main_end)
+            self.assertEqual(doc.front_matter, expected.front_matter)
+            self.assertEqual(doc.main_text, expected.main_text)
+            self.assertEqual(doc.back_matter, expected.back_matter)
+
+    def test_iter_lines_offsets(self):
+        """Test line offsets index into the joined text."""
+        text = "ab\ncd\n\nef"
+        for offset, line in iter_lines(self._chunk(text, 2)):
+            self.assertEqual(text[offset:offset + len(line)], line)
+
+    def test_stream_matches_split_document(self):
+        """Test streamed boundaries reproduce split_document's sections."""
+        for text in self.TEXTS:
+            self._assert_same_sections(text)
+
+    def test_stream_with_custom_markers(self):
+        """Test streamed boundaries with custom start and end markers."""
+        for text in self.TEXTS:
+            self._assert_same_sections(text, start_marker="START HERE", end_marker="END HERE")
+            self._assert_same_sections(text, start_marker="missing", end_marker="appendix")
+
+    def test_stream_stops_reading_early(self):
+        """Test the stream is not consumed past the end of the main text."""
+        def chunks():
+            yield "Chapter 1\nBody"
+            yield "Appendix\nNotes"
+            raise AssertionError("read past the back matter")
+
+        self.assertEqual(split_document_stream(chunks()), (0, 15))
+
+    def test_iter_chapters(self):
+        """Test chapters are split at markers and join back to the full text."""
+        text = self.TEXTS[0]
+        chapters = list(iter_chapters(self._chunk(text, 3)))
+
+        self.assertEqual([title for title, _ in chapters], ["", "Chapter 1", "Chapter 2"])
+        self.assertTrue(chapters[1][1].startswith("Chapter 1\nFirst."))
+        self.assertEqual('\n'.join(chapter for _, chapter in chapters), text)
+
+
+class TestStructureScanner(unittest.TestCase):
+    """Test cases for the combined marker scanner."""
+
+    def setUp(self):
+        """Create a scanner with the default patterns."""
+        self.scanner = StructureScanner()
+
+    def test_iter_markers(self):
+        """Test markers come back in text order with line positions and titles."""
+        text = "Title\n  Chapter 1  \nText\n第二章 开始\nAppendix A\n"
+        markers = list(self.scanner.iter_markers(text))
+
+        self.assertEqual(
+            [(marker.kind, marker.title) for marker in markers],
+            [('chapter', 'Chapter 1'), ('chapter', '第二章 开始'), ('back_matter', 'Appendix A')]
+        )
+        self.assertEqual(markers[0].position, text.index("  Chapter 1"))
+
+    def test_markers_stay_within_a_line(self):
+        """Test whitespace in a pattern does not match across a line break."""
+        self.assertEqual(get_chapter_info("Chapter\n12 apples"), [])
+        self.assertEqual(get_chapter_info("Chapter\t12"), [(0, "Chapter\t12")])
+
+    def test_end_anchor_allows_trailing_whitespace(self):
+        """Test patterns ending in $ match lines with trailing spaces or \\r."""
+        text = "Intro text\nPreface  \r\nMore\nIndex\r\nEnd"
+        self.assertEqual([title for _, title in get_chapter_info(text)], ["Preface"])
+        self.assertEqual(detect_main_text_end(text), text.index("Index"))
+        self.assertEqual(get_chapter_info("Preface to the edition"), [])
+
+    def test_back_matter_mid_line_start(self):
+        """Test a start position inside a line treats the rest of the line as a line."""
+        text = "See the Appendix\nMore text\nIndex"
+        self.assertEqual(detect_main_text_end(text, text.index("Appendix")), text.index("Appendix"))
+        self.assertEqual(detect_main_text_end(text, text.index("the")), text.index("Index"))
+
+    def test_find_boundaries_single_pass(self):
+        """Test the single pass ignores back matter before the first chapter."""
+        text = "Notes\nPreface\nChapter 1\nText\nNotes\nMore"
+        self.assertEqual(
+            self.scanner.find_boundaries(text),
+            (text.index("Preface"), text.rindex("Notes"))
+        )
+        self.assertEqual(self.scanner.find_boundaries("Text\nNotes\nMore"), (0, 5))
+        self.assertEqual(find_section_boundaries("Chapter 1\nText"), (0, len("Chapter 1\nText")))
+
+    def test_custom_patterns(self):
+        """Test a scanner built from custom patterns."""
+        scanner = StructureScanner(chapter_patterns=[r'^scene\s+\d+'], back_matter_patterns=[r'^fin$'])
+
+        self.assertEqual(scanner.chapters("Cast\nScene 1\nChapter 2\nScene 2"), [(5, "Scene 1"), (23, "Scene 2")])
+        self.assertEqual(scanner.classify_line("fin"), 'back_matter')
+        self.assertIsNone(scanner.classify_line("final"))
+        self.assertEqual(StructureScanner(back_matter_patterns=[]).find_back_matter("Index"), None)
+
+
+class TestTocStructure(unittest.TestCase):
+    """Test cases for table of contents driven structure."""
+
+    def setUp(self):
+        """Create a text and a table of contents pointing into it."""
+        self.text = "Cover\nContents\nOpening\nstory\nMiddle\nmore\nAcknowledgements\nthanks"
+        self.toc = [
+            TocEntry(0, "Cover"),
+            TocEntry(self.text.index("Contents"), "Table of Contents"),
+            TocEntry(self.text.index("Opening"), "Opening"),
+            TocEntry(self.text.index("Middle"), "Middle", level=1),
+            TocEntry(self.text.index("Acknowledgements"), "Acknowledgements"),
+        ]
+
+    def test_classify_toc_title(self):
+        """Test titles are sorted into front matter, back matter and chapters."""
+        self.assertEqual(classify_toc_title("Copyright"), 'front_matter')
+        self.assertEqual(classify_toc_title("目录"), 'front_matter')
+        self.assertEqual(classify_toc_title("Appendix B"), 'back_matter')
+        self.assertEqual(classify_toc_title("The Opening"), 'chapter')
+        self.assertEqual(classify_toc_title("Contents of the Heart"), 'chapter')
+
+    def test_toc_section_boundaries(self):
+        """Test the main text runs from the first chapter entry to the back matter."""
+        self.assertEqual(
+            toc_section_boundaries(self.toc, len(self.text)),
+            (self.text.index("Opening"), self.text.index("Acknowledgements"))
+        )
+        self.assertIsNone(toc_section_boundaries(self.toc[:2], len(self.text)))
+
+    def test_toc_chapters(self):
+        """Test chapters are the main text entries."""
+        self.assertEqual(
+            toc_chapters(self.toc, len(self.text)),
+            [(self.text.index("Opening"), "Opening"), (self.text.index("Middle"), "Middle")]
+        )
+
+    def test_split_document_with_toc(self):
+        """Test split_document prefers the table of contents over patterns."""
+        doc = split_document(self.text, toc=self.toc)
+        self.assertEqual(doc.front_matter, "Cover\nContents")
+        self.assertEqual(doc.main_text, "Opening\nstory\nMiddle\nmore")
+        self.assertEqual(doc.back_matter, "Acknowledgements\nthanks")
+
+    def test_unusable_toc_falls_back_to_patterns(self):
+        """Test a table of contents without chapters falls back to CHAPTER_PATTERNS."""
+        text = "Title\nChapter 1\nText"
+        self.assertEqual(
+            find_section_boundaries(text, toc=[TocEntry(0, "Cover")]),
+            find_section_boundaries(text)
+        )
+
+
+class TestChapterIndex(unittest.TestCase):
+    """Test cases for ChapterIndex."""
+
+    def setUp(self):
+        """Create a text with three chapters after a title line."""
+        self.text = "Title\nChapter 1\nOne\nChapter 2\nTwo\nChapter 3\nThree"
+        self.index = ChapterIndex.from_text(self.text)
+
+    def test_matches_get_chapter_info(self):
+        """Test the index holds the same chapters as get_chapter_info."""
+        self.assertEqual(list(zip(self.index.starts, self.index.titles)), get_chapter_info(self.text))
+        self.assertEqual(len(self.index), 3)
+
+    def test_chapter_at(self):
+        """Test offsets map to the chapter containing them."""
+        second = self.text.index("Chapter 2")
+        self.assertIsNone(self.index.chapter_at(0))
+        self.assertEqual(self.index.chapter_at(second - 1), 0)
+        self.assertEqual(self.index.chapter_at(second), 1)
+        self.assertEqual(self.index.chapter_at(len(self.text)), 2)
+
+    def test_spans(self):
+        """Test chapters cover the text from their heading to the next one."""
+        self.assertEqual(self.index.chapter_text(self.text, 1), "Chapter 2\nTwo\n")
+        self.assertEqual(self.index.chapter_text(self.text, -1), "Chapter 3\nThree")
+        self.assertEqual(
+            self.index[0],
+            Chapter(start=self.text.index("Chapter 1"), end=self.text.index("Chapter 2"), title="Chapter 1")
+        )
+        with self.assertRaises(IndexError):
+            self.index.span(3)
+
+    def test_dict_round_trip(self):
+        """Test to_dict output rebuilds an equal index."""
+        self.assertEqual(ChapterIndex.from_dict(self.index.to_dict()), self.index)
+
+    def test_from_toc(self):
+        """Test table of contents chapters take precedence over patterns."""
+        toc = [TocEntry(self.text.index("One"), "One"), TocEntry(self.text.index("Two"), "Two")]
+        index = ChapterIndex.from_text(self.text, toc=toc)
+        self.assertEqual(index.titles, ["One", "Two"])
+
+    def test_section_chapters_relative_to_main_text(self):
+        """Test section chapters point into the stripped main text."""
+        text = "Title page\n\n  Chapter 1\nOne\nChapter 2\nTwo\nAppendix\nNotes"
+        doc = split_document(text)
+
+        self.assertEqual(doc.chapters.titles, ["Chapter 1", "Chapter 2"])
+        for chapter in doc.chapters:
+            self.assertTrue(doc.main_text[chapter.start:].startswith(chapter.title))
+
+        toc = [TocEntry(text.index("Chapter 1"), "Chapter 1"), TocEntry(text.index("Appendix"), "Appendix")]
+        doc = split_document(text, toc=toc)
+        self.assertEqual(doc.chapters, ChapterIndex([(0, "Chapter 1")], len(doc.main_text)))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,202 @@
+"""Tests for embedding_aligner module."""
+
+import os
+import re
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from bilingual_reader import embedding_aligner
+from bilingual_reader.aligner import BilingualAligner
+from bilingual_reader.embedding_aligner import (
+    EmbeddingStore,
+    SegmentEncoder,
+    align_embeddings,
+    segment_key,
+)
+from bilingual_reader.length_aligner import Bead
+
+# Chinese words of the test texts and the English concept they translate
+LEXICON = {
+    "猫": "cat", "狗": "dog", "鸟": "bird", "鱼": "fish", "马": "horse",
+    "吃": "eats", "睡": "sleeps", "跑": "runs", "飞": "flies", "游": "swims",
+    "早上": "morning", "晚上": "evening", "花园": "garden", "河": "river", "山": "mountain",
+}
+
+
+class LexiconEncoder:
+    """Tiny local "model": a hashed bag of concepts shared by both languages."""
+
+    dimension = 64
+
+    def __init__(self):
+        self.calls = []
+        self._words = re.compile('|'.join(sorted(LEXICON, key=len, reverse=True)) + r'|[a-z]+')
+
+    def encode(self, texts, batch_size=32):
+        self.calls.append(list(texts))
+        vectors = np.zeros((len(texts), self.dimension))
+        for row, text in enumerate(texts):
+            for word in self._words.findall(text.lower()):
+                concept = LEXICON.get(word, word)
+                rng = np.random.default_rng(int(segment_key(concept, 'lexicon')[:8], 16))
+                vectors[row] += rng.standard_normal(self.dimension)
+        return vectors
+
+
+ENGLISH = [
+    "The cat sleeps in the garden.",
+    "The dog runs to the river.",
+    "In the morning the bird flies.",
+    "The fish swims in the river.",
+    "The horse eats in the evening.",
+    "The cat runs up the mountain.",
+]
+CHINESE = ["猫睡在花园里。", "狗跑到河边。", "早上鸟飞。", "鱼在河里游。", "马在晚上吃。", "猫跑上山。"]
+
+
+def encode(segments):
+    return SegmentEncoder(model=LexiconEncoder()).encode(segments)
+
+
+class TestAlignEmbeddings(unittest.TestCase):
+    """Test cases for align_embeddings."""
+
+    def test_one_to_one(self):
+        """Test translations in the same order are paired one to one."""
+        beads = align_embeddings(encode(ENGLISH), encode(CHINESE))
+        self.assertEqual(beads, [Bead(k, k + 1, k, k + 1) for k in range(len(ENGLISH))])
+
+    def test_missing_segment(self):
+        """Test a segment missing from the translation is left unpaired."""
+        chinese = CHINESE[:2] + CHINESE[3:]
+        beads = align_embeddings(encode(ENGLISH), encode(chinese))
+        self.assertIn(Bead(2, 3, 2, 2), beads)
+        self.assertEqual(beads[-1], Bead(5, 6, 4, 5))
+
+    def test_merged_segments(self):
+        """Test two segments translated as one are merged."""
+        chinese = CHINESE[:1] + [CHINESE[1] + CHINESE[2]] + CHINESE[3:]
+        beads = align_embeddings(encode(ENGLISH), encode(chinese))
+        self.assertIn(Bead(1, 3, 1, 2), beads)
+        self.assertEqual(len(beads), 5)
+
+    def test_similar_lengths_do_not_confuse_it(self):
+        """Test the pairs follow the meaning where lengths would suggest a shift."""
+        english = ["The cat sleeps.", "The dog runs.", "The bird flies.", "The fish swims."]
+        chinese = ["狗跑。", "鸟飞。", "鱼游。"]
+        beads = align_embeddings(encode(english), encode(chinese))
+        self.assertEqual(beads[0], Bead(0, 1, 0, 0))
+
+    def test_empty(self):
+        """Test empty inputs."""
+        self.assertEqual(align_embeddings(encode([]), encode([])), [])
+        self.assertEqual(align_embeddings(encode(ENGLISH[:2]), encode([])), [Bead(0, 2, 0, 0)])
+
+
+class TestEmbeddingStore(unittest.TestCase):
+    """Test cases for EmbeddingStore and SegmentEncoder."""
+
+    def setUp(self):
+        """Create a temporary directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'embeddings.npy')
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_only_new_segments_are_encoded(self):
+        """Test segments already in the store are not encoded again."""
+        model = LexiconEncoder()
+        encoder = SegmentEncoder(model=model)
+        first = encoder.encode(ENGLISH[:3] + ENGLISH[:1])
+        self.assertEqual(len(model.calls), 1)
+        self.assertEqual(sorted(model.calls[0]), sorted(ENGLISH[:3]))
+
+        second = encoder.encode(ENGLISH)
+        self.assertEqual(sorted(model.calls[1]), sorted(ENGLISH[3:]))
+        np.testing.assert_allclose(second[:3], first[:3])
+        np.testing.assert_allclose(np.linalg.norm(second, axis=1), 1.0, rtol=1e-5)
+
+    def test_store_survives_reopening(self):
+        """Test a store reopened from disk serves the embeddings it was given."""
+        expected = SegmentEncoder(model=LexiconEncoder(), store=EmbeddingStore(self.path)).encode(ENGLISH)
+
+        model = LexiconEncoder()
+        store = EmbeddingStore(self.path)
+        self.assertEqual(len(store), len(ENGLISH))
+        self.assertIsInstance(np.load(self.path, mmap_mode='r'), np.memmap)
+        np.testing.assert_array_equal(SegmentEncoder(model=model, store=store).encode(ENGLISH), expected)
+        self.assertEqual(model.calls, [])
+
+    def test_store_grows(self):
+        """Test the memory-mapped file grows past its initial size and keeps its rows."""
+        keys = [str(number) for number in range(3000)]
+        vectors = np.arange(3000 * 4, dtype=np.float32).reshape(3000, 4)
+        store = EmbeddingStore(self.path)
+        store.add(keys[:1000], vectors[:1000])
+        store.add(keys[1000:], vectors[1000:])
+
+        found, stored = EmbeddingStore(self.path).get(["5", "missing", "2999"])
+        self.assertEqual(found.tolist(), [True, False, True])
+        np.testing.assert_array_equal(stored, vectors[[5, 2999]])
+
+    def test_dimension_mismatch(self):
+        """Test vectors of another model's size are rejected."""
+        store = EmbeddingStore()
+        store.add(["a"], np.ones((1, 4)))
+        with self.assertRaises(ValueError):
+            store.add(["b"], np.ones((1, 8)))
+
+    def test_clear(self):
+        """Test clear removes the files."""
+        store = EmbeddingStore(self.path)
+        store.add(["a"], np.ones((1, 4)))
+        store.clear()
+        self.assertEqual(len(store), 0)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_missing_sentence_transformers(self):
+        """Test a clear error when no model is given and sentence-transformers is missing."""
+        with mock.patch.object(embedding_aligner, 'HAS_SENTENCE_TRANSFORMERS', False):
+            with self.assertRaises(ImportError):
+                SegmentEncoder().encode(["text"])
+
+
+class TestEmbeddingStrategy(unittest.TestCase):
+    """Test cases for BilingualAligner with the embedding strategy."""
+
+    def test_align_texts(self):
+        """Test paragraphs are paired by meaning and a missing one is left unpaired."""
+        aligner = BilingualAligner(strategy="embedding", encoder=SegmentEncoder(model=LexiconEncoder()))
+        chinese = CHINESE[:2] + CHINESE[3:]
+        aligned = aligner.align_texts("\n\n".join(ENGLISH), "\n\n".join(chinese), alignment_mode="paragraph")
+        self.assertEqual(aligned[2], (ENGLISH[2], ""))
+        self.assertEqual(aligned[3], (ENGLISH[3], CHINESE[3]))
+
+    def test_chapters_are_encoded_in_one_batch(self):
+        """Test align_chapters encodes the segments of every chapter in one call."""
+        from bilingual_reader.document_structure import ChapterIndex
+
+        text1 = "Chapter 1\n\n" + "\n\n".join(ENGLISH[:3]) + "\n\nChapter 2\n\n" + "\n\n".join(ENGLISH[3:])
+        text2 = "第一章\n\n" + "\n\n".join(CHINESE[:3]) + "\n\n第二章\n\n" + "\n\n".join(CHINESE[3:])
+        model = LexiconEncoder()
+        aligner = BilingualAligner(strategy="embedding", workers=4, encoder=SegmentEncoder(model=model))
+        aligned = aligner.align_chapters(
+            text1, text2, ChapterIndex.from_text(text1), ChapterIndex.from_text(text2), alignment_mode="paragraph"
+        )
+        self.assertEqual(len(model.calls), 1)
+        self.assertIn((ENGLISH[4], CHINESE[4]), aligned)
+
+    def test_unknown_strategy(self):
+        """Test unknown strategies are still rejected."""
+        with self.assertRaises(ValueError):
+            BilingualAligner(strategy="semantic")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+"""Tests for epub_archive module."""
+
+import os
+import tempfile
+import unittest
+import zipfile
+from bilingual_reader.epub_archive import EpubArchive, resolve_href
+from tests.test_epub_reader import _write_test_epub, _write_toc_epub
+
+
+class TestResolveHref(unittest.TestCase):
+    """Test cases for href resolution."""
+
+    def test_relative(self):
+        """Test hrefs resolve against the referring member's directory."""
+        self.assertEqual(resolve_href('OEBPS/text/ch1.xhtml', '../images/a.png'), 'OEBPS/images/a.png')
+        self.assertEqual(resolve_href('OEBPS/content.opf', 'text/ch1.xhtml'), 'OEBPS/text/ch1.xhtml')
+        self.assertEqual(resolve_href('content.opf', 'ch1.xhtml'), 'ch1.xhtml')
+
+    def test_fragment_and_encoding(self):
+        """Test fragments are dropped and percent-encoding is decoded."""
+        self.assertEqual(resolve_href('a/b.xhtml', 'c%20d.xhtml#note1'), 'a/c d.xhtml')
+
+
+class TestEpubArchive(unittest.TestCase):
+    """Test cases for lazy ePub archive access."""
+
+    def setUp(self):
+        """Write a small ePub whose manifest order differs from its spine."""
+        with tempfile.NamedTemporaryFile(suffix='.epub', delete=False) as f:
+            self.epub_path = f.name
+        _write_test_epub(self.epub_path, reverse_manifest=True)
+
+    def tearDown(self):
+        """Remove the ePub."""
+        os.unlink(self.epub_path)
+
+    def test_documents_in_spine_order(self):
+        """Test documents come back in spine order, without the nav document."""
+        with EpubArchive(self.epub_path) as archive:
+            names = [item.name for item in archive.documents()]
+
+        self.assertEqual(len(names), 3)
+        self.assertTrue(names[0].endswith('front.xhtml'))
+        self.assertTrue(names[1].endswith('text/ch1.xhtml'))
+        self.assertTrue(names[2].endswith('text/ch2.xhtml'))
+
+    def test_read_member(self):
+        """Test members are read by their archive name."""
+        with EpubArchive(self.epub_path) as archive:
+            content = archive.read(archive.documents()[1].name)
+        self.assertIn(b'The first chapter.', content)
+
+    def test_find_image(self):
+        """Test image sources resolve relative to their document."""
+        with EpubArchive(self.epub_path) as archive:
+            document = archive.documents()[1].name
+            self.assertEqual(len(archive.image_names()), 1)
+            self.assertTrue(archive.find_image('../images/figure.png', document).startswith(b'\x89PNG'))
+            # Sloppy paths fall back to matching the end of the image name
+            self.assertIsNotNone(archive.find_image('figure.png', document))
+            self.assertIsNone(archive.find_image('../images/missing.png', document))
+
+    def test_toc_from_nav(self):
+        """Test the navigation document gives titles, targets and nesting."""
+        _write_toc_epub(self.epub_path)
+        with EpubArchive(self.epub_path) as archive:
+            toc = archive.toc()
+
+        self.assertEqual(
+            [(link.title, link.level, link.fragment) for link in toc],
+            [('Copyright', 0, ''), ('Part One', 0, ''), ('The Beginning', 1, ''),
+             ('A Later Scene', 1, 'later'), ('Notes', 0, '')]
+        )
+        self.assertTrue(toc[3].name.endswith('text/one.xhtml'))
+
+    def test_toc_from_ncx(self):
+        """Test the NCX is used when there is no navigation document."""
+        _write_toc_epub(self.epub_path, nav=False)
+        with EpubArchive(self.epub_path) as archive:
+            self.assertFalse(any('nav' in item.properties for item in archive.manifest.values()))
+            toc = archive.toc()
+
+        self.assertEqual([link.title for link in toc], ['Copyright', 'Part One', 'The Beginning', 'A Later Scene', 'Notes'])
+        self.assertEqual(toc[2].level, 1)
+        self.assertEqual(toc[3].fragment, 'later')
+
+    def test_invalid_epub(self):
+        """Test a zip without a container document is rejected."""
+        with tempfile.NamedTemporaryFile(suffix='.epub', delete=False) as f:
+            bad_path = f.name
+        try:
+            with zipfile.ZipFile(bad_path, 'w') as archive:
+                archive.writestr('mimetype', 'application/epub+zip')
+            with self.assertRaises(ValueError):
+                EpubArchive(bad_path)
+        finally:
+            os.unlink(bad_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
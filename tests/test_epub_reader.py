@@ -0,0 +1,282 @@
+"""Tests for epub_reader module."""
+
+import io
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from ebooklib import epub
+from PIL import Image
+import ebooklib
+from bs4 import BeautifulSoup
+from lxml import html
+from bilingual_reader.epub_reader import (
+    element_text,
+    iter_epub_documents,
+    parse_document,
+    read_epub_content
+)
+from bilingual_reader.image_extractor import extract_images_from_epub
+from bilingual_reader.text_extractor import TextExtractor
+
+
+def _write_test_epub(path, reverse_manifest=False):
+    """Write a small ePub with a front page, two chapters and one figure.
+
+    With reverse_manifest, the manifest lists the documents in the opposite
+    order to the spine.
+    """
+    book = epub.EpubBook()
+    book.set_identifier('test-book')
+    book.set_title('Test Book')
+    book.set_language('en')
+
+    buffer = io.BytesIO()
+    Image.new('RGB', (120, 80), (200, 30, 30)).save(buffer, format='PNG')
+    image = epub.EpubItem(
+        uid='figure', file_name='images/figure.png',
+        media_type='image/png', content=buffer.getvalue()
+    )
+    book.add_item(image)
+
+    pages = [
+        ('front', 'front.xhtml', 'Title Page', '<p>Copyright notice.</p>'),
+        ('ch1', 'text/ch1.xhtml', 'Chapter 1',
+         '<h1>Chapter 1</h1><p>The first chapter.</p>'
+         '<figure><img src="../images/figure.png" alt="alt text"/>'
+         '<figcaption>A red box</figcaption></figure>'),
+        ('ch2', 'text/ch2.xhtml', 'Chapter 2', '<h1>Chapter 2</h1><p>The second chapter.</p>'),
+    ]
+    chapters = []
+    for uid, file_name, title, body in pages:
+        chapter = epub.EpubHtml(uid=uid, title=title, file_name=file_name, lang='en')
+        chapter.content = f'<html><body>{body}</body></html>'
+        chapters.append(chapter)
+
+    for chapter in (reversed(chapters) if reverse_manifest else chapters):
+        book.add_item(chapter)
+
+    book.toc = chapters
+    book.spine = chapters
+    book.add_item(epub.EpubNcx())
+    book.add_item(epub.EpubNav())
+    epub.write_epub(path, book)
+    return path
+
+
+class TestEpubReader(unittest.TestCase):
+    """Test cases for single-pass ePub reading."""
+
+    def setUp(self):
+        """Write a small ePub."""
+        with tempfile.NamedTemporaryFile(suffix='.epub', delete=False) as f:
+            self.epub_path = f.name
+        _write_test_epub(self.epub_path)
+
+    def tearDown(self):
+        """Remove the ePub."""
+        os.unlink(self.epub_path)
+
+    def test_read_epub_content(self):
+        """Test text and images come back from one pass."""
+        content = read_epub_content(self.epub_path)
+
+        self.assertIn("Copyright notice.", content.text)
+        self.assertIn("The second chapter.", content.text)
+        self.assertEqual(len(content.images), 1)
+        self.assertEqual(content.images[0].caption, "A red box")
+        self.assertEqual(content.images[0].index, 0)
+        self.assertIsNone(content.images[0].page)
+        self.assertGreater(content.images[0].position, 0.0)
+        self.assertLess(content.images[0].position, 1.0)
+
+    def test_matches_separate_extractors(self):
+        """Test the shared pass matches text-only and image-only extraction."""
+        content = read_epub_content(self.epub_path)
+
+        self.assertEqual(content.text, TextExtractor.extract_from_epub(self.epub_path))
+        images = extract_images_from_epub(self.epub_path)
+        self.assertEqual(
+            [(image.caption, image.position, image.image.size) for image in images],
+            [(image.caption, image.position, image.image.size) for image in content.images]
+        )
+
+    def test_text_only(self):
+        """Test images are skipped when not requested."""
+        content = read_epub_content(self.epub_path, extract_images=False)
+        self.assertEqual(content.images, [])
+        self.assertIn("The first chapter.", content.text)
+
+    def test_iter_documents(self):
+        """Test documents are yielded one at a time with their own images."""
+        documents = list(iter_epub_documents(self.epub_path))
+        self.assertTrue(any(images for _, images in documents))
+        self.assertTrue(all(isinstance(text, str) for text, _ in documents))
+
+
+    def test_spine_order(self):
+        """Test documents follow the spine even when the manifest does not."""
+        _write_test_epub(self.epub_path, reverse_manifest=True)
+        text = TextExtractor.extract_from_epub(self.epub_path)
+
+        self.assertLess(text.index("Copyright notice."), text.index("The first chapter."))
+        self.assertLess(text.index("The first chapter."), text.index("The second chapter."))
+
+    def test_parallel_matches_serial(self):
+        """Test worker processes produce the same text and images."""
+        with patch('bilingual_reader.epub_reader.MIN_DOCUMENTS_PER_WORKER', 1):
+            parallel = read_epub_content(self.epub_path, workers=2)
+        serial = read_epub_content(self.epub_path)
+
+        self.assertEqual(parallel.text, serial.text)
+        self.assertEqual(
+            [(image.caption, image.index) for image in parallel.images],
+            [(image.caption, image.index) for image in serial.images]
+        )
+
+    def test_matches_html_parser_text(self):
+        """Test lxml text matches BeautifulSoup's get_text() for every document."""
+        book = epub.read_epub(self.epub_path)
+        for item in book.get_items_of_type(ebooklib.ITEM_DOCUMENT):
+            text = parse_document(item.get_content()).text
+            expected = BeautifulSoup(item.get_content(), 'html.parser').get_text()
+            self.assertEqual(text.strip(), expected.strip())
+
+
+def _write_toc_epub(path, nav=True):
+    """Write an ePub whose chapter titles do not match any chapter pattern.
+
+    The table of contents has a nested part and a link into the middle of
+    a document. Without nav, it is only available from the NCX.
+    """
+    book = epub.EpubBook()
+    book.set_identifier('toc-book')
+    book.set_title('TOC Book')
+    book.set_language('en')
+
+    pages = [
+        ('front', 'front.xhtml', '<h1>Copyright</h1><p>All rights reserved.</p>'),
+        ('one', 'text/one.xhtml',
+         '<h1>The Beginning</h1><p>It starts here.</p><h2 id="later">A Later Scene</h2><p>It goes on.</p>'),
+        ('notes', 'text/notes.xhtml', '<h1>Notes</h1><p>A note.</p>'),
+    ]
+    documents = {}
+    for uid, file_name, body in pages:
+        document = epub.EpubHtml(uid=uid, title=uid, file_name=file_name, lang='en')
+        document.content = f'<html><body>{body}</body></html>'
+        book.add_item(document)
+        documents[uid] = document
+
+    book.toc = [
+        epub.Link('front.xhtml', 'Copyright', 'front'),
+        (epub.Section('Part One', href='text/one.xhtml'), [
+            epub.Link('text/one.xhtml', 'The Beginning', 'one'),
+            epub.Link('text/one.xhtml#later', 'A Later Scene', 'later'),
+        ]),
+        epub.Link('text/notes.xhtml', 'Notes', 'notes'),
+    ]
+    book.spine = [documents['front'], documents['one'], documents['notes']]
+    book.add_item(epub.EpubNcx())
+    if nav:
+        book.add_item(epub.EpubNav())
+    epub.write_epub(path, book)
+    return path
+
+
+class TestEpubToc(unittest.TestCase):
+    """Test cases for table of contents driven structure."""
+
+    def setUp(self):
+        """Write an ePub with a table of contents."""
+        with tempfile.NamedTemporaryFile(suffix='.epub', delete=False) as f:
+            self.epub_path = f.name
+        _write_toc_epub(self.epub_path)
+
+    def tearDown(self):
+        """Remove the ePub."""
+        os.unlink(self.epub_path)
+
+    def test_toc_positions(self):
+        """Test entries point at their documents and fragments in the text."""
+        content = read_epub_content(self.epub_path)
+        titles = [(entry.title, entry.level) for entry in content.toc]
+        self.assertEqual(titles, [
+            ('Copyright', 0), ('Part One', 0), ('The Beginning', 1), ('A Later Scene', 1), ('Notes', 0)
+        ])
+
+        positions = {entry.title: entry.position for entry in content.toc}
+        self.assertTrue(content.text[positions['The Beginning']:].lstrip().startswith('The Beginning'))
+        self.assertTrue(content.text[positions['A Later Scene']:].lstrip().startswith('A Later Scene'))
+        self.assertTrue(content.text[positions['Notes']:].lstrip().startswith('Notes'))
+
+    def test_structure_from_toc(self):
+        """Test the table of contents splits the book without chapter patterns."""
+        doc = TextExtractor.extract_with_structure(self.epub_path)
+
+        self.assertEqual(doc.front_matter, "Copyright\nAll rights reserved.")
+        self.assertTrue(doc.main_text.startswith("The Beginning"))
+        self.assertIn("It goes on.", doc.main_text)
+        self.assertEqual(doc.back_matter, "Notes\nA note.")
+
+    def test_structure_with_images_from_toc(self):
+        """Test extraction with images uses the same table of contents."""
+        doc = TextExtractor.extract_with_structure_and_images(self.epub_path)
+        self.assertTrue(doc.main_text.startswith("The Beginning"))
+        self.assertEqual(doc.back_matter, "Notes\nA note.")
+
+    def test_markers_override_toc(self):
+        """Test custom markers still take precedence over the table of contents."""
+        doc = TextExtractor.extract_with_structure(self.epub_path, start_marker="A Later Scene")
+        self.assertTrue(doc.main_text.startswith("A Later Scene"))
+        self.assertEqual(doc.back_matter, "Notes\nA note.")
+
+
+class TestParseDocument(unittest.TestCase):
+    """Test cases for lxml document parsing."""
+
+    def test_skips_scripts_and_comments(self):
+        """Test script, style and comment text is left out."""
+        document = parse_document(
+            b'<html><head><title>Title</title></head><body><p>a<!-- note -->b</p>'
+            b'<script>var x = 1;</script><style>p {}</style>c</body></html>'
+        )
+        self.assertEqual(document.text, 'abc')
+
+    def test_collapses_whitespace_between_tags(self):
+        """Test whitespace-only runs collapse like BeautifulSoup, except in <pre>."""
+        document = parse_document(b'<body><p>a</p>\n\t\t<p>b</p> <pre>  x  </pre></body>')
+        self.assertEqual(document.text, 'a\nb   x  ')
+
+    def test_image_captions(self):
+        """Test alt text is used unless the image has a figcaption."""
+        document = parse_document(
+            b'<body><img src="a.png" alt=" Alt "/>'
+            b'<figure><img src="b.png" alt="ignored"/><figcaption> <b>Fig</b> 2 </figcaption></figure>'
+            b'<img alt="no source"/></body>'
+        )
+        self.assertEqual(
+            [(ref.src, ref.caption) for ref in document.images],
+            [('a.png', 'Alt'), ('b.png', 'Fig 2')]
+        )
+
+    def test_empty_document(self):
+        """Test empty documents parse to no text."""
+        self.assertEqual(parse_document(b'').text, '')
+
+    def test_anchor_positions(self):
+        """Test requested element ids are located in the text."""
+        document = parse_document(
+            b'<body id="top"><h1>One</h1><p>Intro</p><h2 id="s2">Two</h2><a name="old">Three</a></body>',
+            anchors=['top', 's2', 'old', 'missing']
+        )
+        self.assertEqual(document.anchors, {'top': 0, 's2': 8, 'old': 11})
+        self.assertEqual(document.text[8:11], 'Two')
+
+    def test_element_text(self):
+        """Test element_text joins nested text and tails."""
+        element = html.fragment_fromstring('<div>a<span>b</span>c</div>')
+        self.assertEqual(element_text(element), 'abc')
+
+
+if __name__ == '__main__':
+    unittest.main()
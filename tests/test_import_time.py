@@ -0,0 +1,87 @@
+"""Import-time budget tests for the command-line entry point."""
+
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that are slow to import and only needed by some inputs or modes
+PDF_MODULES = {'fitz', 'pymupdf', 'PyPDF2'}
+EPUB_MODULES = {'lxml', 'ebooklib', 'bs4'}
+ALIGNMENT_MODULES = {'numpy', 'lingtrain_aligner', 'torch', 'transformers'}
+OUTPUT_MODULES = {'reportlab', 'PIL'}
+
+# Cumulative import time allowed for bilingual_reader.cli, in microseconds.
+# It imports in well under 0.1 s; the budget leaves room for slow machines
+# while still failing if a heavy dependency is imported at module level.
+CLI_IMPORT_BUDGET_US = 500_000
+
+_IMPORT_LINE = re.compile(r'^import time:\s+\d+\s+\|\s+(\d+)\s+\|\s+(.+?)\s*$')
+
+
+def import_times(code, cwd=REPO_ROOT):
+    """Run code with python -X importtime and return {module: cumulative microseconds}."""
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=cwd, env=env, capture_output=True, text=True, timeout=120
+    )
+    if result.returncode != 0:
+        raise AssertionError(f"Subprocess failed:\n{result.stdout}\n{result.stderr}")
+    times = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match:
+            times[match.group(2)] = int(match.group(1))
+    return times
+
+
+class TestImportTime(unittest.TestCase):
+    """Test cases for lazily imported dependencies."""
+
+    def assertNotImported(self, times, modules):
+        """Assert none of the modules (or their submodules) were imported."""
+        imported = sorted(name for name in times if name.split('.')[0] in modules)
+        self.assertEqual(imported, [], f"Unexpected imports: {', '.join(imported)}")
+
+    def test_help(self):
+        """Test --help imports no heavy dependency and stays within budget."""
+        times = import_times(
+            "from bilingual_reader.cli import main\n"
+            "main(['--help'], standalone_mode=False)"
+        )
+        self.assertNotImported(times, PDF_MODULES | EPUB_MODULES | ALIGNMENT_MODULES | OUTPUT_MODULES)
+        self.assertLess(times['bilingual_reader.cli'], CLI_IMPORT_BUDGET_US)
+
+    def test_aligner_import(self):
+        """Test importing the aligner does not import any sentence splitter or NumPy."""
+        times = import_times("import bilingual_reader.aligner")
+        self.assertNotImported(times, PDF_MODULES | EPUB_MODULES | ALIGNMENT_MODULES)
+
+    def test_paragraph_mode_with_text_files(self):
+        """Test a paragraph-mode run on text files only imports the PDF writer."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        with open(os.path.join(temp_dir, 'en.txt'), 'w', encoding='utf-8') as f:
+            f.write("The first paragraph.\n\nThe second paragraph.\n")
+        with open(os.path.join(temp_dir, 'zh.txt'), 'w', encoding='utf-8') as f:
+            f.write("第一段。\n\n第二段。\n")
+
+        times = import_times(
+            "from bilingual_reader.cli import main\n"
+            "main(['--input1', 'en.txt', '--input2', 'zh.txt', '--output', 'out.pdf',\n"
+            "      '--mode', 'paragraph'], standalone_mode=False)",
+            cwd=temp_dir
+        )
+        self.assertTrue(os.path.exists(os.path.join(temp_dir, 'out.pdf')))
+        self.assertNotImported(times, PDF_MODULES | EPUB_MODULES | ALIGNMENT_MODULES)
+        self.assertIn('reportlab', times)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Tests for length_aligner module."""
+
+import math
+import random
+import unittest
+
+import numpy as np
+
+from bilingual_reader.length_aligner import (
+    GALE_CHURCH_PRIORS,
+    Bead,
+    align_lengths,
+    banded_align,
+    gale_church_cost,
+    neg_log_erfc
+)
+
+
+def full_table_cost(lengths1, lengths2):
+    """Return the cheapest alignment cost from an unbanded, unvectorized DP."""
+    cost = gale_church_cost(lengths1, lengths2)
+    n, m = len(lengths1), len(lengths2)
+    table = [[math.inf] * (m + 1) for _ in range(n + 1)]
+    table[0][0] = 0.0
+    for i in range(n + 1):
+        for j in range(m + 1):
+            for di, dj in GALE_CHURCH_PRIORS:
+                if i >= di and j >= dj and (di or dj):
+                    step = float(cost((di, dj), np.array([i]), np.array([j]))[0])
+                    table[i][j] = min(table[i][j], table[i - di][j - dj] + step)
+    return table[n][m]
+
+
+def beads_cost(lengths1, lengths2, beads):
+    """Return the total cost of a sequence of beads."""
+    cost = gale_church_cost(lengths1, lengths2)
+    return sum(
+        float(cost((bead.end1 - bead.start1, bead.end2 - bead.start2), np.array([bead.end1]), np.array([bead.end2]))[0])
+        for bead in beads
+    )
+
+
+class TestNegLogErfc(unittest.TestCase):
+    """Test cases for the erfc approximation."""
+
+    def test_matches_math_erfc(self):
+        """Test the approximation against math.erfc where it does not underflow."""
+        values = np.linspace(0.0, 8.0, 161)
+        expected = [-math.log(math.erfc(value)) for value in values]
+        np.testing.assert_allclose(neg_log_erfc(values), expected, rtol=1e-3, atol=1e-6)
+
+    def test_large_values_stay_finite(self):
+        """Test values far in the tail do not underflow to infinity."""
+        self.assertTrue(np.all(np.isfinite(neg_log_erfc(np.array([50.0, 1e3])))))
+
+
+class TestBandedAlign(unittest.TestCase):
+    """Test cases for banded_align and align_lengths."""
+
+    def test_matches_full_table(self):
+        """Test the banded, vectorized DP finds the optimum of the full table."""
+        rng = random.Random(1)
+        for _ in range(60):
+            lengths1 = [rng.randint(1, 200) for _ in range(rng.randint(1, 20))]
+            lengths2 = [rng.randint(1, 200) for _ in range(rng.randint(1, 20))]
+            beads = align_lengths(lengths1, lengths2)
+
+            self.assertEqual((beads[0].start1, beads[0].start2), (0, 0))
+            self.assertEqual((beads[-1].end1, beads[-1].end2), (len(lengths1), len(lengths2)))
+            self.assertAlmostEqual(
+                beads_cost(lengths1, lengths2, beads), full_table_cost(lengths1, lengths2), places=6
+            )
+
+    def test_missing_segment(self):
+        """Test a segment missing from text 2 joins a neighbour and later pairs stay in step."""
+        lengths1 = [120, 90, 150, 60, 110, 140, 100, 130]
+        lengths2 = [length // 2 for length in lengths1]
+        del lengths2[3]
+        beads = align_lengths(lengths1, lengths2)
+
+        self.assertIn(Bead(2, 4, 2, 3), beads)
+        self.assertEqual(beads[-4:], [Bead(i, i + 1, i - 1, i) for i in range(4, 8)])
+
+    def test_merged_segment(self):
+        """Test two segments translated as one become a 2:1 bead."""
+        lengths1 = [50, 80, 60, 200, 70, 90]
+        lengths2 = [25, 40, 30 + 100, 35, 45]
+        beads = align_lengths(lengths1, lengths2)
+        self.assertIn(Bead(2, 4, 2, 3), beads)
+
+    def test_long_texts_stay_on_the_diagonal(self):
+        """Test a long alignment with scattered omissions recovers the true pairs."""
+        rng = np.random.default_rng(0)
+        lengths1 = rng.integers(20, 300, 5000)
+        noisy = np.maximum(1, (lengths1 * 0.45 * rng.normal(1, 0.05, len(lengths1))).astype(int))
+        kept = np.ones(len(lengths1), dtype=bool)
+        kept[::97] = False
+        beads = align_lengths(lengths1, noisy[kept])
+
+        expected = set()
+        j = 0
+        for i, keep in enumerate(kept):
+            expected.add(Bead(i, i + 1, j, j + int(keep)))
+            j += int(keep)
+        found = len(expected.intersection(beads))
+        self.assertGreater(found / len(lengths1), 0.95)
+
+    def test_empty_sides(self):
+        """Test texts with no segments on one or both sides."""
+        self.assertEqual(align_lengths([], []), [])
+        self.assertEqual(align_lengths([10, 20], []), [Bead(0, 2, 0, 0)])
+        self.assertEqual(align_lengths([], [5]), [Bead(0, 0, 0, 1)])
+
+    def test_rejects_moves_without_text1_segments(self):
+        """Test only the 0:1 move may take no segment from text 1."""
+        cost = gale_church_cost([10], [10])
+        with self.assertRaises(ValueError):
+            banded_align(1, 1, cost, moves=[(1, 1), (0, 2)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,7 +3,10 @@
 import os
 import tempfile
 import unittest
-from bilingual_reader.pdf_generator import PDFGenerator
+from unittest import mock
+from bilingual_reader.aligner import AlignedDocument
+from bilingual_reader.pdf_generator import PDFGenerator, StreamingStory
+from bilingual_reader.segment_store import SegmentStore
 
 
 class TestPDFGenerator(unittest.TestCase):
@@ -79,5 +82,52 @@ class TestPDFGenerator(unittest.TestCase):
         self.assertGreater(os.path.getsize(self.output_path), 0)
 
 
+    def test_generate_pdf_from_iterator(self):
+        """Test pairs are consumed from an iterator while the PDF is laid out."""
+        consumed = []
+        buffered = []
+
+        def pairs():
+            for number in range(3000):
+                consumed.append(number)
+                yield (f"Sentence number {number}.", f"第{number}句。")
+
+        handle_flowable = self.generator.doc.handle_flowable
+
+        def record(flowables):
+            # Flowables created but not yet laid out
+            buffered.append(list.__len__(flowables))
+            return handle_flowable(flowables)
+
+        with mock.patch.object(self.generator.doc, 'handle_flowable', side_effect=record):
+            self.generator.generate_pdf(pairs())
+
+        self.assertEqual(len(consumed), 3000)
+        self.assertLessEqual(max(buffered), 2 * StreamingStory.LOOKAHEAD)
+        self.assertGreater(os.path.getsize(self.output_path), 0)
+
+    def test_aligned_document_with_iterator(self):
+        """Test an AlignedDocument whose main text is an iterator, empty or not."""
+        for main_text in ([("One.", "一。"), ("Two.", "二。")], []):
+            aligned_doc = AlignedDocument(
+                front_matter=[("Preface", "前言")], main_text=iter(main_text), back_matter=[("Notes", "注释")]
+            )
+            self.generator.generate_pdf_from_aligned_document(aligned_doc)
+            self.assertGreater(os.path.getsize(self.output_path), 0)
+
+    def test_aligned_document_from_store(self):
+        """Test a main text kept in a spilled SegmentStore, whole and as a sub-range."""
+        with SegmentStore(max_memory_chars=100, spill_dir=self.temp_dir) as store:
+            store.extend((f"Sentence {index}.", f"第{index}句。") for index in range(50))
+            self.assertTrue(store.spilled)
+            aligned_doc = AlignedDocument(front_matter=[], main_text=store, back_matter=[])
+            self.generator.generate_pdf_from_aligned_document(aligned_doc)
+            self.assertGreater(os.path.getsize(self.output_path), 0)
+            self.generator.generate_pdf_from_aligned_document(
+                aligned_doc._replace(main_text=store.iter_range(10, 20))
+            )
+            self.assertGreater(os.path.getsize(self.output_path), 0)
+
+
 if __name__ == '__main__':
     unittest.main()
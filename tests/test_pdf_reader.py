@@ -0,0 +1,260 @@
+"""Tests for pdf_reader module."""
+
+import os
+import tempfile
+import unittest
+import fitz
+from PIL import Image
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfgen import canvas
+from bilingual_reader.image_extractor import extract_images_from_pdf
+from bilingual_reader.pdf_reader import (
+    PDF_BACKENDS,
+    available_pdf_backends,
+    extract_pdf_page_range,
+    OutlineLink,
+    extract_pdf_pages,
+    get_pdf_backend,
+    join_pages,
+    outline_toc,
+    pdf_page_count,
+    read_pdf_content,
+    read_pdf_outline,
+    register_pdf_backend,
+    split_page_range
+)
+from bilingual_reader.text_extractor import TextExtractor
+from tests.test_text_extractor import _write_test_pdf
+
+
+def _write_test_pdf_with_images(path):
+    """Write a three-page PDF with an image on the first and last pages."""
+    image = ImageReader(Image.new('RGB', (100, 100), (20, 120, 220)))
+    pdf = canvas.Canvas(path)
+    for page_num in range(3):
+        pdf.drawString(72, 720, f"Chapter {page_num + 1}")
+        if page_num != 1:
+            pdf.drawImage(image, 72, 400, width=100, height=100)
+        pdf.showPage()
+    pdf.save()
+
+
+def _write_outline_pdf(path):
+    """Write a PDF with bookmarks, a blank page and a chapter starting mid-page."""
+    pages = [
+        "Copyright 2024 by the author",
+        "The Beginning\nIt was a dark night.",
+        "",
+        "More story.\nA Later Scene\nThe sun rose.",
+        "Notes\n1. A note.",
+    ]
+    doc = fitz.open()
+    for page_text in pages:
+        page = doc.new_page()
+        if page_text:
+            page.insert_text((72, 72), page_text)
+    doc.set_toc([
+        [1, "Copyright", 1],
+        [1, "Part One", 2],
+        [2, "The Beginning", 2],
+        [2, "A Later Scene", 4],
+        [1, "Notes", 5],
+    ])
+    doc.save(path)
+    doc.close()
+
+
+class TestPDFBackendRegistry(unittest.TestCase):
+    """Test cases for the PDF backend registry."""
+
+    def tearDown(self):
+        """Remove backends registered by tests."""
+        PDF_BACKENDS.pop("test", None)
+
+    def test_builtin_backends_registered(self):
+        """Test fitz and pypdf2 are registered."""
+        self.assertIn("fitz", PDF_BACKENDS)
+        self.assertIn("pypdf2", PDF_BACKENDS)
+
+    def test_auto_picks_fastest_available(self):
+        """Test auto selection prefers the lowest-ranked available backend."""
+        backend = get_pdf_backend("auto")
+        self.assertEqual(backend.name, available_pdf_backends()[0])
+        self.assertEqual(backend.name, "fitz")
+
+    def test_unknown_backend(self):
+        """Test an unknown backend name raises ValueError."""
+        with self.assertRaises(ValueError):
+            get_pdf_backend("no-such-backend")
+
+    def test_unavailable_backend(self):
+        """Test selecting an uninstalled backend raises ImportError."""
+        @register_pdf_backend("test", page_count=lambda path: 0, available=False, rank=0)
+        def iter_pages(file_path, start, end):
+            return iter([])
+
+        with self.assertRaises(ImportError):
+            get_pdf_backend("test")
+        self.assertNotEqual(get_pdf_backend("auto").name, "test")
+
+    def test_custom_backend_used_by_auto(self):
+        """Test a registered backend with a better rank is picked by auto."""
+        @register_pdf_backend("test", page_count=lambda path: 2, rank=0)
+        def iter_pages(file_path, start, end):
+            for i in range(start, end):
+                yield f"page {i}"
+
+        self.assertEqual(get_pdf_backend("auto").name, "test")
+        self.assertEqual(extract_pdf_page_range("unused.pdf", 0, 2), ["page 0", "page 1"])
+
+    def test_split_page_range(self):
+        """Test page ranges are contiguous and cover every page once."""
+        self.assertEqual(split_page_range(10, 3), [(0, 4), (4, 7), (7, 10)])
+        self.assertEqual(split_page_range(2, 8), [(0, 1), (1, 2)])
+
+
+class TestPDFBackends(unittest.TestCase):
+    """Test cases for the built-in backends."""
+
+    def setUp(self):
+        """Write a small PDF."""
+        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as f:
+            self.pdf_path = f.name
+        _write_test_pdf(self.pdf_path, 5)
+
+    def tearDown(self):
+        """Remove the PDF."""
+        os.unlink(self.pdf_path)
+
+    def test_page_count(self):
+        """Test both backends agree on the page count."""
+        self.assertEqual(pdf_page_count(self.pdf_path, "fitz"), 5)
+        self.assertEqual(pdf_page_count(self.pdf_path, "pypdf2"), 5)
+
+    def test_page_range(self):
+        """Test extracting a sub-range returns only those pages, in order."""
+        for backend in ("fitz", "pypdf2"):
+            pages = extract_pdf_page_range(self.pdf_path, 1, 3, backend)
+            self.assertEqual(len(pages), 2)
+            self.assertIn("Page 2 of", pages[0])
+            self.assertIn("Page 3 of", pages[1])
+
+    def test_pages_keep_blank_pages(self):
+        """Test extract_pdf_pages keeps a slot for every page."""
+        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as f:
+            outline_path = f.name
+        try:
+            _write_outline_pdf(outline_path)
+            for backend in ("fitz", "pypdf2"):
+                pages = extract_pdf_pages(outline_path, 0, 5, backend)
+                self.assertEqual(len(pages), 5)
+                self.assertFalse(pages[2].strip())
+        finally:
+            os.unlink(outline_path)
+
+
+class TestReadPdfContent(unittest.TestCase):
+    """Test cases for single-pass PDF text and image extraction."""
+
+    def setUp(self):
+        """Write a PDF with images."""
+        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as f:
+            self.pdf_path = f.name
+        _write_test_pdf_with_images(self.pdf_path)
+
+    def tearDown(self):
+        """Remove the PDF."""
+        os.unlink(self.pdf_path)
+
+    def test_matches_separate_extractors(self):
+        """Test one pass gives the fitz text and the same images as two passes."""
+        content = read_pdf_content(self.pdf_path)
+
+        self.assertEqual(content.text, TextExtractor.extract_from_pdf(self.pdf_path, backend="fitz"))
+        images = extract_images_from_pdf(self.pdf_path)
+        self.assertEqual(
+            [(image.page, image.position, image.index, image.image.size) for image in images],
+            [(image.page, image.position, image.index, image.image.size) for image in content.images]
+        )
+        self.assertEqual([image.page for image in content.images], [1, 3])
+
+    def test_structure_and_images(self):
+        """Test structure-aware extraction keeps the DocumentWithImages shape."""
+        doc = TextExtractor.extract_with_structure_and_images(self.pdf_path, pdf_backend="fitz")
+
+        self.assertIn("Chapter 1", doc.main_text)
+        self.assertEqual(len(doc.images), 2)
+
+    def test_page_starts(self):
+        """Test page offsets point at the start of each page's text."""
+        content = read_pdf_content(self.pdf_path)
+
+        self.assertEqual(len(content.page_starts), 3)
+        for page_num, start in enumerate(content.page_starts):
+            self.assertTrue(content.text[start:].startswith(f"Chapter {page_num + 1}"))
+
+
+class TestPdfOutline(unittest.TestCase):
+    """Test cases for outline (bookmark) based structure."""
+
+    def setUp(self):
+        """Write a PDF with an outline."""
+        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as f:
+            self.pdf_path = f.name
+        _write_outline_pdf(self.pdf_path)
+
+    def tearDown(self):
+        """Remove the PDF."""
+        os.unlink(self.pdf_path)
+
+    def test_join_pages(self):
+        """Test blank pages are skipped and point at the next page's text."""
+        text, page_starts = join_pages(["ab", "", "cd", ""])
+
+        self.assertEqual(text, "ab\ncd")
+        self.assertEqual(page_starts, [0, 3, 3, 5])
+
+    def test_read_outline(self):
+        """Test bookmarks are read with 0-indexed levels and pages."""
+        outline = read_pdf_outline(self.pdf_path)
+
+        self.assertEqual(outline[0], OutlineLink(level=0, title="Copyright", page=0))
+        self.assertEqual(outline[2], OutlineLink(level=1, title="The Beginning", page=1))
+        self.assertEqual([link.page for link in outline], [0, 1, 1, 3, 4])
+
+    def test_outline_toc_positions(self):
+        """Test entries map to their title on the target page."""
+        text, toc = TextExtractor.extract_pdf_with_outline(self.pdf_path)
+
+        self.assertEqual(text, TextExtractor.extract_from_pdf(self.pdf_path))
+        by_title = {entry.title: entry for entry in toc}
+        self.assertTrue(text[by_title["The Beginning"].position:].startswith("The Beginning"))
+        # The chapter starts mid-page, after the previous chapter's last line
+        self.assertTrue(text[by_title["A Later Scene"].position:].startswith("A Later Scene"))
+        self.assertTrue(text[by_title["Notes"].position:].startswith("Notes"))
+        # A title that is not on the page falls back to the start of the page
+        self.assertEqual(by_title["Part One"].position, by_title["The Beginning"].position)
+
+    def test_outline_toc_skips_missing_pages(self):
+        """Test entries pointing past the last page are dropped."""
+        toc = outline_toc([OutlineLink(level=0, title="Gone", page=9)], "text", [0])
+        self.assertEqual(toc, [])
+
+    def test_structure_from_outline(self):
+        """Test the outline locates the main text and back matter."""
+        for extract in (
+            lambda: TextExtractor.extract_with_structure(self.pdf_path),
+            lambda: TextExtractor.extract_with_structure_and_images(self.pdf_path, pdf_backend="fitz"),
+            lambda: TextExtractor.extract_with_structure_and_images(
+                self.pdf_path, extract_images_flag=False, pdf_backend="pypdf2"
+            ),
+        ):
+            doc = extract()
+            self.assertIn("Copyright", doc.front_matter)
+            self.assertTrue(doc.main_text.lstrip().startswith("The Beginning"))
+            self.assertIn("The sun rose.", doc.main_text)
+            self.assertTrue(doc.back_matter.lstrip().startswith("Notes"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""Tests for segment_store module."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from bilingual_reader.aligner import BilingualAligner
+from bilingual_reader.document_structure import DocumentSection
+from bilingual_reader.segment_store import SegmentStore
+
+
+def make_pairs(count):
+    """Return count distinct aligned pairs."""
+    return [(f"Sentence {index}.", f"第{index}句。") for index in range(count)]
+
+
+class TestSegmentStore(unittest.TestCase):
+    """Test cases for SegmentStore."""
+
+    def setUp(self):
+        """Create a directory for spill files."""
+        self.spill_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Remove the spill directory."""
+        shutil.rmtree(self.spill_dir)
+
+    def test_small_store_stays_in_memory(self):
+        """Test pairs below the threshold are never written to disk."""
+        pairs = make_pairs(10)
+        with SegmentStore(spill_dir=self.spill_dir) as store:
+            store.extend(pairs)
+            self.assertFalse(store.spilled)
+            self.assertEqual(list(store), pairs)
+        self.assertEqual(os.listdir(self.spill_dir), [])
+
+    def test_spills_past_threshold(self):
+        """Test the pairs move to a spill file and read back the same, in order and by index."""
+        pairs = make_pairs(3000)
+        store = SegmentStore(max_memory_chars=500, spill_dir=self.spill_dir)
+        store.extend(iter(pairs))
+        self.assertTrue(store.spilled)
+        self.assertTrue(os.path.exists(store.spill_path))
+        self.assertLess(store._buffer_chars, 500)
+
+        self.assertEqual(len(store), 3000)
+        self.assertEqual(list(store), pairs)
+        self.assertEqual(store[0], pairs[0])
+        self.assertEqual(store[-1], pairs[-1])
+        self.assertEqual(store[1234], pairs[1234])
+        self.assertEqual(store[995:2010], pairs[995:2010])
+        self.assertEqual(store[::700], pairs[::700])
+        self.assertEqual(list(store.iter_range(2990)), pairs[2990:])
+        with self.assertRaises(IndexError):
+            store[3000]
+
+        store.close()
+        self.assertEqual(os.listdir(self.spill_dir), [])
+        self.assertEqual(len(store), 0)
+
+    def test_append_while_iterating(self):
+        """Test iteration stops at the end the store had when it started, across flushes."""
+        store = SegmentStore(max_memory_chars=50, spill_dir=self.spill_dir)
+        store.extend(make_pairs(5))
+        seen = []
+        for pair in store:
+            seen.append(pair)
+            store.extend(make_pairs(3))
+        self.assertEqual(seen, make_pairs(5))
+        self.assertEqual(len(store), 20)
+        store.close()
+
+    def test_align_documents_into_store(self):
+        """Test align_documents writes the main text into a store and returns it."""
+        doc1 = DocumentSection(main_text="\n\n".join(text for text, _ in make_pairs(200)))
+        doc2 = DocumentSection(main_text="\n\n".join(text for _, text in make_pairs(200)))
+        aligner = BilingualAligner()
+        with SegmentStore(max_memory_chars=1000, spill_dir=self.spill_dir) as store:
+            aligned_doc = aligner.align_documents(doc1, doc2, alignment_mode="paragraph", store=store)
+            self.assertIs(aligned_doc.main_text, store)
+            self.assertTrue(store.spilled)
+            self.assertEqual(list(store), make_pairs(200))
+            with self.assertRaises(ValueError):
+                aligner.align_documents(doc1, doc2, stream=True, store=store)
+
+
+if __name__ == '__main__':
+    unittest.main()
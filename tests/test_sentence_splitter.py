@@ -0,0 +1,101 @@
+"""Tests for sentence_splitter module."""
+
+import unittest
+from unittest import mock
+from bilingual_reader import sentence_splitter
+from bilingual_reader.aligner import BilingualAligner
+from bilingual_reader.sentence_splitter import get_splitter, sentence_spans, split_sentences
+
+
+class TestEnglishSplitting(unittest.TestCase):
+    """Test cases for the English rules."""
+
+    def test_terminators_and_quotes(self):
+        """Test sentences end at . ! ? and keep their closing quotes."""
+        text = 'Then he left! Did he? "Yes," she said. "He did." It rained.'
+        self.assertEqual(
+            split_sentences(text, "en"),
+            ["Then he left!", "Did he?", '"Yes," she said.', '"He did."', "It rained."]
+        )
+
+    def test_abbreviations_initials_and_decimals(self):
+        """Test abbreviations, initials and decimals do not end a sentence."""
+        text = "Mr. Smith paid $3.50 on Jan. 5 for it. It was J. K. Rowling. See Fig. 3 for details."
+        self.assertEqual(
+            split_sentences(text, "en"),
+            ["Mr. Smith paid $3.50 on Jan. 5 for it.", "It was J. K. Rowling.", "See Fig. 3 for details."]
+        )
+
+    def test_ellipses(self):
+        """Test an ellipsis ends a sentence only before an uppercase letter."""
+        text = "Wait... what? He paused… Then he spoke."
+        self.assertEqual(split_sentences(text, "en"), ["Wait... what?", "He paused…", "Then he spoke."])
+
+    def test_lowercase_continuation(self):
+        """Test a period followed by a lowercase word does not end a sentence."""
+        self.assertEqual(split_sentences("Use the .txt format. ok then.", "en"), ["Use the .txt format. ok then."])
+
+    def test_line_breaks(self):
+        """Test hard-wrapped lines are joined and blank lines end a sentence."""
+        text = "A heading\n\nThe first line\nwraps here. Next\n  one.\n\n\nLast"
+        self.assertEqual(
+            split_sentences(text, "en"),
+            ["A heading", "The first line wraps here.", "Next one.", "Last"]
+        )
+
+    def test_empty(self):
+        """Test empty and whitespace-only texts."""
+        self.assertEqual(split_sentences("", "en"), [])
+        self.assertEqual(split_sentences(" \n\n ", "en"), [])
+
+
+class TestChineseSplitting(unittest.TestCase):
+    """Test cases for the Chinese rules."""
+
+    def test_terminators_and_quotes(self):
+        """Test sentences end at 。！？ without spaces and keep closing quotes."""
+        text = "他说：“你好。”然后走了！真的吗？是的。"
+        self.assertEqual(split_sentences(text, "zh"), ["他说：“你好。”", "然后走了！", "真的吗？", "是的。"])
+
+    def test_ellipses_and_decimals(self):
+        """Test ellipses end a sentence only at a quote, and decimals are kept."""
+        text = "他犹豫了……然后说……“好吧……”价格是3.5元。"
+        self.assertEqual(split_sentences(text, "zh"), ["他犹豫了……然后说……", "“好吧……”", "价格是3.5元。"])
+
+    def test_line_breaks_are_removed(self):
+        """Test hard-wrapped Chinese lines are joined without a space."""
+        self.assertEqual(split_sentences("第一行\n第二行。\n\n第三段。", "zh"), ["第一行第二行。", "第三段。"])
+
+    def test_spans(self):
+        """Test sentence spans cover the stripped sentences in the source text."""
+        text = " 第一行\n第二行。 \n\n第三段。"
+        self.assertEqual([text[start:end] for start, end in sentence_spans(text, "zh")], ["第一行\n第二行。", "第三段。"])
+
+
+class TestGetSplitter(unittest.TestCase):
+    """Test cases for choosing a splitter."""
+
+    def test_auto_without_lingtrain(self):
+        """Test auto falls back to the built-in splitter."""
+        with mock.patch.object(sentence_splitter, 'HAS_LINGTRAIN', False):
+            self.assertEqual(get_splitter("auto"), ("builtin", split_sentences))
+            with self.assertRaises(ImportError):
+                get_splitter("lingtrain")
+
+    def test_unknown_splitter(self):
+        """Test unknown names are rejected, also by the aligner."""
+        with self.assertRaises(ValueError):
+            get_splitter("nltk")
+        with self.assertRaises(ValueError):
+            BilingualAligner(splitter="nltk")
+
+    def test_aligner_uses_builtin_splitter(self):
+        """Test sentence mode works with the built-in splitter."""
+        aligned = BilingualAligner(splitter="builtin").align_texts(
+            "Dr. Li arrived. She sat down.", "李医生到了。她坐了下来。"
+        )
+        self.assertEqual(aligned, [("Dr. Li arrived.", "李医生到了。"), ("She sat down.", "她坐了下来。")])
+
+
+if __name__ == '__main__':
+    unittest.main()
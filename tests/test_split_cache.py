@@ -0,0 +1,125 @@
+"""Tests for split_cache module."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from bilingual_reader.aligner import BilingualAligner
+from bilingual_reader.split_cache import SplitCache, split_paragraphs
+
+
+class CountingSplitter:
+    """Sentence splitter that records the paragraphs it is asked to split."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, paragraph, lang):
+        self.calls.append(paragraph)
+        return [sentence.strip() + '.' for sentence in paragraph.split('.') if sentence.strip()]
+
+
+class TestSplitCache(unittest.TestCase):
+    """Test cases for SplitCache."""
+
+    def setUp(self):
+        """Create a temporary directory and a three-paragraph text."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.store_path = os.path.join(self.temp_dir, 'splits.sqlite')
+        self.text = "One. Two.\n\nThree.\n  \nFour. Five. Six."
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_split_paragraphs(self):
+        """Test texts are cut at blank lines, including ones with spaces."""
+        self.assertEqual(split_paragraphs(self.text), ["One. Two.", "Three.", "Four. Five. Six."])
+        self.assertEqual(split_paragraphs("\n\n"), [])
+
+    def test_only_new_paragraphs_are_split(self):
+        """Test a second text only sends its changed paragraph to the splitter."""
+        splitter = CountingSplitter()
+        cache = SplitCache()
+
+        sentences = cache.split(self.text, "en", splitter)
+        self.assertEqual(sentences, ["One.", "Two.", "Three.", "Four.", "Five.", "Six."])
+        self.assertEqual(len(splitter.calls), 3)
+
+        edited = self.text.replace("Three.", "Three, edited.")
+        sentences = cache.split(edited, "en", splitter)
+        self.assertEqual(sentences[2], "Three, edited.")
+        self.assertEqual(splitter.calls[3:], ["Three, edited."])
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+    def test_key_includes_language_and_splitter(self):
+        """Test results are not shared across languages or splitters."""
+        splitter = CountingSplitter()
+        cache = SplitCache()
+        cache.split(self.text, "en", splitter)
+        cache.split(self.text, "fr", splitter)
+        cache.split(self.text, "en", splitter, splitter_name="other")
+        self.assertEqual(len(splitter.calls), 9)
+
+    def test_memory_is_bounded(self):
+        """Test the in-memory LRU evicts the least recently used paragraphs."""
+        splitter = CountingSplitter()
+        cache = SplitCache(max_entries=2)
+        cache.split(self.text, "en", splitter)
+        self.assertEqual(len(cache), 2)
+
+        cache.split("Four. Five. Six.", "en", splitter)
+        self.assertEqual(len(splitter.calls), 3)
+        cache.split("One. Two.", "en", splitter)
+        self.assertEqual(len(splitter.calls), 4)
+
+    def test_store_survives_reopening(self):
+        """Test splits written to the store are reused by a new cache."""
+        splitter = CountingSplitter()
+        with SplitCache(self.store_path) as cache:
+            expected = cache.split(self.text, "en", splitter)
+
+        with SplitCache(self.store_path) as cache:
+            self.assertEqual(cache.split(self.text, "en", splitter), expected)
+            self.assertEqual(cache.hits, 3)
+        self.assertEqual(len(splitter.calls), 3)
+
+    def test_store_is_bounded(self):
+        """Test the store evicts its least recently used paragraphs."""
+        splitter = CountingSplitter()
+        with SplitCache(self.store_path, max_entries=0, max_stored=2) as cache:
+            cache.split(self.text, "en", splitter)
+            cache.split("Three.\n\nFour. Five. Six.", "en", splitter)
+            self.assertEqual(len(splitter.calls), 3)
+            cache.split("One. Two.", "en", splitter)
+            self.assertEqual(len(splitter.calls), 4)
+
+    def test_clear(self):
+        """Test clear empties memory and the store."""
+        splitter = CountingSplitter()
+        with SplitCache(self.store_path) as cache:
+            cache.split(self.text, "en", splitter)
+            cache.clear()
+            cache.split(self.text, "en", splitter)
+        self.assertEqual(len(splitter.calls), 6)
+
+
+class TestAlignerSplitCache(unittest.TestCase):
+    """Test cases for sentence alignment through a split cache."""
+
+    def test_sentence_mode_uses_the_cache(self):
+        """Test realigning the same texts does not split any paragraph again."""
+        cache = SplitCache()
+        aligner = BilingualAligner(lang2="fr", split_cache=cache, splitter="builtin")
+
+        first = aligner.align_texts("One. Two.\n\nThree.", "Un. Deux.\n\nTrois.")
+        self.assertEqual(cache.misses, 4)
+        second = aligner.align_texts("One. Two.\n\nThree.", "Un. Deux.\n\nTrois.")
+
+        self.assertEqual(first, second)
+        self.assertEqual(first[0], ("One.", "Un."))
+        self.assertEqual((cache.hits, cache.misses), (4, 4))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""Tests for text_edits module."""
+
+import unittest
+
+from bilingual_reader.text_edits import TextEdit, apply_edits, diff_texts, edited_range
+
+
+class TestTextEdits(unittest.TestCase):
+    """Test cases for applying and finding text edits."""
+
+    def test_apply_edits(self):
+        """Test edits replace their spans of the old text, in order."""
+        text = "One. Two. Three."
+        edits = [TextEdit(0, 3, "Uno"), TextEdit(5, 8, "Dos"), TextEdit(16, 16, " Four.")]
+        self.assertEqual(apply_edits(text, edits), "Uno. Dos. Three. Four.")
+        self.assertEqual(edited_range(edits), (0, 16, 6))
+        self.assertIs(apply_edits(text, []), text)
+
+    def test_invalid_edits(self):
+        """Test overlapping, unordered and out-of-range edits are rejected."""
+        for edits in (
+            [TextEdit(0, 5, ""), TextEdit(3, 6, "")],
+            [TextEdit(5, 6, ""), TextEdit(0, 1, "")],
+            [TextEdit(10, 20, "")],
+            [TextEdit(4, 2, "")],
+        ):
+            with self.subTest(edits=edits):
+                with self.assertRaises(ValueError):
+                    apply_edits("One. Two.", edits)
+
+    def test_diff_texts(self):
+        """Test the edit between two versions turns the old one into the new one."""
+        cases = [
+            ("The quick fox.", "The quick brown fox."),
+            ("第一段。\n\n第二段。", "第一段。\n\n新的段落。\n\n第二段。"),
+            ("aaaa", "aa"),
+            ("abc", "xyz"),
+            ("", "new"),
+        ]
+        for old, new in cases:
+            with self.subTest(old=old, new=new):
+                edits = diff_texts(old, new)
+                self.assertEqual(len(edits), 1)
+                self.assertEqual(apply_edits(old, edits), new)
+        self.assertEqual(diff_texts("The quick fox.", "The quick brown fox."), [TextEdit(10, 10, "brown ")])
+        self.assertEqual(diff_texts("same", "same"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
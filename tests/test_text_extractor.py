@@ -3,7 +3,19 @@
 import os
 import tempfile
 import unittest
-from bilingual_reader.text_extractor import TextExtractor
+from reportlab.pdfgen import canvas
+from bilingual_reader.document_structure import DocumentSection, split_document
+from bilingual_reader.text_extractor import DocumentWithImages, TextExtractor
+from bilingual_reader.txt_reader import iter_txt_blocks
+
+
+def _write_test_pdf(path, num_pages):
+    """Write a simple PDF with one line of text per page."""
+    pdf = canvas.Canvas(path)
+    for page_num in range(num_pages):
+        pdf.drawString(72, 720, f"Page {page_num + 1} of the test document.")
+        pdf.showPage()
+    pdf.save()
 
 
 class TestTextExtractor(unittest.TestCase):
@@ -37,6 +49,52 @@ class TestTextExtractor(unittest.TestCase):
         finally:
             os.unlink(temp_file)
 
+    def test_iter_pages_txt(self):
+        """Test streamed text blocks join back to the whole file."""
+        for text in (self.test_text, "no trailing newline\nsecond", "a\n\nb\n\n", ""):
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
+                f.write(text)
+                temp_file = f.name
+
+            try:
+                self.assertEqual('\n'.join(TextExtractor.iter_pages(temp_file)), text)
+                blocks = list(iter_txt_blocks(temp_file, chunk_size=3))
+                self.assertEqual('\n'.join(blocks), text)
+            finally:
+                os.unlink(temp_file)
+
+    def test_iter_chapters_txt(self):
+        """Test chapters are streamed from a text file."""
+        text = "Copyright\n\nChapter 1\nOne.\n\nChapter 2\nTwo.\n"
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
+            f.write(text)
+            temp_file = f.name
+
+        try:
+            titles = [title for title, _ in TextExtractor.iter_chapters(temp_file)]
+            self.assertEqual(titles, ["", "Chapter 1", "Chapter 2"])
+        finally:
+            os.unlink(temp_file)
+
+    def test_structure_txt_matches_split_document(self):
+        """Test markers found while decoding a text file split it as split_document does."""
+        text = "Title\nPreface\n\nChapter 1\nOne.\n\nChapter 2\nTwo.\n\nAppendix\nNotes.\n"
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
+            f.write(text)
+            temp_file = f.name
+
+        try:
+            for markers in ({}, {"start_marker": "Chapter 2"}, {"end_marker": "Chapter 2"}):
+                with self.subTest(markers=markers):
+                    expected = split_document(text, **markers)
+                    self.assertEqual(TextExtractor.extract_with_structure(temp_file, **markers), expected)
+                    doc = TextExtractor.extract_with_structure_and_images(temp_file, **markers)
+                    self.assertEqual(doc, DocumentWithImages(
+                        expected.front_matter, expected.main_text, expected.back_matter
+                    ))
+        finally:
+            os.unlink(temp_file)
+
     def test_extract_text_unsupported_format(self):
         """Test extract_text with unsupported file format."""
         with tempfile.NamedTemporaryFile(suffix='.xyz', delete=False) as f:
@@ -49,6 +107,49 @@ class TestTextExtractor(unittest.TestCase):
         finally:
             os.unlink(temp_file)
 
+    def test_extract_from_pdf_parallel_matches_serial(self):
+        """Test parallel PDF extraction returns exactly the serial output."""
+        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as f:
+            temp_file = f.name
+
+        try:
+            _write_test_pdf(temp_file, 2 * TextExtractor.MIN_PAGES_PER_WORKER + 3)
+            serial = TextExtractor.extract_from_pdf(temp_file)
+            parallel = TextExtractor.extract_from_pdf(temp_file, workers=2)
+            self.assertIn("Page 1 of", serial)
+            self.assertEqual(parallel, serial)
+            self.assertEqual('\n'.join(TextExtractor.iter_pages(temp_file)), serial)
+        finally:
+            os.unlink(temp_file)
+
+    def test_extract_from_pdf_backends(self):
+        """Test each installed PDF backend extracts the page text."""
+        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as f:
+            temp_file = f.name
+
+        try:
+            _write_test_pdf(temp_file, 3)
+            for backend in ("fitz", "pypdf2"):
+                text = TextExtractor.extract_from_pdf(temp_file, backend=backend)
+                self.assertIn("Page 3 of the test document.", text)
+        finally:
+            os.unlink(temp_file)
+
+    def test_structure_with_images_shares_text(self):
+        """Test DocumentWithImages is a span-based DocumentSection over one buffer."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
+            f.write("Title\n\nChapter 1\nBody text.\n\nAppendix\nMore.")
+            temp_file = f.name
+
+        try:
+            doc = TextExtractor.extract_with_structure_and_images(temp_file)
+            self.assertIsInstance(doc, DocumentSection)
+            self.assertEqual(doc, DocumentWithImages("Title", "Chapter 1\nBody text.", "Appendix\nMore."))
+            self.assertIs(doc._spans['front_matter'][0], doc._spans['back_matter'][0])
+            self.assertEqual(doc.images, [])
+        finally:
+            os.unlink(temp_file)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,105 @@
+"""Tests for txt_reader module."""
+
+import os
+import tempfile
+import unittest
+from bilingual_reader.txt_reader import (
+    SAMPLE_SIZE,
+    detect_encoding,
+    iter_txt_blocks,
+    iter_txt_chunks,
+    read_txt
+)
+
+SIMPLIFIED = "第一章\n这是一个关于小王子的故事。他住在一颗很小的星球上。\n" * 20
+TRADITIONAL = "第一章\n這是一個關於小王子的故事。他住在一顆很小的星球上。\n" * 20
+
+
+class TestTxtReader(unittest.TestCase):
+    """Test cases for the chunked text reader."""
+
+    def setUp(self):
+        """Create a temporary directory."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Remove the temporary files."""
+        for name in os.listdir(self.temp_dir):
+            os.unlink(os.path.join(self.temp_dir, name))
+        os.rmdir(self.temp_dir)
+
+    def _write(self, data, name='book.txt'):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def test_detect_encodings(self):
+        """Test UTF-8, GB18030, Big5 and BOM detection."""
+        self.assertEqual(detect_encoding(SIMPLIFIED.encode('utf-8')), 'utf-8')
+        self.assertEqual(detect_encoding(SIMPLIFIED.encode('gb18030')), 'gb18030')
+        self.assertEqual(detect_encoding(TRADITIONAL.encode('big5')), 'big5')
+        self.assertEqual(detect_encoding(b'\xef\xbb\xbfhello'), 'utf-8-sig')
+        self.assertEqual(detect_encoding(b'plain ascii'), 'utf-8')
+
+    def test_read_each_encoding(self):
+        """Test files decode to the original text whatever their encoding."""
+        for text, encoding in ((SIMPLIFIED, 'utf-8'), (SIMPLIFIED, 'gb18030'), (TRADITIONAL, 'big5')):
+            path = self._write(text.encode(encoding))
+            self.assertEqual(read_txt(path), text)
+            # Tiny chunks split multi-byte characters across chunk boundaries
+            self.assertEqual(read_txt(path, chunk_size=5), text)
+
+    def test_newlines_translated(self):
+        """Test CRLF and CR are translated like text-mode open, even across chunks."""
+        path = self._write(b"line one\r\nline two\rline three\r\n")
+        with open(path, 'r', encoding='utf-8') as f:
+            expected = f.read()
+        for chunk_size in (1, 2, 9, 1024):
+            self.assertEqual(''.join(iter_txt_chunks(path, chunk_size=chunk_size)), expected)
+
+    def test_blocks_join_to_text(self):
+        """Test line blocks join with newlines into the whole text."""
+        for text in ("a\nbb\n\nccc\n", "no newline", ""):
+            path = self._write(text.encode('utf-8'))
+            for chunk_size in (1, 4, 1024):
+                blocks = list(iter_txt_blocks(path, chunk_size=chunk_size))
+                self.assertEqual('\n'.join(blocks), text)
+
+    def test_encoding_between_samples(self):
+        """Test CJK text only between the detection samples is decoded after falling back."""
+        ascii_line = "An English line of front matter.\r\n"
+        padding = ascii_line * (2 * SAMPLE_SIZE // len(ascii_line))
+        for text, encoding in ((SIMPLIFIED, 'gb18030'), (TRADITIONAL, 'big5')):
+            # Start, middle and end samples all fall in the ASCII padding
+            data = (padding + text + padding * 3).encode(encoding)
+            path = self._write(data)
+            self.assertEqual(detect_encoding(data), 'utf-8')
+            with open(path, 'r', encoding=encoding) as f:
+                expected = f.read()
+            for chunk_size in (SAMPLE_SIZE, 4099, len(data)):
+                with self.subTest(encoding=encoding, chunk_size=chunk_size):
+                    self.assertEqual(read_txt(path, chunk_size=chunk_size), expected)
+                    blocks = list(iter_txt_blocks(path, chunk_size=chunk_size))
+                    self.assertEqual('\n'.join(blocks), expected)
+            with self.assertRaises(UnicodeDecodeError):
+                read_txt(path, encoding='utf-8')
+
+    def test_long_line_split(self):
+        """Test a line longer than max_block_size is split into bounded blocks."""
+        text = "没有换行的一行" * 1000
+        path = self._write(text.encode('utf-8'))
+        blocks = list(iter_txt_blocks(path, chunk_size=64, max_block_size=500))
+        self.assertGreater(len(blocks), 1)
+        self.assertTrue(all(len(block) <= 500 + 64 for block in blocks))
+        self.assertEqual(''.join(blocks), text)
+        self.assertEqual(list(iter_txt_blocks(path, chunk_size=64, max_block_size=None)), [text])
+
+    def test_empty_file(self):
+        """Test an empty file reads as an empty string."""
+        path = self._write(b"")
+        self.assertEqual(read_txt(path), "")
+
+
+if __name__ == '__main__':
+    unittest.main()